@@ -0,0 +1,5 @@
+"""
+Medición de rendimiento del sumador-restador de 4 bits.
+"""
+
+# Este archivo puede estar vacío
@@ -0,0 +1,56 @@
+"""
+Generación de vectores de prueba y tiempo de verificación por ancho.
+
+Para sumadores-restadores de 4 a 128 bits mide cuántos vectores hacen
+falta para la cobertura completa de fallas de pegado, cuánto tarda
+generarlos, cuántas fallas se simularon gracias al fault dropping
+frente a simularlas todas en cada tanda, y cuánto tarda comprobar
+sumador_restador_nbits con esos vectores, que es el coste por build.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import time
+import timeit
+
+from src.adder_nbits import sumador_restador_nbits
+from src.atpg import generar_vectores_sumador
+
+
+ANCHOS = [4, 8, 16, 32, 64, 128]
+
+
+def benchmark_atpg(candidatos: int = 16, semilla: int = 1234):
+    """
+    Mide la generación de vectores y la verificación con ellos.
+
+    Args:
+        candidatos: Candidatos aleatorios por tanda
+        semilla: Semilla del generador de candidatos
+    """
+    print("Benchmark: generación de vectores de prueba")
+    print("=" * 78)
+    print(f"{'Bits':>4} | {'Fallas':>6} | {'Vectores':>8} | {'Generar (s)':>11} | "
+          f"{'Simuladas':>17} | {'Verificar (ms)':>14}")
+    print("-" * 78)
+
+    for n_bits in ANCHOS:
+        inicio = time.perf_counter()
+        r = generar_vectores_sumador(n_bits, semilla=semilla, candidatos=candidatos)
+        t_generar = time.perf_counter() - inicio
+        vectores = r["vectores"]
+
+        def verificar():
+            for a, b, op in vectores:
+                sumador_restador_nbits(a, b, op)
+
+        t_verificar = min(timeit.repeat(verificar, number=1, repeat=5))
+        simuladas = f"{r['simuladas']}/{r['tandas'] * r['total']}"
+        print(f"{n_bits:>4} | {r['total']:>6} | {len(vectores):>8} | "
+              f"{t_generar:>11.3f} | {simuladas:>17} | {t_verificar * 1e3:>14.3f}")
+
+
+if __name__ == "__main__":
+    benchmark_atpg()
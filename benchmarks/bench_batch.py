@@ -0,0 +1,61 @@
+"""
+Compara el bucle escalar con el sumador-restador vectorizado.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import time
+
+import numpy as np
+
+from src.adder_subtractor import sumador_restador_4bits
+from src.batch import sumador_restador_4bits_batch
+
+
+def benchmark_batch(n: int = 100_000, semilla: int = 1234):
+    """
+    Procesa n operaciones aleatorias con ambos caminos y compara.
+    
+    Args:
+        n: Número de operaciones
+        semilla: Semilla del generador aleatorio
+    """
+    rng = np.random.default_rng(semilla)
+    a = rng.integers(0, 16, n, dtype=np.uint8)
+    b = rng.integers(0, 16, n, dtype=np.uint8)
+    op = rng.integers(0, 2, n, dtype=np.uint8)
+    
+    # Operandos como listas de bits para el camino escalar
+    pesos = np.array([8, 4, 2, 1], dtype=np.uint8)
+    a_bits = ((a[:, None] & pesos) > 0).astype(np.uint8).tolist()
+    b_bits = ((b[:, None] & pesos) > 0).astype(np.uint8).tolist()
+    op_lista = op.tolist()
+    
+    inicio = time.perf_counter()
+    escalar = [sumador_restador_4bits(a_bits[i], b_bits[i], op_lista[i])
+               for i in range(n)]
+    t_escalar = time.perf_counter() - inicio
+    
+    # Primera llamada fuera de la medición (construye las tablas)
+    sumador_restador_4bits_batch(a[:1], b[:1], op[:1])
+    inicio = time.perf_counter()
+    resultados, carries = sumador_restador_4bits_batch(a, b, op)
+    t_batch = time.perf_counter() - inicio
+    
+    iguales = all(
+        escalar[i] == (resultados[i].tolist(), int(carries[i]))
+        for i in range(n)
+    )
+    
+    print(f"Benchmark: {n} operaciones (semilla={semilla})")
+    print("=" * 60)
+    print(f"Bucle escalar : {t_escalar:8.3f} s  ({n / t_escalar:12,.0f} op/s)")
+    print(f"Vectorizado   : {t_batch:8.3f} s  ({n / t_batch:12,.0f} op/s)")
+    print(f"Aceleración   : {t_escalar / t_batch:8.1f}x")
+    print(f"Bit a bit idénticos: {'✓' if iguales else '✗'}")
+
+
+if __name__ == "__main__":
+    benchmark_batch()
@@ -0,0 +1,65 @@
+"""
+Compara la evaluación escalar con la simulación por planos de bits.
+
+La evaluación escalar llama a sumador_restador_4bits una vez por
+operación. Por planos, cada llamada a una puerta evalúa todas las
+operaciones del lote a la vez. Se mide el lote completo (con el
+empaquetado y desempaquetado) y solo el circuito sobre los planos.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+import timeit
+
+from src.adder_subtractor import sumador_restador_4bits
+from src.bitslice import (sumador_restador_lote, sumador_restador_planos,
+                          empaquetar, empaquetar_bits, mascara)
+
+
+LOTES = [64, 1024, 4096, 65536]
+
+
+def benchmark_bitslice(repeticiones: int = 3, semilla: int = 1234):
+    """
+    Mide operaciones por segundo escalares y por planos.
+    
+    Args:
+        repeticiones: Repeticiones de timeit (se toma el mínimo)
+        semilla: Semilla del generador aleatorio
+    """
+    rng = random.Random(semilla)
+    
+    print("Benchmark: simulación por planos de bits (4 bits)")
+    print("=" * 72)
+    print(f"{'Lote':>6} | {'Escalar op/s':>13} | {'Lote op/s':>13} | "
+          f"{'Planos op/s':>13} | {'Aceleración':>11}")
+    print("-" * 72)
+    
+    for n in LOTES:
+        a = [[rng.getrandbits(1) for _ in range(4)] for _ in range(n)]
+        b = [[rng.getrandbits(1) for _ in range(4)] for _ in range(n)]
+        ops = [rng.getrandbits(1) for _ in range(n)]
+        
+        def escalar():
+            for x, y, op in zip(a, b, ops):
+                sumador_restador_4bits(x, y, op)
+        
+        a_planos, b_planos = empaquetar(a), empaquetar(b)
+        op_plano, m = empaquetar_bits(ops), mascara(n)
+        
+        t_escalar = min(timeit.repeat(escalar, number=1, repeat=repeticiones))
+        t_lote = min(timeit.repeat(lambda: sumador_restador_lote(a, b, ops),
+                                   number=1, repeat=repeticiones))
+        t_planos = min(timeit.repeat(
+            lambda: sumador_restador_planos(a_planos, b_planos, op_plano, m),
+            number=1, repeat=repeticiones))
+        
+        print(f"{n:>6} | {n / t_escalar:13,.0f} | {n / t_lote:13,.0f} | "
+              f"{n / t_planos:13,.0f} | {t_escalar / t_lote:10.1f}x")
+
+
+if __name__ == "__main__":
+    benchmark_bitslice()
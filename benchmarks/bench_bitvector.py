@@ -0,0 +1,81 @@
+"""
+Compara operandos como listas de bits con operandos BitVector.
+
+Mide el tiempo por operación (BitVector evita volver a validar los bits
+en cada llamada) y la memoria que ocupan muchos operandos guardados
+(BitVector guarda un entero y los valores pequeños se comparten).
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+import timeit
+import tracemalloc
+
+from src.adder_subtractor import sumador_restador_4bits
+from src.adder_nbits import adder_nbits
+from src.bitvector import BitVector
+from src.utils import entero_a_bits
+
+
+def memoria(construir) -> int:
+    """Bytes reservados (pico) al construir y conservar los operandos."""
+    tracemalloc.start()
+    try:
+        operandos = construir()
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del operandos
+    return pico
+
+
+def benchmark_bitvector(n_casos: int = 20000, repeticiones: int = 3,
+                        semilla: int = 1234):
+    """
+    Mide tiempo y memoria con listas y con BitVector.
+    
+    Args:
+        n_casos: Operaciones aleatorias por medida
+        repeticiones: Repeticiones de timeit (se toma el mínimo)
+        semilla: Semilla del generador aleatorio
+    """
+    rng = random.Random(semilla)
+    
+    print("Benchmark: listas de bits frente a BitVector")
+    print("=" * 72)
+    print(f"{'Circuito':<24} | {'Operandos':<9} | {'µs/op':>7} | {'KiB guardados':>13}")
+    print("-" * 72)
+    
+    for nombre, n_bits, funcion in [
+        ("sumador_restador_4bits", 4, lambda a, b: sumador_restador_4bits(a, b, 1)),
+        ("adder_nbits (32 bits)", 32, adder_nbits),
+    ]:
+        valores = [(rng.getrandbits(n_bits), rng.getrandbits(n_bits))
+                   for _ in range(n_casos)]
+        
+        formas = [
+            ("lista", lambda: [(entero_a_bits(a, n_bits), entero_a_bits(b, n_bits))
+                               for a, b in valores]),
+            ("BitVector", lambda: [(BitVector.desde_entero(a, n_bits),
+                                    BitVector.desde_entero(b, n_bits))
+                                   for a, b in valores]),
+        ]
+        
+        for forma, construir in formas:
+            casos = construir()
+            
+            def operar():
+                for a, b in casos:
+                    funcion(a, b)
+            
+            us = min(timeit.repeat(operar, number=1, repeat=repeticiones)) / n_casos * 1e6
+            kib = memoria(construir) / 1024
+            print(f"{nombre:<24} | {forma:<9} | {us:7.2f} | {kib:13,.0f}")
+        print("-" * 72)
+
+
+if __name__ == "__main__":
+    benchmark_bitvector()
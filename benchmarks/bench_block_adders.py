@@ -0,0 +1,66 @@
+"""
+Barre el tamaño de bloque de los sumadores con selección y salto de acarreo.
+
+Para cada ancho muestra las mejores configuraciones de cada tipo según
+el retardo sensibilizado, junto con la profundidad topológica, las
+puertas y el tiempo por operación en Python.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+import timeit
+
+from src.block_adders import (TIPOS, ajustar_bloques, adder_carry_select,
+                              adder_carry_skip)
+from src.utils import entero_a_bits
+
+
+ANCHOS = [16, 32]
+
+SUMADORES = {"seleccion": adder_carry_select, "salto": adder_carry_skip}
+
+
+def benchmark_bloques(n_mejores: int = 3, n_casos: int = 50,
+                      semilla: int = 1234):
+    """
+    Muestra las mejores configuraciones de bloque de cada tipo.
+    
+    Args:
+        n_mejores: Configuraciones a mostrar por tipo y ancho
+        n_casos: Operaciones aleatorias por configuración para medir el tiempo
+        semilla: Semilla del generador aleatorio
+    """
+    rng = random.Random(semilla)
+    
+    print("Benchmark: tamaño de bloque")
+    print("=" * 78)
+    print(f"{'Bits':>4} | {'Tipo':<9} | {'Retardo':>7} | {'Prof.':>5} | "
+          f"{'Puertas':>7} | {'µs/op':>8} | Bloques")
+    print("-" * 78)
+    
+    for n_bits in ANCHOS:
+        casos = [(entero_a_bits(rng.getrandbits(n_bits), n_bits),
+                  entero_a_bits(rng.getrandbits(n_bits), n_bits))
+                 for _ in range(n_casos)]
+        
+        for tipo in TIPOS:
+            sumador = SUMADORES[tipo]
+            for fila in ajustar_bloques(tipo, n_bits)[:n_mejores]:
+                bloques = fila["bloques"]
+                
+                def sumar():
+                    for a, b in casos:
+                        sumador(a, b, 0, bloques)
+                
+                us = min(timeit.repeat(sumar, number=1, repeat=3)) / n_casos * 1e6
+                print(f"{n_bits:>4} | {tipo:<9} | {fila['retardo']:>7} | "
+                      f"{fila['profundidad']:>5} | {fila['compuertas']:>7} | "
+                      f"{us:8.2f} | {bloques}")
+        print("-" * 78)
+
+
+if __name__ == "__main__":
+    benchmark_bloques()
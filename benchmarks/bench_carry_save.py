@@ -0,0 +1,81 @@
+"""
+Compara el acumulador carry-save con el bucle de sumas en cascada.
+
+El bucle ingenuo suma los operandos de uno en uno con un sumador de
+acarreo en cascada del ancho final: K - 1 propagaciones de acarreo. El
+acumulador carry-save solo propaga una vez, en la suma final. Para cada
+número de operandos se muestra el tiempo por operando, el número de
+propagaciones y las puertas y la profundidad del circuito.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+import timeit
+
+from src.adder_nbits import adder_nbits
+from src.carry_save import sumar_operandos, arbol_carry_save, _ancho_suma
+from src.metrics import medir_circuito
+from src.utils import entero_a_bits, bits_a_valor
+
+
+N_BITS = 8
+OPERANDOS = [4, 16, 64, 256]
+
+
+def suma_en_cascada(operandos: list, ancho: int) -> list:
+    """Suma los operandos de uno en uno propagando el acarreo cada vez."""
+    acumulado = [0] * (ancho - len(operandos[0])) + operandos[0]
+    for bits in operandos[1:]:
+        acumulado, _ = adder_nbits(acumulado, [0] * (ancho - len(bits)) + bits)
+    return acumulado
+
+
+def arbol_y_suma(operandos: list) -> list:
+    """Árbol de Wallace seguido de la única propagación de acarreo."""
+    suma, acarreo = arbol_carry_save(operandos)
+    return adder_nbits(suma, acarreo)[0]
+
+
+def benchmark_carry_save(repeticiones: int = 3, semilla: int = 1234):
+    """
+    Mide el bucle en cascada frente al acumulador carry-save.
+    
+    Args:
+        repeticiones: Repeticiones de timeit (se toma el mínimo)
+        semilla: Semilla del generador aleatorio
+    """
+    rng = random.Random(semilla)
+    
+    print(f"Benchmark: suma de K operandos de {N_BITS} bits")
+    print("=" * 72)
+    print(f"{'K':>5} | {'Método':<11} | {'µs/operando':>11} | {'Propag.':>7} | "
+          f"{'Puertas':>7} | {'Prof.':>5}")
+    print("-" * 72)
+    
+    for k in OPERANDOS:
+        valores = [rng.getrandbits(N_BITS) for _ in range(k)]
+        operandos = [entero_a_bits(v, N_BITS) for v in valores]
+        ancho = _ancho_suma(N_BITS, k)
+        
+        metodos = [
+            ("cascada", lambda ops: suma_en_cascada(ops, ancho), k - 1),
+            ("carry-save", sumar_operandos, 1),
+            ("wallace", arbol_y_suma, 1),
+        ]
+        
+        for nombre, funcion, propagaciones in metodos:
+            assert bits_a_valor(funcion(operandos)) == sum(valores)
+            segundos = min(timeit.repeat(lambda: funcion(operandos),
+                                         number=1, repeat=repeticiones))
+            m = medir_circuito(lambda *ops: funcion(list(ops)), *operandos)
+            print(f"{k:>5} | {nombre:<11} | {segundos / k * 1e6:11.2f} | "
+                  f"{propagaciones:>7} | {m['compuertas']:>7} | "
+                  f"{m['profundidad']:>5}")
+        print("-" * 72)
+
+
+if __name__ == "__main__":
+    benchmark_carry_save()
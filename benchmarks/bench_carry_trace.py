@@ -0,0 +1,125 @@
+"""
+Coste de la traza de la cadena de acarreo.
+
+Mide adder_4bits y sumador_restador_4bits sin traza y con traza, y con
+--comparar BASE compara el camino sin traza con una línea base guardada
+por bench_suite.py en un árbol sin carry_trace: medir los dos caminos
+en el mismo proceso no dice nada de una regresión, porque sin traza se
+ejecuta el mismo código en las dos medidas.
+
+Uso:
+    (árbol anterior) python benchmarks/bench_suite.py --filtro 4bits --json base.json
+    python benchmarks/bench_carry_trace.py --comparar base.json
+
+Resultado al añadir carry_trace (1000 operaciones, semilla 1234,
+9 repeticiones, tres pares base/actual alternados en la misma máquina):
+adder_4bits +8.8%, +9.5% y +4.0% de op/s, y el mismo pico de memoria que
+la base en todos los casos. Los demás casos "4bits" variaron hasta ±40%
+entre pares en los dos sentidos, igual en la base que en el árbol
+nuevo, así que son ruido de la máquina y no del cambio.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import json
+import random
+import timeit
+
+from src.adder_4bit import adder_4bits
+from src.adder_subtractor import sumador_restador_4bits
+from src.carry_trace import TrazaAcarreo, adder_4bits_trazado, sumador_trazado
+from benchmarks.bench_suite import ejecutar_suite, comparar, mostrar_resultados
+
+
+def benchmark_traza(n_operaciones: int = 2000, repeticiones: int = 7,
+                    semilla: int = 1234):
+    """
+    Mide el coste de la traza respecto al camino sin traza.
+
+    Args:
+        n_operaciones: Operaciones por medida
+        repeticiones: Repeticiones de timeit (se toma el mínimo)
+        semilla: Semilla del generador aleatorio
+    """
+    rng = random.Random(semilla)
+    operaciones = [([rng.getrandbits(1) for _ in range(4)],
+                    [rng.getrandbits(1) for _ in range(4)],
+                    rng.getrandbits(1)) for _ in range(n_operaciones)]
+    traza = TrazaAcarreo()
+    trazado = sumador_trazado(traza)
+
+    def medir(funcion):
+        def ejecutar():
+            for a, b, c in operaciones:
+                funcion(a, b, c)
+        tiempo = min(timeit.repeat(ejecutar, number=1, repeat=repeticiones))
+        traza.limpiar()
+        return tiempo
+
+    casos = [
+        ("adder_4bits", [
+            ("sin traza", lambda a, b, c: adder_4bits(a, b, c)),
+            ("con traza", lambda a, b, c: adder_4bits_trazado(a, b, c, traza)),
+        ]),
+        ("sumador_restador_4bits", [
+            ("sin traza", lambda a, b, op: sumador_restador_4bits(a, b, op)),
+            ("con traza", lambda a, b, op: sumador_restador_4bits(
+                a, b, op, sumador=trazado)),
+        ]),
+    ]
+
+    print("Benchmark: traza de la cadena de acarreo")
+    print("=" * 62)
+    for circuito, variantes in casos:
+        print(f"\n{circuito}:")
+        print(f"{'Variante':<24} | {'op/s':>10} | {'Relativo':>8}")
+        print("-" * 48)
+        base = None
+        for nombre, funcion in variantes:
+            t = medir(funcion)
+            base = base or t
+            print(f"{nombre:<24} | {n_operaciones / t:>10.0f} | {t / base:>7.2f}x")
+
+
+def comparar_sin_traza(ruta_base: str, umbral: float = 0.10,
+                       repeticiones: int = 9) -> int:
+    """
+    Compara el camino sin traza con una línea base de bench_suite.
+
+    Args:
+        ruta_base: JSON de bench_suite.py --filtro 4bits guardado en un
+            árbol sin carry_trace
+        umbral: Cambio relativo tolerado (0.10 = 10%)
+        repeticiones: Repeticiones de timeit (se toma el mínimo)
+
+    Returns:
+        Número de regresiones
+    """
+    with open(ruta_base, encoding="utf-8") as f:
+        base = json.load(f)
+    datos = ejecutar_suite(base["n_operaciones"], repeticiones,
+                           base["semilla"], "4bits")
+    print(f"\nSin traza frente a {ruta_base}:")
+    mostrar_resultados(datos, base)
+    regresiones = comparar(datos, base, umbral)
+    for r in regresiones:
+        print(f"  ✗ {r['caso']}: {r['metrica']} {r['base']:.0f} -> "
+              f"{r['actual']:.0f} ({r['cambio']:+.1%} peor)")
+    if not regresiones:
+        print(f"\n✓ Sin regresiones (umbral {umbral:.0%})")
+    return len(regresiones)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Coste de la traza de acarreo")
+    parser.add_argument("--comparar", metavar="BASE",
+                        help="Línea base de bench_suite.py sin carry_trace")
+    parser.add_argument("--umbral", type=float, default=0.10)
+    args = parser.parse_args()
+
+    benchmark_traza()
+    if args.comparar:
+        sys.exit(1 if comparar_sin_traza(args.comparar, args.umbral) else 0)
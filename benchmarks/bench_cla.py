@@ -0,0 +1,58 @@
+"""
+Compara el sumador ripple-carry con el de acarreo anticipado (CLA).
+
+Para cada ancho muestra el número de puertas, la profundidad lógica
+(camino crítico) y el tiempo por operación en Python.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+import timeit
+
+from src.adder_nbits import adder_nbits
+from src.carry_lookahead import adder_cla
+from src.metrics import medir_sumador
+from src.utils import entero_a_bits
+
+
+ANCHOS = [4, 8, 16, 32, 64]
+
+
+def benchmark_cla(n_casos: int = 100, semilla: int = 1234):
+    """
+    Mide puertas, profundidad y tiempo de ambos sumadores.
+    
+    Args:
+        n_casos: Operaciones aleatorias por ancho para medir el tiempo
+        semilla: Semilla del generador aleatorio
+    """
+    rng = random.Random(semilla)
+    
+    print("Benchmark: ripple-carry vs carry-lookahead")
+    print("=" * 72)
+    print(f"{'Bits':>5} | {'Sumador':<7} | {'Puertas':>7} | "
+          f"{'Profundidad':>11} | {'µs/op':>8}")
+    print("-" * 72)
+    
+    for n_bits in ANCHOS:
+        casos = [(entero_a_bits(rng.getrandbits(n_bits), n_bits),
+                  entero_a_bits(rng.getrandbits(n_bits), n_bits))
+                 for _ in range(n_casos)]
+        
+        for nombre, sumador in (("ripple", adder_nbits), ("CLA", adder_cla)):
+            metricas = medir_sumador(sumador, n_bits)
+            
+            def sumar():
+                for a, b in casos:
+                    sumador(a, b)
+            
+            us = min(timeit.repeat(sumar, number=1, repeat=3)) / n_casos * 1e6
+            print(f"{n_bits:>5} | {nombre:<7} | {metricas['compuertas']:>7} | "
+                  f"{metricas['profundidad']:>11} | {us:8.2f}")
+
+
+if __name__ == "__main__":
+    benchmark_cla()
@@ -0,0 +1,83 @@
+"""
+Compara las llamadas anidadas con el motor compilado.
+
+Para cada ancho mide el sumador-restador con las funciones anidadas, el
+motor "compilado" de sumador_restador_4bits (con validación) y la
+función compilada directamente, junto con el tiempo de traza y
+compilación, que solo se paga la primera vez.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+import time
+import timeit
+
+from src import compiler
+from src.adder_subtractor import sumador_restador_4bits
+from src.adder_nbits import sumador_restador_nbits
+
+
+ANCHOS = [4, 8, 16, 32, 64]
+
+
+def benchmark_compilador(n_casos: int = 2000, repeticiones: int = 5,
+                         semilla: int = 1234):
+    """
+    Mide operaciones por segundo de cada forma de evaluar.
+    
+    Args:
+        n_casos: Operaciones aleatorias por ancho
+        repeticiones: Repeticiones de timeit (se toma el mínimo)
+        semilla: Semilla del generador aleatorio
+    """
+    rng = random.Random(semilla)
+    
+    print("Benchmark: llamadas anidadas frente a código compilado")
+    print("=" * 78)
+    print(f"{'Bits':>4} | {'Compilar ms':>11} | {'Anidado op/s':>13} | "
+          f"{'Motor op/s':>13} | {'Directo op/s':>13} | {'x':>5}")
+    print("-" * 78)
+    
+    for n_bits in ANCHOS:
+        casos = [([rng.getrandbits(1) for _ in range(n_bits)],
+                  [rng.getrandbits(1) for _ in range(n_bits)],
+                  rng.getrandbits(1)) for _ in range(n_casos)]
+        
+        # Primera compilación del proceso (la caché en disco puede existir)
+        compiler._sumadores_restadores.pop((n_bits, None), None)
+        inicio = time.perf_counter()
+        directo = compiler.compilar_sumador_restador(n_bits)
+        ms = (time.perf_counter() - inicio) * 1e3
+        
+        if n_bits == 4:
+            def anidado():
+                for a, b, op in casos:
+                    sumador_restador_4bits(a, b, op)
+            
+            def motor():
+                for a, b, op in casos:
+                    sumador_restador_4bits(a, b, op, motor="compilado")
+        else:
+            def anidado():
+                for a, b, op in casos:
+                    sumador_restador_nbits(a, b, op)
+            motor = None
+        
+        def compilado():
+            for a, b, op in casos:
+                directo(a, b, op)
+        
+        t_anidado = min(timeit.repeat(anidado, number=1, repeat=repeticiones))
+        t_directo = min(timeit.repeat(compilado, number=1, repeat=repeticiones))
+        motor_ops = (f"{n_casos / min(timeit.repeat(motor, number=1, repeat=repeticiones)):13,.0f}"
+                     if motor else f"{'-':>13}")
+        print(f"{n_bits:>4} | {ms:11.1f} | {n_casos / t_anidado:13,.0f} | "
+              f"{motor_ops} | {n_casos / t_directo:13,.0f} | "
+              f"{t_anidado / t_directo:5.1f}")
+
+
+if __name__ == "__main__":
+    benchmark_compilador()
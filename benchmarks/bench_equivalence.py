@@ -0,0 +1,40 @@
+"""
+Tiempo de la verificación exhaustiva de equivalencia.
+
+Verifica adder_cla contra el sumador ripple para anchos de 4 a 12 bits
+(de 512 a 33 millones de entradas), con un proceso y con todos los
+núcleos, y muestra las entradas verificadas por segundo.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.carry_lookahead import adder_cla
+from src.equivalence import verificar_sumador
+
+
+ANCHOS = [4, 6, 8, 10, 12]
+
+
+def benchmark_equivalencia():
+    """Mide el tiempo de verificar adder_cla en cada ancho."""
+    nucleos = os.cpu_count() or 1
+    configuraciones = sorted({1, nucleos})
+
+    print("Benchmark: verificación exhaustiva de adder_cla")
+    print("=" * 62)
+    print(f"{'Bits':>4} | {'Entradas':>10} | {'Procesos':>8} | {'Tiempo (s)':>10} | "
+          f"{'Entradas/s':>12}")
+    print("-" * 62)
+
+    for n_bits in ANCHOS:
+        for procesos in configuraciones:
+            r = verificar_sumador(adder_cla, n_bits, procesos=procesos)
+            estado = "" if r["equivalentes"] else "  ✗"
+            print(f"{n_bits:>4} | {r['total']:>10} | {r['procesos']:>8} | "
+                  f"{r['tiempo']:>10.3f} | {r['total'] / r['tiempo']:>12.0f}{estado}")
+
+
+if __name__ == "__main__":
+    benchmark_equivalencia()
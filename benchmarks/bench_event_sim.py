@@ -0,0 +1,79 @@
+"""
+Trabajo de la simulación por eventos frente a la evaluación completa.
+
+Para cada ancho se aplican dos secuencias de operaciones al simulador
+por eventos: operandos aleatorios y un contador (A = A + 1, solo cambian
+los bits bajos casi siempre). Se muestran las puertas evaluadas por
+operación frente a las del circuito completo (lo que evaluaría
+Netlist.evaluar), el tiempo medio y máximo de estabilización y las
+operaciones por segundo de cada forma.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+import timeit
+
+from src.event_sim import simulador_sumador_restador
+
+
+ANCHOS = [8, 32, 64]
+
+
+def _secuencias(n_bits: int, n_operaciones: int, rng):
+    """Secuencias aleatoria y de contador para un ancho."""
+    aleatoria = [([rng.getrandbits(1) for _ in range(n_bits)],
+                  [rng.getrandbits(1) for _ in range(n_bits)],
+                  rng.getrandbits(1)) for _ in range(n_operaciones)]
+    uno = [0] * (n_bits - 1) + [1]
+    contador = [([int(c) for c in format(i, "b").zfill(n_bits)[-n_bits:]], uno, 0)
+                for i in range(n_operaciones)]
+    return [("aleatoria", aleatoria), ("contador", contador)]
+
+
+def benchmark_eventos(n_operaciones: int = 1000, repeticiones: int = 3,
+                      semilla: int = 1234):
+    """
+    Mide puertas evaluadas, tiempos de estabilización y velocidad.
+    
+    Args:
+        n_operaciones: Operaciones por secuencia
+        repeticiones: Repeticiones de timeit (se toma el mínimo)
+        semilla: Semilla del generador aleatorio
+    """
+    rng = random.Random(semilla)
+    
+    print("Benchmark: simulación por eventos (retardo unitario)")
+    print("=" * 84)
+    print(f"{'Bits':>4} | {'Secuencia':<10} | {'Puertas/op':>16} | "
+          f"{'Estab. media/máx':>16} | {'Eventos op/s':>12} | {'Completo op/s':>13}")
+    print("-" * 84)
+    
+    for n_bits in ANCHOS:
+        for nombre, secuencia in _secuencias(n_bits, n_operaciones, rng):
+            sim = simulador_sumador_restador(n_bits)
+            red = sim.netlist
+            tiempos = [t for _, t in sim.simular(secuencia)]
+            por_operacion = sim.evaluaciones / n_operaciones
+            
+            def eventos():
+                sim.simular(secuencia)
+            
+            def completo():
+                for a, b, op in secuencia:
+                    red.evaluar(a, b, op)
+            
+            t_eventos = min(timeit.repeat(eventos, number=1, repeat=repeticiones))
+            t_completo = min(timeit.repeat(completo, number=1, repeat=repeticiones))
+            
+            puertas = f"{por_operacion:.1f} de {len(red)}"
+            estabilizacion = f"{sum(tiempos) / len(tiempos):.1f} / {max(tiempos)}"
+            print(f"{n_bits:>4} | {nombre:<10} | {puertas:>16} | "
+                  f"{estabilizacion:>16} | {n_operaciones / t_eventos:>12.0f} | "
+                  f"{n_operaciones / t_completo:>13.0f}")
+
+
+if __name__ == "__main__":
+    benchmark_eventos()
@@ -0,0 +1,55 @@
+"""
+Simulación de fallas por planos frente a simulación falla a falla.
+
+Para sumadores-restadores de 4 a 64 bits y 64 vectores aleatorios,
+mide el tiempo de simular todas las fallas de pegado con
+simular_fallas (muchas fallas y vectores por pasada) y con una pasada
+por falla (fallas_por_pasada=1, solo paralelismo de vectores), y la
+cobertura obtenida.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import time
+
+from src.netlist import trazar_sumador_restador
+from src.fault_sim import simular_fallas, vectores_aleatorios
+
+
+ANCHOS = [4, 8, 16, 32, 64]
+
+
+def benchmark_fallas(n_vectores: int = 64, semilla: int = 1234):
+    """
+    Mide el tiempo de la simulación de fallas en cada ancho.
+
+    Args:
+        n_vectores: Vectores de prueba aleatorios
+        semilla: Semilla del generador aleatorio
+    """
+    print(f"Benchmark: simulación de fallas de pegado ({n_vectores} vectores)")
+    print("=" * 70)
+    print(f"{'Bits':>4} | {'Fallas':>6} | {'Cobertura':>9} | {'Pasadas':>7} | "
+          f"{'Planos (s)':>10} | {'Falla a falla (s)':>17}")
+    print("-" * 70)
+
+    for n_bits in ANCHOS:
+        red = trazar_sumador_restador(n_bits)
+        vectores = vectores_aleatorios(n_vectores, n_bits, semilla)
+
+        inicio = time.perf_counter()
+        r = simular_fallas(red, vectores)
+        t_planos = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        simular_fallas(red, vectores, fallas_por_pasada=1)
+        t_una = time.perf_counter() - inicio
+
+        print(f"{n_bits:>4} | {r['total']:>6} | {r['cobertura']:>8.1f}% | "
+              f"{r['pasadas']:>7} | {t_planos:>10.3f} | {t_una:>17.3f}")
+
+
+if __name__ == "__main__":
+    benchmark_fallas()
@@ -0,0 +1,53 @@
+"""
+Compara el motor fusionado con el de dos pasadas (complemento a 2 + suma).
+
+Cuenta cuántas puertas primitivas (AND, OR, NOT) evalúa cada motor, con
+qué profundidad lógica (ver metrics.medir_circuito) y cuánto tarda por
+operación.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import timeit
+from itertools import product
+
+from src.adder_subtractor import sumador_restador_4bits
+from src.metrics import medir_circuito
+
+
+def benchmark_fusionado():
+    """Mide puertas evaluadas, profundidad y tiempo por operación de cada motor."""
+    casos = [(list(e[0:4]), list(e[4:8]), e[8])
+             for e in product((0, 1), repeat=9)]
+    
+    print("Benchmark: motor fusionado vs dos pasadas")
+    print("=" * 78)
+    print(f"{'Motor':<10} | {'Op':<5} | {'AND':>4} | {'OR':>4} | "
+          f"{'NOT':>4} | {'Total':>5} | {'Prof.':>5} | {'µs/op':>7}")
+    print("-" * 78)
+    
+    for motor in ("dos_pasos", "fusionado"):
+        for op, op_str in ((0, "suma"), (1, "resta")):
+            subcasos = [c for c in casos if c[2] == op]
+            a, b, _ = subcasos[0]
+            medida = medir_circuito(
+                lambda a, b, o: sumador_restador_4bits(a, b, o, motor), a, b, op)
+            puertas = medida["por_tipo"]
+            
+            def recorrer():
+                for a, b, o in subcasos:
+                    sumador_restador_4bits(a, b, o, motor)
+            
+            tiempo = min(timeit.repeat(recorrer, number=5, repeat=3))
+            us = tiempo / (len(subcasos) * 5) * 1e6
+            
+            print(f"{motor:<10} | {op_str:<5} | {puertas['AND']:>4} | "
+                  f"{puertas['OR']:>4} | {puertas['NOT']:>4} | "
+                  f"{medida['compuertas']:>5} | {medida['profundidad']:>5} | "
+                  f"{us:7.2f}")
+
+
+if __name__ == "__main__":
+    benchmark_fusionado()
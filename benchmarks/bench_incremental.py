@@ -0,0 +1,88 @@
+"""
+Evaluación incremental frente a evaluación completa del netlist.
+
+Secuencias con pocos bits cambiados entre operaciones consecutivas:
+un contador (A = i, B = 1) y un barrido en el que cambia un solo bit
+aleatorio de A en cada operación, más una secuencia aleatoria como
+referencia del peor caso. Para cada una se muestran las puertas
+evaluadas por operación y las operaciones por segundo del evaluador
+incremental y de Netlist.evaluar, que evalúa siempre todo el circuito.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+import timeit
+
+from src.incremental import sumador_restador_incremental
+
+
+ANCHOS = [8, 32, 64]
+
+
+def _secuencias(n_bits: int, n_operaciones: int, rng):
+    """Secuencias de contador, de un bit y aleatoria para un ancho."""
+    uno = [0] * (n_bits - 1) + [1]
+    contador = [([int(c) for c in format(i, "b").zfill(n_bits)[-n_bits:]], uno, 0)
+                for i in range(n_operaciones)]
+
+    a = [rng.getrandbits(1) for _ in range(n_bits)]
+    b = [rng.getrandbits(1) for _ in range(n_bits)]
+    un_bit = []
+    for _ in range(n_operaciones):
+        a = list(a)
+        a[rng.randrange(n_bits)] ^= 1
+        un_bit.append((a, b, 1))
+
+    aleatoria = [([rng.getrandbits(1) for _ in range(n_bits)],
+                  [rng.getrandbits(1) for _ in range(n_bits)],
+                  rng.getrandbits(1)) for _ in range(n_operaciones)]
+    return [("contador", contador), ("un bit", un_bit), ("aleatoria", aleatoria)]
+
+
+def benchmark_incremental(n_operaciones: int = 2000, repeticiones: int = 5,
+                          semilla: int = 1234):
+    """
+    Mide puertas evaluadas y operaciones por segundo.
+    
+    Args:
+        n_operaciones: Operaciones por secuencia
+        repeticiones: Repeticiones de timeit (se toma el mínimo)
+        semilla: Semilla del generador aleatorio
+    """
+    rng = random.Random(semilla)
+    
+    print("Benchmark: evaluación incremental frente a completa")
+    print("=" * 76)
+    print(f"{'Bits':>4} | {'Secuencia':<10} | {'Puertas/op':>16} | "
+          f"{'Incremental op/s':>16} | {'Completa op/s':>13}")
+    print("-" * 76)
+    
+    for n_bits in ANCHOS:
+        for nombre, secuencia in _secuencias(n_bits, n_operaciones, rng):
+            ev = sumador_restador_incremental(n_bits)
+            red = ev.netlist
+            for entradas in secuencia:
+                ev.evaluar(*entradas)
+            por_operacion = ev.evaluadas / ev.llamadas
+            
+            def incremental():
+                for a, b, op in secuencia:
+                    ev.evaluar(a, b, op)
+            
+            def completa():
+                for a, b, op in secuencia:
+                    red.evaluar(a, b, op)
+            
+            t_inc = min(timeit.repeat(incremental, number=1, repeat=repeticiones))
+            t_comp = min(timeit.repeat(completa, number=1, repeat=repeticiones))
+            
+            puertas = f"{por_operacion:.1f} de {len(red)}"
+            print(f"{n_bits:>4} | {nombre:<10} | {puertas:>16} | "
+                  f"{n_operaciones / t_inc:>16.0f} | {n_operaciones / t_comp:>13.0f}")
+
+
+if __name__ == "__main__":
+    benchmark_incremental()
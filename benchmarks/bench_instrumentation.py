@@ -0,0 +1,63 @@
+"""
+Coste de la instrumentación.
+
+Mide las operaciones por segundo de sumador_restador_4bits (motor
+dos_pasos, el que pasa por todas las puertas) sin instrumentación,
+antes de activarla por primera vez y después de desactivarla, y con
+ella activa contando solo llamadas o también tiempos. Las dos medidas
+sin instrumentación deben coincidir: desactivada, no queda ninguna
+envoltura en el camino.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+import timeit
+
+import src
+from src import instrumentation
+
+
+def benchmark_instrumentacion(n_operaciones: int = 500, repeticiones: int = 5,
+                              semilla: int = 1234):
+    """
+    Mide el coste de la instrumentación activa y desactivada.
+
+    Args:
+        n_operaciones: Operaciones por medida
+        repeticiones: Repeticiones de timeit (se toma el mínimo)
+        semilla: Semilla del generador aleatorio
+    """
+    rng = random.Random(semilla)
+    operaciones = [([rng.getrandbits(1) for _ in range(4)],
+                    [rng.getrandbits(1) for _ in range(4)],
+                    rng.getrandbits(1)) for _ in range(n_operaciones)]
+
+    def ejecutar():
+        for a, b, op in operaciones:
+            src.sumador_restador_4bits(a, b, op, motor="dos_pasos")
+
+    def medir():
+        return min(timeit.repeat(ejecutar, number=1, repeat=repeticiones))
+
+    medidas = [("desactivada (inicio)", medir())]
+    for nombre, tiempos in (("solo llamadas", False), ("llamadas y tiempos", True)):
+        instrumentation.activar(tiempos=tiempos)
+        medidas.append((nombre, medir()))
+        instrumentation.desactivar()
+    medidas.append(("desactivada (después)", medir()))
+    instrumentation.reiniciar()
+
+    base = medidas[0][1]
+    print("Benchmark: coste de la instrumentación (sumador_restador_4bits)")
+    print("=" * 58)
+    print(f"{'Instrumentación':<22} | {'op/s':>10} | {'Relativo':>8}")
+    print("-" * 58)
+    for nombre, t in medidas:
+        print(f"{nombre:<22} | {n_operaciones / t:>10.0f} | {t / base:>7.2f}x")
+
+
+if __name__ == "__main__":
+    benchmark_instrumentacion()
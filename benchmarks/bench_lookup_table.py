@@ -0,0 +1,67 @@
+"""
+Compara el motor de puertas lógicas con el motor de tabla precalculada.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import timeit
+from itertools import product
+
+from src.adder_subtractor import sumador_restador_4bits
+from src.lookup_table import sumador_restador_tabla, obtener_tabla
+
+
+def medir(funcion, casos, repeticiones: int = 5) -> float:
+    """
+    Mide el tiempo medio por operación de una función.
+    
+    Args:
+        funcion: Función con la interfaz de sumador_restador_4bits
+        casos: Lista de tuplas (a_bits, b_bits, operacion)
+        repeticiones: Veces que se recorre la lista de casos
+        
+    Returns:
+        Microsegundos por operación (mejor de 3 mediciones)
+    """
+    def recorrer():
+        for a, b, op in casos:
+            funcion(a, b, op)
+    
+    tiempo = min(timeit.repeat(recorrer, number=repeticiones, repeat=3))
+    return tiempo / (len(casos) * repeticiones) * 1e6
+
+
+def benchmark_tabla():
+    """Mide los motores sobre las 512 combinaciones posibles."""
+    casos = [(list(e[0:4]), list(e[4:8]), e[8])
+             for e in product((0, 1), repeat=9)]
+    
+    # Construir la tabla fuera de la medición
+    obtener_tabla()
+    
+    motores = [
+        ("Puertas (dos_pasos)",
+         lambda a, b, op: sumador_restador_4bits(a, b, op, motor="dos_pasos")),
+        ("Puertas (fusionado)",
+         lambda a, b, op: sumador_restador_4bits(a, b, op, motor="fusionado")),
+        ("Tabla vía motor=\"tabla\"",
+         lambda a, b, op: sumador_restador_4bits(a, b, op, motor="tabla")),
+        ("Tabla directa", sumador_restador_tabla),
+    ]
+    
+    print("Benchmark: puertas lógicas vs tabla precalculada")
+    print("=" * 60)
+    print(f"{'Motor':<28} | {'µs/op':>8} | {'Aceleración':>11}")
+    print("-" * 60)
+    
+    base = None
+    for nombre, funcion in motores:
+        us = medir(funcion, casos)
+        base = base or us
+        print(f"{nombre:<28} | {us:8.3f} | {base / us:10.1f}x")
+
+
+if __name__ == "__main__":
+    benchmark_tabla()
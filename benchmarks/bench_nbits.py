@@ -0,0 +1,57 @@
+"""
+Mide cómo escala el sumador-restador de N bits con el ancho.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+import timeit
+
+from src.adder_nbits import adder_nbits, sumador_restador_nbits
+from src.utils import entero_a_bits
+
+
+ANCHOS = [4, 8, 16, 32, 64, 128]
+
+
+def benchmark_anchos(n_casos: int = 200, semilla: int = 1234):
+    """
+    Mide el coste por operación y por bit para cada ancho.
+    
+    Args:
+        n_casos: Operaciones aleatorias por ancho
+        semilla: Semilla del generador aleatorio
+    """
+    rng = random.Random(semilla)
+    
+    print(f"Benchmark: escalado con el ancho ({n_casos} operaciones por ancho)")
+    print("=" * 66)
+    print(f"{'Bits':>5} | {'adder µs/op':>12} | {'µs/bit':>7} | "
+          f"{'sum-rest µs/op':>14} | {'µs/bit':>7}")
+    print("-" * 66)
+    
+    for n_bits in ANCHOS:
+        casos = [(entero_a_bits(rng.getrandbits(n_bits), n_bits),
+                  entero_a_bits(rng.getrandbits(n_bits), n_bits),
+                  rng.getrandbits(1))
+                 for _ in range(n_casos)]
+        
+        def sumar():
+            for a, b, _ in casos:
+                adder_nbits(a, b)
+        
+        def sumar_restar():
+            for a, b, op in casos:
+                sumador_restador_nbits(a, b, op)
+        
+        us_suma = min(timeit.repeat(sumar, number=1, repeat=3)) / n_casos * 1e6
+        us_sr = min(timeit.repeat(sumar_restar, number=1, repeat=3)) / n_casos * 1e6
+        
+        print(f"{n_bits:>5} | {us_suma:12.2f} | {us_suma / n_bits:7.3f} | "
+              f"{us_sr:14.2f} | {us_sr / n_bits:7.3f}")
+
+
+if __name__ == "__main__":
+    benchmark_anchos()
@@ -0,0 +1,74 @@
+"""
+Compara las llamadas anidadas con la evaluación del netlist.
+
+Para cada ancho, el sumador-restador se evalúa con las funciones
+anidadas (sumador_restador_4bits / sumador_restador_nbits), con el
+netlist bit a bit (Netlist.evaluar: validación y la función compilada
+del netlist) y con el netlist sobre planos de bits
+(Netlist.evaluar_planos), que evalúa todas las operaciones del lote en
+una pasada.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+import timeit
+
+from src.adder_subtractor import sumador_restador_4bits
+from src.adder_nbits import sumador_restador_nbits
+from src.bitslice import empaquetar, empaquetar_bits, mascara
+from src.netlist import trazar_sumador_restador
+
+
+ANCHOS = [4, 8, 16, 32]
+
+
+def benchmark_netlist(n_casos: int = 2000, repeticiones: int = 5,
+                      semilla: int = 1234):
+    """
+    Mide operaciones por segundo de cada forma de evaluar.
+    
+    Args:
+        n_casos: Operaciones aleatorias por ancho
+        repeticiones: Repeticiones de timeit (se toma el mínimo)
+        semilla: Semilla del generador aleatorio
+    """
+    rng = random.Random(semilla)
+    
+    print("Benchmark: llamadas anidadas frente a netlist")
+    print("=" * 72)
+    print(f"{'Bits':>4} | {'Puertas':>7} | {'Anidado op/s':>13} | "
+          f"{'Netlist op/s':>13} | {'Planos op/s':>13}")
+    print("-" * 72)
+    
+    for n_bits in ANCHOS:
+        red = trazar_sumador_restador(n_bits)
+        anidado = sumador_restador_4bits if n_bits == 4 else sumador_restador_nbits
+        casos = [([rng.getrandbits(1) for _ in range(n_bits)],
+                  [rng.getrandbits(1) for _ in range(n_bits)],
+                  rng.getrandbits(1)) for _ in range(n_casos)]
+        
+        def llamadas():
+            for a, b, op in casos:
+                anidado(a, b, op)
+        
+        def netlist():
+            for a, b, op in casos:
+                red.evaluar(a, b, op)
+        
+        planos = (empaquetar([a for a, _, _ in casos])
+                  + empaquetar([b for _, b, _ in casos])
+                  + [empaquetar_bits([op for _, _, op in casos])])
+        m = mascara(n_casos)
+        
+        tiempos = [min(timeit.repeat(f, number=1, repeat=repeticiones))
+                   for f in (llamadas, netlist,
+                             lambda: red.evaluar_planos(planos, m))]
+        print(f"{n_bits:>4} | {len(red):>7} | "
+              + " | ".join(f"{n_casos / t:13,.0f}" for t in tiempos))
+
+
+if __name__ == "__main__":
+    benchmark_netlist()
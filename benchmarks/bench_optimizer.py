@@ -0,0 +1,76 @@
+"""
+Efecto del optimizador de netlists en la evaluación.
+
+Para cada circuito se cuentan las puertas antes y después de optimizar()
+y se mide la evaluación con Netlist.evaluar y con la función compilada
+de cada versión.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+import timeit
+
+from src.adder_4bit import adder_4bits
+from src.adder_nbits import adder_nbits
+from src.complement import complemento_a_2
+from src.netlist import trazar, trazar_sumador_restador
+from src.compiler import compilar
+from src.optimizer import optimizar
+
+
+def _circuitos(rng, n_casos):
+    """Circuitos a comparar con sus casos de prueba."""
+    def bits(n):
+        return [rng.getrandbits(1) for _ in range(n)]
+
+    return [
+        ("complemento_a_2", trazar(complemento_a_2, [0] * 4),
+         [(bits(4),) for _ in range(n_casos)]),
+        ("adder_4bits (cin = 0)", trazar(adder_4bits, [0] * 4, [0] * 4),
+         [(bits(4), bits(4)) for _ in range(n_casos)]),
+        ("adder_nbits 32 (cin = 0)", trazar(adder_nbits, [0] * 32, [0] * 32),
+         [(bits(32), bits(32)) for _ in range(n_casos)]),
+        ("sumador_restador 32", trazar_sumador_restador(32),
+         [(bits(32), bits(32), rng.getrandbits(1)) for _ in range(n_casos)]),
+    ]
+
+
+def benchmark_optimizador(n_casos: int = 2000, repeticiones: int = 5,
+                          semilla: int = 1234):
+    """
+    Mide operaciones por segundo de cada circuito antes y después.
+    
+    Args:
+        n_casos: Operaciones aleatorias por circuito
+        repeticiones: Repeticiones de timeit (se toma el mínimo)
+        semilla: Semilla del generador aleatorio
+    """
+    rng = random.Random(semilla)
+    
+    print("Benchmark: netlist original frente a optimizado")
+    print("=" * 78)
+    print(f"{'Circuito':<26} | {'Puertas':>9} | {'Netlist op/s':>19} | "
+          f"{'Compilado op/s':>19}")
+    print("-" * 78)
+    
+    for nombre, red, casos in _circuitos(rng, n_casos):
+        optimizada = optimizar(red)
+        medidas = []
+        for version in (red, optimizada):
+            compilada = compilar(version, en_disco=False)
+            for funcion in (version.evaluar, compilada):
+                tiempo = min(timeit.repeat(
+                    lambda: [funcion(*caso) for caso in casos],
+                    number=1, repeat=repeticiones))
+                medidas.append(n_casos / tiempo)
+        
+        print(f"{nombre:<26} | {len(red):>4}->{len(optimizada):<4} | "
+              f"{medidas[0]:>8.0f}->{medidas[2]:<9.0f} | "
+              f"{medidas[1]:>8.0f}->{medidas[3]:<9.0f}")
+
+
+if __name__ == "__main__":
+    benchmark_optimizador()
@@ -0,0 +1,83 @@
+"""
+Actividad de conmutación por planos frente a operación a operación.
+
+Cuenta las conmutaciones de un flujo aleatorio de operaciones con
+actividad() (bloques evaluados por planos de bits) y con una
+evaluación del netlist por operación, y muestra las operaciones por
+segundo de cada forma y el pico de memoria de actividad() para flujos
+de distinta longitud, que no debe crecer con ella.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+import time
+import tracemalloc
+
+from src.netlist import trazar_sumador_restador
+from src.power import actividad
+
+
+def _flujo(n_operaciones: int, n_bits: int, semilla: int):
+    """Generador de operaciones aleatorias."""
+    rng = random.Random(semilla)
+    for _ in range(n_operaciones):
+        yield ([rng.getrandbits(1) for _ in range(n_bits)],
+               [rng.getrandbits(1) for _ in range(n_bits)],
+               rng.getrandbits(1))
+
+
+def _directa(red, operaciones) -> int:
+    """Conmutaciones totales evaluando operación a operación."""
+    total = 0
+    anterior = None
+    for a, b, op in operaciones:
+        valores = red.evaluar_planos(a + b + [op])[:red.n_cables]
+        if anterior is not None:
+            total += sum(x != y for x, y in zip(anterior, valores))
+        anterior = valores
+    return total
+
+
+def benchmark_potencia(n_operaciones: int = 50000, semilla: int = 1234):
+    """
+    Mide la velocidad y la memoria del conteo de conmutaciones.
+
+    Args:
+        n_operaciones: Operaciones del flujo de velocidad
+        semilla: Semilla del generador aleatorio
+    """
+    print("Benchmark: actividad de conmutación")
+    print("=" * 56)
+    print(f"{'Bits':>4} | {'Planos op/s':>12} | {'Directa op/s':>12} | {'Mejora':>7}")
+    print("-" * 56)
+    for n_bits in (4, 16, 64):
+        red = trazar_sumador_restador(n_bits)
+        operaciones = list(_flujo(n_operaciones, n_bits, semilla))
+
+        inicio = time.perf_counter()
+        actividad(red, operaciones)
+        t_planos = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        _directa(red, operaciones)
+        t_directa = time.perf_counter() - inicio
+
+        print(f"{n_bits:>4} | {n_operaciones / t_planos:>12.0f} | "
+              f"{n_operaciones / t_directa:>12.0f} | {t_directa / t_planos:>6.1f}x")
+
+    print(f"\n{'Operaciones':>11} | {'Pico de memoria (KB)':>20}")
+    print("-" * 36)
+    red = trazar_sumador_restador(4)
+    for longitud in (10000, 100000, 1000000):
+        tracemalloc.start()
+        actividad(red, _flujo(longitud, 4, semilla))
+        pico = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"{longitud:>11} | {pico / 1024:>20.0f}")
+
+
+if __name__ == "__main__":
+    benchmark_potencia()
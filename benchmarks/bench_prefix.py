@@ -0,0 +1,69 @@
+"""
+Compara las topologías de prefijos paralelos con ripple y CLA.
+
+Para cada ancho muestra puertas, profundidad, fan-out máximo y tiempo
+por operación en Python, para elegir el compromiso área/profundidad.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+import timeit
+
+from src.adder_nbits import adder_nbits
+from src.carry_lookahead import adder_cla
+from src.prefix_adder import (adder_kogge_stone, adder_brent_kung,
+                              adder_sklansky)
+from src.metrics import medir_sumador
+from src.utils import entero_a_bits
+
+
+ANCHOS = [8, 16, 32, 64]
+
+SUMADORES = [
+    ("ripple", adder_nbits),
+    ("CLA", adder_cla),
+    ("kogge_stone", adder_kogge_stone),
+    ("brent_kung", adder_brent_kung),
+    ("sklansky", adder_sklansky),
+]
+
+
+def benchmark_prefijos(n_casos: int = 50, semilla: int = 1234):
+    """
+    Mide cada sumador en cada ancho.
+    
+    Args:
+        n_casos: Operaciones aleatorias por ancho para medir el tiempo
+        semilla: Semilla del generador aleatorio
+    """
+    rng = random.Random(semilla)
+    
+    print("Benchmark: topologías de sumadores")
+    print("=" * 72)
+    print(f"{'Bits':>4} | {'Sumador':<12} | {'Puertas':>7} | {'Prof.':>5} | "
+          f"{'Fan-out':>7} | {'µs/op':>8}")
+    print("-" * 72)
+    
+    for n_bits in ANCHOS:
+        casos = [(entero_a_bits(rng.getrandbits(n_bits), n_bits),
+                  entero_a_bits(rng.getrandbits(n_bits), n_bits))
+                 for _ in range(n_casos)]
+        
+        for nombre, sumador in SUMADORES:
+            m = medir_sumador(sumador, n_bits)
+            
+            def sumar():
+                for a, b in casos:
+                    sumador(a, b)
+            
+            us = min(timeit.repeat(sumar, number=1, repeat=3)) / n_casos * 1e6
+            print(f"{n_bits:>4} | {nombre:<12} | {m['compuertas']:>7} | "
+                  f"{m['profundidad']:>5} | {m['fanout_maximo']:>7} | {us:8.2f}")
+        print("-" * 72)
+
+
+if __name__ == "__main__":
+    benchmark_prefijos()
@@ -0,0 +1,307 @@
+"""
+Suite de benchmarks de todas las capas, de las puertas al sumador-restador.
+
+Para cada caso (puertas, half_adder, full_adder, adder_4bits, los
+complementos, sumador_restador_4bits con cada motor, bits_a_entero y
+los motores alternativos) mide:
+
+- Operaciones por segundo: el mínimo de varias repeticiones de timeit
+  sobre una lista fija de entradas generada con una semilla.
+- Memoria: con tracemalloc, el pico de memoria temporal al ejecutar la
+  lista una vez y la memoria que queda retenida después (cachés,
+  fugas), ambas en bytes.
+
+Los resultados se pueden guardar en JSON y compararse con una línea
+base guardada antes; la comparación marca como regresión una caída de
+operaciones por segundo o una subida del pico de memoria mayores que el
+umbral, y termina con código 1 si hay alguna.
+
+Uso:
+    python benchmarks/bench_suite.py --json base.json
+    python benchmarks/bench_suite.py --comparar base.json --umbral 0.15
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import json
+import platform
+import random
+import timeit
+import tracemalloc
+
+from src.logic_gates import AND, OR, NOT, XOR
+from src.half_adder import half_adder
+from src.full_adder import full_adder
+from src.adder_4bit import adder_4bits
+from src.complement import complemento_a_1, complemento_a_2
+from src.adder_subtractor import sumador_restador_4bits, MOTORES
+from src.adder_nbits import sumador_restador_nbits
+from src.lookup_table import sumador_restador_tabla
+from src.bitslice import sumador_restador_lote
+from src.bitvector import BitVector
+from src.batch import sumador_restador_4bits_batch, np
+from src.utils import bits_a_entero
+
+
+# Versión del formato del JSON de resultados
+FORMATO = 1
+
+# Una subida de memoria menor que esto no cuenta como regresión (bytes)
+HOLGURA_MEMORIA = 1024
+
+
+def _casos(n_operaciones: int, rng) -> list:
+    """
+    Casos de la suite con sus entradas.
+
+    Args:
+        n_operaciones: Operaciones por caso
+        rng: Generador aleatorio con la semilla de la suite
+
+    Returns:
+        Lista de tuplas (nombre, ejecutar): ejecutar() hace las
+        n_operaciones del caso una vez
+    """
+    def bits(n):
+        return [rng.getrandbits(1) for _ in range(n)]
+
+    pares = [(rng.getrandbits(1), rng.getrandbits(1)) for _ in range(n_operaciones)]
+    ternas = [(a, b, rng.getrandbits(1)) for a, b in pares]
+    nibbles = [bits(4) for _ in range(n_operaciones)]
+    operaciones = [(bits(4), bits(4), rng.getrandbits(1)) for _ in range(n_operaciones)]
+    vectores = [(BitVector(a), BitVector(b), op) for a, b, op in operaciones]
+    a_lote = [a for a, _, _ in operaciones]
+    b_lote = [b for _, b, _ in operaciones]
+    op_lote = [op for _, _, op in operaciones]
+
+    def por_operacion(funcion, entradas):
+        def ejecutar():
+            for args in entradas:
+                funcion(*args)
+        return ejecutar
+
+    casos = [
+        ("AND", por_operacion(AND, pares)),
+        ("OR", por_operacion(OR, pares)),
+        ("NOT", por_operacion(NOT, [(a,) for a, _ in pares])),
+        ("XOR", por_operacion(XOR, pares)),
+        ("half_adder", por_operacion(half_adder, pares)),
+        ("full_adder", por_operacion(full_adder, ternas)),
+        ("adder_4bits", por_operacion(adder_4bits,
+                                      [(a, b, op) for a, b, op in operaciones])),
+        ("complemento_a_1", por_operacion(complemento_a_1, [(n,) for n in nibbles])),
+        ("complemento_a_2", por_operacion(complemento_a_2, [(n,) for n in nibbles])),
+    ]
+    for motor in MOTORES:
+        casos.append((f"sumador_restador_4bits[{motor}]",
+                      por_operacion(sumador_restador_4bits,
+                                    [(a, b, op, motor) for a, b, op in operaciones])))
+    casos += [
+        ("sumador_restador_4bits[BitVector]",
+         por_operacion(sumador_restador_4bits, vectores)),
+        ("sumador_restador_nbits", por_operacion(sumador_restador_nbits, operaciones)),
+        ("sumador_restador_tabla", por_operacion(sumador_restador_tabla, operaciones)),
+        ("sumador_restador_lote",
+         lambda: sumador_restador_lote(a_lote, b_lote, op_lote)),
+        ("bits_a_entero", por_operacion(bits_a_entero,
+                                        [(n, op) for n, (_, _, op)
+                                         in zip(nibbles, operaciones)])),
+    ]
+    if np is not None:
+        a_np = np.array(a_lote, dtype=np.uint8)
+        b_np = np.array(b_lote, dtype=np.uint8)
+        op_np = np.array(op_lote, dtype=np.uint8)
+        casos.append(("sumador_restador_4bits_batch",
+                      lambda: sumador_restador_4bits_batch(a_np, b_np, op_np)))
+    return casos
+
+
+def medir_caso(ejecutar, n_operaciones: int, repeticiones: int) -> dict:
+    """
+    Mide un caso: operaciones por segundo y memoria.
+
+    Args:
+        ejecutar: Función sin argumentos que hace n_operaciones
+        n_operaciones: Operaciones por llamada a ejecutar
+        repeticiones: Repeticiones de timeit (se toma el mínimo)
+
+    Returns:
+        Diccionario con ops_por_segundo, pico_bytes y retenida_bytes
+    """
+    ejecutar()  # Calentar cachés (tabla, motor compilado)
+    tiempo = min(timeit.repeat(ejecutar, number=1, repeat=repeticiones))
+
+    tracemalloc.start()
+    try:
+        antes, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        ejecutar()
+        despues, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "ops_por_segundo": n_operaciones / tiempo,
+        "pico_bytes": pico - antes,
+        "retenida_bytes": despues - antes,
+    }
+
+
+def ejecutar_suite(n_operaciones: int = 1000, repeticiones: int = 5,
+                   semilla: int = 1234, filtro: str = None) -> dict:
+    """
+    Ejecuta todos los casos de la suite.
+
+    Args:
+        n_operaciones: Operaciones por caso
+        repeticiones: Repeticiones de timeit (se toma el mínimo)
+        semilla: Semilla del generador de entradas
+        filtro: Si se da, solo los casos cuyo nombre lo contiene
+
+    Returns:
+        Diccionario serializable en JSON con la configuración y, en
+        "resultados", las medidas de cada caso (ver medir_caso)
+    """
+    rng = random.Random(semilla)
+    resultados = {}
+    for nombre, ejecutar in _casos(n_operaciones, rng):
+        if filtro and filtro not in nombre:
+            continue
+        resultados[nombre] = medir_caso(ejecutar, n_operaciones, repeticiones)
+
+    return {
+        "formato": FORMATO,
+        "python": platform.python_version(),
+        "semilla": semilla,
+        "n_operaciones": n_operaciones,
+        "repeticiones": repeticiones,
+        "resultados": resultados,
+    }
+
+
+def comparar(actual: dict, base: dict, umbral: float = 0.10) -> list:
+    """
+    Compara dos ejecuciones de la suite.
+
+    Args:
+        actual: Resultado de ejecutar_suite
+        base: Resultado guardado de una ejecución anterior
+        umbral: Cambio relativo tolerado (0.10 = 10%)
+
+    Returns:
+        Lista de regresiones; cada una es un diccionario con caso,
+        metrica, base, actual y cambio (relativo, positivo = peor).
+        Los casos que solo están en una de las dos se ignoran.
+
+    Raises:
+        ValueError: Si el formato, la semilla o el número de operaciones
+            no coinciden
+    """
+    for clave in ("formato", "semilla", "n_operaciones"):
+        if base.get(clave) != actual.get(clave):
+            raise ValueError(f"La línea base no es comparable: {clave} "
+                             f"{base.get(clave)} != {actual.get(clave)}")
+
+    regresiones = []
+    for nombre, medidas in actual["resultados"].items():
+        previas = base["resultados"].get(nombre)
+        if previas is None:
+            continue
+
+        caida = 1 - medidas["ops_por_segundo"] / previas["ops_por_segundo"]
+        if caida > umbral:
+            regresiones.append({"caso": nombre, "metrica": "ops_por_segundo",
+                                "base": previas["ops_por_segundo"],
+                                "actual": medidas["ops_por_segundo"],
+                                "cambio": caida})
+
+        subida = medidas["pico_bytes"] - previas["pico_bytes"]
+        if (subida > HOLGURA_MEMORIA
+                and subida > umbral * max(previas["pico_bytes"], 1)):
+            regresiones.append({"caso": nombre, "metrica": "pico_bytes",
+                                "base": previas["pico_bytes"],
+                                "actual": medidas["pico_bytes"],
+                                "cambio": subida / max(previas["pico_bytes"], 1)})
+    return regresiones
+
+
+def mostrar_resultados(datos: dict, base: dict = None):
+    """
+    Imprime los resultados de la suite, con el cambio respecto a una
+    línea base si se da.
+
+    Args:
+        datos: Resultado de ejecutar_suite
+        base: Resultado de una ejecución anterior (opcional)
+    """
+    print(f"Suite de benchmarks ({datos['n_operaciones']} operaciones por caso, "
+          f"semilla {datos['semilla']})")
+    print("=" * 88)
+    print(f"{'Caso':<36} | {'op/s':>10} | {'Pico (B)':>9} | {'Retenida (B)':>12} | "
+          f"{'vs base':>8}")
+    print("-" * 88)
+    for nombre, medidas in datos["resultados"].items():
+        cambio = ""
+        if base and nombre in base["resultados"]:
+            previas = base["resultados"][nombre]
+            relativo = medidas["ops_por_segundo"] / previas["ops_por_segundo"] - 1
+            cambio = f"{relativo:+.1%}"
+        print(f"{nombre:<36} | {medidas['ops_por_segundo']:>10.0f} | "
+              f"{medidas['pico_bytes']:>9} | {medidas['retenida_bytes']:>12} | "
+              f"{cambio:>8}")
+
+
+def main(argumentos=None) -> int:
+    """
+    Punto de entrada de la línea de comandos.
+
+    Returns:
+        0 si no hay regresiones, 1 si las hay
+    """
+    parser = argparse.ArgumentParser(description="Suite de benchmarks del sumador-restador")
+    parser.add_argument("--json", help="Guarda los resultados en este archivo")
+    parser.add_argument("--comparar", metavar="BASE",
+                        help="Compara con los resultados guardados en BASE")
+    parser.add_argument("--umbral", type=float, default=0.10,
+                        help="Cambio relativo tolerado (default: 0.10)")
+    parser.add_argument("--operaciones", type=int, default=1000)
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--semilla", type=int, default=1234)
+    parser.add_argument("--filtro", help="Solo los casos cuyo nombre lo contiene")
+    args = parser.parse_args(argumentos)
+
+    base = None
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as f:
+            base = json.load(f)
+
+    datos = ejecutar_suite(args.operaciones, args.repeticiones,
+                           args.semilla, args.filtro)
+    mostrar_resultados(datos, base)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(datos, f, indent=2, ensure_ascii=False)
+        print(f"\nResultados guardados en {args.json}")
+
+    if base is None:
+        return 0
+    try:
+        regresiones = comparar(datos, base, args.umbral)
+    except ValueError as e:
+        parser.error(str(e))
+    if not regresiones:
+        print(f"\n✓ Sin regresiones (umbral {args.umbral:.0%})")
+        return 0
+    print(f"\n✗ {len(regresiones)} regresiones (umbral {args.umbral:.0%}):")
+    for r in regresiones:
+        print(f"  {r['caso']}: {r['metrica']} {r['base']:.0f} -> "
+              f"{r['actual']:.0f} ({r['cambio']:+.1%} peor)")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
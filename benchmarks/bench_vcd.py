@@ -0,0 +1,83 @@
+"""
+Coste de la exportación VCD.
+
+Mide el tiempo por llamada de sumador_restador_4bits sin grabación,
+después de una grabación (debe ser el mismo: la función original
+vuelve a su sitio) y con grabar_vcd() activo, y los ciclos por segundo
+y el pico de memoria de volcar_sumador_restador() para flujos de
+distinta longitud, que no debe crecer con ella.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+import time
+import timeit
+import tempfile
+import tracemalloc
+
+import src
+from src.vcd import grabar_vcd, volcar_sumador_restador
+
+
+def _flujo(n_operaciones: int, n_bits: int, semilla: int):
+    """Generador de operaciones aleatorias."""
+    rng = random.Random(semilla)
+    for _ in range(n_operaciones):
+        yield ([rng.getrandbits(1) for _ in range(n_bits)],
+               [rng.getrandbits(1) for _ in range(n_bits)],
+               rng.getrandbits(1))
+
+
+def benchmark_vcd(n_llamadas: int = 20000, semilla: int = 1234):
+    """
+    Mide el coste de grabar y el de no grabar.
+
+    Args:
+        n_llamadas: Llamadas por medición
+        semilla: Semilla del generador aleatorio
+    """
+    operaciones = list(_flujo(256, 4, semilla))
+
+    def llamar():
+        for a, b, op in operaciones:
+            src.sumador_restador_4bits(a, b, op)
+
+    repeticiones = max(n_llamadas // len(operaciones), 1)
+    n = repeticiones * len(operaciones)
+    directorio = tempfile.mkdtemp()
+    ruta = os.path.join(directorio, "traza.vcd")
+
+    print("Benchmark: exportación VCD")
+    print("=" * 50)
+    print(f"{'Modo':<22} | {'us/llamada':>10} | {'Relativo':>8}")
+    print("-" * 50)
+    base = min(timeit.repeat(llamar, number=repeticiones, repeat=5)) / n
+    with grabar_vcd(ruta):
+        pass
+    despues = min(timeit.repeat(llamar, number=repeticiones, repeat=5)) / n
+    with grabar_vcd(ruta):
+        grabando = min(timeit.repeat(llamar, number=repeticiones, repeat=5)) / n
+    for nombre, t in (("sin grabar", base), ("tras grabar", despues),
+                      ("grabando", grabando)):
+        print(f"{nombre:<22} | {t * 1e6:>10.2f} | {t / base:>7.2f}x")
+
+    print(f"\n{'Ciclos':>9} | {'Ciclos/s':>10} | {'Pico (KB)':>9} | {'Archivo (KB)':>12}")
+    print("-" * 50)
+    for longitud in (10000, 50000, 200000):
+        tracemalloc.start()
+        inicio = time.perf_counter()
+        volcar_sumador_restador(ruta, _flujo(longitud, 4, semilla))
+        transcurrido = time.perf_counter() - inicio
+        pico = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"{longitud:>9} | {longitud / transcurrido:>10.0f} | {pico / 1024:>9.0f} | "
+              f"{os.path.getsize(ruta) / 1024:>12.0f}")
+    os.remove(ruta)
+    os.rmdir(directorio)
+
+
+if __name__ == "__main__":
+    benchmark_vcd()
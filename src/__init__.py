@@ -11,23 +11,107 @@ Módulos exportados:
 - adder_4bit: Sumador de 4 bits
 - complement: Complemento a 1 y 2
 - adder_subtractor: Sumador-restador principal
+- adder_nbits: Sumador y sumador-restador de ancho configurable
+- carry_lookahead: Sumador con acarreo anticipado (CLA)
+- prefix_adder: Sumadores de prefijos (Kogge-Stone, Brent-Kung, Sklansky)
+- block_adders: Sumadores con selección y salto de acarreo
+- carry_save: Suma de muchos operandos con acarreo guardado
+- bitvector: Vector de bits inmutable validado al construirse
+- netlist: Circuito como lista explícita de puertas, obtenido por traza
+- compiler: Netlist traducido a una función de código lineal (motor "compilado")
+- optimizer: Propagación de constantes, subexpresiones comunes y puertas muertas
+- tech_mapping: Mapeo a bibliotecas de solo NAND o solo NOR con sus costes
+- event_sim: Simulación por eventos con retardos de propagación por puerta
+- timing: Análisis estático de tiempos: llegadas, camino crítico y holgura
+- incremental: Reevaluación de solo las puertas afectadas por un cambio
+- instrumentation: Contadores y tiempos opcionales de puertas y circuitos
+- equivalence: Verificación exhaustiva de equivalencia con varios procesos
+- fault_sim: Simulación de fallas de pegado y cobertura de vectores de prueba
+- atpg: Generación de conjuntos compactos de vectores de prueba
+- power: Actividad de conmutación y estimación de potencia dinámica
+- vcd: Exportación de formas de onda VCD en streaming
+- carry_trace: Traza opcional de la cadena de acarreo del sumador de 4 bits
+- metrics: Número de puertas y profundidad lógica de los circuitos
+- bitslice: Simulación por planos de bits (muchos vectores por puerta)
+- lookup_table: Motor de tabla precalculada
+- batch: Sumador-restador vectorizado con NumPy (opcional)
 - utils: Funciones auxiliares
 """
 
-from .logic_gates import AND, OR, NOT, XOR, NAND
+from .logic_gates import AND, OR, NOT, XOR, NAND, NOR
 from .half_adder import half_adder
 from .full_adder import full_adder
 from .adder_4bit import adder_4bits
 from .complement import complemento_a_1, complemento_a_2
 from .adder_subtractor import sumador_restador_4bits
-from .utils import bits_a_entero, mostrar_operacion, ingresar_bits
+from .adder_nbits import (adder_nbits, complemento_a_1_nbits,
+                          complemento_a_2_nbits, sumador_restador_nbits)
+from .carry_lookahead import adder_cla, cla_4bits
+from .prefix_adder import (adder_prefijos, adder_kogge_stone,
+                           adder_brent_kung, adder_sklansky,
+                           red_prefijos, reportar_topologias)
+from .block_adders import (adder_carry_select, adder_carry_skip,
+                           ajustar_bloques)
+from .carry_save import compresor_3_2, arbol_carry_save, sumar_operandos
+from .bitvector import BitVector
+from .netlist import Netlist, trazar, trazar_sumador_restador
+from .compiler import compilar, compilar_sumador_restador
+from .optimizer import optimizar, reporte_optimizacion
+from .tech_mapping import mapear, mapear_circuito, reporte_tecnologia
+from .event_sim import SimuladorEventos, simulador_sumador_restador
+from .timing import (analizar_tiempos, analizar_sumador,
+                     analizar_sumador_restador)
+from .incremental import EvaluadorIncremental, sumador_restador_incremental
+from .instrumentation import activar, desactivar, reiniciar, instantanea, instrumentar
+from .equivalence import verificar_equivalencia, verificar_sumador
+from .fault_sim import enumerar_fallas, simular_fallas, simular_fallas_sumador
+from .atpg import generar_vectores, generar_vectores_sumador, compactar
+from .power import actividad, actividad_sumador_restador, leer_operaciones
+from .vcd import EscritorVCD, volcar_sumador_restador, grabar_vcd
+from .carry_trace import (TrazaAcarreo, adder_4bits_trazado, sumador_trazado,
+                          sumador_restador_trazado)
+from .metrics import medir_circuito, medir_sumador
+from .bitslice import (empaquetar, desempaquetar, sumador_restador_lote)
+from .lookup_table import (sumador_restador_tabla, construir_tabla,
+                           verificar_tabla)
+from .batch import sumador_restador_4bits_batch
+from .utils import (bits_a_entero, mostrar_operacion, ingresar_bits,
+                    entero_a_bits, bits_a_valor)
 
 __version__ = "1.0.0"
 __author__ = "Tu Nombre"
 __all__ = [
-    "AND", "OR", "NOT", "XOR", "NAND",
+    "AND", "OR", "NOT", "XOR", "NAND", "NOR",
     "half_adder", "full_adder", "adder_4bits",
     "complemento_a_1", "complemento_a_2",
     "sumador_restador_4bits",
-    "bits_a_entero", "mostrar_operacion", "ingresar_bits"
+    "adder_nbits", "complemento_a_1_nbits", "complemento_a_2_nbits",
+    "sumador_restador_nbits",
+    "adder_cla", "cla_4bits",
+    "adder_prefijos", "adder_kogge_stone", "adder_brent_kung",
+    "adder_sklansky", "red_prefijos", "reportar_topologias",
+    "adder_carry_select", "adder_carry_skip", "ajustar_bloques",
+    "compresor_3_2", "arbol_carry_save", "sumar_operandos",
+    "BitVector",
+    "Netlist", "trazar", "trazar_sumador_restador",
+    "compilar", "compilar_sumador_restador",
+    "optimizar", "reporte_optimizacion",
+    "mapear", "mapear_circuito", "reporte_tecnologia",
+    "SimuladorEventos", "simulador_sumador_restador",
+    "analizar_tiempos", "analizar_sumador", "analizar_sumador_restador",
+    "EvaluadorIncremental", "sumador_restador_incremental",
+    "activar", "desactivar", "reiniciar", "instantanea", "instrumentar",
+    "verificar_equivalencia", "verificar_sumador",
+    "enumerar_fallas", "simular_fallas", "simular_fallas_sumador",
+    "generar_vectores", "generar_vectores_sumador", "compactar",
+    "actividad", "actividad_sumador_restador", "leer_operaciones",
+    "EscritorVCD", "volcar_sumador_restador", "grabar_vcd",
+    "TrazaAcarreo", "adder_4bits_trazado", "sumador_trazado",
+    "sumador_restador_trazado",
+    "medir_circuito", "medir_sumador",
+    "empaquetar", "desempaquetar", "sumador_restador_lote",
+    "sumador_restador_tabla", "construir_tabla", "verificar_tabla",
+    "sumador_restador_4bits_batch",
+    "bits_a_entero", "mostrar_operacion", "ingresar_bits",
+    "entero_a_bits", "bits_a_valor"
 ]
\ No newline at end of file
@@ -5,6 +5,7 @@ Conecta 4 sumadores completos en cascada para sumar números de 4 bits.
 """
 
 from .full_adder import full_adder
+from .bitvector import validados
 
 
 def adder_4bits(a_bits: list, b_bits: list, cin: int = 0):
@@ -32,10 +33,12 @@ def adder_4bits(a_bits: list, b_bits: list, cin: int = 0):
     if len(a_bits) != 4 or len(b_bits) != 4:
         raise ValueError("Las listas deben tener exactamente 4 bits")
     
-    # Validar que todos los bits sean 0 o 1
-    for bit in a_bits + b_bits:
-        if bit not in [0, 1]:
-            raise ValueError("Los bits deben ser 0 o 1")
+    # Validar que todos los bits sean 0 o 1 (un BitVector ya viene validado)
+    for bits in (a_bits, b_bits):
+        if not validados(bits):
+            for bit in bits:
+                if bit not in [0, 1]:
+                    raise ValueError("Los bits deben ser 0 o 1")
     
     # Inicializar resultado y acarreo
     resultado = [0, 0, 0, 0]
@@ -0,0 +1,193 @@
+"""
+Sumador, complementos y sumador-restador de ancho configurable.
+
+Generaliza los circuitos de 4 bits a cualquier número de bits (8, 16,
+32, 64...) encadenando sumadores completos. Las listas siguen el mismo
+orden que en el resto del paquete: el MSB primero y el LSB al final.
+"""
+
+from .logic_gates import NOT, XOR
+from .full_adder import full_adder
+from .bitvector import validados
+
+
+def _validar_bits(*operandos: list) -> int:
+    """
+    Valida que los operandos tengan el mismo ancho y solo bits 0 o 1.
+
+    Args:
+        *operandos: Listas de bits a validar
+
+    Returns:
+        El número de bits común a todos los operandos
+
+    Raises:
+        ValueError: Si algún operando está vacío, los anchos no coinciden
+            o hay valores distintos de 0 y 1
+    """
+    n_bits = len(operandos[0])
+    if n_bits == 0:
+        raise ValueError("Las listas deben tener al menos 1 bit")
+
+    for bits in operandos:
+        if len(bits) != n_bits:
+            raise ValueError("Las listas deben tener el mismo número de bits")
+        if validados(bits):
+            continue
+        for bit in bits:
+            if bit not in [0, 1]:
+                raise ValueError("Los bits deben ser 0 o 1")
+
+    return n_bits
+
+
+def adder_nbits(a_bits: list, b_bits: list, cin: int = 0):
+    """
+    Implementa un sumador de N bits con acarreo en cascada (ripple-carry).
+
+    Args:
+        a_bits: Lista de N bits representando el primer número
+        b_bits: Lista de N bits representando el segundo número
+        cin: Acarreo de entrada (default: 0)
+
+    Returns:
+        Tupla (resultado_bits, cout) donde:
+        - resultado_bits: Lista de N bits con el resultado
+        - cout: Acarreo de salida (0 o 1)
+
+    Raises:
+        ValueError: Si las listas están vacías, tienen distinto ancho
+            o contienen bits inválidos
+
+    Examples:
+        >>> adder_nbits([0,0,0,0,0,1,0,1], [0,0,0,0,0,0,1,1])
+        ([0,0,0,0,1,0,0,0], 0)  # 5 + 3 = 8
+    """
+    n_bits = _validar_bits(a_bits, b_bits)
+
+    resultado = [0] * n_bits
+    carry = cin
+
+    # Sumar bit por bit, empezando por el LSB (último índice)
+    for i in range(n_bits - 1, -1, -1):
+        resultado[i], carry = full_adder(a_bits[i], b_bits[i], carry)
+
+    return resultado, carry
+
+
+def complemento_a_1_nbits(bits: list) -> list:
+    """
+    Calcula el complemento a 1 de un número de N bits.
+
+    Args:
+        bits: Lista de N bits
+
+    Returns:
+        Lista de N bits con cada bit invertido
+
+    Examples:
+        >>> complemento_a_1_nbits([0,0,0,0,0,1,0,1])
+        [1,1,1,1,1,0,1,0]
+    """
+    _validar_bits(bits)
+    return [NOT(bit) for bit in bits]
+
+
+def complemento_a_2_nbits(bits: list, sumador=adder_nbits) -> list:
+    """
+    Calcula el complemento a 2 de un número de N bits.
+
+    Args:
+        bits: Lista de N bits
+        sumador: Sumador de N bits a usar (default: adder_nbits),
+            con la interfaz (a_bits, b_bits, cin)
+
+    Returns:
+        Lista de N bits representando el complemento a 2
+
+    Examples:
+        >>> complemento_a_2_nbits([0,0,0,0,0,0,0,1])  # 1
+        [1,1,1,1,1,1,1,1]  # -1 en complemento a 2
+    """
+    comp1 = complemento_a_1_nbits(bits)
+    uno = [0] * (len(bits) - 1) + [1]
+    resultado, _ = sumador(comp1, uno, 0)
+    return resultado
+
+
+def sumador_restador_nbits(a_bits: list, b_bits: list, operacion: int,
+                           sumador=adder_nbits):
+    """
+    Implementa un sumador-restador de N bits.
+
+    Usa el mismo camino fusionado que sumador_restador_4bits: cada bit
+    de B pasa por una XOR con la operación y la operación entra como
+    acarreo inicial, en una sola pasada del sumador.
+
+    Args:
+        a_bits: Lista de N bits representando el primer número
+        b_bits: Lista de N bits representando el segundo número
+        operacion: 0 para suma, 1 para resta
+        sumador: Sumador de N bits a usar (default: adder_nbits),
+            p. ej. adder_cla
+
+    Returns:
+        Tupla (resultado_bits, cout) donde:
+        - resultado_bits: Lista de N bits con el resultado
+        - cout: Acarreo/overflow de salida (en resta, 1 = sin préstamo)
+
+    Raises:
+        ValueError: Si operacion no es 0 o 1 o los bits no son válidos
+
+    Examples:
+        >>> sumador_restador_nbits([0,0,0,0,0,1,1,1], [0,0,0,0,0,0,1,0], 1)
+        ([0,0,0,0,0,1,0,1], 1)  # 7 - 2 = 5
+    """
+    if operacion not in [0, 1]:
+        raise ValueError("La operación debe ser 0 (suma) o 1 (resta)")
+
+    _validar_bits(a_bits, b_bits)
+
+    b_operand = [XOR(bit, operacion) for bit in b_bits]
+    return sumador(a_bits, b_operand, operacion)
+
+
+def prueba_sumador_restador_nbits():
+    """
+    Prueba el sumador-restador con varios anchos.
+    """
+    from .utils import entero_a_bits, bits_a_valor
+
+    print("Prueba del Sumador-Restador de N bits:")
+    print("=" * 70)
+
+    casos_prueba = [
+        # (n_bits, a, b, op)
+        (8, 100, 27, 0),
+        (8, 100, 27, 1),
+        (8, 27, 100, 1),
+        (16, 40000, 25535, 0),
+        (32, 2**31, 2**31, 0),
+        (64, 2**64 - 1, 1, 0),
+    ]
+
+    correctos = 0
+    for n_bits, a, b, op in casos_prueba:
+        resultado, cout = sumador_restador_nbits(
+            entero_a_bits(a, n_bits), entero_a_bits(b, n_bits), op
+        )
+        esperado = (a - b) if op else (a + b)
+        obtenido = bits_a_valor(resultado) + (cout << n_bits) - (op << n_bits)
+        correcto = obtenido == esperado
+        correctos += correcto
+        estado = "✓" if correcto else "✗"
+
+        op_str = "+" if op == 0 else "-"
+        print(f"  [{n_bits:2} bits] {a} {op_str} {b} = "
+              f"{bits_a_valor(resultado)} (cout={cout}) {estado}")
+
+    return correctos == len(casos_prueba)
+
+
+if __name__ == "__main__":
+    prueba_sumador_restador_nbits()
@@ -3,13 +3,37 @@ Implementación del sumador-restador de 4 bits.
 
 Combina un sumador de 4 bits con circuitos de complemento
 para realizar tanto sumas como restas.
+
+El motor por defecto es el camino fusionado de los sumadores-restadores
+reales: cada bit de B pasa por una XOR con la línea de operación y la
+propia operación entra como acarreo inicial, así que A - B = A + NOT(B) + 1
+se calcula en una sola pasada del sumador. El camino de dos pasadas
+(complemento a 2 y después suma) se conserva con fines didácticos.
 """
 
+import inspect
+
+from .logic_gates import XOR
 from .adder_4bit import adder_4bits
 from .complement import complemento_a_2
+from .bitvector import validados
+
+
+# Motores disponibles para evaluar el sumador-restador
+MOTORES = ("fusionado", "dos_pasos", "tabla", "compilado")
+
+# sumador_restador_tabla, importado la primera vez que se usa el motor
+# "tabla" (lookup_table importa este módulo)
+_sumador_tabla = None
 
+# Motor compilado de cada sumador, para no repetir la importación diferida;
+# la clave es siempre una función original de nivel de módulo, nunca una
+# envoltura ni una función local, así que el diccionario no crece sin límite
+_compilados = {}
 
-def sumador_restador_4bits(a_bits: list, b_bits: list, operacion: int):
+
+def sumador_restador_4bits(a_bits: list, b_bits: list, operacion: int,
+                           motor: str = "fusionado", sumador=adder_4bits):
     """
     Implementa un sumador-restador de 4 bits.
     
@@ -17,6 +41,17 @@ def sumador_restador_4bits(a_bits: list, b_bits: list, operacion: int):
         a_bits: Lista de 4 bits representando el primer número
         b_bits: Lista de 4 bits representando el segundo número
         operacion: 0 para suma, 1 para resta
+        motor: Forma de evaluar el circuito:
+            - "fusionado": B XOR operacion con operacion como acarreo
+              de entrada, en una sola pasada del sumador
+            - "dos_pasos": puertas lógicas, complemento a 2 y después suma
+            - "tabla": búsqueda en la tabla precalculada (ver lookup_table)
+            - "compilado": el camino fusionado traducido a una función de
+              código lineal (ver compiler); con un sumador local (una
+              closure como sumador_trazado, que puede guardar estado
+              en cada llamada) se usa el camino fusionado
+        sumador: Sumador de 4 bits usado por los motores de puertas y
+            el compilado (default: adder_4bits), p. ej. cla_4bits
         
     Returns:
         Tupla (resultado_bits, cout) donde:
@@ -24,7 +59,8 @@ def sumador_restador_4bits(a_bits: list, b_bits: list, operacion: int):
         - cout: Acarreo/overflow de salida
         
     Raises:
-        ValueError: Si operacion no es 0 o 1
+        ValueError: Si operacion no es 0 o 1, los bits no son válidos
+            o el motor no existe
         
     Examples:
         >>> sumador_restador_4bits([0,1,0,1], [0,0,1,1], 0)
@@ -39,18 +75,75 @@ def sumador_restador_4bits(a_bits: list, b_bits: list, operacion: int):
     if len(a_bits) != 4 or len(b_bits) != 4:
         raise ValueError("Las listas deben tener exactamente 4 bits")
     
+    if motor == "tabla":
+        if _sumador_tabla is None:
+            _importar_tabla()
+        return _sumador_tabla(a_bits, b_bits, operacion)
+    elif motor not in ("fusionado", "dos_pasos", "compilado"):
+        raise ValueError(f"Motor desconocido: {motor}. Opciones: {MOTORES}")
+    
+    # Validar los bits antes de que NOT o XOR los conviertan en 0/1
+    for bits in (a_bits, b_bits):
+        if not validados(bits):
+            for bit in bits:
+                if bit not in [0, 1]:
+                    raise ValueError("Los bits deben ser 0 o 1")
+    
+    if motor == "compilado":
+        compilado = _compilados.get(sumador)
+        if compilado is None:
+            # Una envoltura (instrumentation, vcd) usa el del sumador que
+            # envuelve: guardarla como clave la mantendría viva al quitarla
+            original = inspect.unwrap(sumador)
+            compilado = _compilados.get(original)
+            if compilado is None and _de_modulo(original):
+                # Importación diferida: el compilador traza este mismo módulo
+                from .compiler import compilar_sumador_restador
+                compilado = _compilados[original] = \
+                    compilar_sumador_restador(4, original)
+        if compilado is not None:
+            return compilado(a_bits, b_bits, operacion)
+    
+    if motor != "dos_pasos":
+        # Camino fusionado (también "compilado" con un sumador local)
+        # Resta: A + (B XOR 1) + 1 = A + complemento_a_2(B), en una pasada
+        b_operand = [XOR(bit, operacion) for bit in b_bits]
+        return sumador(a_bits, b_operand, operacion)
+    
     # Para resta: A - B = A + complemento_a_2(B)
     if operacion == 1:  # Resta
-        b_operand = complemento_a_2(b_bits)
+        b_operand = complemento_a_2(b_bits, sumador)
     else:  # Suma (operacion == 0)
         b_operand = b_bits
     
     # Realizar la suma
-    resultado, cout = adder_4bits(a_bits, b_operand, 0)
+    resultado, cout = sumador(a_bits, b_operand, 0)
     
     return resultado, cout
 
 
+def _de_modulo(funcion) -> bool:
+    """
+    Indica si una función está definida a nivel de módulo.
+
+    Solo esas se compilan: una función local (closure) se crea de nuevo
+    en cada llamada a la función que la define y puede guardar estado
+    en cada operación, que el código compilado no reproduciría.
+    """
+    return "<locals>" not in getattr(funcion, "__qualname__", "<locals>")
+
+
+def _importar_tabla():
+    """
+    Importa el motor de tabla una sola vez, para no ejecutar la
+    importación diferida en cada llamada con motor="tabla".
+    """
+    global _sumador_tabla
+    # Importación diferida: la tabla se construye a partir de este módulo
+    from .lookup_table import sumador_restador_tabla
+    _sumador_tabla = sumador_restador_tabla
+
+
 def prueba_sumador_restador():
     """
     Prueba el sumador-restador con varios casos de prueba.
@@ -0,0 +1,201 @@
+"""
+Generación automática de vectores de prueba compactos.
+
+Probar todas las entradas deja de ser posible en cuanto el sumador se
+ensancha (2^(2N+1) vectores). Para las fallas de pegado (ver
+fault_sim) basta con muchos menos: un sumador ripple de cualquier
+ancho se prueba con una docena de vectores, porque cada sumador
+completo solo necesita ver sus 8 combinaciones de entrada. Este módulo
+busca un conjunto así:
+
+1. Genera candidatos aleatorios por tandas (con semilla fija) y simula
+   las fallas que quedan con toda la tanda a la vez.
+2. De cada tanda elige, de forma voraz, el candidato que detecta más
+   fallas pendientes, lo añade al conjunto y descarta las fallas que
+   detecta (fault dropping); repite mientras algún candidato detecte
+   alguna. La tanda siguiente solo simula las fallas que quedan, así
+   que cada pasada es más barata que la anterior.
+3. Se detiene cuando no quedan fallas o tras varias tandas seguidas sin
+   detectar ninguna (las que queden pueden ser redundantes).
+4. Compactación estática: simula el conjunto en orden inverso y quita
+   los vectores que no detectan ninguna falla que no detecten los
+   posteriores.
+
+El tamaño del conjunto crece muy despacio con el ancho, así que el
+tiempo de verificar un sumador con él se mantiene casi constante.
+"""
+
+import random
+
+from .netlist import trazar, trazar_sumador_restador
+from .fault_sim import enumerar_fallas, simular_fallas
+
+
+def _vector_aleatorio(netlist, rng) -> tuple:
+    """Argumentos aleatorios con la forma de las entradas del netlist."""
+    return tuple([rng.getrandbits(1) for _ in entrada]
+                 if isinstance(entrada, list) else rng.getrandbits(1)
+                 for entrada in netlist.entradas)
+
+
+def compactar(netlist, vectores: list, fallas: list = None) -> list:
+    """
+    Quita los vectores que no aportan cobertura.
+
+    Recorre los vectores del último al primero y conserva cada uno solo
+    si detecta alguna falla que no detecten los ya conservados. La
+    cobertura no cambia.
+
+    Args:
+        netlist: Netlist del circuito
+        vectores: Lista de tuplas de argumentos
+        fallas: Fallas a cubrir (default: enumerar_fallas(netlist))
+
+    Returns:
+        Lista de vectores conservados, en su orden original
+    """
+    if not vectores:
+        return []
+    detectores = simular_fallas(netlist, vectores, fallas)["detectores"]
+    pendientes = {falla: m for falla, m in detectores.items() if m}
+    conservados = []
+    for k in range(len(vectores) - 1, -1, -1):
+        bit = 1 << k
+        detectadas = [falla for falla, m in pendientes.items() if m & bit]
+        if detectadas:
+            conservados.append(k)
+            for falla in detectadas:
+                del pendientes[falla]
+    return [vectores[k] for k in sorted(conservados)]
+
+
+def generar_vectores(netlist, fallas: list = None, semilla: int = 0,
+                     candidatos: int = 64, tandas_sin_progreso: int = 8,
+                     compactado: bool = True) -> dict:
+    """
+    Genera un conjunto compacto de vectores que detecta las fallas.
+
+    Args:
+        netlist: Netlist del circuito, trazado con AND, OR y NOT
+        fallas: Fallas a cubrir (default: enumerar_fallas(netlist))
+        semilla: Semilla del generador de candidatos
+        candidatos: Candidatos aleatorios por tanda
+        tandas_sin_progreso: Tandas seguidas sin detectar ninguna falla
+            tras las que se abandona la búsqueda
+        compactado: Si es True, aplica compactar() al final
+
+    Returns:
+        Diccionario con:
+        - vectores: Lista de tuplas de argumentos
+        - total: Número de fallas
+        - detectadas: Fallas detectadas por los vectores
+        - cobertura: Porcentaje de fallas detectadas
+        - no_detectadas: Fallas que ninguna tanda detectó
+        - tandas: Tandas de candidatos simuladas
+        - simuladas: Suma, sobre las tandas, de las fallas simuladas
+          (sin fault dropping sería tandas * total)
+
+    Raises:
+        ValueError: Si candidatos o tandas_sin_progreso no son positivos
+    """
+    if candidatos < 1 or tandas_sin_progreso < 1:
+        raise ValueError("candidatos y tandas_sin_progreso deben ser positivos")
+    fallas = enumerar_fallas(netlist) if fallas is None else list(fallas)
+    rng = random.Random(semilla)
+
+    pendientes = list(fallas)
+    vectores = []
+    tandas = 0
+    simuladas = 0
+    sin_progreso = 0
+    while pendientes and sin_progreso < tandas_sin_progreso:
+        tanda = [_vector_aleatorio(netlist, rng) for _ in range(candidatos)]
+        detectores = simular_fallas(netlist, tanda, pendientes)["detectores"]
+        tandas += 1
+        simuladas += len(pendientes)
+
+        # Cobertura voraz: el candidato que más fallas pendientes detecta
+        cubiertas = {falla: m for falla, m in detectores.items() if m}
+        sin_progreso = 0 if cubiertas else sin_progreso + 1
+        while cubiertas:
+            cuenta = [0] * candidatos
+            for m in cubiertas.values():
+                while m:
+                    bajo = m & -m
+                    cuenta[bajo.bit_length() - 1] += 1
+                    m ^= bajo
+            mejor = max(range(candidatos), key=cuenta.__getitem__)
+            vectores.append(tanda[mejor])
+            bit = 1 << mejor
+            cubiertas = {falla: m for falla, m in cubiertas.items() if not m & bit}
+
+        pendientes = [falla for falla in pendientes
+                      if not detectores[falla] or falla in cubiertas]
+
+    if compactado:
+        vectores = compactar(netlist, vectores, fallas)
+
+    detectadas = len(fallas) - len(pendientes)
+    return {
+        "vectores": vectores,
+        "total": len(fallas),
+        "detectadas": detectadas,
+        "cobertura": 100.0 * detectadas / len(fallas) if fallas else 100.0,
+        "no_detectadas": pendientes,
+        "tandas": tandas,
+        "simuladas": simuladas,
+    }
+
+
+def generar_vectores_sumador(n_bits: int = 4, sumador=None, restador: bool = True,
+                             **opciones) -> dict:
+    """
+    Vectores de prueba compactos del sumador o del sumador-restador.
+
+    Args:
+        n_bits: Ancho de los operandos (default: 4)
+        sumador: Sumador (a_bits, b_bits, cin); por defecto adder_4bits
+            para 4 bits y adder_nbits para otros anchos
+        restador: Si es True, vectores (a_bits, b_bits, operacion) del
+            sumador-restador; si no, (a_bits, b_bits, cin) del sumador
+        **opciones: Las de generar_vectores
+
+    Returns:
+        Resultado de generar_vectores, más netlist con el circuito
+    """
+    if restador:
+        red = trazar_sumador_restador(n_bits, sumador=sumador)
+    else:
+        from .adder_4bit import adder_4bits
+        from .adder_nbits import adder_nbits
+
+        sumador = sumador or (adder_4bits if n_bits == 4 else adder_nbits)
+        red = trazar(sumador, [0] * n_bits, [0] * n_bits, 0)
+    resultado = generar_vectores(red, **opciones)
+    resultado["netlist"] = red
+    return resultado
+
+
+def prueba_atpg():
+    """
+    Genera vectores para el sumador-restador de varios anchos y muestra
+    cuántos hacen falta para la cobertura completa.
+    """
+    print("Generación de vectores de prueba del sumador-restador:")
+    print("=" * 64)
+    print(f"{'Bits':>4} | {'Fallas':>6} | {'Vectores':>8} | {'Cobertura':>9} | "
+          f"{'Exhaustivo':>10}")
+    print("-" * 64)
+
+    correcto = True
+    for n_bits in (4, 8, 16, 32):
+        r = generar_vectores_sumador(n_bits)
+        correcto &= r["cobertura"] == 100.0
+        print(f"{n_bits:>4} | {r['total']:>6} | {len(r['vectores']):>8} | "
+              f"{r['cobertura']:>8.1f}% | {'2^' + str(2 * n_bits + 1):>10}")
+
+    return correcto
+
+
+if __name__ == "__main__":
+    prueba_atpg()
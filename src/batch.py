@@ -0,0 +1,164 @@
+"""
+Sumador-restador de 4 bits vectorizado con NumPy.
+
+Procesa arreglos completos de operandos en una sola llamada. Los
+resultados se obtienen indexando una copia en NumPy de la tabla
+precalculada (ver lookup_table), que a su vez se construye con el
+circuito de puertas, así que el resultado es idéntico bit a bit al de
+sumador_restador_4bits.
+
+NumPy es una dependencia opcional: el resto del paquete funciona sin
+ella y solo este módulo la requiere al usarse.
+"""
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional
+    np = None
+
+from .lookup_table import obtener_tabla
+
+
+# Tablas en NumPy indexadas por [operacion, a, b]
+_tablas_np = None
+
+
+def _requerir_numpy():
+    """Lanza ImportError si NumPy no está instalado."""
+    if np is None:
+        raise ImportError(
+            "sumador_restador_4bits_batch requiere NumPy (pip install numpy)"
+        )
+
+
+def _obtener_tablas_np():
+    """
+    Convierte la tabla precalculada a arreglos de NumPy.
+
+    Returns:
+        Tupla (resultados, carries) con formas (2, 16, 16, 4) y
+        (2, 16, 16), ambos de tipo uint8
+    """
+    global _tablas_np
+    if _tablas_np is None:
+        resultados = np.zeros((2, 16, 16, 4), dtype=np.uint8)
+        carries = np.zeros((2, 16, 16), dtype=np.uint8)
+        for entrada, (resultado, cout) in obtener_tabla().items():
+            a = entrada[0] * 8 + entrada[1] * 4 + entrada[2] * 2 + entrada[3]
+            b = entrada[4] * 8 + entrada[5] * 4 + entrada[6] * 2 + entrada[7]
+            resultados[entrada[8], a, b] = resultado
+            carries[entrada[8], a, b] = cout
+        _tablas_np = (resultados, carries)
+    return _tablas_np
+
+
+def _a_nibbles(valores, nombre: str):
+    """
+    Normaliza un operando a un arreglo 1-D de nibbles (0 a 15).
+
+    Args:
+        valores: Arreglo 1-D de nibbles o matriz N x 4 de bits (MSB primero)
+        nombre: Nombre del operando para los mensajes de error
+
+    Returns:
+        Arreglo 1-D de tipo intp con valores de 0 a 15
+
+    Raises:
+        ValueError: Si la forma o los valores no son válidos
+    """
+    valores = np.asarray(valores)
+
+    if valores.dtype.kind not in "biu":
+        raise ValueError(f"{nombre} debe contener enteros")
+
+    if valores.ndim == 1:
+        if valores.size and (valores.min() < 0 or valores.max() > 15):
+            raise ValueError(f"Los nibbles de {nombre} deben estar entre 0 y 15")
+        return valores.astype(np.intp)
+
+    if valores.ndim == 2 and valores.shape[1] == 4:
+        if valores.size and (valores.min() < 0 or valores.max() > 1):
+            raise ValueError(f"Los bits de {nombre} deben ser 0 o 1")
+        pesos = np.array([8, 4, 2, 1], dtype=np.intp)
+        return valores.astype(np.intp) @ pesos
+
+    raise ValueError(
+        f"{nombre} debe ser un arreglo de nibbles o una matriz N x 4 de bits"
+    )
+
+
+def sumador_restador_4bits_batch(a, b, op):
+    """
+    Suma o resta arreglos de operandos de 4 bits en una sola llamada.
+
+    Args:
+        a: Arreglo de N nibbles (uint8, 0 a 15) o matriz N x 4 de bits
+           con el MSB primero, igual que las listas de sumador_restador_4bits
+        b: Segundo operando, con el mismo formato que a
+        op: 0 para suma, 1 para resta; un escalar o un arreglo de N valores
+
+    Returns:
+        Tupla (resultado_bits, cout) donde:
+        - resultado_bits: Matriz N x 4 (uint8) con los bits del resultado
+        - cout: Arreglo de N acarreos de salida (uint8)
+
+    Raises:
+        ImportError: Si NumPy no está instalado
+        ValueError: Si las formas o los valores no son válidos
+
+    Examples:
+        >>> r, c = sumador_restador_4bits_batch([5, 7], [3, 2], [0, 1])
+        >>> r.tolist(), c.tolist()
+        ([[1,0,0,0], [0,1,0,1]], [0, 1])  # 5 + 3 = 8, 7 - 2 = 5
+    """
+    _requerir_numpy()
+
+    a_nib = _a_nibbles(a, "a")
+    b_nib = _a_nibbles(b, "b")
+    if a_nib.shape != b_nib.shape:
+        raise ValueError("a y b deben tener el mismo número de operandos")
+
+    op = np.asarray(op)
+    if op.dtype.kind not in "biu":
+        raise ValueError("La operación debe ser 0 (suma) o 1 (resta)")
+    if op.size and (op.min() < 0 or op.max() > 1):
+        raise ValueError("La operación debe ser 0 (suma) o 1 (resta)")
+    if op.ndim > 1 or (op.ndim == 1 and op.shape != a_nib.shape):
+        raise ValueError("op debe ser un escalar o tener un valor por operando")
+
+    resultados, carries = _obtener_tablas_np()
+    op = op.astype(np.intp)
+    return resultados[op, a_nib, b_nib], carries[op, a_nib, b_nib]
+
+
+def prueba_batch():
+    """
+    Compara el modo vectorizado con el escalar en algunos casos.
+    """
+    from .adder_subtractor import sumador_restador_4bits
+
+    print("Prueba del sumador-restador vectorizado:")
+    print("=" * 60)
+
+    a = [5, 7, 2, 8]
+    b = [3, 2, 7, 8]
+    op = [0, 1, 1, 0]
+    resultados, carries = sumador_restador_4bits_batch(a, b, op)
+
+    correctos = 0
+    for i in range(len(a)):
+        a_bits = [(a[i] >> k) & 1 for k in (3, 2, 1, 0)]
+        b_bits = [(b[i] >> k) & 1 for k in (3, 2, 1, 0)]
+        esperado = sumador_restador_4bits(a_bits, b_bits, op[i])
+        obtenido = (resultados[i].tolist(), int(carries[i]))
+        estado = "✓" if obtenido == esperado else "✗"
+        correctos += obtenido == esperado
+        op_str = "+" if op[i] == 0 else "-"
+        print(f"  {a[i]} {op_str} {b[i]} = {obtenido[0]} "
+              f"(cout={obtenido[1]}) {estado}")
+
+    return correctos == len(a)
+
+
+if __name__ == "__main__":
+    prueba_batch()
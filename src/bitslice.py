@@ -0,0 +1,284 @@
+"""
+Simulación por planos de bits (bit-slicing, SWAR).
+
+Las puertas de logic_gates trabajan con un solo bit. Aquí cada cable es
+un entero de Python que lleva el bit de ese cable para muchos vectores
+de prueba a la vez: el bit k del entero corresponde al vector k. Una
+operación bit a bit del entero evalúa la puerta para todos los vectores
+en una sola llamada, y como los enteros de Python no tienen límite de
+tamaño, el número de vectores tampoco lo tiene (64, 4096...).
+
+Los circuitos se construyen igual que los originales (XOR con AND, OR
+y NOT; medio sumador con XOR y AND; sumador completo con dos medios
+sumadores y una OR...), solo cambian las puertas. NOT necesita la
+máscara de vectores válidos para no encender bits por encima del
+último vector.
+
+Para pasar de listas de bits a planos y viceversa se usan empaquetar()
+y desempaquetar(): un operando de N bits por vector se convierte en N
+planos, uno por posición.
+"""
+
+from .adder_nbits import _validar_bits
+
+
+def mascara(n_vectores: int) -> int:
+    """Entero con un 1 en cada posición de vector válida."""
+    return (1 << n_vectores) - 1
+
+
+def AND_planos(a: int, b: int) -> int:
+    """AND de todos los vectores a la vez."""
+    return a & b
+
+
+def OR_planos(a: int, b: int) -> int:
+    """OR de todos los vectores a la vez."""
+    return a | b
+
+
+def NOT_planos(a: int, mascara_vectores: int) -> int:
+    """NOT de todos los vectores a la vez, limitado a la máscara."""
+    return a ^ mascara_vectores
+
+
+def XOR_planos(a: int, b: int, mascara_vectores: int) -> int:
+    """XOR construida con AND, OR y NOT, igual que en logic_gates."""
+    return OR_planos(AND_planos(a, NOT_planos(b, mascara_vectores)),
+                     AND_planos(NOT_planos(a, mascara_vectores), b))
+
+
+def half_adder_planos(a: int, b: int, mascara_vectores: int):
+    """
+    Medio sumador por planos.
+
+    Args:
+        a: Plano del primer bit
+        b: Plano del segundo bit
+        mascara_vectores: Máscara de vectores válidos
+
+    Returns:
+        Tupla (suma, carry) de planos
+    """
+    suma = XOR_planos(a, b, mascara_vectores)
+    carry = AND_planos(a, b)
+    return suma, carry
+
+
+def full_adder_planos(a: int, b: int, cin: int, mascara_vectores: int):
+    """
+    Sumador completo por planos: dos medios sumadores y una OR.
+
+    Args:
+        a: Plano del primer bit
+        b: Plano del segundo bit
+        cin: Plano del acarreo de entrada
+        mascara_vectores: Máscara de vectores válidos
+
+    Returns:
+        Tupla (suma, cout) de planos
+    """
+    suma_temp, carry1 = half_adder_planos(a, b, mascara_vectores)
+    suma, carry2 = half_adder_planos(suma_temp, cin, mascara_vectores)
+    return suma, OR_planos(carry1, carry2)
+
+
+def adder_nbits_planos(a_planos: list, b_planos: list, cin: int,
+                       mascara_vectores: int):
+    """
+    Sumador de N bits con acarreo en cascada, por planos.
+
+    Args:
+        a_planos: N planos del primer operando (MSB primero)
+        b_planos: N planos del segundo operando (MSB primero)
+        cin: Plano del acarreo de entrada (0 o la máscara para un valor
+            constante, o un acarreo distinto por vector)
+        mascara_vectores: Máscara de vectores válidos
+
+    Returns:
+        Tupla (resultado_planos, cout) con N planos y el plano del
+        acarreo de salida
+
+    Raises:
+        ValueError: Si los operandos no tienen el mismo número de planos
+    """
+    n_bits = len(a_planos)
+    if n_bits == 0 or len(b_planos) != n_bits:
+        raise ValueError("Los operandos deben tener el mismo número de planos")
+
+    resultado = [0] * n_bits
+    carry = cin
+    for i in range(n_bits - 1, -1, -1):
+        resultado[i], carry = full_adder_planos(a_planos[i], b_planos[i],
+                                                carry, mascara_vectores)
+    return resultado, carry
+
+
+def adder_4bits_planos(a_planos: list, b_planos: list, cin: int,
+                       mascara_vectores: int):
+    """
+    Sumador de 4 bits por planos, equivalente a adder_4bits.
+
+    Raises:
+        ValueError: Si los operandos no tienen exactamente 4 planos
+    """
+    if len(a_planos) != 4 or len(b_planos) != 4:
+        raise ValueError("Los operandos deben tener exactamente 4 planos")
+    return adder_nbits_planos(a_planos, b_planos, cin, mascara_vectores)
+
+
+def sumador_restador_planos(a_planos: list, b_planos: list, operacion: int,
+                            mascara_vectores: int):
+    """
+    Sumador-restador por planos con el camino fusionado.
+
+    Cada plano de B pasa por una XOR con el plano de la operación, que
+    también entra como acarreo inicial (ver sumador_restador_4bits).
+
+    Args:
+        a_planos: N planos del primer operando (MSB primero)
+        b_planos: N planos del segundo operando (MSB primero)
+        operacion: Plano de la operación: bit k a 1 si el vector k resta
+        mascara_vectores: Máscara de vectores válidos
+
+    Returns:
+        Tupla (resultado_planos, cout) como adder_nbits_planos
+    """
+    b_operand = [XOR_planos(plano, operacion, mascara_vectores)
+                 for plano in b_planos]
+    return adder_nbits_planos(a_planos, b_operand, operacion, mascara_vectores)
+
+
+def empaquetar(vectores: list) -> list:
+    """
+    Convierte K listas de N bits en N planos.
+
+    Args:
+        vectores: Lista de K listas de N bits (MSB primero)
+
+    Returns:
+        Lista de N enteros; el bit k del plano i es vectores[k][i]
+
+    Raises:
+        ValueError: Si no hay vectores o no son válidos
+
+    Examples:
+        >>> empaquetar([[0,1], [1,1], [1,0]])
+        [6, 3]  # 0b110 y 0b011
+    """
+    if not vectores:
+        raise ValueError("Se necesita al menos un vector")
+    _validar_bits(*vectores)
+    # El vector K-1 queda a la izquierda: es el bit más significativo
+    columnas = zip(*reversed(vectores))
+    return [int("".join(map(str, columna)), 2) for columna in columnas]
+
+
+def empaquetar_bits(bits: list) -> int:
+    """
+    Convierte K bits sueltos (uno por vector) en un plano.
+
+    Examples:
+        >>> empaquetar_bits([1, 0, 1, 1])
+        13  # 0b1101
+    """
+    return empaquetar([[bit] for bit in bits])[0]
+
+
+def desempaquetar(planos: list, n_vectores: int) -> list:
+    """
+    Convierte N planos en K listas de N bits; inversa de empaquetar().
+
+    Args:
+        planos: Lista de N planos
+        n_vectores: Número de vectores K
+
+    Returns:
+        Lista de K listas de N bits (MSB primero)
+
+    Examples:
+        >>> desempaquetar([6, 3], 3)
+        [[0,1], [1,1], [1,0]]
+    """
+    columnas = [format(plano, "b").zfill(n_vectores)[::-1] for plano in planos]
+    return [list(map(int, fila)) for fila in zip(*columnas)]
+
+
+def desempaquetar_bits(plano: int, n_vectores: int) -> list:
+    """Convierte un plano en K bits sueltos; inversa de empaquetar_bits()."""
+    return [bits[0] for bits in desempaquetar([plano], n_vectores)]
+
+
+def sumador_restador_lote(a_vectores: list, b_vectores: list,
+                          operaciones) -> list:
+    """
+    Evalúa muchas operaciones de suma/resta con planos de bits.
+
+    Args:
+        a_vectores: Lista de K listas de N bits
+        b_vectores: Lista de K listas de N bits
+        operaciones: Operación común (0 o 1) o lista de K operaciones
+
+    Returns:
+        Lista de K tuplas (resultado_bits, cout), los mismos valores que
+        sumador_restador_4bits (o sumador_restador_nbits) para cada par
+
+    Raises:
+        ValueError: Si los vectores o las operaciones no son válidos
+
+    Examples:
+        >>> sumador_restador_lote([[0,1,1,1], [0,1,0,1]],
+        ...                       [[0,0,1,0], [0,0,1,1]], [1, 0])
+        [([0,1,0,1], 1), ([1,0,0,0], 0)]  # 7 - 2 = 5, 5 + 3 = 8
+    """
+    n_vectores = len(a_vectores)
+    if len(b_vectores) != n_vectores:
+        raise ValueError("Debe haber el mismo número de vectores A y B")
+    if isinstance(operaciones, int):
+        operaciones = [operaciones] * n_vectores
+    if len(operaciones) != n_vectores:
+        raise ValueError("Debe haber una operación por vector")
+    if any(op not in [0, 1] for op in operaciones):
+        raise ValueError("La operación debe ser 0 (suma) o 1 (resta)")
+
+    a_planos = empaquetar(a_vectores)
+    b_planos = empaquetar(b_vectores)
+    if len(a_planos) != len(b_planos):
+        raise ValueError("Las listas deben tener el mismo número de bits")
+
+    resultado, cout = sumador_restador_planos(
+        a_planos, b_planos, empaquetar_bits(operaciones), mascara(n_vectores)
+    )
+    return list(zip(desempaquetar(resultado, n_vectores),
+                    desempaquetar_bits(cout, n_vectores)))
+
+
+def prueba_bitslice():
+    """
+    Evalúa las 512 operaciones de 4 bits en una sola pasada por planos.
+    """
+    from itertools import product
+    from .adder_subtractor import sumador_restador_4bits
+
+    print("Prueba de la simulación por planos de bits:")
+    print("=" * 60)
+
+    casos = list(product(product((0, 1), repeat=4), product((0, 1), repeat=4),
+                         (0, 1)))
+    a_vectores = [list(a) for a, _, _ in casos]
+    b_vectores = [list(b) for _, b, _ in casos]
+    operaciones = [op for _, _, op in casos]
+
+    obtenidos = sumador_restador_lote(a_vectores, b_vectores, operaciones)
+    errores = sum(
+        1 for (a, b, op), obtenido in zip(casos, obtenidos)
+        if obtenido != sumador_restador_4bits(list(a), list(b), op)
+    )
+
+    estado = "✓" if errores == 0 else "✗"
+    print(f"  {len(casos)} operaciones por puerta, {errores} diferencias {estado}")
+    return errores == 0
+
+
+if __name__ == "__main__":
+    prueba_bitslice()
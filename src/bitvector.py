@@ -0,0 +1,195 @@
+"""
+Vector de bits inmutable y compacto.
+
+Los circuitos del paquete reciben listas de bits y las validan en cada
+llamada: comprobar que cada elemento es 0 o 1 cuesta tanto como buena
+parte de la suma en los circuitos pequeños. BitVector se valida una
+sola vez, al construirse, y los circuitos lo reconocen y no vuelven a
+recorrer sus bits.
+
+BitVector es una tupla de bits (MSB primero) sin __dict__: se indexa,
+se recorre y se mide con la misma velocidad que una lista, así que
+cualquier función que acepta una lista de bits acepta también un
+BitVector. int() devuelve su valor sin signo. Los valores pequeños
+(hasta 8 bits) se internan: construir dos veces el mismo valor devuelve
+el mismo objeto, sin nueva reserva de memoria, y su valor se guarda al
+construirlo. Una tupla no admite atributos propios sin __dict__ (que
+casi duplicaría la memoria de un vector ancho), así que el valor de
+los vectores anchos se obtiene de sus bits con una sola conversión en C.
+"""
+
+
+# Anchos cuyos valores se internan
+ANCHO_INTERNADO = 8
+
+# (valor, n_bits) -> BitVector ya construido
+_internados = {}
+
+# id(BitVector internado) -> valor. Los internados no se liberan nunca,
+# así que su id no se reutiliza
+_valores = {}
+
+# Bits (bytes 0 y 1) -> dígitos "0" y "1"
+_DIGITOS = bytes.maketrans(b"\x00\x01", b"01")
+
+# Dígitos "0" y "1" -> bits (bytes 0 y 1), para construir desde repr()
+_BITS = bytes.maketrans(b"01", b"\x00\x01")
+
+
+class BitVector(tuple):
+    """
+    Secuencia inmutable de bits (MSB primero), validada al construirse.
+
+    Args:
+        bits: Secuencia de bits (0 o 1), MSB primero, o cadena de
+            dígitos "0" y "1" como la que muestra repr()
+
+    Raises:
+        ValueError: Si está vacía o algún elemento no es 0 o 1
+
+    Examples:
+        >>> v = BitVector([0,1,0,1])
+        >>> int(v), len(v), v[1], list(v)
+        (5, 4, 1, [0,1,0,1])
+        >>> BitVector('0101') is v
+        True
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, bits):
+        if type(bits) is BitVector:
+            return bits
+        if isinstance(bits, str):
+            if bits.strip("01"):
+                raise ValueError("Los bits deben ser 0 o 1")
+            bits = tuple(bits.encode("ascii").translate(_BITS))
+        else:
+            bits = tuple(bits)
+        if not bits:
+            raise ValueError("Las listas deben tener al menos 1 bit")
+        valor = 0
+        for bit in bits:
+            if bit not in [0, 1]:
+                raise ValueError("Los bits deben ser 0 o 1")
+            # 1.0 o True pasan la comprobación: se normalizan a int
+            valor = (valor << 1) | int(bit)
+
+        vector = _internados.get((valor, len(bits)))
+        if vector is None:
+            vector = super().__new__(cls, map(int, bits))
+            if len(bits) <= ANCHO_INTERNADO:
+                _internados[(valor, len(bits))] = vector
+                _valores[id(vector)] = valor
+        return vector
+
+    @classmethod
+    def desde_entero(cls, valor: int, n_bits: int) -> "BitVector":
+        """
+        Construye un BitVector a partir de un entero sin signo.
+
+        Args:
+            valor: Entero entre 0 y 2**n_bits - 1
+            n_bits: Número de bits
+
+        Returns:
+            El BitVector (internado si n_bits <= ANCHO_INTERNADO)
+
+        Raises:
+            ValueError: Si el valor no cabe en n_bits bits
+
+        Examples:
+            >>> BitVector.desde_entero(5, 4)
+            BitVector('0101')
+        """
+        vector = _internados.get((valor, n_bits))
+        if vector is not None:
+            return vector
+
+        if n_bits < 1:
+            raise ValueError("El número de bits debe ser al menos 1")
+        if not 0 <= valor < (1 << n_bits):
+            raise ValueError(f"{valor} no cabe en {n_bits} bits")
+
+        vector = super().__new__(cls, map(int, format(valor, "b").zfill(n_bits)))
+        if n_bits <= ANCHO_INTERNADO:
+            _internados[(valor, n_bits)] = vector
+            _valores[id(vector)] = valor
+        return vector
+
+    def __int__(self) -> int:
+        valor = _valores.get(id(self))
+        if valor is None:
+            valor = int(bytes(self).translate(_DIGITOS), 2)
+        return valor
+
+    def __add__(self, otro):
+        """
+        Concatena: con otro BitVector da un BitVector, con una lista una
+        lista y con una tupla una tupla.
+        """
+        if type(otro) is BitVector:
+            return BitVector(tuple(self) + otro)
+        if isinstance(otro, list):
+            return list(self) + otro
+        if isinstance(otro, tuple):
+            return tuple(self) + otro
+        return NotImplemented
+
+    def __radd__(self, otro):
+        if isinstance(otro, list):
+            return otro + list(self)
+        if isinstance(otro, tuple):
+            return otro + tuple(self)
+        return NotImplemented
+
+    def __eq__(self, otro):
+        if isinstance(otro, list):
+            return list(self) == otro
+        return tuple.__eq__(self, otro)
+
+    def __ne__(self, otro):
+        return not self == otro
+
+    __hash__ = tuple.__hash__
+
+    def __repr__(self):
+        return f"BitVector('{''.join(map(str, self))}')"
+
+
+def validados(*operandos) -> bool:
+    """
+    Indica si todos los operandos son BitVector, ya validados.
+
+    Los circuitos lo usan para no volver a comprobar bit a bit lo que
+    BitVector comprobó al construirse.
+    """
+    for operando in operandos:
+        if type(operando) is not BitVector:
+            return False
+    return True
+
+
+def prueba_bitvector():
+    """
+    Muestra el uso de BitVector con los circuitos del paquete.
+    """
+    from .adder_subtractor import sumador_restador_4bits
+
+    print("Prueba de BitVector:")
+    print("=" * 60)
+
+    a = BitVector([0, 1, 1, 1])
+    b = BitVector.desde_entero(2, 4)
+    print(f"  a = {a} ({int(a)}), b = {b} ({int(b)})")
+    print(f"  Internado: BitVector([0,0,1,0]) is b -> {BitVector([0,0,1,0]) is b}")
+
+    resultado, cout = sumador_restador_4bits(a, b, 1)
+    print(f"  a - b = {resultado} (cout={cout})")
+    correcto = resultado == [0, 1, 0, 1] and cout == 1
+    print(f"  {'✓' if correcto else '✗'}")
+    return correcto
+
+
+if __name__ == "__main__":
+    prueba_bitvector()
@@ -0,0 +1,288 @@
+"""
+Sumadores por bloques: selección de acarreo y salto de acarreo.
+
+Ambos dividen los operandos en bloques de sumadores en cascada
+(adder_nbits) y aceleran el paso del acarreo entre bloques:
+
+- Selección de acarreo (carry-select): cada bloque, salvo el primero,
+  se calcula dos veces, suponiendo acarreo de entrada 0 y 1. Cuando
+  llega el acarreo real, un multiplexor elige el resultado correcto.
+- Salto de acarreo (carry-skip): si todos los bits de un bloque
+  propagan (A XOR B = 1), el acarreo de entrada salta directamente a
+  la salida del bloque sin recorrer la cadena interna.
+
+El tamaño de bloque decide el compromiso entre la cadena interna y la
+cadena entre bloques; ajustar_bloques() lo elige midiendo el retardo
+de cada configuración.
+
+El retardo del salto de acarreo se mide con profundidad sensibilizada
+(ver metrics): el camino topológico más largo, que atraviesa la cadena
+interna de todos los bloques, es un camino falso.
+"""
+
+from .logic_gates import AND, OR, NOT, XOR
+from .adder_nbits import adder_nbits, _validar_bits
+from .carry_lookahead import _and_arbol
+
+
+TIPOS = ("seleccion", "salto")
+
+
+def _particion(n_bits: int, bloques) -> list:
+    """
+    Devuelve el tamaño de cada bloque, empezando por el LSB.
+
+    Args:
+        n_bits: Ancho total
+        bloques: Tamaño uniforme (int) o lista de tamaños desde el LSB
+
+    Returns:
+        Lista de tamaños que suman n_bits
+
+    Raises:
+        ValueError: Si los tamaños no son positivos o no suman n_bits
+    """
+    if isinstance(bloques, int):
+        if bloques < 1:
+            raise ValueError("El tamaño de bloque debe ser al menos 1")
+        tamanos = [bloques] * (n_bits // bloques)
+        if n_bits % bloques:
+            tamanos.append(n_bits % bloques)
+        return tamanos
+
+    tamanos = list(bloques)
+    if any(k < 1 for k in tamanos) or sum(tamanos) != n_bits:
+        raise ValueError(f"Los bloques {tamanos} no suman {n_bits} bits")
+    return tamanos
+
+
+def _mux(sel: int, no_sel: int, si_0: int, si_1: int) -> int:
+    """Multiplexor 2:1: si_1 cuando sel = 1, si_0 cuando sel = 0."""
+    return OR(AND(si_1, sel), AND(si_0, no_sel))
+
+
+def _dividir(a_bits: list, b_bits: list, tamanos: list):
+    """Genera los pares de bloques (MSB primero), empezando por el LSB."""
+    fin = len(a_bits)
+    for k in tamanos:
+        yield a_bits[fin - k:fin], b_bits[fin - k:fin]
+        fin -= k
+
+
+def adder_carry_select(a_bits: list, b_bits: list, cin: int = 0,
+                       bloques=4):
+    """
+    Implementa un sumador con selección de acarreo.
+
+    Args:
+        a_bits: Lista de N bits representando el primer número
+        b_bits: Lista de N bits representando el segundo número
+        cin: Acarreo de entrada (default: 0)
+        bloques: Tamaño uniforme de bloque o lista de tamaños desde el
+            LSB (default: 4)
+
+    Returns:
+        Tupla (resultado_bits, cout), igual que adder_nbits
+
+    Raises:
+        ValueError: Si las entradas o los bloques no son válidos
+
+    Examples:
+        >>> adder_carry_select([0,1,0,1,0,1,0,1], [0,0,1,1,0,0,1,1])
+        ([1,0,0,0,1,0,0,0], 0)  # 85 + 51 = 136
+    """
+    n_bits = _validar_bits(a_bits, b_bits)
+    tamanos = _particion(n_bits, bloques)
+
+    resultado = []
+    carry = cin
+    for indice, (a_bloque, b_bloque) in enumerate(_dividir(a_bits, b_bits,
+                                                           tamanos)):
+        if indice == 0:
+            suma, carry = adder_nbits(a_bloque, b_bloque, carry)
+        else:
+            suma_0, cout_0 = adder_nbits(a_bloque, b_bloque, 0)
+            suma_1, cout_1 = adder_nbits(a_bloque, b_bloque, 1)
+            no_carry = NOT(carry)
+            suma = [_mux(carry, no_carry, s0, s1)
+                    for s0, s1 in zip(suma_0, suma_1)]
+            # cout_1 >= cout_0, así que basta con cout_0 + carry·cout_1
+            carry = OR(cout_0, AND(cout_1, carry))
+        resultado = suma + resultado
+
+    return resultado, carry
+
+
+def adder_carry_skip(a_bits: list, b_bits: list, cin: int = 0, bloques=4):
+    """
+    Implementa un sumador con salto de acarreo.
+
+    Args:
+        a_bits: Lista de N bits representando el primer número
+        b_bits: Lista de N bits representando el segundo número
+        cin: Acarreo de entrada (default: 0)
+        bloques: Tamaño uniforme de bloque o lista de tamaños desde el
+            LSB (default: 4)
+
+    Returns:
+        Tupla (resultado_bits, cout), igual que adder_nbits
+
+    Raises:
+        ValueError: Si las entradas o los bloques no son válidos
+
+    Examples:
+        >>> adder_carry_skip([0,1,0,1,0,1,0,1], [0,0,1,1,0,0,1,1])
+        ([1,0,0,0,1,0,0,0], 0)  # 85 + 51 = 136
+    """
+    n_bits = _validar_bits(a_bits, b_bits)
+    tamanos = _particion(n_bits, bloques)
+
+    resultado = []
+    carry = cin
+    for a_bloque, b_bloque in _dividir(a_bits, b_bits, tamanos):
+        suma, cout_cadena = adder_nbits(a_bloque, b_bloque, carry)
+        propaga = _and_arbol([XOR(a, b) for a, b in zip(a_bloque, b_bloque)])
+        # Si todo el bloque propaga, el acarreo de entrada salta al final
+        carry = _mux(propaga, NOT(propaga), cout_cadena, carry)
+        resultado = suma + resultado
+
+    return resultado, carry
+
+
+def _vectores_peor_caso(n_bits: int) -> list:
+    """
+    Vectores que generan un acarreo y lo propagan hasta el MSB.
+
+    Para cada posición s, el bit s genera (o anula) el acarreo y todos
+    los bits por encima propagan; se añaden los casos en que propaga el
+    acarreo de entrada. Son los vectores que recorren las cadenas de
+    acarreo más largas.
+
+    Returns:
+        Lista de tuplas (a_bits, b_bits, cin)
+    """
+    vectores = [([1] * n_bits, [0] * n_bits, cin) for cin in (0, 1)]
+    for s in range(n_bits):
+        # Posición s contada desde el LSB; las listas van MSB primero
+        for bit_s in (0, 1):
+            a = [1] * (n_bits - s - 1) + [bit_s] + [0] * s
+            b = [0] * (n_bits - s - 1) + [bit_s] + [0] * s
+            for cin in (0, 1):
+                vectores.append((a, b, cin))
+    return vectores
+
+
+def medir_configuracion(tipo: str, n_bits: int, bloques) -> dict:
+    """
+    Mide un sumador por bloques con una configuración concreta.
+
+    Args:
+        tipo: "seleccion" o "salto"
+        n_bits: Ancho de los operandos
+        bloques: Tamaño uniforme o lista de tamaños desde el LSB
+
+    Returns:
+        Diccionario con:
+        - bloques: Lista de tamaños desde el LSB
+        - compuertas: Número de puertas primitivas
+        - profundidad: Profundidad topológica (incluye caminos falsos)
+        - retardo: Mayor profundidad sensibilizada de los vectores de
+          peor caso, el criterio usado para elegir configuración
+
+    Raises:
+        ValueError: Si el tipo no existe
+    """
+    from .metrics import medir_circuito
+
+    if tipo == "seleccion":
+        sumador = adder_carry_select
+    elif tipo == "salto":
+        sumador = adder_carry_skip
+    else:
+        raise ValueError(f"Tipo desconocido: {tipo}. Opciones: {TIPOS}")
+
+    tamanos = _particion(n_bits, bloques)
+
+    def circuito(a, b, cin):
+        return sumador(a, b, cin, tamanos)
+
+    estatica = medir_circuito(circuito, [0] * n_bits, [0] * n_bits, 0)
+    retardo = max(
+        medir_circuito(circuito, a, b, cin, sensibilizado=True)["profundidad"]
+        for a, b, cin in _vectores_peor_caso(n_bits)
+    )
+
+    return {
+        "bloques": tamanos,
+        "compuertas": estatica["compuertas"],
+        "profundidad": estatica["profundidad"],
+        "retardo": retardo,
+    }
+
+
+def ajustar_bloques(tipo: str, n_bits: int, candidatos: list = None) -> list:
+    """
+    Barre tamaños de bloque y ordena las configuraciones por retardo.
+
+    Args:
+        tipo: "seleccion" o "salto"
+        n_bits: Ancho de los operandos
+        candidatos: Configuraciones a probar (tamaños uniformes o listas
+            de tamaños). Por defecto, todos los tamaños uniformes de 1 a
+            n_bits y, para selección, bloques crecientes (k, k+1, ...)
+
+    Returns:
+        Lista de diccionarios de medir_configuracion ordenada por
+        (retardo, compuertas); el primero es la mejor configuración
+
+    Examples:
+        >>> ajustar_bloques("salto", 16)[0]["bloques"]
+        [3, 3, 3, 3, 3, 1]
+    """
+    if candidatos is None:
+        candidatos = list(range(1, n_bits + 1))
+        if tipo == "seleccion":
+            for inicial in range(1, n_bits):
+                crecientes = []
+                k = inicial
+                while sum(crecientes) + k < n_bits:
+                    crecientes.append(k)
+                    k += 1
+                crecientes.append(n_bits - sum(crecientes))
+                candidatos.append(crecientes)
+
+    resultados = []
+    vistos = set()
+    for bloques in candidatos:
+        tamanos = tuple(_particion(n_bits, bloques))
+        if tamanos in vistos:
+            continue
+        vistos.add(tamanos)
+        resultados.append(medir_configuracion(tipo, n_bits, list(tamanos)))
+
+    resultados.sort(key=lambda r: (r["retardo"], r["compuertas"]))
+    return resultados
+
+
+def prueba_bloques():
+    """
+    Muestra la mejor configuración de cada tipo para varios anchos.
+    """
+    print("Ajuste de tamaño de bloque:")
+    print("=" * 72)
+    print(f"{'Bits':>4} | {'Tipo':<9} | {'Retardo':>7} | {'Prof.':>5} | "
+          f"{'Puertas':>7} | Bloques (desde el LSB)")
+    print("-" * 72)
+
+    for n_bits in (8, 16):
+        for tipo in TIPOS:
+            mejor = ajustar_bloques(tipo, n_bits)[0]
+            print(f"{n_bits:>4} | {tipo:<9} | {mejor['retardo']:>7} | "
+                  f"{mejor['profundidad']:>5} | {mejor['compuertas']:>7} | "
+                  f"{mejor['bloques']}")
+
+    return True
+
+
+if __name__ == "__main__":
+    prueba_bloques()
@@ -0,0 +1,241 @@
+"""
+Implementación de un sumador con acarreo anticipado (Carry-Lookahead).
+
+En lugar de esperar a que el acarreo recorra la cadena de sumadores
+completos, cada bit calcula dos señales:
+- Generar:   g = A AND B   (el bit produce acarreo por sí mismo)
+- Propagar:  p = A XOR B   (el bit deja pasar el acarreo que recibe)
+
+Con ellas, el acarreo de cada posición se obtiene directamente:
+
+    c1 = g0 + p0·c0
+    c2 = g1 + p1·g0 + p1·p0·c0
+    c3 = g2 + p2·g1 + p2·p1·g0 + p2·p1·p0·c0
+
+Los bits se agrupan en bloques de 4 que exponen un generar (G) y un
+propagar (P) de grupo. Los bloques se combinan con la misma lógica de
+anticipación, de forma jerárquica, así que la profundidad crece con el
+logaritmo del ancho en lugar de linealmente.
+"""
+
+from .logic_gates import AND, OR, XOR
+from .adder_nbits import _validar_bits
+
+
+# Bits por bloque de anticipación
+TAMANO_BLOQUE = 4
+
+
+def _and_arbol(senales: list) -> int:
+    """AND de varias señales como árbol balanceado de puertas de 2 entradas."""
+    while len(senales) > 1:
+        siguiente = [AND(senales[i], senales[i + 1])
+                     for i in range(0, len(senales) - 1, 2)]
+        if len(senales) % 2:
+            siguiente.append(senales[-1])
+        senales = siguiente
+    return senales[0]
+
+
+def _or_arbol(senales: list) -> int:
+    """OR de varias señales como árbol balanceado de puertas de 2 entradas."""
+    while len(senales) > 1:
+        siguiente = [OR(senales[i], senales[i + 1])
+                     for i in range(0, len(senales) - 1, 2)]
+        if len(senales) % 2:
+            siguiente.append(senales[-1])
+        senales = siguiente
+    return senales[0]
+
+
+def _anticipar(g: list, p: list, c0=None) -> int:
+    """
+    Calcula el acarreo de salida de un grupo de bits.
+
+    Implementa g[n-1] + p[n-1]·g[n-2] + ... + p[n-1]···p[0]·c0.
+
+    Args:
+        g: Señales generar del grupo (LSB primero)
+        p: Señales propagar del grupo (LSB primero)
+        c0: Acarreo de entrada; None para obtener el generar de grupo
+
+    Returns:
+        El acarreo de salida (o el generar de grupo si c0 es None)
+    """
+    n = len(g)
+    terminos = []
+    for i in range(n - 1, -1, -1):
+        terminos.append(_and_arbol(p[i + 1:n] + [g[i]]))
+    if c0 is not None:
+        terminos.append(_and_arbol(p + [c0]))
+    return _or_arbol(terminos)
+
+
+def _acarreos_bloque(g: list, p: list, cin: int) -> list:
+    """Acarreo de entrada de cada bit de un bloque (LSB primero)."""
+    return [cin] + [_anticipar(g[:i], p[:i], cin) for i in range(1, len(g))]
+
+
+def _gp_grupo(g: list, p: list):
+    """Generar (G) y propagar (P) de un grupo de bits."""
+    return _anticipar(g, p), _and_arbol(p)
+
+
+def bloque_cla(g: list, p: list, cin: int):
+    """
+    Bloque de anticipación de hasta 4 bits.
+
+    Args:
+        g: Señales generar del bloque (LSB primero)
+        p: Señales propagar del bloque (LSB primero)
+        cin: Acarreo de entrada del bloque
+
+    Returns:
+        Tupla (acarreos, G, P) donde:
+        - acarreos: Acarreo de entrada de cada bit (LSB primero)
+        - G: Generar de grupo
+        - P: Propagar de grupo
+    """
+    grupo_g, grupo_p = _gp_grupo(g, p)
+    return _acarreos_bloque(g, p, cin), grupo_g, grupo_p
+
+
+def _acarreos(g: list, p: list, cin: int):
+    """
+    Calcula los acarreos de todas las posiciones de forma jerárquica.
+
+    Args:
+        g: Señales generar (LSB primero)
+        p: Señales propagar (LSB primero)
+        cin: Acarreo de entrada
+
+    Returns:
+        Tupla (acarreos, cout) con el acarreo de entrada de cada bit
+        (LSB primero) y el acarreo de salida
+    """
+    n = len(g)
+    if n <= TAMANO_BLOQUE:
+        acarreos, grupo_g, grupo_p = bloque_cla(g, p, cin)
+        return acarreos, OR(grupo_g, AND(grupo_p, cin))
+
+    # Generar y propagar de cada bloque, independientes del acarreo
+    inicios = range(0, n, TAMANO_BLOQUE)
+    grupos_g = []
+    grupos_p = []
+    for k in inicios:
+        grupo_g, grupo_p = _gp_grupo(g[k:k + TAMANO_BLOQUE],
+                                     p[k:k + TAMANO_BLOQUE])
+        grupos_g.append(grupo_g)
+        grupos_p.append(grupo_p)
+
+    # Siguiente nivel: acarreo de entrada de cada bloque
+    acarreos_grupo, cout = _acarreos(grupos_g, grupos_p, cin)
+
+    # Acarreos internos de cada bloque a partir de su acarreo de entrada
+    acarreos = []
+    for k, c_grupo in zip(inicios, acarreos_grupo):
+        acarreos.extend(_acarreos_bloque(g[k:k + TAMANO_BLOQUE],
+                                         p[k:k + TAMANO_BLOQUE], c_grupo))
+
+    return acarreos, cout
+
+
+def adder_cla(a_bits: list, b_bits: list, cin: int = 0):
+    """
+    Implementa un sumador con acarreo anticipado de N bits.
+
+    Args:
+        a_bits: Lista de N bits representando el primer número
+        b_bits: Lista de N bits representando el segundo número
+        cin: Acarreo de entrada (default: 0)
+
+    Returns:
+        Tupla (resultado_bits, cout), igual que adder_nbits
+
+    Raises:
+        ValueError: Si las listas están vacías, tienen distinto ancho
+            o contienen bits inválidos
+
+    Examples:
+        >>> adder_cla([0,0,0,0,0,1,0,1], [0,0,0,0,0,0,1,1])
+        ([0,0,0,0,1,0,0,0], 0)  # 5 + 3 = 8
+    """
+    n_bits = _validar_bits(a_bits, b_bits)
+
+    # Pasar a LSB primero para indexar por posición
+    a = a_bits[::-1]
+    b = b_bits[::-1]
+    g = [AND(a[i], b[i]) for i in range(n_bits)]
+    p = [XOR(a[i], b[i]) for i in range(n_bits)]
+
+    acarreos, cout = _acarreos(g, p, cin)
+
+    resultado = [XOR(p[i], acarreos[i]) for i in range(n_bits)]
+    return resultado[::-1], cout
+
+
+def cla_4bits(a_bits: list, b_bits: list, cin: int = 0):
+    """
+    Sumador de 4 bits con acarreo anticipado.
+
+    Sustituto directo de adder_4bits: misma interfaz, validación y
+    resultados, así que puede pasarse como sumador a complemento_a_2
+    o a sumador_restador_4bits.
+
+    Args:
+        a_bits: Lista de 4 bits representando el primer número
+        b_bits: Lista de 4 bits representando el segundo número
+        cin: Acarreo de entrada (default: 0)
+
+    Returns:
+        Tupla (resultado_bits, cout) igual que adder_4bits
+
+    Raises:
+        ValueError: Si las listas no tienen exactamente 4 bits
+
+    Examples:
+        >>> cla_4bits([0,1,0,1], [0,0,1,1])
+        ([1,0,0,0], 0)  # 5 + 3 = 8
+    """
+    if len(a_bits) != 4 or len(b_bits) != 4:
+        raise ValueError("Las listas deben tener exactamente 4 bits")
+    return adder_cla(a_bits, b_bits, cin)
+
+
+def prueba_cla():
+    """
+    Compara el sumador con acarreo anticipado con el de acarreo en cascada.
+    """
+    from .adder_4bit import adder_4bits
+    from .metrics import medir_sumador
+    from .adder_nbits import adder_nbits
+
+    print("Prueba del sumador con acarreo anticipado (CLA):")
+    print("=" * 60)
+
+    casos_prueba = [
+        ([0,0,0,0], [0,0,0,0], "0 + 0"),
+        ([0,1,0,1], [0,0,1,1], "5 + 3"),
+        ([1,0,0,0], [1,0,0,0], "8 + 8"),
+        ([1,1,1,1], [0,0,0,1], "15 + 1"),
+    ]
+
+    for a, b, desc in casos_prueba:
+        esperado = adder_4bits(a, b)
+        obtenido = cla_4bits(a, b)
+        estado = "✓" if obtenido == esperado else "✗"
+        print(f"  {desc}: {obtenido[0]} (cout={obtenido[1]}) {estado}")
+
+    print("\nProfundidad lógica (puertas en el camino crítico):")
+    print(f"{'Bits':>5} | {'Ripple':>7} | {'CLA':>5}")
+    print("-" * 25)
+    for n_bits in (4, 8, 16, 32):
+        ripple = medir_sumador(adder_nbits, n_bits)["profundidad"]
+        cla = medir_sumador(adder_cla, n_bits)["profundidad"]
+        print(f"{n_bits:>5} | {ripple:>7} | {cla:>5}")
+
+    return True
+
+
+if __name__ == "__main__":
+    prueba_cla()
@@ -0,0 +1,181 @@
+"""
+Suma de muchos operandos con sumadores de acarreo guardado (carry-save).
+
+Sumar K números con un sumador normal obliga a propagar el acarreo por
+todo el ancho K - 1 veces. Un compresor 3:2 (una fila de sumadores
+completos sin conexión entre ellos) reduce tres números a dos, la suma
+parcial y los acarreos desplazados una posición, sin propagar nada:
+
+    x + y + z = suma + acarreo
+
+Encadenando compresores, K operandos se reducen a dos vectores y solo
+la suma final propaga el acarreo. El acumulador (sumar_operandos)
+consume los operandos de uno en uno, así que acepta cualquier iterable
+o generador sin guardarlo en memoria; arbol_carry_save() reduce una
+lista en forma de árbol (Wallace), con profundidad logarítmica en K.
+
+El ancho crece lo justo para que la suma de todos los operandos quepa
+sin desbordamiento.
+"""
+
+from .full_adder import full_adder
+from .adder_nbits import adder_nbits, _validar_bits
+
+
+def compresor_3_2(x_bits: list, y_bits: list, z_bits: list):
+    """
+    Reduce tres números a dos con una fila de sumadores completos.
+
+    Args:
+        x_bits: Lista de N bits
+        y_bits: Lista de N bits
+        z_bits: Lista de N bits
+
+    Returns:
+        Tupla (suma, acarreo) de N bits cada una, con
+        suma + acarreo = x + y + z (módulo 2**N). El acarreo que sale
+        del MSB se descarta, así que el ancho debe dejar margen
+
+    Examples:
+        >>> compresor_3_2([0,0,1,1], [0,1,0,1], [0,1,1,0])
+        ([0,0,0,0], [1,1,1,0])  # 3 + 5 + 6 = 0 + 14
+    """
+    n_bits = len(x_bits)
+    suma = [0] * n_bits
+    acarreo = [0] * n_bits
+
+    # Cada columna es independiente: no hay cadena de acarreo
+    for i in range(n_bits):
+        suma[i], cout = full_adder(x_bits[i], y_bits[i], z_bits[i])
+        if i > 0:
+            acarreo[i - 1] = cout
+
+    return suma, acarreo
+
+
+def _extender(bits: list, ancho: int) -> list:
+    """Extiende con ceros por la izquierda hasta el ancho dado."""
+    return [0] * (ancho - len(bits)) + bits
+
+
+def _ancho_suma(n_bits: int, k_operandos: int) -> int:
+    """Bits necesarios para sumar k operandos de n bits sin desbordar."""
+    return max(n_bits, (k_operandos * ((1 << n_bits) - 1)).bit_length())
+
+
+def arbol_carry_save(operandos: list):
+    """
+    Reduce una lista de operandos a dos vectores con un árbol de Wallace.
+
+    En cada nivel los operandos se agrupan de tres en tres y cada grupo
+    pasa por un compresor 3:2; los que sobran pasan al nivel siguiente.
+
+    Args:
+        operandos: Lista de K listas de N bits
+
+    Returns:
+        Tupla (suma, acarreo) con el ancho necesario para que
+        suma + acarreo sea la suma exacta de los operandos
+
+    Raises:
+        ValueError: Si la lista está vacía o los operandos no son válidos
+
+    Examples:
+        >>> arbol_carry_save([[0,0,1,1], [0,1,0,1], [0,1,1,0], [0,0,0,1]])
+        ([0,0,1,1,1,1], [0,0,0,0,0,0])  # 3 + 5 + 6 + 1 = 15 (6 bits)
+    """
+    if not operandos:
+        raise ValueError("Se necesita al menos un operando")
+    n_bits = _validar_bits(*operandos)
+    ancho = _ancho_suma(n_bits, len(operandos))
+
+    nivel = [_extender(list(bits), ancho) for bits in operandos]
+    if len(nivel) == 1:
+        nivel.append([0] * ancho)
+
+    while len(nivel) > 2:
+        siguiente = []
+        for i in range(0, len(nivel) - 2, 3):
+            siguiente.extend(compresor_3_2(nivel[i], nivel[i + 1], nivel[i + 2]))
+        siguiente.extend(nivel[len(nivel) - len(nivel) % 3:])
+        nivel = siguiente
+
+    return nivel[0], nivel[1]
+
+
+def sumar_operandos(operandos, sumador=adder_nbits) -> list:
+    """
+    Suma un iterable de operandos con un acumulador carry-save.
+
+    Cada operando entra en un compresor 3:2 junto con la suma parcial y
+    los acarreos acumulados, así que no se propaga ningún acarreo hasta
+    la suma final. Los operandos se consumen de uno en uno: puede ser un
+    generador de cualquier longitud.
+
+    Args:
+        operandos: Iterable de listas de N bits (sin signo)
+        sumador: Sumador para la suma final (default: adder_nbits),
+            con la interfaz (a_bits, b_bits, cin)
+
+    Returns:
+        Lista de bits con la suma exacta; tiene los bits justos para la
+        mayor suma posible de esa cantidad de operandos
+
+    Raises:
+        ValueError: Si no hay operandos o no son válidos
+
+    Examples:
+        >>> sumar_operandos([[0,0,1,1], [0,1,0,1], [0,1,1,0], [0,0,0,1]])
+        [0,0,1,1,1,1]  # 3 + 5 + 6 + 1 = 15 (6 bits)
+    """
+    iterador = iter(operandos)
+    try:
+        primero = list(next(iterador))
+    except StopIteration:
+        raise ValueError("Se necesita al menos un operando") from None
+    n_bits = _validar_bits(primero)
+
+    suma = primero
+    acarreo = [0] * n_bits
+    k_operandos = 1
+    for bits in iterador:
+        _validar_bits(primero, bits)
+        k_operandos += 1
+        ancho = _ancho_suma(n_bits, k_operandos)
+        if ancho > len(suma):
+            suma = _extender(suma, ancho)
+            acarreo = _extender(acarreo, ancho)
+        suma, acarreo = compresor_3_2(suma, acarreo, _extender(list(bits), ancho))
+
+    # Única propagación de acarreo
+    resultado, _ = sumador(suma, acarreo, 0)
+    return resultado
+
+
+def prueba_carry_save():
+    """
+    Suma listas de operandos y compara con la suma de Python.
+    """
+    import random
+    from .utils import entero_a_bits, bits_a_valor
+
+    print("Prueba del acumulador carry-save:")
+    print("=" * 60)
+
+    rng = random.Random(8)
+    correctos = 0
+    casos = [(4, 2), (4, 10), (8, 100), (16, 1000)]
+    for n_bits, k in casos:
+        valores = [rng.getrandbits(n_bits) for _ in range(k)]
+        resultado = sumar_operandos(entero_a_bits(v, n_bits) for v in valores)
+        correcto = bits_a_valor(resultado) == sum(valores)
+        correctos += correcto
+        estado = "✓" if correcto else "✗"
+        print(f"  {k:5} operandos de {n_bits:2} bits: suma = "
+              f"{bits_a_valor(resultado)} ({len(resultado)} bits) {estado}")
+
+    return correctos == len(casos)
+
+
+if __name__ == "__main__":
+    prueba_carry_save()
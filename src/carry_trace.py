@@ -0,0 +1,219 @@
+"""
+Traza de la cadena de acarreo del sumador de 4 bits.
+
+adder_4bits descarta los acarreos intermedios dentro de su bucle y
+mostrar_operacion solo ve el resultado final. Este módulo ofrece una
+versión del sumador que guarda, para cada etapa, la tupla
+(bit, a, b, cin, suma, cout) en un objeto TrazaAcarreo, para ver cómo
+se propaga el acarreo.
+
+La traza es un camino aparte: adder_4bits no tiene ningún parámetro ni
+comprobación nueva, así que sin traza el coste es exactamente el de
+antes. Para trazar se usa adder_4bits_trazado (o sumador_trazado(traza)
+como sumador de cualquier función que acepte sumador=).
+"""
+
+from .full_adder import full_adder
+from .bitvector import validados
+
+
+# Nombre de cada campo de una etapa
+CAMPOS = ("bit", "a", "b", "cin", "suma", "cout")
+
+
+class TrazaAcarreo:
+    """
+    Etapas de la cadena de acarreo de una o más sumas.
+
+    Atributos:
+        operaciones: Lista con una entrada por suma trazada; cada una es
+            la lista de sus etapas del LSB al MSB, tuplas
+            (bit, a, b, cin, suma, cout) donde bit es el peso (0 = LSB)
+
+    Examples:
+        >>> traza = TrazaAcarreo()
+        >>> adder_4bits_trazado([0,1,1,1], [0,0,0,1], 0, traza)
+        ([1, 0, 0, 0], 0)
+        >>> traza.ultima()[0]
+        (0, 1, 1, 0, 0, 1)
+        >>> traza.cadena_mas_larga()
+        3
+    """
+
+    def __init__(self):
+        self.operaciones = []
+
+    def __len__(self) -> int:
+        return len(self.operaciones)
+
+    def ultima(self) -> list:
+        """
+        Etapas de la última suma trazada.
+
+        Raises:
+            IndexError: Si no hay ninguna suma trazada
+        """
+        return self.operaciones[-1]
+
+    def acarreos(self, operacion: int = -1) -> list:
+        """
+        Acarreos de una suma: el de entrada y el de salida de cada etapa,
+        del LSB al MSB.
+
+        Args:
+            operacion: Índice de la suma (default: la última)
+
+        Returns:
+            Lista de 5 bits [cin, c1, c2, c3, cout]
+        """
+        etapas = self.operaciones[operacion]
+        return [etapas[0][3]] + [etapa[5] for etapa in etapas]
+
+    def cadena_mas_larga(self, operacion: int = -1) -> int:
+        """
+        Número de etapas que recorre el acarreo más largo de una suma.
+
+        Una cadena empieza en una etapa que genera acarreo (o en la
+        primera, si cin es 1) y sigue mientras las etapas siguientes lo
+        propaguen (a != b) con acarreo de salida 1.
+
+        Args:
+            operacion: Índice de la suma (default: la última)
+
+        Returns:
+            Longitud de la cadena más larga (0 si no hay acarreos)
+        """
+        mas_larga = 0
+        actual = 0
+        for _, a, b, cin, _, cout in self.operaciones[operacion]:
+            if cout and cin and a != b:
+                actual += 1
+            else:
+                actual = 1 if cout else 0
+            mas_larga = max(mas_larga, actual)
+        return mas_larga
+
+    def limpiar(self):
+        """Descarta todas las sumas trazadas."""
+        self.operaciones.clear()
+
+    def mostrar(self, operacion: int = -1):
+        """
+        Muestra las etapas de una suma como tabla.
+
+        Args:
+            operacion: Índice de la suma (default: la última)
+        """
+        print("  " + " | ".join(f"{campo:>4}" for campo in CAMPOS))
+        print("  " + "-" * (7 * len(CAMPOS) - 3))
+        for etapa in self.operaciones[operacion]:
+            print("  " + " | ".join(f"{valor:>4}" for valor in etapa))
+        print(f"  Cadena de acarreo más larga: {self.cadena_mas_larga(operacion)}")
+
+
+def adder_4bits_trazado(a_bits: list, b_bits: list, cin: int, traza: TrazaAcarreo):
+    """
+    Sumador de 4 bits que guarda sus etapas en una traza.
+
+    Mismo resultado y mismas validaciones que adder_4bits.
+
+    Args:
+        a_bits: Lista de 4 bits representando el primer número
+        b_bits: Lista de 4 bits representando el segundo número
+        cin: Acarreo de entrada
+        traza: TrazaAcarreo donde se añade la suma
+
+    Returns:
+        Tupla (resultado_bits, cout), como adder_4bits
+
+    Raises:
+        ValueError: Si las listas no tienen exactamente 4 bits o algún
+            bit no es 0 o 1
+    """
+    if len(a_bits) != 4 or len(b_bits) != 4:
+        raise ValueError("Las listas deben tener exactamente 4 bits")
+    for bits in (a_bits, b_bits):
+        if not validados(bits):
+            for bit in bits:
+                if bit not in [0, 1]:
+                    raise ValueError("Los bits deben ser 0 o 1")
+
+    resultado = [0, 0, 0, 0]
+    etapas = []
+    carry = cin
+    for i in range(3, -1, -1):
+        entrada = carry
+        suma, carry = full_adder(a_bits[i], b_bits[i], carry)
+        resultado[i] = suma
+        etapas.append((3 - i, a_bits[i], b_bits[i], entrada, suma, carry))
+    traza.operaciones.append(etapas)
+
+    return resultado, carry
+
+
+def sumador_trazado(traza: TrazaAcarreo):
+    """
+    Sumador (a_bits, b_bits, cin) que guarda sus etapas en la traza.
+
+    Sirve como argumento sumador= de sumador_restador_4bits y de las
+    demás funciones que aceptan un sumador de 4 bits.
+
+    Args:
+        traza: TrazaAcarreo donde se añaden las sumas
+
+    Returns:
+        Función con la firma de adder_4bits
+    """
+    def sumador(a_bits: list, b_bits: list, cin: int = 0):
+        return adder_4bits_trazado(a_bits, b_bits, cin, traza)
+    return sumador
+
+
+def sumador_restador_trazado(a_bits: list, b_bits: list, operacion: int,
+                             traza: TrazaAcarreo):
+    """
+    sumador_restador_4bits (camino fusionado) con la cadena de acarreo
+    guardada en la traza.
+
+    En la resta, las etapas muestran B ya complementado y cin = 1.
+
+    Args:
+        a_bits: Primer operando (4 bits)
+        b_bits: Segundo operando (4 bits)
+        operacion: 0 para suma, 1 para resta
+        traza: TrazaAcarreo donde se añade la suma
+
+    Returns:
+        Tupla (resultado_bits, cout), como sumador_restador_4bits
+    """
+    from .adder_subtractor import sumador_restador_4bits
+
+    return sumador_restador_4bits(a_bits, b_bits, operacion,
+                                  sumador=sumador_trazado(traza))
+
+
+def prueba_traza_acarreo():
+    """
+    Muestra la cadena de acarreo de varias operaciones.
+    """
+    from .utils import mostrar_operacion
+
+    print("Traza de la cadena de acarreo:")
+    print("=" * 60)
+
+    traza = TrazaAcarreo()
+    casos = [
+        ([0, 1, 0, 1], [0, 0, 1, 1], 0),   # 5 + 3
+        ([1, 1, 1, 1], [0, 0, 0, 1], 0),   # 15 + 1: el acarreo recorre todo
+        ([0, 1, 1, 1], [0, 0, 1, 0], 1),   # 7 - 2
+    ]
+    for a, b, op in casos:
+        resultado, cout = sumador_restador_trazado(a, b, op, traza)
+        mostrar_operacion(a, b, resultado, cout, op)
+        traza.mostrar()
+
+    return traza.cadena_mas_larga(1) == 4
+
+
+if __name__ == "__main__":
+    prueba_traza_acarreo()
@@ -0,0 +1,301 @@
+"""
+Simulación compilada: el circuito como una función Python sin llamadas.
+
+Evaluar el circuito con las funciones anidadas paga en cada capa una
+llamada y una tupla. Aquí el netlist (ver netlist) se traduce a una
+sola función de código lineal, una asignación por puerta con los
+operadores &, | y ^:
+
+    def circuito(e0, e1, e2, uno=1):
+        c2, c3, c4, c5 = e0
+        ...
+        c12 = c9 ^ uno
+        c13 = c5 & c12
+        ...
+        return [c80, c67, c54, c41], c82
+
+Como en Netlist.evaluar_planos, NOT es una XOR con el parámetro uno;
+pasando la máscara de vectores la misma función evalúa planos de bits.
+
+El código generado se guarda en disco con el nombre del SHA-256 del
+propio código y se carga como un módulo, así que Python reutiliza
+también su bytecode en __pycache__. Si cambia el generador, cambia el
+nombre; antes de cargar un archivo se comprueba que contiene
+exactamente ese código y, si no (truncado o editado), se reescribe.
+El directorio se puede cambiar con la variable de entorno
+SUMADOR_CACHE; si no se puede escribir, la función se compila en
+memoria.
+"""
+
+import hashlib
+import importlib.util
+import os
+import tempfile
+
+from .netlist import CERO, UNO
+from .adder_4bit import adder_4bits
+
+
+# Cambia si cambia el código generado, para invalidar la caché
+VERSION_CODIGO = 1
+
+# Directorio por defecto de la caché de código generado
+DIRECTORIO_CACHE = os.path.join(os.path.expanduser("~"), ".cache",
+                                "sumador_restador")
+
+# Funciones ya compiladas en este proceso: huella -> función
+_compiladas = {}
+
+# Sumadores-restadores compilados: (n_bits, sumador) -> función
+_sumadores_restadores = {}
+
+
+def _nombre(cable: int) -> str:
+    """Expresión de un cable en el código generado."""
+    if cable == CERO:
+        return "0"
+    if cable == UNO:
+        return "uno"
+    return f"c{cable}"
+
+
+def _expresion_salida(salida) -> str:
+    """Expresión que reconstruye la estructura de salidas."""
+    if isinstance(salida, list):
+        return "[" + ", ".join(_expresion_salida(e) for e in salida) + "]"
+    if isinstance(salida, tuple):
+        partes = [_expresion_salida(e) for e in salida]
+        return "(" + ", ".join(partes) + ("," if len(partes) == 1 else "") + ")"
+    return _nombre(salida)
+
+
+def generar_codigo(netlist, nombre: str = "circuito") -> str:
+    """
+    Genera el código fuente de la función que evalúa un netlist.
+
+    Args:
+        netlist: Netlist a compilar
+        nombre: Nombre de la función generada
+
+    Returns:
+        Código fuente con una función que recibe los mismos argumentos
+        que la función trazada, más el parámetro opcional uno (la
+        máscara de vectores), y devuelve la misma estructura
+
+    Raises:
+        ValueError: Si el netlist tiene una puerta desconocida
+    """
+    argumentos = [f"e{i}" for i in range(len(netlist.entradas))]
+    lineas = [f"def {nombre}({', '.join(argumentos)}, uno=1):"]
+
+    for argumento, entrada in zip(argumentos, netlist.entradas):
+        if isinstance(entrada, list):
+            # Desempaquetar comprueba también el número de bits
+            destinos = ", ".join(_nombre(c) for c in entrada)
+            coma = "," if len(entrada) == 1 else ""
+            lineas.append(f"    {destinos}{coma} = {argumento}")
+        else:
+            lineas.append(f"    {_nombre(entrada)} = {argumento}")
+
+    for tipo, entradas, salida in netlist.compuertas:
+        operandos = [_nombre(c) for c in entradas]
+        if tipo == "AND":
+            expresion = f"{operandos[0]} & {operandos[1]}"
+        elif tipo == "OR":
+            expresion = f"{operandos[0]} | {operandos[1]}"
+        elif tipo == "XOR":
+            expresion = f"{operandos[0]} ^ {operandos[1]}"
+        elif tipo == "NOT":
+            expresion = f"{operandos[0]} ^ uno"
+        elif tipo == "NAND":
+            expresion = f"({operandos[0]} & {operandos[1]}) ^ uno"
+        elif tipo == "NOR":
+            expresion = f"({operandos[0]} | {operandos[1]}) ^ uno"
+        else:
+            raise ValueError(f"Puerta desconocida: {tipo}")
+        lineas.append(f"    {_nombre(salida)} = {expresion}")
+
+    lineas.append(f"    return {_expresion_salida(netlist.salidas)}")
+    return "\n".join(lineas) + "\n"
+
+
+def huella(netlist) -> str:
+    """
+    Huella SHA-256 de un netlist, usada como clave de la caché en memoria.
+
+    Dos netlists con las mismas puertas, entradas y salidas tienen la
+    misma huella aunque provengan de funciones distintas.
+    """
+    contenido = repr((VERSION_CODIGO, netlist.entradas, netlist.compuertas,
+                      netlist.salidas))
+    return hashlib.sha256(contenido.encode()).hexdigest()
+
+
+def _clave_codigo(codigo: str) -> str:
+    """Nombre en la caché en disco: SHA-256 del código generado."""
+    return hashlib.sha256(codigo.encode()).hexdigest()
+
+
+def _cargar_desde_disco(codigo: str, directorio: str):
+    """
+    Escribe (si falta o no coincide) y carga el módulo con el código generado.
+
+    Returns:
+        La función "circuito" del módulo, o None si no se pudo usar el
+        directorio
+    """
+    clave = _clave_codigo(codigo)
+    ruta = os.path.join(directorio, f"circuito_{clave}.py")
+    try:
+        try:
+            with open(ruta, encoding="utf-8") as archivo:
+                guardado = archivo.read()
+        except FileNotFoundError:
+            guardado = None
+
+        if guardado != codigo:
+            os.makedirs(directorio, exist_ok=True)
+            # Escritura atómica: otro proceso nunca ve el archivo a medias
+            descriptor, temporal = tempfile.mkstemp(dir=directorio, suffix=".tmp")
+            with os.fdopen(descriptor, "w", encoding="utf-8") as archivo:
+                archivo.write(codigo)
+            os.replace(temporal, ruta)
+            # El bytecode de un archivo alterado tampoco vale
+            try:
+                os.remove(importlib.util.cache_from_source(ruta))
+            except OSError:
+                pass
+
+        spec = importlib.util.spec_from_file_location(f"circuito_{clave}", ruta)
+        modulo = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(modulo)
+        return modulo.circuito
+    except OSError:
+        return None
+
+
+def compilar(netlist, directorio: str = None, en_disco: bool = True):
+    """
+    Compila un netlist a una función Python de código lineal.
+
+    Args:
+        netlist: Netlist a compilar
+        directorio: Directorio de la caché (default: SUMADOR_CACHE o
+            DIRECTORIO_CACHE)
+        en_disco: Si es False, no se usa la caché en disco
+
+    Returns:
+        Función con los mismos argumentos y resultado que la función
+        trazada (sin validación de entradas) y el parámetro opcional uno
+
+    Examples:
+        >>> circuito = compilar(trazar(full_adder, 0, 0, 0))
+        >>> circuito(1, 1, 0)
+        (0, 1)
+    """
+    clave = huella(netlist)
+    funcion = _compiladas.get(clave)
+    if funcion is not None:
+        return funcion
+
+    codigo = generar_codigo(netlist)
+    if en_disco:
+        directorio = directorio or os.environ.get("SUMADOR_CACHE",
+                                                  DIRECTORIO_CACHE)
+        funcion = _cargar_desde_disco(codigo, directorio)
+
+    if funcion is None:
+        espacio = {}
+        exec(compile(codigo, f"<circuito {clave[:12]}>", "exec"), espacio)
+        funcion = espacio["circuito"]
+
+    _compiladas[clave] = funcion
+    return funcion
+
+
+def compilar_sumador_restador(n_bits: int = 4, sumador=None):
+    """
+    Sumador-restador compilado de n bits (camino fusionado).
+
+    Las XOR se trazan como un solo nodo: el resultado es el mismo y el
+    código generado tiene una operación ^ en lugar de cinco. El netlist
+    pasa por optimizar() antes de generar el código. La traza y la
+    compilación se hacen una vez por ancho y sumador en cada proceso;
+    solo se guardan las de sumadores de nivel de módulo, porque una
+    función local (una closure nueva en cada llamada) haría crecer la
+    caché sin límite. El código generado no llama al sumador: si este
+    guarda algo en cada llamada (como sumador_trazado), solo lo hace al
+    trazar.
+
+    Args:
+        n_bits: Ancho de los operandos (default: 4)
+        sumador: Sumador a compilar (ver trazar_sumador_restador)
+
+    Returns:
+        Función (a_bits, b_bits, operacion) -> (resultado_bits, cout)
+        sin validación de entradas
+    """
+    clave = (n_bits, sumador)
+    funcion = _sumadores_restadores.get(clave)
+    if funcion is None:
+        from .netlist import trazar_sumador_restador
+        from .optimizer import optimizar
+        red = trazar_sumador_restador(n_bits, primitivas=("AND", "OR", "NOT", "XOR"),
+                                      sumador=sumador)
+        funcion = compilar(optimizar(red))
+        if sumador is None or "<locals>" not in getattr(sumador, "__qualname__",
+                                                         "<locals>"):
+            _sumadores_restadores[clave] = funcion
+    return funcion
+
+
+def sumador_restador_compilado(a_bits: list, b_bits: list, operacion: int,
+                               sumador=adder_4bits):
+    """
+    Motor compilado del sumador-restador de 4 bits.
+
+    Args:
+        a_bits: Lista de 4 bits representando el primer número
+        b_bits: Lista de 4 bits representando el segundo número
+        operacion: 0 para suma, 1 para resta
+        sumador: Sumador de 4 bits a compilar (default: adder_4bits)
+
+    Returns:
+        Tupla (resultado_bits, cout), igual que sumador_restador_4bits
+
+    Raises:
+        ValueError: Si las entradas no son válidas
+    """
+    from .adder_subtractor import sumador_restador_4bits
+    return sumador_restador_4bits(a_bits, b_bits, operacion, motor="compilado",
+                                  sumador=sumador)
+
+
+def prueba_compilador():
+    """
+    Muestra el código generado para el sumador completo y verifica el
+    motor compilado con todas las entradas de 4 bits.
+    """
+    from itertools import product
+    from .full_adder import full_adder
+    from .netlist import trazar
+    from .adder_subtractor import sumador_restador_4bits
+
+    print("Código generado para full_adder:")
+    print("=" * 60)
+    print(generar_codigo(trazar(full_adder, 0, 0, 0), "full_adder"))
+
+    errores = 0
+    for a, b, op in product(product((0, 1), repeat=4),
+                            product((0, 1), repeat=4), (0, 1)):
+        if sumador_restador_compilado(list(a), list(b), op) != \
+                sumador_restador_4bits(list(a), list(b), op):
+            errores += 1
+
+    estado = "✓" if errores == 0 else "✗"
+    print(f"Motor compilado: 512 entradas, {errores} diferencias {estado}")
+    return errores == 0
+
+
+if __name__ == "__main__":
+    prueba_compilador()
@@ -31,7 +31,7 @@ def complemento_a_1(bits: list) -> list:
     return [NOT(bit) for bit in bits]
 
 
-def complemento_a_2(bits: list) -> list:
+def complemento_a_2(bits: list, sumador=adder_4bits) -> list:
     """
     Calcula el complemento a 2 de un número binario.
     
@@ -39,6 +39,8 @@ def complemento_a_2(bits: list) -> list:
     
     Args:
         bits: Lista de 4 bits
+        sumador: Sumador de 4 bits a usar (default: adder_4bits),
+            con la interfaz (a_bits, b_bits, cin)
         
     Returns:
         Lista de 4 bits representando el complemento a 2
@@ -52,7 +54,7 @@ def complemento_a_2(bits: list) -> list:
     
     # Paso 2: Sumar 1 (0001 en binario)
     uno = [0, 0, 0, 1]
-    resultado, _ = adder_4bits(comp1, uno, 0)
+    resultado, _ = sumador(comp1, uno, 0)
     
     return resultado
 
@@ -0,0 +1,392 @@
+"""
+Verificación exhaustiva de equivalencia de sumadores-restadores.
+
+Un sumador-restador de N bits tiene 2^(2N+1) entradas posibles: con
+N = 12 son 33 millones, demasiadas para llamar al circuito una a una,
+pero pocas si se evalúan por planos de bits (ver bitslice). Para
+comprobar que un diseño alternativo equivale a sumador_restador_4bits
+(o a sumador_restador_nbits para otros anchos):
+
+1. Se trazan el candidato y la referencia a netlist (ver netlist) con
+   XOR como nodo.
+2. El espacio de entradas se numera: el índice i es el entero de los
+   bits (a_bits, b_bits, operacion) concatenados, MSB primero. Se
+   divide en bloques de 2^k índices consecutivos.
+3. Cada bloque se evalúa de una vez: el plano de cada bit de entrada es
+   un patrón periódico (los k bits bajos del índice) o todo unos o todo
+   ceros (los altos), así que construirlo no cuesta nada. Las salidas
+   de los dos netlists se comparan con XOR; un 1 en el resultado es un
+   contraejemplo.
+4. Los bloques se reparten entre procesos; se recorren en orden, así
+   que el contraejemplo devuelto es el de menor índice.
+
+La traza solo es fiel si la estructura del candidato no depende de los
+valores de entrada (ver netlist): una función que se comporta distinto
+en alguna entrada daría un netlist equivalente y una verificación
+falsa. Por eso una función se verifica por defecto en modo "escalar",
+que la llama entrada por entrada y solo es práctico para anchos
+pequeños; los planos se usan con un Netlist o si se pide modo="planos"
+(como hace verificar_sumador), aceptando esa suposición. Aun así, la
+traza se compara antes con llamadas directas en algunas entradas y se
+rechaza si no coincide o si el candidato no se puede trazar (p. ej.
+sumador_restador_tabla).
+"""
+
+import inspect
+import os
+import pickle
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from .netlist import Netlist, trazar
+from .bitslice import mascara
+
+
+# Primitivas de la traza: XOR como un nodo, menos puertas que evaluar
+PRIMITIVAS_EQUIVALENCIA = ("AND", "OR", "NOT", "XOR")
+
+# Modos de evaluación
+MODOS = ("planos", "escalar")
+
+# Entradas aleatorias con las que se comprueba que la traza es fiel
+MUESTRAS_TRAZA = 64
+
+# Estado de cada proceso de trabajo, fijado por _iniciar_trabajador
+_trabajo = {}
+
+
+def _referencia(n_bits: int):
+    """
+    Sumador-restador de referencia para un ancho: la función original,
+    sin las envolturas de instrumentation o grabar_vcd.
+    """
+    from .adder_subtractor import sumador_restador_4bits
+    from .adder_nbits import sumador_restador_nbits
+
+    return inspect.unwrap(sumador_restador_4bits if n_bits == 4
+                          else sumador_restador_nbits)
+
+
+def _decodificar(indice: int, n_bits: int) -> tuple:
+    """Argumentos (a_bits, b_bits, operacion) de un índice del espacio."""
+    bits = [(indice >> p) & 1 for p in range(2 * n_bits, -1, -1)]
+    return bits[:n_bits], bits[n_bits:2 * n_bits], bits[2 * n_bits]
+
+
+def _patron(posicion: int, bits_bloque: int) -> int:
+    """
+    Plano del bit `posicion` del índice en un bloque de 2^bits_bloque
+    índices consecutivos: 2^posicion ceros, 2^posicion unos, repetido.
+    """
+    mitad = 1 << posicion
+    periodo = 2 * mitad
+    unidad = ((1 << mitad) - 1) << mitad
+    return unidad * (((1 << (1 << bits_bloque)) - 1) // ((1 << periodo) - 1))
+
+
+def _iniciar_trabajador(modo: str, n_bits: int, bits_bloque: int,
+                        referencia, candidato):
+    """
+    Prepara el estado de un proceso: los netlists (o funciones) y los
+    planos de los bits bajos del índice, que son iguales en todos los
+    bloques.
+    """
+    _trabajo.clear()
+    _trabajo.update(modo=modo, n_bits=n_bits, bits_bloque=bits_bloque,
+                    referencia=referencia, candidato=candidato)
+    if modo == "planos":
+        _trabajo["bajos"] = [_patron(p, bits_bloque) for p in range(bits_bloque)]
+
+
+def _verificar_bloque(inicio: int):
+    """
+    Compara candidato y referencia en un bloque del espacio de entradas.
+
+    Args:
+        inicio: Primer índice del bloque (múltiplo del tamaño de bloque)
+
+    Returns:
+        Índice del primer contraejemplo del bloque, o None
+    """
+    n_bits = _trabajo["n_bits"]
+    n_vectores = 1 << _trabajo["bits_bloque"]
+    referencia = _trabajo["referencia"]
+    candidato = _trabajo["candidato"]
+
+    if _trabajo["modo"] == "escalar":
+        for indice in range(inicio, inicio + n_vectores):
+            a, b, op = _decodificar(indice, n_bits)
+            if tuple(candidato(a, b, op)) != tuple(referencia(a, b, op)):
+                return indice
+        return None
+
+    # Planos de las entradas, del bit más alto del índice al más bajo
+    todos = mascara(n_vectores)
+    bajos = _trabajo["bajos"]
+    planos = []
+    for posicion in range(2 * n_bits, -1, -1):
+        if posicion < len(bajos):
+            planos.append(bajos[posicion])
+        else:
+            planos.append(todos if (inicio >> posicion) & 1 else 0)
+
+    esperado = referencia.evaluar_planos(planos, todos)
+    obtenido = candidato.evaluar_planos(planos, todos)
+    diferencias = 0
+    for c_ref, c_cand in zip(referencia.cables_salida(), candidato.cables_salida()):
+        diferencias |= esperado[c_ref] ^ obtenido[c_cand]
+    if not diferencias:
+        return None
+    return inicio + (diferencias & -diferencias).bit_length() - 1
+
+
+def _traza_fiel(red: Netlist, funcion, n_bits: int) -> bool:
+    """Compara la traza con llamadas directas en algunas entradas."""
+    rng = random.Random(n_bits)
+    total = 1 << (2 * n_bits + 1)
+    indices = {0, total - 1}
+    indices.update(rng.randrange(total) for _ in range(MUESTRAS_TRAZA))
+    for indice in sorted(indices):
+        a, b, op = _decodificar(indice, n_bits)
+        if red.evaluar(a, b, op) != tuple(funcion(a, b, op)):
+            return False
+    return True
+
+
+def _preparar(candidato, n_bits: int, modo: str):
+    """
+    Elige el modo y construye lo que necesitan los procesos.
+
+    Returns:
+        Tupla (modo, referencia, candidato): netlists en modo "planos",
+        funciones en modo "escalar"
+    """
+    funcion_referencia = _referencia(n_bits)
+    ejemplo = ([0] * n_bits, [0] * n_bits, 0)
+
+    if isinstance(candidato, Netlist):
+        if modo == "escalar":
+            raise ValueError("Un netlist solo se puede verificar en modo planos")
+        red = candidato
+    elif modo == "planos":
+        try:
+            red = trazar(candidato, *ejemplo, primitivas=PRIMITIVAS_EQUIVALENCIA)
+            fiel = _traza_fiel(red, candidato, n_bits)
+        except Exception:  # Cualquier fallo de la traza: no es trazable
+            fiel = False
+        if not fiel:
+            raise ValueError("El candidato no se puede trazar fielmente; "
+                             "use el modo escalar")
+    else:
+        red = None
+
+    if red is None:
+        return "escalar", funcion_referencia, candidato
+
+    formas = [len(e) if isinstance(e, list) else None for e in red.entradas]
+    if formas != [n_bits, n_bits, None] or len(red.cables_salida()) != n_bits + 1:
+        raise ValueError(f"El candidato no tiene la forma de un sumador-restador "
+                         f"de {n_bits} bits")
+    referencia = trazar(funcion_referencia, *ejemplo,
+                        primitivas=PRIMITIVAS_EQUIVALENCIA)
+    return "planos", referencia, red
+
+
+def verificar_equivalencia(candidato, n_bits: int = 4, procesos: int = None,
+                           modo: str = None, bits_bloque: int = 16) -> dict:
+    """
+    Comprueba un sumador-restador contra la referencia en todas las entradas.
+
+    Args:
+        candidato: Función (a_bits, b_bits, operacion) -> (resultado_bits,
+            cout), o su Netlist
+        n_bits: Ancho de los operandos (default: 4)
+        procesos: Procesos de trabajo (default: os.cpu_count()); con 1 se
+            verifica en el proceso actual. En modo escalar, si el
+            candidato no se puede enviar a otro proceso (una lambda o una
+            función local) también se usa el proceso actual
+        modo: "planos", "escalar" o None (planos para un Netlist,
+            escalar para una función). Con "planos", una función se
+            traza una vez y se verifica el netlist trazado: solo es
+            válido si la función no depende de los valores de entrada
+        bits_bloque: Cada bloque tiene 2^bits_bloque entradas
+
+    Returns:
+        Diccionario con:
+        - equivalentes: True si coinciden en todas las entradas
+        - contraejemplo: None, o diccionario con indice, a_bits, b_bits,
+          operacion, esperado y obtenido de la entrada de menor índice
+          en la que difieren
+        - verificadas: Entradas comprobadas sin diferencias
+        - total: 2^(2N+1)
+        - modo, procesos, bloques, tiempo (segundos)
+
+    Raises:
+        ValueError: Si n_bits, procesos, el modo o la forma del
+            candidato no son válidos
+
+    Examples:
+        >>> from functools import partial
+        >>> from src.adder_nbits import sumador_restador_nbits
+        >>> from src.carry_lookahead import adder_cla
+        >>> r = verificar_equivalencia(
+        ...     partial(sumador_restador_nbits, sumador=adder_cla), 8,
+        ...     modo="planos")
+        >>> r["equivalentes"], r["total"]
+        (True, 131072)
+    """
+    if n_bits < 1:
+        raise ValueError("n_bits debe ser al menos 1")
+    if modo is not None and modo not in MODOS:
+        raise ValueError(f"Modo desconocido: {modo}. Opciones: {MODOS}")
+    procesos = procesos or os.cpu_count() or 1
+    if procesos < 1:
+        raise ValueError("procesos debe ser al menos 1")
+
+    inicio_reloj = time.perf_counter()
+    modo, referencia, evaluado = _preparar(candidato, n_bits, modo)
+
+    total = 1 << (2 * n_bits + 1)
+    bits_bloque = max(0, min(bits_bloque, 2 * n_bits + 1))
+    tamano = 1 << bits_bloque
+    bloques = range(0, total, tamano)
+    configuracion = (modo, n_bits, bits_bloque, referencia, evaluado)
+
+    if procesos > 1 and modo == "escalar":
+        try:
+            pickle.dumps(evaluado)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            procesos = 1
+    procesos = min(procesos, len(bloques))
+
+    indice = None
+    if procesos == 1:
+        _iniciar_trabajador(*configuracion)
+        for inicio in bloques:
+            indice = _verificar_bloque(inicio)
+            if indice is not None:
+                break
+    else:
+        with ProcessPoolExecutor(procesos, initializer=_iniciar_trabajador,
+                                 initargs=configuracion) as ejecutor:
+            # map devuelve los resultados en orden: el primero que no es
+            # None es el contraejemplo de menor índice
+            for resultado in ejecutor.map(_verificar_bloque, bloques):
+                if resultado is not None:
+                    indice = resultado
+                    ejecutor.shutdown(wait=False, cancel_futures=True)
+                    break
+
+    contraejemplo = None
+    if indice is not None:
+        a, b, op = _decodificar(indice, n_bits)
+        if isinstance(candidato, Netlist):
+            obtenido = candidato.evaluar(a, b, op)
+        else:
+            obtenido = candidato(a, b, op)
+        contraejemplo = {
+            "indice": indice,
+            "a_bits": a,
+            "b_bits": b,
+            "operacion": op,
+            "esperado": _referencia(n_bits)(a, b, op),
+            "obtenido": obtenido,
+        }
+
+    return {
+        "equivalentes": indice is None,
+        "contraejemplo": contraejemplo,
+        "verificadas": total if indice is None else indice,
+        "total": total,
+        "modo": modo,
+        "procesos": procesos,
+        "bloques": len(bloques),
+        "tiempo": time.perf_counter() - inicio_reloj,
+    }
+
+
+def verificar_sumador(sumador, n_bits: int = 4, modo: str = "planos",
+                      **opciones) -> dict:
+    """
+    Comprueba un sumador (a_bits, b_bits, cin) usándolo dentro del
+    sumador-restador.
+
+    Por defecto usa el modo "planos": supone que el sumador es un
+    circuito de puertas sin decisiones sobre los valores de entrada,
+    como todos los del paquete. Si no lo es, hay que pedir
+    modo="escalar".
+
+    Args:
+        sumador: Sumador de n bits, p. ej. adder_cla o adder_kogge_stone
+        n_bits: Ancho de los operandos (default: 4)
+        modo: Modo de verificar_equivalencia (default: "planos")
+        **opciones: Las demás de verificar_equivalencia
+
+    Returns:
+        Resultado de verificar_equivalencia
+    """
+    circuito = partial(_referencia(n_bits), sumador=sumador)
+    return verificar_equivalencia(circuito, n_bits, modo=modo, **opciones)
+
+
+def mostrar_resultado(nombre: str, resultado: dict):
+    """
+    Imprime el resultado de una verificación en una línea, más el
+    contraejemplo si lo hay.
+
+    Args:
+        nombre: Nombre del candidato
+        resultado: Diccionario de verificar_equivalencia
+    """
+    estado = "✓" if resultado["equivalentes"] else "✗"
+    print(f"  {estado} {nombre:<28} {resultado['total']:>10} entradas  "
+          f"{resultado['modo']:<8} {resultado['tiempo']:7.2f} s")
+    contraejemplo = resultado["contraejemplo"]
+    if contraejemplo:
+        a = "".join(map(str, contraejemplo["a_bits"]))
+        b = "".join(map(str, contraejemplo["b_bits"]))
+        print(f"      A={a} B={b} op={contraejemplo['operacion']}: "
+              f"esperado {contraejemplo['esperado']}, "
+              f"obtenido {contraejemplo['obtenido']}")
+
+
+def prueba_equivalencia():
+    """
+    Verifica los sumadores alternativos del paquete y muestra cómo se
+    informa de un contraejemplo.
+    """
+    from .carry_lookahead import adder_cla
+    from .prefix_adder import adder_kogge_stone, adder_brent_kung
+    from .lookup_table import sumador_restador_tabla
+
+    print("Verificación exhaustiva de equivalencia:")
+    print("=" * 64)
+
+    correcto = True
+    for nombre, sumador, n_bits in [("adder_cla", adder_cla, 4),
+                                    ("adder_kogge_stone", adder_kogge_stone, 8),
+                                    ("adder_brent_kung", adder_brent_kung, 10)]:
+        resultado = verificar_sumador(sumador, n_bits, procesos=1)
+        mostrar_resultado(f"{nombre} ({n_bits} bits)", resultado)
+        correcto &= resultado["equivalentes"]
+
+    resultado = verificar_equivalencia(sumador_restador_tabla, 4, procesos=1)
+    mostrar_resultado("sumador_restador_tabla", resultado)
+    correcto &= resultado["equivalentes"]
+
+    # Un netlist con una puerta cambiada debe dar un contraejemplo
+    red = trazar(_referencia(4), [0] * 4, [0] * 4, 0,
+                 primitivas=PRIMITIVAS_EQUIVALENCIA)
+    tipo, entradas, salida = red.compuertas[-1]
+    red.compuertas[-1] = ("AND" if tipo == "OR" else "OR", entradas, salida)
+    resultado = verificar_equivalencia(red, 4, procesos=1)
+    mostrar_resultado("netlist alterado", resultado)
+    correcto &= not resultado["equivalentes"]
+
+    return correcto
+
+
+if __name__ == "__main__":
+    prueba_equivalencia()
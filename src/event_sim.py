@@ -0,0 +1,232 @@
+"""
+Simulación por eventos con retardos de propagación por puerta.
+
+Los demás motores evalúan el circuito sin retardos: todas las puertas,
+una vez, en orden topológico. Aquí cada puerta tarda un tiempo en
+propagar su resultado (según su tipo, ver RETARDOS) y el simulador
+solo trabaja donde algo cambia:
+
+1. Al aplicar nuevas entradas, cada bit de entrada que cambia genera
+   un evento (tiempo, cable, valor) en una cola de prioridad.
+2. Se procesan juntos todos los eventos del mismo instante y se
+   evalúan solo las puertas que leen algún cable que cambió, una vez
+   cada una; si su salida va a cambiar, se programa un evento en
+   tiempo + retardo de la puerta.
+3. Cuando la cola se vacía el circuito está estable. El tiempo desde
+   que cambiaron las entradas hasta el último cambio de un cable es el
+   tiempo de estabilización de la operación.
+
+El modelo de retardo es de transporte: un pulso más corto que el
+retardo de una puerta también se propaga, así que se ven los glitches
+de la cadena de acarreo. Como el estado se conserva entre operaciones,
+una secuencia de entradas que cambian poco evalúa pocas puertas aunque
+el sumador sea muy ancho.
+"""
+
+import heapq
+
+from .netlist import trazar_sumador_restador
+
+
+# Retardo de propagación de cada tipo de puerta (unidades arbitrarias)
+RETARDOS = {
+    "AND": 1,
+    "OR": 1,
+    "NOT": 1,
+    "XOR": 1,
+    "NAND": 1,
+    "NOR": 1,
+}
+
+
+class SimuladorEventos:
+    """
+    Simulador por eventos de un netlist, con estado entre operaciones.
+
+    Args:
+        netlist: Netlist a simular (ver netlist)
+        retardos: Retardo por tipo de puerta; los tipos que falten toman
+            el valor de RETARDOS
+
+    Atributos:
+        tiempo: Tiempo de simulación actual (se acumula entre operaciones)
+        evaluaciones: Puertas evaluadas desde el último reiniciar_contadores()
+        eventos: Cambios de valor de cables desde el último reinicio
+
+    Raises:
+        ValueError: Si algún retardo es negativo o una puerta es desconocida
+
+    Examples:
+        >>> sim = SimuladorEventos(trazar(full_adder, 0, 0, 0))
+        >>> sim.aplicar(1, 1, 0)
+        ((0, 1), 5)
+    """
+
+    def __init__(self, netlist, retardos: dict = None):
+        self.netlist = netlist
+        retardos = {**RETARDOS, **(retardos or {})}
+        if any(r < 0 for r in retardos.values()):
+            raise ValueError("Los retardos no pueden ser negativos")
+
+        # Por puerta: (operación, cable a, cable b, salida, retardo)
+        self._puertas = [
+            operacion + (retardos[tipo],)
+            for operacion, (tipo, _, _) in zip(netlist.operaciones(),
+                                               netlist.compuertas)
+        ]
+        self._lectores = netlist.lectores()
+        self._cables_entrada = netlist.cables_entrada()
+        self._reconstruir = netlist.reconstruir
+
+        # Estado estable con todas las entradas a 0
+        self.valores = netlist.evaluar_planos(
+            [0] * len(self._cables_entrada))[:netlist.n_cables]
+        # Valor de cada cable cuando se procesen los eventos pendientes
+        self._proyectado = list(self.valores)
+        self.tiempo = 0
+        self.reiniciar_contadores()
+
+    def reiniciar_contadores(self):
+        """Pone a cero los contadores de puertas evaluadas y eventos."""
+        self.evaluaciones = 0
+        self.eventos = 0
+
+    def aplicar(self, *entradas):
+        """
+        Cambia las entradas y simula hasta que el circuito se estabiliza.
+
+        Args:
+            *entradas: Los mismos argumentos que la función trazada
+
+        Returns:
+            Tupla (salida, tiempo_estabilizacion): el valor que devolvería
+            la función trazada y el tiempo desde el cambio de entradas
+            hasta el último cambio de un cable (0 si nada cambia)
+
+        Raises:
+            ValueError: Si las entradas no son válidas
+        """
+        bits = self.netlist.aplanar(*entradas)
+        valores = self.valores
+        proyectado = self._proyectado
+        puertas = self._puertas
+        lectores = self._lectores
+
+        inicio = self.tiempo
+        cola = []
+        secuencia = 0
+        for cable, bit in zip(self._cables_entrada, bits):
+            if valores[cable] != bit:
+                proyectado[cable] = bit
+                cola.append((inicio, secuencia, cable, bit))
+                secuencia += 1
+        heapq.heapify(cola)
+
+        ultimo_cambio = inicio
+        evaluaciones = 0
+        eventos = 0
+        while cola:
+            # Todos los eventos del mismo instante, antes de evaluar puertas
+            tiempo = cola[0][0]
+            anteriores = {}
+            while cola and cola[0][0] == tiempo:
+                _, _, cable, valor = heapq.heappop(cola)
+                anteriores.setdefault(cable, valores[cable])
+                valores[cable] = valor
+
+            # Un cambio cuenta para el tiempo aunque nadie lea el cable
+            # (una salida del circuito)
+            afectadas = set()
+            for cable, anterior in anteriores.items():
+                if valores[cable] != anterior:
+                    afectadas.update(lectores[cable])
+                    eventos += 1
+                    ultimo_cambio = tiempo
+
+            for indice in afectadas:
+                operacion, a, b, salida, retardo = puertas[indice]
+                nuevo = operacion(valores[a], valores[b])
+                evaluaciones += 1
+                if nuevo != proyectado[salida]:
+                    proyectado[salida] = nuevo
+                    heapq.heappush(cola, (tiempo + retardo, secuencia, salida, nuevo))
+                    secuencia += 1
+
+        self.tiempo = ultimo_cambio
+        self.evaluaciones += evaluaciones
+        self.eventos += eventos
+        return self._reconstruir(valores), ultimo_cambio - inicio
+
+    def simular(self, secuencia) -> list:
+        """
+        Aplica una secuencia de entradas, una operación tras otra.
+
+        Args:
+            secuencia: Iterable de tuplas de argumentos
+
+        Returns:
+            Lista de tuplas (salida, tiempo_estabilizacion)
+        """
+        return [self.aplicar(*entradas) for entradas in secuencia]
+
+
+def simulador_sumador_restador(n_bits: int = 4, retardos: dict = None,
+                               sumador=None) -> SimuladorEventos:
+    """
+    Simulador por eventos del sumador-restador de n bits.
+
+    El circuito se traza con XOR como un solo nodo, así que su retardo
+    es el de RETARDOS["XOR"] y no el de sus cinco puertas.
+
+    Args:
+        n_bits: Ancho de los operandos (default: 4)
+        retardos: Retardo por tipo de puerta (ver SimuladorEventos)
+        sumador: Sumador a simular (ver trazar_sumador_restador)
+
+    Returns:
+        SimuladorEventos cuyo aplicar(a_bits, b_bits, operacion) devuelve
+        ((resultado_bits, cout), tiempo_estabilizacion)
+    """
+    red = trazar_sumador_restador(n_bits, primitivas=("AND", "OR", "NOT", "XOR"),
+                                  sumador=sumador)
+    return SimuladorEventos(red, retardos)
+
+
+def prueba_event_sim():
+    """
+    Simula una secuencia de operaciones de 4 bits y muestra el tiempo de
+    estabilización y las puertas evaluadas en cada una.
+    """
+    from .adder_subtractor import sumador_restador_4bits
+
+    print("Simulación por eventos del sumador-restador de 4 bits:")
+    print("=" * 60)
+    sim = simulador_sumador_restador(4, {"XOR": 2})
+    print(f"Puertas del circuito: {len(sim.netlist)}")
+    print(f"{'Operación':<22} | {'Resultado':>9} | {'Tiempo':>6} | {'Puertas':>7}")
+    print("-" * 60)
+
+    secuencia = [
+        ([0, 1, 1, 1], [0, 0, 0, 1], 0),
+        ([0, 1, 1, 1], [0, 0, 0, 1], 0),
+        ([0, 1, 1, 1], [0, 0, 0, 1], 1),
+        ([1, 1, 1, 1], [0, 0, 0, 1], 0),
+        ([0, 0, 1, 1], [0, 1, 0, 1], 1),
+    ]
+
+    correcto = True
+    for a, b, op in secuencia:
+        antes = sim.evaluaciones
+        (resultado, cout), tiempo = sim.aplicar(a, b, op)
+        correcto &= (resultado, cout) == sumador_restador_4bits(a, b, op)
+        simbolo = "-" if op else "+"
+        texto = f"{''.join(map(str, a))} {simbolo} {''.join(map(str, b))}"
+        print(f"{texto:<22} | {''.join(map(str, resultado)):>9} | "
+              f"{tiempo:>6} | {sim.evaluaciones - antes:>7}")
+
+    print(f"\n{'✓' if correcto else '✗'} Resultados iguales a sumador_restador_4bits")
+    return correcto
+
+
+if __name__ == "__main__":
+    prueba_event_sim()
@@ -0,0 +1,309 @@
+"""
+Simulación de fallas de pegado (stuck-at) por planos de bits.
+
+Una falla de pegado a 0 o a 1 fija el valor de un cable del netlist
+(ver netlist) sin importar lo que calcule la puerta que lo produce. Un
+conjunto de vectores de prueba detecta la falla si, con algún vector,
+alguna salida del circuito con la falla difiere de la del circuito
+correcto. La cobertura es el porcentaje de fallas detectadas.
+
+El sumador-restador se traza con las primitivas AND, OR y NOT, así que
+hay fallas en cada cable interno de las XOR, de los semisumadores, de
+los sumadores completos y del camino de B XOR operacion, además de en
+las entradas. Se modela una falla por cable (en el tronco, no en cada
+rama de su fan-out).
+
+Para no simular el circuito una vez por falla y por vector, cada
+pasada evalúa F fallas con V vectores a la vez en planos de F * V bits:
+el bloque f de V bits es una copia del circuito con la falla f. Las
+entradas se replican en los F bloques y, al calcular un cable con
+fallas, se fuerzan a 0 o a 1 los bloques de esas fallas con dos
+máscaras. Comparar las salidas con las del circuito correcto da, por
+bloque, los vectores que detectan cada falla. Las pasadas son
+independientes y se reparten entre procesos si hay muchas.
+"""
+
+import random
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+
+from .netlist import UNO, trazar_sumador_restador
+from .bitslice import mascara
+
+
+# Bits por plano en una pasada (fallas * vectores); limita la memoria
+ANCHO_PASADA = 1 << 20
+
+# Estado de cada proceso de trabajo, fijado por _iniciar_trabajador
+_trabajo = {}
+
+
+def enumerar_fallas(netlist) -> list:
+    """
+    Todas las fallas de pegado del netlist.
+
+    Args:
+        netlist: Netlist del circuito
+
+    Returns:
+        Lista de tuplas (cable, valor) con valor 0 o 1, para cada
+        entrada y cada salida de puerta, en orden de cables
+    """
+    cables = list(netlist.cables_entrada())
+    cables.extend(salida for _, _, salida in netlist.compuertas)
+    return [(cable, valor) for cable in cables for valor in (0, 1)]
+
+
+def describir_falla(netlist, falla: tuple, nombres: tuple = None) -> str:
+    """
+    Descripción legible de una falla.
+
+    Args:
+        netlist: Netlist del circuito
+        falla: Tupla (cable, valor)
+        nombres: Nombre de cada argumento de la función trazada (p. ej.
+            ("a_bits", "b_bits", "operacion")); por defecto su posición
+
+    Returns:
+        Texto como "adder_4bits[0]/full_adder[1]/half_adder[0] AND
+        (cable 31) s-a-1" o "b_bits[2] s-a-0"
+    """
+    cable, valor = falla
+    for k, entrada in enumerate(netlist.entradas):
+        nombre = nombres[k] if nombres else f"entrada {k}"
+        if entrada == cable:
+            return f"{nombre} s-a-{valor}"
+        if isinstance(entrada, list) and cable in entrada:
+            return f"{nombre}[{entrada.index(cable)}] s-a-{valor}"
+    for indice, (tipo, _, salida) in enumerate(netlist.compuertas):
+        if salida == cable:
+            origen = netlist.origen[indice] if netlist.origen else None
+            lugar = f"{origen} {tipo}" if origen else tipo
+            return f"{lugar} (cable {cable}) s-a-{valor}"
+    raise ValueError(f"El cable {cable} no es una entrada ni una salida de puerta")
+
+
+def _iniciar_trabajador(netlist, planos: list, n_vectores: int):
+    """
+    Prepara el estado de un proceso: el netlist, los planos de entrada y
+    las salidas del circuito correcto.
+    """
+    _trabajo.clear()
+    buenos = netlist.evaluar_planos(list(planos), mascara(n_vectores))
+    _trabajo.update(
+        programa=netlist.programa(),
+        netlist=netlist,
+        salidas=netlist.cables_salida(),
+        planos=planos,
+        buenos=buenos,
+        n_vectores=n_vectores,
+    )
+
+
+def _simular_pasada(fallas: list) -> list:
+    """
+    Simula un grupo de fallas con todos los vectores en una pasada.
+
+    Args:
+        fallas: Lista de tuplas (cable, valor)
+
+    Returns:
+        Por falla, la máscara de los vectores que la detectan (el bit k
+        es el vector k; 0 si ninguno)
+    """
+    n_vectores = _trabajo["n_vectores"]
+    bloque = mascara(n_vectores)
+    n_fallas = len(fallas)
+    todos = mascara(n_fallas * n_vectores)
+    # Copia de un plano de V bits en cada uno de los F bloques
+    replica = todos // bloque
+
+    # Máscaras (and, or) de cada cable con fallas
+    inyecciones = {}
+    for f, (cable, valor) in enumerate(fallas):
+        mascaras = inyecciones.setdefault(cable, [todos, 0])
+        mascaras[0] &= ~(bloque << (f * n_vectores))
+        if valor:
+            mascaras[1] |= bloque << (f * n_vectores)
+
+    valores = _trabajo["netlist"].valores_iniciales(
+        [plano * replica for plano in _trabajo["planos"]], todos)
+    for cable in range(UNO + 1, UNO + 1 + len(_trabajo["planos"])):
+        if cable in inyecciones:
+            y, o = inyecciones[cable]
+            valores[cable] = (valores[cable] & y) | o
+
+    for operador, a, b, salida in _trabajo["programa"]:
+        valor = operador(valores[a], valores[b])
+        if salida in inyecciones:
+            y, o = inyecciones[salida]
+            valor = (valor & y) | o
+        valores[salida] = valor
+
+    buenos = _trabajo["buenos"]
+    diferencias = 0
+    for cable in _trabajo["salidas"]:
+        diferencias |= valores[cable] ^ (buenos[cable] * replica)
+
+    return [(diferencias >> (f * n_vectores)) & bloque for f in range(n_fallas)]
+
+
+def simular_fallas(netlist, vectores: list, fallas: list = None,
+                   procesos: int = 1, fallas_por_pasada: int = None) -> dict:
+    """
+    Simula fallas de pegado con un conjunto de vectores de prueba.
+
+    Args:
+        netlist: Netlist del circuito (trazado con AND, OR y NOT para
+            tener fallas en todos los cables internos)
+        vectores: Lista de tuplas de argumentos de la función trazada
+        fallas: Fallas a simular (default: enumerar_fallas(netlist))
+        procesos: Procesos de trabajo; con más de 1 las pasadas se
+            reparten entre ellos
+        fallas_por_pasada: Fallas por pasada (default: las que caben en
+            ANCHO_PASADA bits)
+
+    Returns:
+        Diccionario con:
+        - total: Número de fallas simuladas
+        - detectadas: Número de fallas detectadas
+        - cobertura: Porcentaje de fallas detectadas
+        - no_detectadas: Lista de fallas no detectadas
+        - deteccion: Falla -> índice del primer vector que la detecta,
+          o None
+        - detectores: Falla -> máscara de los vectores que la detectan
+          (el bit k es el vector k)
+        - pasadas: Número de pasadas
+
+    Raises:
+        ValueError: Si no hay vectores, alguno no es válido o una falla
+            no está en el netlist
+    """
+    if not vectores:
+        raise ValueError("Se necesita al menos un vector")
+    if procesos < 1:
+        raise ValueError("procesos debe ser al menos 1")
+    fallas = enumerar_fallas(netlist) if fallas is None else list(fallas)
+    for cable, valor in fallas:
+        if not UNO < cable < netlist.n_cables or valor not in (0, 1):
+            raise ValueError(f"Falla no válida: {(cable, valor)}")
+
+    # Planos de entrada: el bit k del plano de un cable es su valor en
+    # el vector k
+    n_vectores = len(vectores)
+    bits = [netlist.aplanar(*v) for v in vectores]
+    planos = [0] * len(bits[0])
+    for k, fila in enumerate(bits):
+        for i, bit in enumerate(fila):
+            if bit:
+                planos[i] |= 1 << k
+
+    por_pasada = fallas_por_pasada or max(1, ANCHO_PASADA // n_vectores)
+    grupos = [fallas[i:i + por_pasada] for i in range(0, len(fallas), por_pasada)]
+    procesos = min(procesos, len(grupos))
+
+    if procesos <= 1:
+        _iniciar_trabajador(netlist, planos, n_vectores)
+        resultados = [_simular_pasada(grupo) for grupo in grupos]
+    else:
+        with ProcessPoolExecutor(procesos, initializer=_iniciar_trabajador,
+                                 initargs=(netlist, planos, n_vectores)) as ejecutor:
+            resultados = list(ejecutor.map(_simular_pasada, grupos))
+
+    detectores = {}
+    for grupo, resultado in zip(grupos, resultados):
+        detectores.update(zip(grupo, resultado))
+    deteccion = {falla: (m & -m).bit_length() - 1 if m else None
+                 for falla, m in detectores.items()}
+    no_detectadas = [falla for falla in fallas if deteccion[falla] is None]
+    detectadas = len(fallas) - len(no_detectadas)
+
+    return {
+        "total": len(fallas),
+        "detectadas": detectadas,
+        "cobertura": 100.0 * detectadas / len(fallas) if fallas else 100.0,
+        "no_detectadas": no_detectadas,
+        "deteccion": deteccion,
+        "detectores": detectores,
+        "pasadas": len(grupos),
+    }
+
+
+def vectores_exhaustivos(n_bits: int = 4) -> list:
+    """Las 2^(2N+1) entradas (a_bits, b_bits, operacion) de N bits."""
+    return [(list(a), list(b), op)
+            for a, b, op in product(product((0, 1), repeat=n_bits),
+                                    product((0, 1), repeat=n_bits), (0, 1))]
+
+
+def vectores_aleatorios(n_vectores: int, n_bits: int = 4, semilla: int = 0) -> list:
+    """n_vectores entradas (a_bits, b_bits, operacion) aleatorias de N bits."""
+    rng = random.Random(semilla)
+    return [([rng.getrandbits(1) for _ in range(n_bits)],
+             [rng.getrandbits(1) for _ in range(n_bits)],
+             rng.getrandbits(1)) for _ in range(n_vectores)]
+
+
+def simular_fallas_sumador(vectores: list, n_bits: int = None, sumador=None,
+                           **opciones) -> dict:
+    """
+    Simulación de fallas del sumador-restador de n bits.
+
+    Args:
+        vectores: Lista de tuplas (a_bits, b_bits, operacion)
+        n_bits: Ancho de los operandos (default: el de los vectores)
+        sumador: Sumador a usar (ver trazar_sumador_restador)
+        **opciones: Las de simular_fallas
+
+    Returns:
+        Resultado de simular_fallas, más netlist con el circuito trazado
+    """
+    if not vectores:
+        raise ValueError("Se necesita al menos un vector")
+    n_bits = n_bits or len(vectores[0][0])
+    red = trazar_sumador_restador(n_bits, sumador=sumador)
+    resultado = simular_fallas(red, vectores, **opciones)
+    resultado["netlist"] = red
+    return resultado
+
+
+def mostrar_reporte(resultado: dict, limite: int = 10):
+    """
+    Imprime la cobertura y las fallas no detectadas.
+
+    Args:
+        resultado: Diccionario de simular_fallas_sumador
+        limite: Máximo de fallas no detectadas que se listan
+    """
+    print(f"  Cobertura: {resultado['detectadas']}/{resultado['total']} "
+          f"fallas ({resultado['cobertura']:.1f}%)")
+    no_detectadas = resultado["no_detectadas"]
+    for falla in no_detectadas[:limite]:
+        print("    " + describir_falla(resultado["netlist"], falla,
+                                       ("a_bits", "b_bits", "operacion")))
+    if len(no_detectadas) > limite:
+        print(f"    ... y {len(no_detectadas) - limite} más")
+
+
+def prueba_fallas():
+    """
+    Cobertura de fallas del sumador-restador de 4 bits con todas las
+    entradas y con conjuntos pequeños de vectores aleatorios.
+    """
+    print("Simulación de fallas de pegado del sumador-restador de 4 bits:")
+    print("=" * 64)
+
+    exhaustivo = simular_fallas_sumador(vectores_exhaustivos(4))
+    print("Las 512 entradas:")
+    mostrar_reporte(exhaustivo)
+
+    for n_vectores in (4, 8, 16):
+        print(f"\n{n_vectores} vectores aleatorios:")
+        mostrar_reporte(simular_fallas_sumador(vectores_aleatorios(n_vectores, 4)),
+                        limite=3)
+
+    return exhaustivo["cobertura"] == 100.0
+
+
+if __name__ == "__main__":
+    prueba_fallas()
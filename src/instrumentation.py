@@ -0,0 +1,241 @@
+"""
+Instrumentación opcional: llamadas y tiempo de puertas y circuitos.
+
+activar() sustituye, en todos los módulos del paquete, las puertas de
+logic_gates y los circuitos compuestos (half_adder, full_adder,
+adder_4bits, complemento_a_2...) por envolturas que cuentan cada
+llamada y miden su tiempo. desactivar() vuelve a poner las funciones
+originales. La sustitución es la misma que usan medir_circuito y
+trazar (ver metrics), así que con la instrumentación desactivada no
+queda ninguna envoltura en el camino: las funciones del paquete llaman
+directamente a las originales y el coste es exactamente cero.
+
+Los tiempos son inclusivos: el de full_adder incluye el de sus dos
+half_adder, y como las llamadas internas también están envueltas,
+incluye el coste de su propia instrumentación. Sirven para comparar y
+para encontrar dónde se concentra el trabajo, no como medida absoluta.
+
+Solo se sustituyen los nombres de los módulos del paquete: una llamada
+desde fuera se cuenta si pasa por ellos (src.sumador_restador_4bits),
+pero no si usa una referencia tomada antes de activar (from src import
+sumador_restador_4bits en otro módulo). Las llamadas internas del
+paquete se cuentan siempre. Como la sustitución es global al proceso,
+no se debe activar desde varios hilos a la vez.
+
+Uso:
+    import src
+    with instrumentar() as medicion:
+        src.sumador_restador_4bits([0,1,1,1], [0,0,1,0], 1)
+    medicion["full_adder"]["llamadas"]   # 4
+"""
+
+import functools
+import time
+from contextlib import contextmanager
+
+from . import logic_gates
+from .half_adder import half_adder
+from .full_adder import full_adder
+from .adder_4bit import adder_4bits
+from .complement import complemento_a_1, complemento_a_2
+from .adder_subtractor import sumador_restador_4bits
+from .metrics import _sustituir_funciones
+
+
+# Funciones que se pueden instrumentar, en orden de abajo arriba
+INSTRUMENTABLES = {
+    "AND": logic_gates.AND,
+    "OR": logic_gates.OR,
+    "NOT": logic_gates.NOT,
+    "XOR": logic_gates.XOR,
+    "NAND": logic_gates.NAND,
+    "NOR": logic_gates.NOR,
+    "half_adder": half_adder,
+    "full_adder": full_adder,
+    "adder_4bits": adder_4bits,
+    "complemento_a_1": complemento_a_1,
+    "complemento_a_2": complemento_a_2,
+    "sumador_restador_4bits": sumador_restador_4bits,
+}
+
+# Nombre -> [llamadas, nanosegundos]; las envolturas actualizan la lista
+_contadores = {nombre: [0, 0] for nombre in INSTRUMENTABLES}
+
+# Función original -> envoltura, mientras la instrumentación está activa
+_envolturas = {}
+
+
+def _envolver(nombre: str, funcion, tiempos: bool):
+    """Envoltura que cuenta las llamadas y, si se pide, el tiempo."""
+    contador = _contadores[nombre]
+
+    if tiempos:
+        reloj = time.perf_counter_ns
+
+        @functools.wraps(funcion)
+        def envoltura(*args, **kwargs):
+            inicio = reloj()
+            try:
+                return funcion(*args, **kwargs)
+            finally:
+                contador[0] += 1
+                contador[1] += reloj() - inicio
+    else:
+        @functools.wraps(funcion)
+        def envoltura(*args, **kwargs):
+            contador[0] += 1
+            return funcion(*args, **kwargs)
+
+    return envoltura
+
+
+def activa() -> bool:
+    """Indica si la instrumentación está activa."""
+    return bool(_envolturas)
+
+
+def activar(nombres=None, tiempos: bool = True):
+    """
+    Activa la instrumentación.
+
+    Args:
+        nombres: Funciones a instrumentar (claves de INSTRUMENTABLES);
+            por defecto todas
+        tiempos: Si es False solo se cuentan las llamadas, con menos
+            coste por llamada
+
+    Raises:
+        ValueError: Si algún nombre es desconocido
+        RuntimeError: Si la instrumentación ya está activa
+    """
+    if activa():
+        raise RuntimeError("La instrumentación ya está activa")
+    nombres = list(nombres or INSTRUMENTABLES)
+    for nombre in nombres:
+        if nombre not in INSTRUMENTABLES:
+            raise ValueError(f"Función desconocida: {nombre}. "
+                             f"Opciones: {tuple(INSTRUMENTABLES)}")
+
+    for nombre in nombres:
+        original = INSTRUMENTABLES[nombre]
+        _envolturas[original] = _envolver(nombre, original, tiempos)
+    _sustituir_funciones(_envolturas)
+
+
+def desactivar():
+    """
+    Vuelve a poner las funciones originales. Los contadores se
+    conservan hasta reiniciar().
+    """
+    if not activa():
+        return
+    _sustituir_funciones({envoltura: original
+                          for original, envoltura in _envolturas.items()})
+    _envolturas.clear()
+
+
+def reiniciar():
+    """Pone a cero todos los contadores."""
+    for contador in _contadores.values():
+        contador[0] = 0
+        contador[1] = 0
+
+
+def instantanea() -> dict:
+    """
+    Copia de los contadores.
+
+    Returns:
+        Diccionario nombre -> {"llamadas": int, "tiempo": segundos}
+        con las funciones llamadas al menos una vez
+    """
+    return {
+        nombre: {"llamadas": llamadas, "tiempo": nanosegundos / 1e9}
+        for nombre, (llamadas, nanosegundos) in _contadores.items()
+        if llamadas
+    }
+
+
+@contextmanager
+def instrumentar(nombres=None, tiempos: bool = True):
+    """
+    Instrumenta un bloque de código.
+
+    Si la instrumentación ya estaba activa se mide con ella y se deja
+    activa; si no, se activa solo durante el bloque.
+
+    Args:
+        nombres: Funciones a instrumentar (ver activar)
+        tiempos: Si es False solo se cuentan las llamadas
+
+    Yields:
+        Diccionario que al salir del bloque contiene la instantánea de
+        las llamadas hechas dentro de él
+    """
+    medicion = {}
+    propia = not activa()
+    if propia:
+        activar(nombres, tiempos)
+    inicio = instantanea()
+    try:
+        yield medicion
+    finally:
+        for nombre, datos in instantanea().items():
+            previo = inicio.get(nombre, {"llamadas": 0, "tiempo": 0.0})
+            llamadas = datos["llamadas"] - previo["llamadas"]
+            if llamadas:
+                medicion[nombre] = {
+                    "llamadas": llamadas,
+                    "tiempo": datos["tiempo"] - previo["tiempo"],
+                }
+        if propia:
+            desactivar()
+
+
+def mostrar_instantanea(datos: dict):
+    """
+    Imprime una instantánea, de las funciones de más arriba a las de
+    más abajo.
+
+    Args:
+        datos: Diccionario de instantanea() o de instrumentar()
+    """
+    print(f"{'Función':<24} | {'Llamadas':>9} | {'Tiempo (ms)':>11} | "
+          f"{'µs/llamada':>10}")
+    print("-" * 64)
+    for nombre in reversed(list(INSTRUMENTABLES)):
+        if nombre in datos:
+            llamadas = datos[nombre]["llamadas"]
+            tiempo = datos[nombre]["tiempo"]
+            print(f"{nombre:<24} | {llamadas:>9} | {tiempo * 1e3:>11.3f} | "
+                  f"{tiempo * 1e6 / llamadas:>10.2f}")
+
+
+def prueba_instrumentacion():
+    """
+    Muestra el trabajo de una resta de 4 bits y de las 512 operaciones.
+    """
+    from itertools import product
+
+    print("Instrumentación de sumador_restador_4bits:")
+    print("=" * 64)
+
+    with instrumentar() as medicion:
+        sumador_restador_4bits([0, 1, 1, 1], [0, 0, 1, 0], 1)
+    print("Una resta (7 - 2):")
+    mostrar_instantanea(medicion)
+
+    with instrumentar() as medicion:
+        for a, b, op in product(product((0, 1), repeat=4),
+                                product((0, 1), repeat=4), (0, 1)):
+            sumador_restador_4bits(list(a), list(b), op, motor="dos_pasos")
+    print("\nLas 512 operaciones con el motor dos_pasos:")
+    mostrar_instantanea(medicion)
+
+    correcto = not activa() and medicion["full_adder"]["llamadas"] == 512 * 4 + 256 * 4
+    print(f"\n{'✓' if correcto else '✗'} Instrumentación desactivada al salir")
+    return correcto
+
+
+if __name__ == "__main__":
+    prueba_instrumentacion()
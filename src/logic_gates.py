@@ -103,6 +103,22 @@ def NAND(a: int, b: int) -> int:
     return NOT(AND(a, b))
 
 
+def NOR(a: int, b: int) -> int:
+    """
+    Implementa la puerta lógica NOR usando solo OR y NOT.
+    
+    NOR(a,b) = NOT(OR(a,b))
+    
+    Args:
+        a: Primer bit de entrada (0 o 1)
+        b: Segundo bit de entrada (0 o 1)
+        
+    Returns:
+        Resultado de la operación NOR (0 o 1)
+    """
+    return NOT(OR(a, b))
+
+
 def prueba_tablas_verdad():
     """
     Muestra las tablas de verdad de todas las puertas lógicas.
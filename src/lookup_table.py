@@ -0,0 +1,164 @@
+"""
+Motor de tabla precalculada para el sumador-restador de 4 bits.
+
+El espacio de entradas es pequeño (16 x 16 x 2 = 512 combinaciones),
+así que se recorre una sola vez con el circuito de puertas lógicas y
+se guarda cada resultado. Después, cada operación se resuelve con una
+única búsqueda en la tabla.
+
+El circuito de puertas sigue siendo la referencia: la tabla se construye
+a partir de él y verificar_tabla() comprueba que ambos coinciden. Se usa
+siempre la función original (inspect.unwrap): con instrumentation o
+grabar_vcd activos, sumador_restador_4bits es una envoltura, y construir
+la tabla no es una llamada del usuario.
+"""
+
+import inspect
+from itertools import product
+
+from .adder_subtractor import sumador_restador_4bits
+
+
+# Motor de puertas usado como referencia para construir la tabla
+MOTOR_REFERENCIA = "fusionado"
+
+# Tabla compartida, se construye la primera vez que se necesita
+_tabla = None
+
+
+def construir_tabla() -> dict:
+    """
+    Construye la tabla de resultados recorriendo el circuito de puertas.
+
+    Returns:
+        Diccionario de 512 entradas. La clave es la tupla
+        (a3, a2, a1, a0, b3, b2, b1, b0, operacion) y el valor es
+        (resultado_bits, cout), con resultado_bits como tupla.
+    """
+    referencia = inspect.unwrap(sumador_restador_4bits)
+    tabla = {}
+    for entrada in product((0, 1), repeat=9):
+        a_bits = list(entrada[0:4])
+        b_bits = list(entrada[4:8])
+        operacion = entrada[8]
+        resultado, cout = referencia(
+            a_bits, b_bits, operacion, motor=MOTOR_REFERENCIA
+        )
+        tabla[entrada] = (tuple(resultado), cout)
+    return tabla
+
+
+def obtener_tabla() -> dict:
+    """
+    Devuelve la tabla compartida, construyéndola si aún no existe.
+
+    Returns:
+        La tabla de 512 entradas (ver construir_tabla)
+    """
+    global _tabla
+    if _tabla is None:
+        _tabla = construir_tabla()
+    return _tabla
+
+
+def sumador_restador_tabla(a_bits: list, b_bits: list, operacion: int):
+    """
+    Sumador-restador de 4 bits resuelto con una búsqueda en la tabla.
+
+    Tiene la misma interfaz y los mismos resultados que
+    sumador_restador_4bits, pero sin evaluar ninguna puerta.
+
+    Args:
+        a_bits: Lista de 4 bits representando el primer número
+        b_bits: Lista de 4 bits representando el segundo número
+        operacion: 0 para suma, 1 para resta
+
+    Returns:
+        Tupla (resultado_bits, cout) igual que sumador_restador_4bits
+
+    Raises:
+        ValueError: Si la entrada no es válida
+
+    Examples:
+        >>> sumador_restador_tabla([0,1,1,1], [0,0,1,0], 1)
+        ([0,1,0,1], 1)  # 7 - 2 = 5
+    """
+    # La clave no separa A de B: sin esta comprobación, dos anchos
+    # erróneos que suman 8 bits darían una entrada de la tabla
+    if len(a_bits) != 4 or len(b_bits) != 4:
+        raise ValueError("Las listas deben tener exactamente 4 bits")
+
+    tabla = _tabla if _tabla is not None else obtener_tabla()
+    try:
+        resultado, cout = tabla[(*a_bits, *b_bits, operacion)]
+    except (KeyError, TypeError):
+        # Entrada fuera de la tabla: el circuito de referencia
+        # lanza el mismo error que lanzaría sin la tabla
+        return inspect.unwrap(sumador_restador_4bits)(
+            a_bits, b_bits, operacion, motor=MOTOR_REFERENCIA)
+    return list(resultado), cout
+
+
+def verificar_tabla(tabla: dict = None) -> bool:
+    """
+    Comprueba que la tabla coincide con el circuito de puertas.
+
+    Vuelve a evaluar las 512 combinaciones con el circuito de referencia
+    y las compara con cada entrada de la tabla.
+
+    Args:
+        tabla: Tabla a verificar (default: la tabla compartida)
+
+    Returns:
+        True si la tabla tiene las 512 entradas y todas coinciden
+    """
+    if tabla is None:
+        tabla = obtener_tabla()
+
+    if len(tabla) != 512:
+        return False
+
+    referencia = inspect.unwrap(sumador_restador_4bits)
+    for entrada in product((0, 1), repeat=9):
+        esperado = referencia(
+            list(entrada[0:4]), list(entrada[4:8]), entrada[8],
+            motor=MOTOR_REFERENCIA
+        )
+        if entrada not in tabla:
+            return False
+        resultado, cout = tabla[entrada]
+        if (list(resultado), cout) != esperado:
+            return False
+
+    return True
+
+
+def prueba_tabla():
+    """
+    Construye la tabla, la verifica y muestra algunas operaciones.
+    """
+    print("Prueba del motor de tabla precalculada:")
+    print("=" * 60)
+
+    tabla = obtener_tabla()
+    print(f"Entradas en la tabla: {len(tabla)}")
+
+    correcta = verificar_tabla(tabla)
+    estado = "✓" if correcta else "✗"
+    print(f"Tabla == circuito de puertas: {estado}")
+
+    casos = [
+        ([0,1,0,1], [0,0,1,1], 0, "5 + 3"),
+        ([0,1,1,1], [0,0,1,0], 1, "7 - 2"),
+        ([0,0,1,0], [0,1,1,1], 1, "2 - 7"),
+    ]
+
+    for a, b, op, desc in casos:
+        resultado, cout = sumador_restador_tabla(a, b, op)
+        print(f"\n{desc}: {resultado} (cout={cout})")
+
+    return correcta
+
+
+if __name__ == "__main__":
+    prueba_tabla()
@@ -0,0 +1,266 @@
+"""
+Métricas estructurales de los circuitos: puertas, profundidad y fan-out.
+
+Para medir un circuito se ejecuta una vez con bits que recuerdan su
+profundidad lógica (el número de puertas entre la entrada y ese bit) y
+un identificador de cable para contar cuántas puertas lo leen (fan-out).
+Durante la medición AND, OR y NOT se sustituyen en todos los módulos
+del paquete por versiones que cuentan cada evaluación y propagan la
+profundidad, así que las puertas derivadas (XOR, NAND) se miden por las
+primitivas que las componen.
+
+Con sensibilizado=True la profundidad tiene en cuenta los valores: una
+AND con una entrada a 0 (o una OR con una entrada a 1) queda decidida
+por esa entrada, sin esperar a las demás. Así se mide el retardo real
+de un vector concreto y se descartan los caminos falsos, que en diseños
+como el sumador con salto de acarreo dominan la profundidad topológica.
+
+La sustitución es temporal y global al proceso: no se debe medir desde
+varios hilos a la vez.
+"""
+
+import sys
+from collections import Counter
+from contextlib import contextmanager
+from itertools import count
+from types import FunctionType
+
+from . import logic_gates
+
+
+# Puertas primitivas del paquete, todas las demás se construyen con ellas
+PRIMITIVAS = ("AND", "OR", "NOT")
+
+# Valor de entrada que decide la salida de cada puerta por sí solo
+VALOR_CONTROLANTE = {"AND": 0, "OR": 1}
+
+
+class _Senal(int):
+    """Bit (0 o 1) que recuerda su profundidad lógica y su cable."""
+
+    def __new__(cls, valor: int, nivel: int = 0, cable: int = None):
+        senal = super().__new__(cls, valor)
+        senal.nivel = nivel
+        senal.cable = cable
+        return senal
+
+
+def _nivel(bit) -> int:
+    """Profundidad de un bit; las constantes tienen profundidad 0."""
+    return getattr(bit, "nivel", 0)
+
+
+def _modulos_del_paquete():
+    """Módulos del paquete cargados en el proceso."""
+    paquete = logic_gates.__name__.rpartition(".")[0]
+    for modulo in list(sys.modules.values()):
+        # __spec__ identifica también a un módulo ejecutado con -m
+        spec = getattr(modulo, "__spec__", None)
+        nombre = spec.name if spec else getattr(modulo, "__name__", "")
+        if nombre == paquete or nombre.startswith(paquete + "."):
+            yield modulo
+
+
+def _sustituir_funciones(reemplazos: dict):
+    """
+    Sustituye funciones en todos los módulos del paquete.
+
+    Se cambian los nombres globales que apuntan a cada función original
+    y los valores por defecto de las funciones del paquete (como
+    sumador=adder_4bits), que Python fija al definir la función. Para
+    deshacerlo se llama con el diccionario invertido.
+
+    Args:
+        reemplazos: Diccionario función original -> función que la
+            reemplaza
+    """
+    # Por id: los valores de los módulos no tienen por qué ser hashables
+    por_id = {id(original): (original, nueva)
+              for original, nueva in reemplazos.items()}
+
+    def sustituto(valor):
+        par = por_id.get(id(valor))
+        return par[1] if par is not None and par[0] is valor else None
+
+    def sustituir_defaults(funcion):
+        defaults = funcion.__defaults__
+        for d in defaults:
+            if id(d) in por_id:
+                funcion.__defaults__ = tuple(sustituto(d) or d for d in defaults)
+                break
+
+    for modulo in _modulos_del_paquete():
+        for nombre, valor in list(vars(modulo).items()):
+            if type(valor) is FunctionType and valor.__defaults__:
+                sustituir_defaults(valor)
+            par = por_id.get(id(valor))
+            if par is not None and par[0] is valor:
+                setattr(modulo, nombre, par[1])
+                # La función sustituida puede tener sus propios defaults
+                if type(par[1]) is FunctionType and par[1].__defaults__:
+                    sustituir_defaults(par[1])
+
+
+@contextmanager
+def _compuertas_sustituidas(reemplazos: dict):
+    """
+    Sustituye temporalmente puertas primitivas en todo el paquete.
+
+    Args:
+        reemplazos: Diccionario nombre -> función que reemplaza a la
+            puerta original de logic_gates con ese nombre
+    """
+    sustituciones = {getattr(logic_gates, nombre): reemplazo
+                     for nombre, reemplazo in reemplazos.items()}
+    _sustituir_funciones(sustituciones)
+    try:
+        yield
+    finally:
+        # Se recorren de nuevo los módulos por si alguno se importó
+        # durante la sustitución y enlazó la puerta sustituida
+        _sustituir_funciones({reemplazo: original
+                              for original, reemplazo in sustituciones.items()})
+
+
+def _a_senales(entrada, cables):
+    """
+    Convierte un bit o una lista de bits en señales de profundidad 0.
+
+    Args:
+        entrada: Bit o lista de bits
+        cables: Iterador que numera los cables
+    """
+    if isinstance(entrada, (list, tuple)):
+        return [_Senal(bit, 0, next(cables)) for bit in entrada]
+    return _Senal(entrada, 0, next(cables))
+
+
+def _aplanar(salida) -> list:
+    """Devuelve los bits de una salida anidada (tuplas y listas)."""
+    if isinstance(salida, (list, tuple)):
+        bits = []
+        for elemento in salida:
+            bits.extend(_aplanar(elemento))
+        return bits
+    return [salida]
+
+
+def medir_circuito(funcion, *entradas, sensibilizado: bool = False) -> dict:
+    """
+    Mide el número de puertas y la profundidad lógica de un circuito.
+
+    El circuito se evalúa una vez con las entradas dadas. Para circuitos
+    combinacionales sin ramas dependientes de los datos (todos los
+    sumadores del paquete) el resultado no depende de los valores.
+
+    Args:
+        funcion: Función que implementa el circuito
+        *entradas: Argumentos de la función; cada uno es un bit o una
+            lista de bits
+        sensibilizado: Si es True, la profundidad de cada puerta depende
+            de los valores (ver la descripción del módulo) y el resultado
+            corresponde solo a estas entradas
+
+    Returns:
+        Diccionario con:
+        - compuertas: Número total de puertas primitivas evaluadas
+        - por_tipo: Número de puertas AND, OR y NOT
+        - profundidad: Puertas en el camino crítico (máximo de las salidas)
+        - profundidad_salidas: Profundidad de cada bit de salida, en el
+          orden en que la función los devuelve
+        - fanout_maximo: Mayor número de puertas que leen un mismo cable
+        - fanout_medio: Media de lectores por cable leído
+
+    Examples:
+        >>> medir_circuito(full_adder, 0, 0, 0)["compuertas"]
+        13
+    """
+    contador = Counter()
+    lectores = Counter()
+    cables = count()
+
+    def medida(nombre, original):
+        def compuerta(*bits):
+            contador[nombre] += 1
+            for bit in bits:
+                if isinstance(bit, _Senal):
+                    lectores[bit.cable] += 1
+            controlante = VALOR_CONTROLANTE.get(nombre)
+            decisivos = [_nivel(b) for b in bits if b == controlante]
+            if sensibilizado and decisivos:
+                nivel = 1 + min(decisivos)
+            else:
+                nivel = 1 + max(_nivel(b) for b in bits)
+            return _Senal(original(*bits), nivel, next(cables))
+        return compuerta
+
+    reemplazos = {nombre: medida(nombre, getattr(logic_gates, nombre))
+                  for nombre in PRIMITIVAS}
+
+    # Medir directamente una primitiva también debe contarla
+    for nombre in PRIMITIVAS:
+        if funcion is getattr(logic_gates, nombre):
+            funcion = reemplazos[nombre]
+
+    senales = [_a_senales(entrada, cables) for entrada in entradas]
+    with _compuertas_sustituidas(reemplazos):
+        salida = funcion(*senales)
+
+    niveles = [_nivel(bit) for bit in _aplanar(salida)]
+    return {
+        "compuertas": sum(contador.values()),
+        "por_tipo": {nombre: contador[nombre] for nombre in PRIMITIVAS},
+        "profundidad": max(niveles, default=0),
+        "profundidad_salidas": niveles,
+        "fanout_maximo": max(lectores.values(), default=0),
+        "fanout_medio": (sum(lectores.values()) / len(lectores)
+                         if lectores else 0.0),
+    }
+
+
+def medir_sumador(sumador, n_bits: int) -> dict:
+    """
+    Mide un sumador con la interfaz (a_bits, b_bits, cin).
+
+    Args:
+        sumador: Función sumadora, p. ej. adder_4bits o adder_nbits
+        n_bits: Ancho de los operandos
+
+    Returns:
+        El diccionario de medir_circuito; profundidad_salidas tiene los
+        bits del resultado (MSB primero) seguidos del acarreo de salida
+    """
+    return medir_circuito(sumador, [0] * n_bits, [0] * n_bits, 0)
+
+
+def prueba_metricas():
+    """
+    Muestra las métricas de los circuitos del paquete.
+    """
+    from .half_adder import half_adder
+    from .full_adder import full_adder
+    from .adder_4bit import adder_4bits
+
+    print("Métricas de los circuitos:")
+    print("=" * 60)
+    print(f"{'Circuito':<14} | {'Puertas':>7} | {'AND':>4} | {'OR':>4} | "
+          f"{'NOT':>4} | {'Prof.':>5}")
+    print("-" * 60)
+
+    circuitos = [
+        ("Half adder", half_adder, (0, 0)),
+        ("Full adder", full_adder, (0, 0, 0)),
+        ("Adder 4 bits", adder_4bits, ([0] * 4, [0] * 4, 0)),
+    ]
+
+    for nombre, funcion, entradas in circuitos:
+        m = medir_circuito(funcion, *entradas)
+        t = m["por_tipo"]
+        print(f"{nombre:<14} | {m['compuertas']:>7} | {t['AND']:>4} | "
+              f"{t['OR']:>4} | {t['NOT']:>4} | {m['profundidad']:>5}")
+
+    return True
+
+
+if __name__ == "__main__":
+    prueba_metricas()
@@ -0,0 +1,269 @@
+"""
+Optimización de netlists: constantes, subexpresiones comunes y puertas
+muertas.
+
+Los netlists trazados conservan toda la estructura de las funciones:
+XOR se descompone en 2 NOT, 2 AND y 1 OR aunque otra XOR ya haya negado
+la misma señal, y complemento_a_2 suma la constante [0,0,0,1] con una
+cadena completa de sumadores. optimizar() recorre las puertas en orden
+topológico y para cada una:
+
+1. Sustituye sus entradas por el cable que las representa.
+2. Simplifica con las reglas del álgebra de Boole cuando alguna entrada
+   es constante, las dos entradas son el mismo cable o una es la
+   negación de la otra (AND(x, 0) = 0, OR(x, x) = x, NOT(NOT(x)) = x,
+   AND(x, NOT(x)) = 0...). La salida pasa a ser un cable existente.
+3. Si ya existe una puerta del mismo tipo con las mismas entradas
+   (en cualquier orden), reutiliza su salida.
+
+Al final se eliminan las puertas cuya salida no llega a ninguna salida
+del circuito y se renumeran los cables. Una sola pasada basta: como las
+puertas se visitan en orden topológico, cada simplificación se propaga
+a las siguientes.
+"""
+
+from .netlist import Netlist, CERO, UNO, _aplanar
+
+
+# Puertas cuyas entradas se pueden intercambiar
+CONMUTATIVAS = ("AND", "OR", "XOR", "NAND", "NOR")
+
+
+def _simplificar(tipo: str, entradas: tuple, negacion: dict):
+    """
+    Aplica las reglas de simplificación a una puerta.
+
+    Args:
+        tipo: Tipo de la puerta
+        entradas: Cables de entrada, ya sustituidos por su representante
+        negacion: Cable -> cable del que es la negación (salidas de NOT)
+
+    Returns:
+        Tupla (cable, None) si la puerta equivale a un cable existente o
+        a una constante, o (None, (tipo, entradas)) con la puerta que
+        queda, posiblemente de otro tipo
+    """
+    if tipo == "NOT":
+        (x,) = entradas
+        if x == CERO:
+            return UNO, None
+        if x == UNO:
+            return CERO, None
+        if x in negacion:
+            return negacion[x], None
+        return None, (tipo, entradas)
+
+    x, y = entradas
+    constantes = {x, y} & {CERO, UNO}
+    complementarias = negacion.get(x) == y or negacion.get(y) == x
+    otra = y if x in (CERO, UNO) else x
+
+    if tipo == "AND":
+        if CERO in constantes or complementarias:
+            return CERO, None
+        if UNO in constantes:
+            return otra, None
+        if x == y:
+            return x, None
+    elif tipo == "OR":
+        if UNO in constantes or complementarias:
+            return UNO, None
+        if CERO in constantes:
+            return otra, None
+        if x == y:
+            return x, None
+    elif tipo == "XOR":
+        if x == y:
+            return CERO, None
+        if complementarias:
+            return UNO, None
+        if x in (CERO, UNO) and y in (CERO, UNO):
+            return (UNO if x != y else CERO), None
+        if CERO in constantes:
+            return otra, None
+        if UNO in constantes:
+            return _simplificar("NOT", (otra,), negacion)
+    elif tipo == "NAND":
+        if CERO in constantes or complementarias:
+            return UNO, None
+        if UNO in constantes:
+            return _simplificar("NOT", (otra,), negacion)
+        if x == y:
+            return _simplificar("NOT", (x,), negacion)
+    elif tipo == "NOR":
+        if UNO in constantes or complementarias:
+            return CERO, None
+        if CERO in constantes:
+            return _simplificar("NOT", (otra,), negacion)
+        if x == y:
+            return _simplificar("NOT", (x,), negacion)
+
+    return None, (tipo, entradas)
+
+
+def _renumerar(salida, nuevos: dict):
+    """Sustituye los cables de una estructura de salidas."""
+    if isinstance(salida, list):
+        return [_renumerar(elemento, nuevos) for elemento in salida]
+    if isinstance(salida, tuple):
+        return tuple(_renumerar(elemento, nuevos) for elemento in salida)
+    return nuevos[salida]
+
+
+def _compactar(entradas: list, compuertas: list, salidas,
+               origen: dict = None) -> Netlist:
+    """
+    Elimina las puertas muertas y renumera los cables.
+
+    Args:
+        entradas: Entradas del netlist (sus cables no cambian)
+        compuertas: Puertas en orden topológico
+        salidas: Estructura de salidas sobre los cables de compuertas
+        origen: Cable de salida de cada puerta -> su ruta de llamadas,
+            o None si no se conoce
+
+    Returns:
+        Netlist con las puertas que llegan a alguna salida, cuyas
+        salidas quedan numeradas a continuación de las entradas
+    """
+    necesarios = set(_aplanar(salidas))
+    vivas = []
+    for tipo, cables, salida in reversed(compuertas):
+        if salida in necesarios:
+            necesarios.update(cables)
+            vivas.append((tipo, cables, salida))
+    vivas.reverse()
+
+    # Constantes y entradas conservan su cable
+    cables_entrada = _aplanar(entradas)
+    nuevos = {CERO: CERO, UNO: UNO}
+    nuevos.update((cable, cable) for cable in cables_entrada)
+    siguiente = UNO + 1 + len(cables_entrada)
+    resultado = []
+    for tipo, cables, salida in vivas:
+        nuevos[salida] = siguiente
+        resultado.append((tipo, tuple(nuevos[c] for c in cables), siguiente))
+        siguiente += 1
+
+    if origen is not None:
+        origen = [origen[salida] for _, _, salida in vivas]
+    return Netlist(entradas, resultado, _renumerar(salidas, nuevos), siguiente,
+                   origen)
+
+
+def optimizar(netlist: Netlist) -> Netlist:
+    """
+    Devuelve un netlist equivalente con menos puertas.
+
+    Args:
+        netlist: Netlist a optimizar (no se modifica)
+
+    Returns:
+        Netlist con las mismas entradas y la misma estructura de salidas,
+        tras propagar constantes, compartir subexpresiones comunes y
+        eliminar las puertas muertas. Cada puerta que queda conserva su
+        origen
+
+    Examples:
+        >>> red = trazar(adder_4bits, [0]*4, [0]*4)   # cin = 0 constante
+        >>> len(red), len(optimizar(red))
+        (52, 45)
+    """
+    # Cable original -> cable que lo representa
+    representante = {CERO: CERO, UNO: UNO}
+    for cable in netlist.cables_entrada():
+        representante[cable] = cable
+
+    negacion = {}
+    existentes = {}
+    compuertas = []
+
+    for tipo, entradas, salida in netlist.compuertas:
+        entradas = tuple(representante[c] for c in entradas)
+        cable, puerta = _simplificar(tipo, entradas, negacion)
+        if cable is not None:
+            representante[salida] = cable
+            continue
+
+        tipo, entradas = puerta
+        clave = (tipo, tuple(sorted(entradas)) if tipo in CONMUTATIVAS else entradas)
+        if clave in existentes:
+            representante[salida] = existentes[clave]
+            continue
+
+        existentes[clave] = salida
+        representante[salida] = salida
+        compuertas.append((tipo, entradas, salida))
+        if tipo == "NOT":
+            negacion[salida] = entradas[0]
+            negacion.setdefault(entradas[0], salida)
+
+    origen = None
+    if netlist.origen is not None:
+        origen = {salida: ruta for (_, _, salida), ruta
+                  in zip(netlist.compuertas, netlist.origen)}
+    return _compactar(netlist.entradas, compuertas,
+                      _renumerar(netlist.salidas, representante), origen)
+
+
+def reporte_optimizacion(netlist: Netlist) -> dict:
+    """
+    Compara un netlist con su versión optimizada.
+
+    Args:
+        netlist: Netlist a optimizar
+
+    Returns:
+        Diccionario con:
+        - antes, despues: Diccionarios con compuertas (total), por_tipo
+          y profundidad (niveles) de cada versión
+        - optimizado: El netlist optimizado
+    """
+    optimizado = optimizar(netlist)
+
+    def resumen(red):
+        return {
+            "compuertas": len(red),
+            "por_tipo": red.contar(),
+            "profundidad": len(red.niveles()),
+        }
+
+    return {
+        "antes": resumen(netlist),
+        "despues": resumen(optimizado),
+        "optimizado": optimizado,
+    }
+
+
+def prueba_optimizador():
+    """
+    Muestra el efecto de la optimización en varios circuitos.
+    """
+    from .netlist import trazar, trazar_sumador_restador
+    from .adder_4bit import adder_4bits
+    from .complement import complemento_a_2
+
+    print("Optimización de netlists:")
+    print("=" * 60)
+    print(f"{'Circuito':<28} | {'Antes':>6} | {'Después':>7} | {'Prof.':>9}")
+    print("-" * 60)
+
+    circuitos = [
+        ("adder_4bits (cin = 0)", trazar(adder_4bits, [0] * 4, [0] * 4)),
+        ("complemento_a_2", trazar(complemento_a_2, [0] * 4)),
+        ("sumador_restador 4 bits", trazar_sumador_restador(4)),
+        ("sumador_restador 32 bits", trazar_sumador_restador(32)),
+    ]
+
+    for nombre, red in circuitos:
+        r = reporte_optimizacion(red)
+        antes, despues = r["antes"], r["despues"]
+        print(f"{nombre:<28} | {antes['compuertas']:>6} | "
+              f"{despues['compuertas']:>7} | "
+              f"{antes['profundidad']:>4}->{despues['profundidad']:<3}")
+
+    return True
+
+
+if __name__ == "__main__":
+    prueba_optimizador()
@@ -0,0 +1,244 @@
+"""
+Actividad de conmutación y estimación de potencia dinámica.
+
+La potencia dinámica de un circuito CMOS es proporcional a cuántas
+veces cambia de valor cada cable, por la capacidad que carga. Este
+módulo pasa un flujo de operaciones por el netlist del sumador-restador
+(ver netlist) y cuenta, para cada cable, las conmutaciones entre cada
+operación y la siguiente:
+
+1. El flujo se consume en bloques de K operaciones (itertools.islice),
+   así que la memoria no depende de su longitud: sirve un generador o
+   un archivo de millones de líneas (ver leer_operaciones).
+2. Cada bloque se evalúa de una vez por planos de bits (ver bitslice):
+   el bit k del plano de un cable es su valor en la operación k.
+3. Las conmutaciones dentro del bloque son los unos de
+   plano ^ (plano >> 1) en las K - 1 posiciones válidas; la del borde
+   entre bloques se obtiene comparando el último bit del bloque
+   anterior con el primero del actual.
+
+El modelo es de retardo cero: cuenta los cambios del valor estable de
+cada cable, no los glitches de la cadena de acarreo (para esos, ver
+event_sim). La energía se estima como la suma de las conmutaciones de
+cada cable por su carga, el número de puertas que lo leen (al menos 1).
+"""
+
+from itertools import islice, chain
+
+from .netlist import trazar_sumador_restador
+from .bitslice import mascara
+
+
+# Operaciones por bloque de evaluación
+BLOQUE = 4096
+
+
+def _contar_unos(plano: int) -> int:
+    """Número de bits a 1 de un plano."""
+    return bin(plano).count("1")
+
+
+def actividad(netlist, operaciones, bloque: int = BLOQUE) -> dict:
+    """
+    Cuenta las conmutaciones de cada cable a lo largo de un flujo.
+
+    Args:
+        netlist: Netlist del circuito
+        operaciones: Iterable de tuplas de argumentos de la función
+            trazada; se recorre una sola vez
+        bloque: Operaciones evaluadas a la vez
+
+    Returns:
+        Diccionario con:
+        - operaciones: Número de operaciones del flujo
+        - transiciones: Pares de operaciones consecutivas (operaciones - 1)
+        - conmutaciones: Conmutaciones de cada cable (índice = cable)
+        - por_compuerta: Conmutaciones de la salida de cada puerta, en
+          el orden de netlist.compuertas
+        - total: Suma de por_compuerta
+        - por_operacion: total / transiciones
+        - actividad: Por puerta, conmutaciones / transiciones (factor
+          de actividad, entre 0 y 1)
+        - energia: Suma de conmutaciones por carga de cada cable (ver
+          el docstring del módulo), en unidades arbitrarias
+
+    Raises:
+        ValueError: Si bloque no es positivo o alguna operación no es
+            válida
+    """
+    if bloque < 1:
+        raise ValueError("El bloque debe tener al menos una operación")
+
+    n_cables = netlist.n_cables
+    conmutaciones = [0] * n_cables
+    ultimo = None      # Valor de cada cable en la operación anterior
+    n_operaciones = 0
+
+    iterador = iter(operaciones)
+    while True:
+        lote = list(islice(iterador, bloque))
+        if not lote:
+            break
+        k = len(lote)
+
+        # Plano de cada entrada: la operación k es el bit k
+        filas = [netlist.aplanar(*entradas) for entradas in reversed(lote)]
+        planos = [int("".join(map(str, columna)), 2) for columna in zip(*filas)]
+        todos = mascara(k)
+        valores = netlist.evaluar_planos(planos, todos)
+
+        interior = todos >> 1
+        for cable in range(n_cables):
+            plano = valores[cable]
+            cambios = _contar_unos((plano ^ (plano >> 1)) & interior)
+            if ultimo is not None:
+                cambios += ultimo[cable] ^ (plano & 1)
+            conmutaciones[cable] += cambios
+        ultimo = [(valores[cable] >> (k - 1)) & 1 for cable in range(n_cables)]
+        n_operaciones += k
+
+    transiciones = max(n_operaciones - 1, 0)
+    lectores = netlist.lectores()
+    por_compuerta = [conmutaciones[salida] for _, _, salida in netlist.compuertas]
+    total = sum(por_compuerta)
+    energia = sum(conmutaciones[c] * max(len(lectores[c]), 1)
+                  for c in range(n_cables))
+
+    return {
+        "operaciones": n_operaciones,
+        "transiciones": transiciones,
+        "conmutaciones": conmutaciones,
+        "por_compuerta": por_compuerta,
+        "total": total,
+        "por_operacion": total / transiciones if transiciones else 0.0,
+        "actividad": [c / transiciones if transiciones else 0.0
+                      for c in por_compuerta],
+        "energia": energia,
+    }
+
+
+def actividad_sumador_restador(operaciones, n_bits: int = None, sumador=None,
+                               bloque: int = BLOQUE) -> dict:
+    """
+    Actividad de conmutación del sumador-restador.
+
+    Args:
+        operaciones: Iterable de tuplas (a_bits, b_bits, operacion)
+        n_bits: Ancho de los operandos (default: el de la primera
+            operación)
+        sumador: Sumador a usar (ver trazar_sumador_restador)
+        bloque: Operaciones evaluadas a la vez
+
+    Returns:
+        Resultado de actividad, más netlist con el circuito trazado
+
+    Raises:
+        ValueError: Si el flujo está vacío y no se da n_bits
+    """
+    iterador = iter(operaciones)
+    if n_bits is None:
+        primera = next(iterador, None)
+        if primera is None:
+            raise ValueError("El flujo de operaciones está vacío")
+        n_bits = len(primera[0])
+        iterador = chain([primera], iterador)
+
+    red = trazar_sumador_restador(n_bits, sumador=sumador)
+    resultado = actividad(red, iterador, bloque)
+    resultado["netlist"] = red
+    return resultado
+
+
+def por_componente(netlist, por_compuerta: list, profundidad: int = 2) -> dict:
+    """
+    Agrupa las conmutaciones por componente según el origen de las puertas.
+
+    Args:
+        netlist: Netlist trazado (con origen)
+        por_compuerta: Conmutaciones de cada puerta (ver actividad)
+        profundidad: Niveles de la ruta de llamadas que se conservan;
+            con 2, "sumador_restador_4bits[0]/adder_4bits[0]/full_adder[1]/
+            half_adder[0]" se cuenta en "sumador_restador_4bits[0]/adder_4bits[0]"
+
+    Returns:
+        Diccionario ruta -> conmutaciones, en orden de primera aparición
+    """
+    grupos = {}
+    for indice, cambios in enumerate(por_compuerta):
+        origen = netlist.origen[indice] if netlist.origen else ""
+        ruta = "/".join(origen.split("/")[:profundidad]) or "-"
+        grupos[ruta] = grupos.get(ruta, 0) + cambios
+    return grupos
+
+
+def leer_operaciones(ruta: str):
+    """
+    Lee un flujo de operaciones de un archivo de texto, línea a línea.
+
+    Cada línea tiene los bits de A, los de B y la operación separados
+    por espacios, p. ej. "0111 0010 1"; la operación puede ser 0/1 o
+    +/-. Se ignoran las líneas vacías y las que empiezan por "#".
+
+    Args:
+        ruta: Ruta del archivo
+
+    Yields:
+        Tuplas (a_bits, b_bits, operacion)
+
+    Raises:
+        ValueError: Si una línea no tiene el formato esperado
+    """
+    operaciones = {"0": 0, "1": 1, "+": 0, "-": 1}
+    with open(ruta, encoding="utf-8") as archivo:
+        for numero, linea in enumerate(archivo, 1):
+            linea = linea.strip()
+            if not linea or linea.startswith("#"):
+                continue
+            campos = linea.split()
+            if (len(campos) != 3 or campos[2] not in operaciones
+                    or not set(campos[0] + campos[1]) <= {"0", "1"}):
+                raise ValueError(f"Línea {numero} no válida: {linea!r}")
+            yield ([int(c) for c in campos[0]], [int(c) for c in campos[1]],
+                   operaciones[campos[2]])
+
+
+def prueba_potencia():
+    """
+    Compara la actividad de un flujo aleatorio con la de un contador y
+    muestra qué componentes conmutan más.
+    """
+    import random
+    from .utils import entero_a_bits
+
+    print("Actividad de conmutación del sumador-restador de 8 bits:")
+    print("=" * 64)
+
+    rng = random.Random(8)
+    aleatorio = (([rng.getrandbits(1) for _ in range(8)],
+                  [rng.getrandbits(1) for _ in range(8)],
+                  rng.getrandbits(1)) for _ in range(20000))
+    uno = entero_a_bits(1, 8)
+    contador = ((entero_a_bits(i % 256, 8), uno, 0) for i in range(20000))
+
+    resultados = {}
+    for nombre, flujo in (("aleatorio", aleatorio), ("contador", contador)):
+        r = actividad_sumador_restador(flujo)
+        resultados[nombre] = r
+        print(f"{nombre:<10}: {r['operaciones']} operaciones, "
+              f"{r['por_operacion']:.1f} conmutaciones/operación, "
+              f"energía {r['energia']}")
+
+    r = resultados["aleatorio"]
+    print("\nComponentes con más conmutaciones (flujo aleatorio):")
+    grupos = por_componente(r["netlist"], r["por_compuerta"], profundidad=3)
+    for ruta, cambios in sorted(grupos.items(), key=lambda g: -g[1])[:5]:
+        print(f"  {cambios:>8}  {ruta}")
+
+    correcto = (resultados["contador"]["por_operacion"]
+                < resultados["aleatorio"]["por_operacion"])
+    print(f"\n{'✓' if correcto else '✗'} El contador conmuta menos que el flujo aleatorio")
+    return correcto
+
+
+if __name__ == "__main__":
+    prueba_potencia()
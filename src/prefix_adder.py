@@ -0,0 +1,231 @@
+"""
+Sumadores de prefijos paralelos: Kogge-Stone, Brent-Kung y Sklansky.
+
+Igual que en el sumador con acarreo anticipado, cada bit produce un
+generar (g = A AND B) y un propagar (p = A XOR B). El acarreo que sale
+de la posición i es el generar del rango [i:0], que se obtiene
+combinando rangos contiguos con el operador de prefijo:
+
+    (G, P) o (G', P') = (G + P·G', P·P')
+
+Cada operador son 3 puertas (AND, OR y AND), o 2 cuando el rango
+resultante llega a la posición 0 y ya no hace falta P. Las topologías se
+diferencian en cómo se organizan los operadores:
+- Kogge-Stone: log2(n) niveles, muchos operadores, fan-out 2
+- Brent-Kung: 2·log2(n) - 1 niveles, pocos operadores, fan-out 2
+- Sklansky: log2(n) niveles, pocos operadores, fan-out que crece con n
+
+La red se genera primero como una lista de operaciones por nivel
+(red_prefijos) y después se construye con puertas (adder_prefijos).
+"""
+
+from .logic_gates import AND, OR, XOR
+from .adder_nbits import _validar_bits
+
+
+TOPOLOGIAS = ("kogge_stone", "brent_kung", "sklansky")
+
+
+def red_prefijos(topologia: str, n_bits: int) -> list:
+    """
+    Genera la red de prefijos de una topología.
+
+    Args:
+        topologia: "kogge_stone", "brent_kung" o "sklansky"
+        n_bits: Número de posiciones
+
+    Returns:
+        Lista de niveles; cada nivel es una lista de pares (i, j) que
+        indican que la posición i se combina con la posición j < i
+        (posiciones numeradas desde el LSB). Las operaciones de un mismo
+        nivel leen los valores del nivel anterior.
+
+    Raises:
+        ValueError: Si la topología no existe o n_bits < 1
+
+    Examples:
+        >>> red_prefijos("kogge_stone", 4)
+        [[(1, 0), (2, 1), (3, 2)], [(2, 0), (3, 1)]]
+    """
+    if n_bits < 1:
+        raise ValueError("El número de bits debe ser al menos 1")
+
+    niveles = []
+
+    if topologia == "kogge_stone":
+        distancia = 1
+        while distancia < n_bits:
+            niveles.append([(i, i - distancia) for i in range(distancia, n_bits)])
+            distancia *= 2
+
+    elif topologia == "sklansky":
+        distancia = 1
+        while distancia < n_bits:
+            niveles.append([(i, (i // distancia) * distancia - 1)
+                            for i in range(n_bits)
+                            if (i // distancia) % 2 == 1])
+            distancia *= 2
+
+    elif topologia == "brent_kung":
+        # Subida: se combinan bloques de tamaño creciente
+        distancia = 1
+        while 2 * distancia <= n_bits:
+            niveles.append([(i, i - distancia)
+                            for i in range(2 * distancia - 1, n_bits,
+                                           2 * distancia)])
+            distancia *= 2
+        # Bajada: se completan las posiciones que faltan
+        distancia //= 2
+        while distancia >= 1:
+            nivel = [(i, i - distancia)
+                     for i in range(3 * distancia - 1, n_bits, 2 * distancia)]
+            if nivel:
+                niveles.append(nivel)
+            distancia //= 2
+
+    else:
+        raise ValueError(f"Topología desconocida: {topologia}. "
+                         f"Opciones: {TOPOLOGIAS}")
+
+    return niveles
+
+
+def adder_prefijos(a_bits: list, b_bits: list, cin: int = 0,
+                   topologia: str = "kogge_stone"):
+    """
+    Implementa un sumador de prefijos paralelos de N bits.
+
+    El acarreo de entrada se incorpora al generar de la posición 0
+    (g0 + p0·cin), así que la red calcula directamente todos los acarreos.
+
+    Args:
+        a_bits: Lista de N bits representando el primer número
+        b_bits: Lista de N bits representando el segundo número
+        cin: Acarreo de entrada (default: 0)
+        topologia: "kogge_stone", "brent_kung" o "sklansky"
+
+    Returns:
+        Tupla (resultado_bits, cout), igual que adder_nbits
+
+    Raises:
+        ValueError: Si las entradas o la topología no son válidas
+
+    Examples:
+        >>> adder_prefijos([0,1,0,1], [0,0,1,1], topologia="sklansky")
+        ([1,0,0,0], 0)  # 5 + 3 = 8
+    """
+    n_bits = _validar_bits(a_bits, b_bits)
+    red = red_prefijos(topologia, n_bits)
+
+    # Pasar a LSB primero para indexar por posición
+    a = a_bits[::-1]
+    b = b_bits[::-1]
+    p = [XOR(a[i], b[i]) for i in range(n_bits)]
+    g = [AND(a[i], b[i]) for i in range(n_bits)]
+    g[0] = OR(g[0], AND(p[0], cin))
+
+    # grupo_g[i] y grupo_p[i] cubren el rango [i:k] ya combinado;
+    # completo[i] indica que el rango llega hasta la posición 0
+    grupo_g = list(g)
+    grupo_p = list(p)
+    completo = [i == 0 for i in range(n_bits)]
+    for nivel in red:
+        anterior_g = list(grupo_g)
+        anterior_p = list(grupo_p)
+        anterior_completo = list(completo)
+        for i, j in nivel:
+            grupo_g[i] = OR(anterior_g[i], AND(anterior_p[i], anterior_g[j]))
+            # Si el rango ya llega a la posición 0 solo hace falta G
+            if anterior_completo[j]:
+                completo[i] = True
+            else:
+                grupo_p[i] = AND(anterior_p[i], anterior_p[j])
+
+    # El acarreo hacia la posición i es el generar del rango [i-1:0]
+    acarreos = [cin] + grupo_g[:-1]
+    resultado = [XOR(p[i], acarreos[i]) for i in range(n_bits)]
+    return resultado[::-1], grupo_g[-1]
+
+
+def adder_kogge_stone(a_bits: list, b_bits: list, cin: int = 0):
+    """Sumador Kogge-Stone con la interfaz (a_bits, b_bits, cin)."""
+    return adder_prefijos(a_bits, b_bits, cin, "kogge_stone")
+
+
+def adder_brent_kung(a_bits: list, b_bits: list, cin: int = 0):
+    """Sumador Brent-Kung con la interfaz (a_bits, b_bits, cin)."""
+    return adder_prefijos(a_bits, b_bits, cin, "brent_kung")
+
+
+def adder_sklansky(a_bits: list, b_bits: list, cin: int = 0):
+    """Sumador Sklansky con la interfaz (a_bits, b_bits, cin)."""
+    return adder_prefijos(a_bits, b_bits, cin, "sklansky")
+
+
+def reportar_topologias(n_bits: int) -> list:
+    """
+    Compara las topologías de prefijos para un ancho dado.
+
+    Args:
+        n_bits: Ancho de los operandos
+
+    Returns:
+        Lista con un diccionario por topología con:
+        - topologia: Nombre de la topología
+        - operadores: Número de operadores de prefijo en la red
+        - niveles: Niveles de la red de prefijos
+        - fanout_red: Mayor número de lectores de un nodo de la red
+          (los operadores que lo usan más el propio nodo)
+        - compuertas, profundidad, fanout_maximo, fanout_medio: Medidas
+          del sumador completo con puertas primitivas (ver medir_circuito)
+    """
+    from .metrics import medir_circuito
+
+    reporte = []
+    for topologia in TOPOLOGIAS:
+        red = red_prefijos(topologia, n_bits)
+        fanout_red = max(
+            (1 + sum(1 for _, j in nivel if j == nodo)
+             for nivel in red for nodo in {j for _, j in nivel}),
+            default=1
+        )
+        metricas = medir_circuito(
+            lambda a, b, cin: adder_prefijos(a, b, cin, topologia),
+            [0] * n_bits, [0] * n_bits, 0
+        )
+        reporte.append({
+            "topologia": topologia,
+            "operadores": sum(len(nivel) for nivel in red),
+            "niveles": len(red),
+            "fanout_red": fanout_red,
+            "compuertas": metricas["compuertas"],
+            "profundidad": metricas["profundidad"],
+            "fanout_maximo": metricas["fanout_maximo"],
+            "fanout_medio": metricas["fanout_medio"],
+        })
+    return reporte
+
+
+def prueba_prefijos():
+    """
+    Muestra el reporte de las topologías para varios anchos.
+    """
+    print("Sumadores de prefijos paralelos:")
+    print("=" * 72)
+    print(f"{'Bits':>4} | {'Topología':<12} | {'Oper.':>5} | {'Niv.':>4} | "
+          f"{'Puertas':>7} | {'Prof.':>5} | {'Fan-out':>7}")
+    print("(Fan-out: red de prefijos / puertas primitivas)")
+    print("-" * 72)
+
+    for n_bits in (8, 16, 32):
+        for fila in reportar_topologias(n_bits):
+            print(f"{n_bits:>4} | {fila['topologia']:<12} | "
+                  f"{fila['operadores']:>5} | {fila['niveles']:>4} | "
+                  f"{fila['compuertas']:>7} | {fila['profundidad']:>5} | "
+                  f"{fila['fanout_red']:>3}/{fila['fanout_maximo']:<3}")
+
+    return True
+
+
+if __name__ == "__main__":
+    prueba_prefijos()
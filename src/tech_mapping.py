@@ -0,0 +1,260 @@
+"""
+Mapeo tecnológico a bibliotecas de una sola puerta (NAND o NOR).
+
+NAND y NOR son universales: cualquier circuito se puede construir solo
+con una de ellas, y en CMOS estático son las puertas más baratas (4
+transistores frente a 6 de AND u OR). mapear() reescribe un netlist
+(ver netlist) con una sola clase de puerta, sustituyendo cada puerta
+por su plantilla (p es la puerta de la biblioteca):
+
+    Biblioteca NAND                     Biblioteca NOR
+    NOT x   = p(x, x)                   NOT x   = p(x, x)
+    AND x y = NOT p(x, y)               AND x y = p(NOT x, NOT y)
+    OR x y  = p(NOT x, NOT y)           OR x y  = NOT p(x, y)
+    XOR x y = p(p(x, n), p(y, n))       XOR x y = NOT p(p(x, n), p(y, n))
+              con n = p(x, y)                     con n = p(x, y)
+
+Al construir se eliminan las dobles negaciones (AND seguida de OR se
+convierte en la forma NAND-NAND) y se comparten las puertas iguales,
+así que el sumador completo queda en las 9 NAND de los libros de texto.
+
+El resultado es un Netlist como cualquier otro: se evalúa con
+Netlist.evaluar, con planos de bits (evaluar_planos) o compilado
+(compiler.compilar), y se mide con las mismas cuentas de puertas y
+niveles que el circuito original.
+"""
+
+from .half_adder import half_adder
+from .full_adder import full_adder
+from .adder_4bit import adder_4bits
+from .netlist import CERO, UNO, trazar, trazar_sumador_restador
+from .optimizer import optimizar, _compactar, _renumerar
+
+
+# Bibliotecas disponibles
+BIBLIOTECAS = ("NAND", "NOR")
+
+# Transistores por puerta de dos entradas en CMOS estático (estimación)
+TRANSISTORES = {
+    "NOT": 2,
+    "NAND": 4,
+    "NOR": 4,
+    "AND": 6,
+    "OR": 6,
+    "XOR": 12,
+}
+
+# Primitivas de la traza: XOR como un nodo para usar su plantilla
+PRIMITIVAS_TRAZA = ("AND", "OR", "NOT", "XOR")
+
+# Circuitos del informe: nombre -> función que devuelve su netlist
+CIRCUITOS = {
+    "half_adder": lambda primitivas: trazar(half_adder, 0, 0,
+                                            primitivas=primitivas),
+    "full_adder": lambda primitivas: trazar(full_adder, 0, 0, 0,
+                                            primitivas=primitivas),
+    "adder_4bits": lambda primitivas: trazar(
+        adder_4bits, [0] * 4, [0] * 4, 0, primitivas=primitivas),
+    "sumador_restador_4bits": lambda primitivas: trazar_sumador_restador(
+        4, primitivas=primitivas),
+}
+
+
+def mapear(netlist, biblioteca: str = "NAND", optimizado: bool = True):
+    """
+    Reescribe un netlist con una sola clase de puerta.
+
+    Args:
+        netlist: Netlist a mapear (no se modifica)
+        biblioteca: "NAND" o "NOR"
+        optimizado: Si es True, el netlist pasa antes por optimizar()
+            para no mapear puertas redundantes
+
+    Returns:
+        Netlist equivalente cuyas puertas son todas de la biblioteca
+
+    Raises:
+        ValueError: Si la biblioteca o alguna puerta es desconocida
+
+    Examples:
+        >>> red = mapear(trazar(full_adder, 0, 0, 0, primitivas=("AND", "OR", "XOR")))
+        >>> red.contar(), red.evaluar(1, 1, 0)
+        ({'NAND': 9}, (0, 1))
+    """
+    if biblioteca not in BIBLIOTECAS:
+        raise ValueError(f"Biblioteca desconocida: {biblioteca}. "
+                         f"Opciones: {BIBLIOTECAS}")
+    if optimizado:
+        netlist = optimizar(netlist)
+
+    compuertas = []
+    # Cada puerta nueva toma el origen de la puerta que se está mapeando
+    origen = {} if netlist.origen is not None else None
+    ruta = [None]
+    existentes = {}
+    # Salida de p(x, x) -> x, para eliminar las dobles negaciones
+    negado_de = {}
+    siguiente = [netlist.n_cables]
+
+    def p(x, y):
+        if x == y and x in negado_de:
+            return negado_de[x]
+        clave = (min(x, y), max(x, y))
+        salida = existentes.get(clave)
+        if salida is None:
+            salida = existentes[clave] = siguiente[0]
+            siguiente[0] += 1
+            compuertas.append((biblioteca, (x, y), salida))
+            if origen is not None:
+                origen[salida] = ruta[0]
+            if x == y:
+                negado_de[salida] = x
+        return salida
+
+    def negar(x):
+        return p(x, x)
+
+    def xor_propia(x, y):
+        # XOR para NAND, XNOR para NOR
+        n = p(x, y)
+        return p(p(x, n), p(y, n))
+
+    if biblioteca == "NAND":
+        plantillas = {
+            "NOT": negar,
+            "AND": lambda x, y: negar(p(x, y)),
+            "OR": lambda x, y: p(negar(x), negar(y)),
+            "NAND": p,
+            "NOR": lambda x, y: negar(p(negar(x), negar(y))),
+            "XOR": xor_propia,
+        }
+    else:
+        plantillas = {
+            "NOT": negar,
+            "AND": lambda x, y: p(negar(x), negar(y)),
+            "OR": lambda x, y: negar(p(x, y)),
+            "NAND": lambda x, y: negar(p(negar(x), negar(y))),
+            "NOR": p,
+            "XOR": lambda x, y: negar(xor_propia(x, y)),
+        }
+
+    # Cable original -> cable del netlist mapeado
+    cables = {CERO: CERO, UNO: UNO}
+    for cable in netlist.cables_entrada():
+        cables[cable] = cable
+
+    for indice, (tipo, entradas, salida) in enumerate(netlist.compuertas):
+        if tipo not in plantillas:
+            raise ValueError(f"Puerta desconocida: {tipo}")
+        if origen is not None:
+            ruta[0] = netlist.origen[indice]
+        cables[salida] = plantillas[tipo](*(cables[c] for c in entradas))
+
+    # Las dobles negaciones eliminadas dejan puertas sin lectores
+    return _compactar(netlist.entradas, compuertas,
+                      _renumerar(netlist.salidas, cables), origen)
+
+
+def costo(netlist) -> dict:
+    """
+    Coste de un netlist para dimensionar el hardware.
+
+    Returns:
+        Diccionario con:
+        - compuertas: Número total de puertas
+        - por_tipo: Puertas de cada tipo
+        - profundidad: Niveles lógicos (puertas en el camino más largo)
+        - transistores: Estimación en CMOS estático (ver TRANSISTORES)
+    """
+    por_tipo = netlist.contar()
+    return {
+        "compuertas": len(netlist),
+        "por_tipo": por_tipo,
+        "profundidad": len(netlist.niveles()),
+        "transistores": sum(TRANSISTORES[tipo] * n for tipo, n in por_tipo.items()),
+    }
+
+
+def mapear_circuito(nombre: str, biblioteca: str = "NAND"):
+    """
+    Netlist mapeado de uno de los circuitos del paquete.
+
+    Args:
+        nombre: Clave de CIRCUITOS
+        biblioteca: "NAND" o "NOR"
+
+    Returns:
+        Netlist con las mismas entradas que la función del circuito
+        (adder_4bits recibe cin como tercer argumento)
+
+    Raises:
+        ValueError: Si el circuito o la biblioteca son desconocidos
+    """
+    if nombre not in CIRCUITOS:
+        raise ValueError(f"Circuito desconocido: {nombre}. "
+                         f"Opciones: {tuple(CIRCUITOS)}")
+    return mapear(CIRCUITOS[nombre](PRIMITIVAS_TRAZA), biblioteca)
+
+
+def reporte_tecnologia(nombres: list = None) -> dict:
+    """
+    Coste de los circuitos con las puertas originales y cada biblioteca.
+
+    La columna "original" es el circuito tal como está escrito en el
+    paquete, con XOR descompuesta en AND, OR y NOT.
+
+    Args:
+        nombres: Circuitos a incluir (default: todos los de CIRCUITOS)
+
+    Returns:
+        Diccionario nombre -> {"original": costo, "NAND": costo,
+        "NOR": costo}
+
+    Raises:
+        ValueError: Si algún circuito es desconocido
+    """
+    reporte = {}
+    for nombre in nombres or CIRCUITOS:
+        if nombre not in CIRCUITOS:
+            raise ValueError(f"Circuito desconocido: {nombre}. "
+                             f"Opciones: {tuple(CIRCUITOS)}")
+        fila = {"original": costo(CIRCUITOS[nombre](("AND", "OR", "NOT")))}
+        for biblioteca in BIBLIOTECAS:
+            fila[biblioteca] = costo(mapear_circuito(nombre, biblioteca))
+        reporte[nombre] = fila
+    return reporte
+
+
+def prueba_tech_mapping():
+    """
+    Muestra el coste de cada circuito por biblioteca y verifica los
+    circuitos mapeados con todas sus entradas.
+    """
+    from itertools import product
+
+    print("Mapeo tecnológico (puertas / niveles / transistores):")
+    print("=" * 72)
+    print(f"{'Circuito':<24} | {'Original':>14} | {'NAND':>14} | {'NOR':>14}")
+    print("-" * 72)
+
+    for nombre, fila in reporte_tecnologia().items():
+        celdas = [f"{c['compuertas']}/{c['profundidad']}/{c['transistores']}"
+                  for c in (fila["original"], fila["NAND"], fila["NOR"])]
+        print(f"{nombre:<24} | {celdas[0]:>14} | {celdas[1]:>14} | {celdas[2]:>14}")
+
+    original = CIRCUITOS["sumador_restador_4bits"](("AND", "OR", "NOT"))
+    errores = 0
+    for biblioteca in BIBLIOTECAS:
+        red = mapear_circuito("sumador_restador_4bits", biblioteca)
+        for a, b, op in product(product((0, 1), repeat=4),
+                                product((0, 1), repeat=4), (0, 1)):
+            if red.evaluar(list(a), list(b), op) != original.evaluar(list(a), list(b), op):
+                errores += 1
+
+    estado = "✓" if errores == 0 else "✗"
+    print(f"\nSumador-restador NAND y NOR: {errores} diferencias {estado}")
+    return errores == 0
+
+
+if __name__ == "__main__":
+    prueba_tech_mapping()
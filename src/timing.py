@@ -0,0 +1,213 @@
+"""
+Análisis estático de tiempos (STA) del sumador-restador.
+
+En lugar de simular entradas, el análisis estático recorre el netlist
+(ver netlist) una vez en cada sentido y da cotas válidas para todas las
+entradas a la vez:
+
+1. Llegada: el instante más tardío en que puede cambiar cada cable. Las
+   entradas llegan en 0 y cada puerta suma su retardo (ver
+   event_sim.RETARDOS) al máximo de las llegadas de sus entradas.
+2. Camino crítico: siguiendo hacia atrás, desde la salida más tardía,
+   la entrada que fijó la llegada de cada puerta.
+3. Holgura: con un tiempo objetivo, el instante requerido de cada cable
+   es el mínimo, entre las puertas que lo leen, de su requerido menos
+   su retardo. Holgura = requerido - llegada; si es negativa en alguna
+   salida, el circuito no cumple el objetivo.
+
+Cada paso visita cada puerta una vez, así que el coste es lineal en el
+tamaño del circuito: el sumador de 64 bits se analiza tan rápido como
+se traza. El análisis es pesimista (no descarta caminos falsos que
+ninguna entrada sensibiliza), igual que medir_circuito sin
+sensibilizado.
+"""
+
+from .event_sim import RETARDOS
+from .netlist import trazar, trazar_sumador_restador
+
+
+# Primitivas de la traza: XOR como un nodo con su propio retardo
+PRIMITIVAS_TIEMPOS = ("AND", "OR", "NOT", "XOR")
+
+
+def analizar_tiempos(netlist, retardos: dict = None,
+                     objetivo: float = None) -> dict:
+    """
+    Análisis estático de tiempos de un netlist.
+
+    Args:
+        netlist: Netlist a analizar
+        retardos: Retardo por tipo de puerta; los tipos que falten toman
+            el valor de event_sim.RETARDOS
+        objetivo: Tiempo objetivo para la holgura (default: el retardo
+            máximo, con lo que la holgura mínima es 0)
+
+    Returns:
+        Diccionario con:
+        - llegada: Llegada de cada salida, con la misma estructura que
+          las salidas del netlist (p. ej. ([b3, b2, b1, b0], cout))
+        - retardo_maximo: Mayor llegada de una salida
+        - camino_critico: Lista de puertas desde una entrada hasta la
+          salida más tardía; cada una es un diccionario con indice,
+          tipo, origen (ruta de llamadas o None) y llegada
+        - objetivo: Tiempo objetivo usado
+        - holgura: Holgura de cada salida, con la estructura de llegada
+        - holgura_minima: Menor holgura de una salida
+        - holgura_compuertas: Holgura de la salida de cada puerta
+        - cumple: True si ninguna holgura es negativa
+
+    Raises:
+        ValueError: Si algún retardo es negativo o una puerta es desconocida
+
+    Examples:
+        >>> r = analizar_tiempos(trazar(full_adder, 0, 0, 0))
+        >>> r["llegada"], r["retardo_maximo"]
+        ((6, 5), 6)
+    """
+    retardos = {**RETARDOS, **(retardos or {})}
+    if any(r < 0 for r in retardos.values()):
+        raise ValueError("Los retardos no pueden ser negativos")
+    for tipo, _, _ in netlist.compuertas:
+        if tipo not in retardos:
+            raise ValueError(f"Puerta desconocida: {tipo}")
+
+    # Hacia delante: llegada de cada cable y puerta que la fija
+    llegada = [0] * netlist.n_cables
+    productora = [None] * netlist.n_cables
+    for indice, (tipo, entradas, salida) in enumerate(netlist.compuertas):
+        llegada[salida] = retardos[tipo] + max(llegada[c] for c in entradas)
+        productora[salida] = indice
+
+    cables_salida = netlist.cables_salida()
+    retardo_maximo = max((llegada[c] for c in cables_salida), default=0)
+    if objetivo is None:
+        objetivo = retardo_maximo
+
+    # Camino crítico: hacia atrás por la entrada más tardía de cada puerta
+    camino = []
+    cable = max(cables_salida, key=lambda c: llegada[c], default=None)
+    while cable is not None and productora[cable] is not None:
+        indice = productora[cable]
+        tipo, entradas, _ = netlist.compuertas[indice]
+        camino.append({
+            "indice": indice,
+            "tipo": tipo,
+            "origen": netlist.origen[indice] if netlist.origen else None,
+            "llegada": llegada[cable],
+        })
+        cable = max(entradas, key=lambda c: llegada[c])
+    camino.reverse()
+
+    # Hacia atrás: instante requerido de cada cable
+    infinito = float("inf")
+    requerido = [infinito] * netlist.n_cables
+    for c in cables_salida:
+        requerido[c] = objetivo
+    for tipo, entradas, salida in reversed(netlist.compuertas):
+        limite = requerido[salida] - retardos[tipo]
+        for c in entradas:
+            if limite < requerido[c]:
+                requerido[c] = limite
+
+    holgura_compuertas = [requerido[salida] - llegada[salida]
+                          for _, _, salida in netlist.compuertas]
+    holguras = [objetivo - llegada[c] for c in cables_salida]
+
+    return {
+        "llegada": netlist.reconstruir(llegada),
+        "retardo_maximo": retardo_maximo,
+        "camino_critico": camino,
+        "objetivo": objetivo,
+        "holgura": netlist.reconstruir([objetivo - t for t in llegada]),
+        "holgura_minima": min(holguras, default=objetivo),
+        "holgura_compuertas": holgura_compuertas,
+        "cumple": all(h >= 0 for h in holguras),
+    }
+
+
+def analizar_sumador(n_bits: int = 4, retardos: dict = None,
+                     objetivo: float = None, sumador=None) -> dict:
+    """
+    Análisis estático de tiempos del sumador de n bits.
+
+    Args:
+        n_bits: Ancho de los operandos (default: 4)
+        retardos: Retardo por tipo de puerta (ver analizar_tiempos)
+        objetivo: Tiempo objetivo (ver analizar_tiempos)
+        sumador: Sumador (a_bits, b_bits, cin); por defecto adder_4bits
+            para 4 bits y adder_nbits para otros anchos
+
+    Returns:
+        Resultado de analizar_tiempos; las salidas son
+        (resultado_bits, cout) y cin es una entrada más
+    """
+    from .adder_4bit import adder_4bits
+    from .adder_nbits import adder_nbits
+
+    sumador = sumador or (adder_4bits if n_bits == 4 else adder_nbits)
+    red = trazar(sumador, [0] * n_bits, [0] * n_bits, 0,
+                 primitivas=PRIMITIVAS_TIEMPOS)
+    return analizar_tiempos(red, retardos, objetivo)
+
+
+def analizar_sumador_restador(n_bits: int = 4, retardos: dict = None,
+                              objetivo: float = None, sumador=None) -> dict:
+    """
+    Análisis estático de tiempos del sumador-restador de n bits.
+
+    Args:
+        n_bits: Ancho de los operandos (default: 4)
+        retardos: Retardo por tipo de puerta (ver analizar_tiempos)
+        objetivo: Tiempo objetivo (ver analizar_tiempos)
+        sumador: Sumador a usar (ver trazar_sumador_restador)
+
+    Returns:
+        Resultado de analizar_tiempos; las salidas son
+        (resultado_bits, cout)
+    """
+    red = trazar_sumador_restador(n_bits, primitivas=PRIMITIVAS_TIEMPOS,
+                                  sumador=sumador)
+    return analizar_tiempos(red, retardos, objetivo)
+
+
+def mostrar_camino(camino: list):
+    """
+    Imprime un camino crítico, una puerta por línea.
+
+    Args:
+        camino: Lista devuelta en analizar_tiempos()["camino_critico"]
+    """
+    for paso in camino:
+        origen = paso["origen"] or "-"
+        print(f"  {paso['llegada']:>6}  {paso['tipo']:<4} {origen}")
+
+
+def prueba_timing():
+    """
+    Muestra el informe de tiempos del sumador-restador de 4 bits y el
+    retardo máximo de anchos mayores.
+    """
+    print("Análisis estático de tiempos del sumador-restador de 4 bits:")
+    print("=" * 72)
+    r = analizar_sumador_restador(4, objetivo=10)
+    resultado, cout = r["llegada"]
+    print(f"Llegada de los bits de resultado (MSB primero): {resultado}")
+    print(f"Llegada del acarreo de salida: {cout}")
+    print(f"Retardo máximo: {r['retardo_maximo']}, objetivo: {r['objetivo']}, "
+          f"holgura mínima: {r['holgura_minima']} "
+          f"({'cumple' if r['cumple'] else 'no cumple'})")
+    print("\nCamino crítico (llegada, puerta, origen):")
+    mostrar_camino(r["camino_critico"])
+
+    print(f"\n{'Bits':>4} | {'adder':>7} | {'sumador_restador':>16}")
+    print("-" * 34)
+    for n_bits in (4, 8, 16, 32, 64):
+        sumador = analizar_sumador(n_bits)["retardo_maximo"]
+        completo = analizar_sumador_restador(n_bits)["retardo_maximo"]
+        print(f"{n_bits:>4} | {sumador:>7} | {completo:>16}")
+
+    return True
+
+
+if __name__ == "__main__":
+    prueba_timing()
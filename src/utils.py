@@ -5,6 +5,7 @@ Incluye conversiones, visualización y entrada de datos.
 """
 
 from .adder_4bit import bits_a_decimal
+from .bitvector import validados
 
 
 def bits_a_entero(bits: list, es_resta: bool = False, cout: int = 0) -> int:
@@ -38,6 +39,59 @@ def bits_a_entero(bits: list, es_resta: bool = False, cout: int = 0) -> int:
         return -valor_positivo
 
 
+def entero_a_bits(valor: int, n_bits: int = 4) -> list:
+    """
+    Convierte un entero a una lista de n bits (MSB primero).
+    
+    Los valores negativos se representan en complemento a 2.
+    
+    Args:
+        valor: Entero entre -2**(n_bits-1) y 2**n_bits - 1
+        n_bits: Número de bits del resultado (default: 4)
+        
+    Returns:
+        Lista de n_bits bits (0 o 1)
+        
+    Raises:
+        ValueError: Si el valor no cabe en n_bits bits
+        
+    Examples:
+        >>> entero_a_bits(5)
+        [0,1,0,1]
+        >>> entero_a_bits(-1, 8)
+        [1,1,1,1,1,1,1,1]
+    """
+    if n_bits < 1:
+        raise ValueError("El número de bits debe ser al menos 1")
+    if not -(1 << (n_bits - 1)) <= valor < (1 << n_bits):
+        raise ValueError(f"{valor} no cabe en {n_bits} bits")
+    
+    valor &= (1 << n_bits) - 1
+    return [(valor >> i) & 1 for i in range(n_bits - 1, -1, -1)]
+
+
+def bits_a_valor(bits: list) -> int:
+    """
+    Convierte una lista de bits de cualquier ancho a su valor sin signo.
+    
+    Args:
+        bits: Lista de bits (MSB primero)
+        
+    Returns:
+        Valor entero sin signo
+        
+    Examples:
+        >>> bits_a_valor([0,0,0,0,1,0,0,0])
+        8
+    """
+    if validados(bits):
+        return int(bits)
+    valor = 0
+    for bit in bits:
+        valor = (valor << 1) | bit
+    return valor
+
+
 def mostrar_operacion(a_bits: list, b_bits: list, resultado: list, 
                       cout: int, operacion: int) -> None:
     """
@@ -0,0 +1,336 @@
+"""
+Exportación de formas de onda en formato VCD (Value Change Dump).
+
+Un archivo VCD describe cómo cambian las señales de un circuito a lo
+largo del tiempo y se abre con visores como GTKWave. Aquí cada
+operación del sumador-restador es un ciclo: se evalúa el netlist (ver
+netlist) con sus entradas y se escriben las señales que cambiaron
+respecto al ciclo anterior:
+
+- Las entradas (a_bits, b_bits, operacion) y salidas (resultado, cout)
+  como vectores.
+- El acarreo de salida de cada full_adder, dentro de un scope por
+  instancia según el origen de las puertas (p. ej.
+  sumador_restador_4bits_0 > adder_4bits_0 > full_adder_2 > cout).
+- Con internos=True, además, la salida de cada puerta.
+
+La escritura es incremental: solo se guarda el último valor de cada
+señal y cada ciclo se escribe en un archivo con buffer, así que una
+traza de millones de ciclos no ocupa memoria. El modelo es de retardo
+cero (un valor estable por ciclo); los glitches de la cadena de acarreo
+se ven con event_sim.
+
+grabar_vcd() registra las llamadas a sumador_restador_4bits hechas a
+través del paquete con la misma sustitución de funciones que usa
+instrumentation: sin grabación activa no hay ninguna envoltura en el
+camino y el coste es cero.
+"""
+
+import functools
+import inspect
+from contextlib import contextmanager
+
+from .netlist import trazar_sumador_restador
+from .metrics import _sustituir_funciones
+
+
+# Bytes del buffer del archivo
+BUFFER = 1 << 16
+
+# Caracteres de los identificadores VCD (ASCII imprimible)
+_PRIMER_ID = 33
+_N_IDS = 94
+
+
+def _identificador(indice: int) -> str:
+    """Identificador VCD corto: !, ", #, ..., ~, !!, !", ..."""
+    codigo = ""
+    indice += 1
+    while indice:
+        indice, resto = divmod(indice - 1, _N_IDS)
+        codigo = chr(_PRIMER_ID + resto) + codigo
+    return codigo
+
+
+def _scope(origen: str) -> tuple:
+    """Ruta de llamadas como scopes VCD: "full_adder[2]" -> "full_adder_2"."""
+    return tuple(parte.replace("[", "_").replace("]", "")
+                 for parte in origen.split("/") if parte)
+
+
+class EscritorVCD:
+    """
+    Escritor incremental de un archivo VCD para un netlist.
+
+    Args:
+        destino: Ruta del archivo o archivo de texto abierto (no se
+            cierra al terminar)
+        netlist: Netlist del circuito
+        nombres: Nombre de cada argumento de la función trazada
+        nombres_salida: Nombre de cada elemento de la salida
+        internos: Si es True, también la salida de cada puerta
+        periodo: Unidades de tiempo por ciclo
+        escala: Unidad de tiempo ($timescale)
+        buffer: Bytes del buffer al abrir una ruta
+
+    Atributos:
+        ciclos: Ciclos registrados
+        cambios: Cambios de valor escritos (sin contar el volcado inicial)
+
+    Examples:
+        >>> import io
+        >>> with EscritorVCD(io.StringIO(), trazar_sumador_restador(4)) as vcd:
+        ...     vcd.registrar([0,1,1,1], [0,0,1,0], 1)
+        ([0, 1, 0, 1], 1)
+    """
+
+    def __init__(self, destino, netlist, nombres=("a_bits", "b_bits", "operacion"),
+                 nombres_salida=("resultado", "cout"), internos: bool = False,
+                 periodo: int = 1, escala: str = "1ns", buffer: int = BUFFER):
+        self.netlist = netlist
+        self.periodo = periodo
+        if isinstance(destino, str):
+            self._archivo = open(destino, "w", encoding="ascii", buffering=buffer)
+            self._propio = True
+        else:
+            self._archivo = destino
+            self._propio = False
+
+        # Señales: scope -> lista de (nombre, cables); un cable es un bit
+        senales = {}
+        raiz = ("sumador_restador",)
+        for nombre, entrada in zip(nombres, netlist.entradas):
+            cables = entrada if isinstance(entrada, list) else [entrada]
+            senales.setdefault(raiz, []).append((nombre, cables))
+        salidas = netlist.salidas if isinstance(netlist.salidas, tuple) \
+            else (netlist.salidas,)
+        for nombre, salida in zip(nombres_salida, salidas):
+            cables = salida if isinstance(salida, list) else [salida]
+            senales[raiz].append((nombre, cables))
+
+        # Acarreo de cada full_adder: la última puerta de su propio cuerpo
+        origen = netlist.origen or [""] * len(netlist.compuertas)
+        acarreos = {}
+        for ruta, (_, _, salida) in zip(origen, netlist.compuertas):
+            if ruta.rpartition("/")[2].startswith("full_adder["):
+                acarreos[ruta] = salida
+        for ruta, salida in acarreos.items():
+            senales.setdefault(raiz + _scope(ruta), []).append(("cout", [salida]))
+
+        if internos:
+            for ruta, (tipo, _, salida) in zip(origen, netlist.compuertas):
+                senales.setdefault(raiz + _scope(ruta), []).append(
+                    (f"{tipo}_{salida}", [salida]))
+
+        # Por señal: (identificador, cables, es_vector)
+        self._senales = []
+        self._escribir_cabecera(escala, senales)
+        self._ultimos = [None] * len(self._senales)
+        self.ciclos = 0
+        self.cambios = 0
+
+    def _escribir_cabecera(self, escala: str, senales: dict):
+        """Declara los scopes y las variables."""
+        lineas = ["$version sumador-restador vcd $end", f"$timescale {escala} $end"]
+        abiertos = ()
+        for scope in sorted(senales):
+            comun = 0
+            while (comun < min(len(abiertos), len(scope))
+                   and abiertos[comun] == scope[comun]):
+                comun += 1
+            lineas.extend("$upscope $end" for _ in abiertos[comun:])
+            lineas.extend(f"$scope module {nombre} $end" for nombre in scope[comun:])
+            abiertos = scope
+            for nombre, cables in senales[scope]:
+                codigo = _identificador(len(self._senales))
+                ancho = len(cables)
+                rango = f" [{ancho - 1}:0]" if ancho > 1 else ""
+                lineas.append(f"$var wire {ancho} {codigo} {nombre}{rango} $end")
+                self._senales.append((codigo, tuple(cables), ancho > 1))
+        lineas.extend("$upscope $end" for _ in abiertos)
+        lineas.append("$enddefinitions $end")
+        self._archivo.write("\n".join(lineas) + "\n")
+
+    def registrar(self, *entradas):
+        """
+        Evalúa el netlist con unas entradas y escribe un ciclo.
+
+        Args:
+            *entradas: Los mismos argumentos que la función trazada
+
+        Returns:
+            El mismo valor que devolvería la función trazada
+
+        Raises:
+            ValueError: Si las entradas no son válidas
+        """
+        bits = self.netlist.aplanar(*entradas)
+        valores = self.netlist.evaluar_planos(bits)
+        self.registrar_valores(valores)
+        return self.netlist.reconstruir(valores)
+
+    def registrar_valores(self, valores: list):
+        """
+        Escribe un ciclo a partir del valor de cada cable.
+
+        Args:
+            valores: Lista de valores indexada por cable (ver
+                Netlist.evaluar_planos)
+        """
+        lineas = []
+        ultimos = self._ultimos
+        for i, (codigo, cables, es_vector) in enumerate(self._senales):
+            if es_vector:
+                valor = "b" + "".join([str(valores[c]) for c in cables]) + " "
+            else:
+                valor = str(valores[cables[0]])
+            if valor != ultimos[i]:
+                ultimos[i] = valor
+                lineas.append(valor + codigo)
+
+        tiempo = self.ciclos * self.periodo
+        if self.ciclos == 0:
+            self._archivo.write(f"#0\n$dumpvars\n" + "\n".join(lineas) + "\n$end\n")
+        elif lineas:
+            self.cambios += len(lineas)
+            self._archivo.write(f"#{tiempo}\n" + "\n".join(lineas) + "\n")
+        self.ciclos += 1
+
+    def cerrar(self):
+        """Escribe el instante final y cierra el archivo si se abrió aquí."""
+        if self._archivo is None:
+            return
+        self._archivo.write(f"#{self.ciclos * self.periodo}\n")
+        if self._propio:
+            self._archivo.close()
+        else:
+            self._archivo.flush()
+        self._archivo = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+
+def volcar_sumador_restador(destino, operaciones, n_bits: int = 4, sumador=None,
+                            **opciones) -> int:
+    """
+    Escribe el VCD de un flujo de operaciones del sumador-restador.
+
+    Args:
+        destino: Ruta o archivo de texto abierto
+        operaciones: Iterable de tuplas (a_bits, b_bits, operacion); se
+            consume una a una
+        n_bits: Ancho de los operandos (default: 4)
+        sumador: Sumador a usar (ver trazar_sumador_restador)
+        **opciones: Las de EscritorVCD
+
+    Returns:
+        Número de ciclos escritos
+    """
+    red = trazar_sumador_restador(n_bits, sumador=sumador)
+    with EscritorVCD(destino, red, **opciones) as vcd:
+        for a, b, op in operaciones:
+            vcd.registrar(a, b, op)
+    return vcd.ciclos
+
+
+@contextmanager
+def grabar_vcd(destino, sumador=None, **opciones):
+    """
+    Graba en un VCD las llamadas a sumador_restador_4bits del bloque.
+
+    Cada llamada hecha a través de los módulos del paquete (ver
+    instrumentation) es un ciclo: sus entradas se evalúan en el netlist
+    del camino fusionado con el sumador dado a grabar_vcd. Los
+    argumentos sumador= y motor= de la llamada grabada se ignoran: el VCD
+    es siempre el del circuito de grabar_vcd, aunque la llamada use otro
+    sumador (si ese sumador da otro resultado, el VCD no lo refleja).
+    Las llamadas anidadas dentro de otra no se graban, ni los usos
+    internos del paquete que no son llamadas del usuario: construir y
+    verificar la tabla (lookup_table), las referencias de equivalence y
+    trazar el sumador-restador llaman a la función original
+    (inspect.unwrap), no a la envoltura.
+
+    Se compone con instrumentation si esta se activa antes: envuelve la
+    función que haya en ese momento. Trazar el circuito al entrar
+    cuenta en los contadores de las funciones internas (adder_4bits,
+    full_adder...).
+
+    Args:
+        destino: Ruta o archivo de texto abierto
+        sumador: Sumador del circuito grabado (default: adder_4bits)
+        **opciones: Las de EscritorVCD
+
+    Yields:
+        El EscritorVCD
+
+    Examples:
+        >>> import io, src
+        >>> salida = io.StringIO()
+        >>> with grabar_vcd(salida) as vcd:
+        ...     src.sumador_restador_4bits([0,1,1,1], [0,0,1,0], 1)
+        ([0, 1, 0, 1], 1)
+        >>> vcd.ciclos
+        1
+    """
+    from . import adder_subtractor
+
+    # La función que hay ahora (puede estar ya envuelta por otra herramienta)
+    actual = adder_subtractor.sumador_restador_4bits
+    firma = inspect.signature(actual)
+    red = trazar_sumador_restador(4, sumador=sumador)
+    vcd = EscritorVCD(destino, red, **opciones)
+
+    # Profundidad de llamadas en curso: las anidadas (p. ej. las que
+    # construyen la tabla del motor "tabla") no son ciclos
+    anidadas = [0]
+
+    @functools.wraps(actual)
+    def grabada(*args, **kwargs):
+        anidadas[0] += 1
+        try:
+            resultado = actual(*args, **kwargs)
+        finally:
+            anidadas[0] -= 1
+        if anidadas[0]:
+            return resultado
+        argumentos = firma.bind(*args, **kwargs).arguments
+        bits = red.aplanar(argumentos["a_bits"], argumentos["b_bits"],
+                           argumentos["operacion"])
+        vcd.registrar_valores(red.evaluar_planos(bits))
+        return resultado
+
+    _sustituir_funciones({actual: grabada})
+    try:
+        yield vcd
+    finally:
+        _sustituir_funciones({grabada: actual})
+        vcd.cerrar()
+
+
+def prueba_vcd():
+    """
+    Graba una secuencia de operaciones de 4 bits y muestra el VCD.
+    """
+    import io
+    from . import adder_subtractor
+
+    print("Exportación VCD del sumador-restador de 4 bits:")
+    print("=" * 60)
+    salida = io.StringIO()
+    with grabar_vcd(salida) as vcd:
+        for a, b, op in [([0, 1, 1, 1], [0, 0, 0, 1], 0),
+                         ([1, 1, 1, 1], [0, 0, 0, 1], 0),
+                         ([0, 1, 1, 1], [0, 0, 1, 0], 1)]:
+            adder_subtractor.sumador_restador_4bits(a, b, op)
+    texto = salida.getvalue()
+    print(texto)
+    print(f"{vcd.ciclos} ciclos, {vcd.cambios} cambios")
+    return vcd.ciclos == 3
+
+
+if __name__ == "__main__":
+    prueba_vcd()
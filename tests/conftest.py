@@ -0,0 +1,20 @@
+"""
+Configuración común de las pruebas.
+"""
+
+import pytest
+from itertools import product
+
+
+@pytest.fixture(autouse=True, scope="session")
+def cache_de_sesion(tmp_path_factory):
+    """El motor compilado no escribe en la caché del usuario durante las pruebas."""
+    with pytest.MonkeyPatch.context() as parche:
+        parche.setenv("SUMADOR_CACHE", str(tmp_path_factory.mktemp("cache")))
+        yield
+
+
+@pytest.fixture
+def todos_4():
+    """Las 16 entradas de 4 bits (MSB primero), para las pruebas exhaustivas."""
+    return [list(bits) for bits in product((0, 1), repeat=4)]
@@ -0,0 +1,126 @@
+"""
+Pruebas unitarias para los circuitos de ancho configurable.
+"""
+
+import random
+import pytest
+from itertools import product
+from src.adder_4bit import adder_4bits
+from src.complement import complemento_a_1, complemento_a_2
+from src.adder_subtractor import sumador_restador_4bits
+from src.adder_nbits import (adder_nbits, complemento_a_1_nbits,
+                             complemento_a_2_nbits, sumador_restador_nbits)
+from src.utils import entero_a_bits, bits_a_valor
+
+
+class TestAdderNBits:
+    """Pruebas para el sumador de N bits."""
+    
+    def test_igual_a_adder_4bits(self):
+        """Con 4 bits coincide con adder_4bits en todas las entradas."""
+        for entrada in product((0, 1), repeat=9):
+            a, b, cin = list(entrada[0:4]), list(entrada[4:8]), entrada[8]
+            assert adder_nbits(a, b, cin) == adder_4bits(a, b, cin)
+    
+    @pytest.mark.parametrize("n_bits", [1, 2, 3, 5, 6])
+    def test_exhaustivo_anchos_pequenos(self, n_bits):
+        """Suma correcta en todas las entradas para anchos pequeños."""
+        for a in range(2 ** n_bits):
+            for b in range(2 ** n_bits):
+                for cin in (0, 1):
+                    resultado, cout = adder_nbits(entero_a_bits(a, n_bits),
+                                                  entero_a_bits(b, n_bits), cin)
+                    assert bits_a_valor(resultado) + (cout << n_bits) == a + b + cin
+    
+    @pytest.mark.parametrize("n_bits", [16, 32, 64, 100])
+    def test_anchos_grandes(self, n_bits):
+        """Suma correcta con operandos aleatorios en anchos grandes."""
+        rng = random.Random(n_bits)
+        for _ in range(50):
+            a = rng.getrandbits(n_bits)
+            b = rng.getrandbits(n_bits)
+            resultado, cout = adder_nbits(entero_a_bits(a, n_bits),
+                                          entero_a_bits(b, n_bits))
+            assert bits_a_valor(resultado) + (cout << n_bits) == a + b
+    
+    def test_entradas_invalidas(self):
+        """Valida anchos y valores de los bits."""
+        with pytest.raises(ValueError):
+            adder_nbits([], [])
+        with pytest.raises(ValueError):
+            adder_nbits([0, 1], [0, 1, 0])
+        with pytest.raises(ValueError):
+            adder_nbits([0, 2], [0, 1])
+
+
+class TestComplementosNBits:
+    """Pruebas para los complementos de N bits."""
+    
+    def test_igual_a_complementos_4bits(self):
+        """Con 4 bits coinciden con complemento_a_1 y complemento_a_2."""
+        for bits in product((0, 1), repeat=4):
+            bits = list(bits)
+            assert complemento_a_1_nbits(bits) == complemento_a_1(bits)
+            assert complemento_a_2_nbits(bits) == complemento_a_2(bits)
+    
+    @pytest.mark.parametrize("valor,n_bits", [(1, 8), (100, 8), (12345, 16)])
+    def test_negacion(self, valor, n_bits):
+        """complemento_a_2_nbits(x) representa -x."""
+        comp2 = complemento_a_2_nbits(entero_a_bits(valor, n_bits))
+        assert comp2 == entero_a_bits(-valor, n_bits)
+
+
+class TestSumadorRestadorNBits:
+    """Pruebas para el sumador-restador de N bits."""
+    
+    def test_igual_a_sumador_restador_4bits(self):
+        """Con 4 bits coincide con sumador_restador_4bits."""
+        for entrada in product((0, 1), repeat=9):
+            a, b, op = list(entrada[0:4]), list(entrada[4:8]), entrada[8]
+            assert sumador_restador_nbits(a, b, op) == \
+                sumador_restador_4bits(a, b, op)
+    
+    @pytest.mark.parametrize("n_bits", [8, 16, 32, 64])
+    def test_resta(self, n_bits):
+        """La resta produce A - B módulo 2**n y cout = 1 si A >= B."""
+        rng = random.Random(n_bits)
+        for _ in range(50):
+            a = rng.getrandbits(n_bits)
+            b = rng.getrandbits(n_bits)
+            resultado, cout = sumador_restador_nbits(entero_a_bits(a, n_bits),
+                                                     entero_a_bits(b, n_bits), 1)
+            assert bits_a_valor(resultado) == (a - b) % (1 << n_bits)
+            assert cout == (1 if a >= b else 0)
+    
+    def test_operacion_invalida(self):
+        """Valida la operación."""
+        with pytest.raises(ValueError):
+            sumador_restador_nbits([0] * 8, [0] * 8, 2)
+
+
+class TestConversiones:
+    """Pruebas para entero_a_bits y bits_a_valor."""
+    
+    def test_ida_y_vuelta(self):
+        """bits_a_valor invierte a entero_a_bits."""
+        for n_bits in (1, 4, 8, 13):
+            for valor in range(0, 2 ** n_bits, max(1, 2 ** n_bits // 37)):
+                assert bits_a_valor(entero_a_bits(valor, n_bits)) == valor
+    
+    def test_negativos(self):
+        """Los negativos se codifican en complemento a 2."""
+        assert entero_a_bits(-5) == [1, 0, 1, 1]
+        assert entero_a_bits(-8) == [1, 0, 0, 0]
+    
+    def test_fuera_de_rango(self):
+        """Valores que no caben lanzan ValueError."""
+        with pytest.raises(ValueError):
+            entero_a_bits(16)
+        with pytest.raises(ValueError):
+            entero_a_bits(-9)
+        with pytest.raises(ValueError):
+            entero_a_bits(0, 0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
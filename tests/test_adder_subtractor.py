@@ -3,6 +3,7 @@ Pruebas unitarias para el sumador-restador completo.
 """
 
 import pytest
+from itertools import product
 from src.adder_subtractor import sumador_restador_4bits
 from src.utils import bits_a_entero, mostrar_operacion
 
@@ -130,5 +131,49 @@ class TestAdderSubtractor:
             assert False, "mostrar_operacion lanzó una excepción"
 
 
+class TestMotores:
+    """Pruebas para los motores fusionado y de dos pasadas."""
+    
+    def test_motor_por_defecto_es_fusionado(self):
+        """Sin indicar motor se usa el camino fusionado."""
+        for entrada in product((0, 1), repeat=9):
+            a, b, op = list(entrada[0:4]), list(entrada[4:8]), entrada[8]
+            assert sumador_restador_4bits(a, b, op) == \
+                sumador_restador_4bits(a, b, op, motor="fusionado")
+    
+    def test_fusionado_vs_dos_pasos(self):
+        """
+        Ambos motores dan el mismo resultado en todas las entradas.
+        
+        El acarreo solo difiere al restar B = 0: el camino fusionado
+        calcula A + 1111 + 1, que siempre produce acarreo (no hay
+        préstamo), mientras que complemento_a_2(0000) descarta ese
+        acarreo y deja cout = 0.
+        """
+        for entrada in product((0, 1), repeat=9):
+            a, b, op = list(entrada[0:4]), list(entrada[4:8]), entrada[8]
+            res_f, cout_f = sumador_restador_4bits(a, b, op, motor="fusionado")
+            res_d, cout_d = sumador_restador_4bits(a, b, op, motor="dos_pasos")
+            
+            assert res_f == res_d
+            if op == 1 and b == [0, 0, 0, 0]:
+                assert (cout_f, cout_d) == (1, 0)
+            else:
+                assert cout_f == cout_d
+    
+    def test_resta_de_cero_es_positiva(self):
+        """A - 0 produce cout = 1 y se interpreta como positivo."""
+        resultado, carry = sumador_restador_4bits([0,1,1,1], [0,0,0,0], 1)
+        assert resultado == [0, 1, 1, 1]
+        assert carry == 1
+        assert bits_a_entero(resultado, es_resta=True, cout=carry) == 7
+    
+    @pytest.mark.parametrize("motor", ["fusionado", "dos_pasos"])
+    def test_bits_invalidos_en_resta(self, motor):
+        """Un bit inválido en B se rechaza también al restar."""
+        with pytest.raises(ValueError):
+            sumador_restador_4bits([0,0,0,0], [0,2,0,0], 1, motor=motor)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
@@ -0,0 +1,98 @@
+"""
+Pruebas unitarias para la generación de vectores de prueba.
+"""
+
+import pytest
+from src import logic_gates
+from src.adder_nbits import sumador_restador_nbits
+from src.carry_lookahead import adder_cla
+from src.netlist import trazar
+from src.utils import bits_a_valor
+from src.fault_sim import simular_fallas, vectores_aleatorios
+from src.atpg import generar_vectores, generar_vectores_sumador, compactar
+
+
+class TestCobertura:
+    """Los vectores generados detectan todas las fallas."""
+    
+    @pytest.mark.parametrize("n_bits", [4, 8, 16])
+    def test_sumador_restador(self, n_bits):
+        """Cobertura completa con muchos menos vectores que el exhaustivo."""
+        r = generar_vectores_sumador(n_bits)
+        assert r["cobertura"] == 100.0
+        assert r["no_detectadas"] == []
+        assert len(r["vectores"]) <= 16
+        comprobacion = simular_fallas(r["netlist"], r["vectores"])
+        assert comprobacion["cobertura"] == 100.0
+    
+    def test_sumador(self):
+        """También para adder_4bits, con vectores (a_bits, b_bits, cin)."""
+        r = generar_vectores_sumador(4, restador=False)
+        assert r["cobertura"] == 100.0
+        assert all(len(v) == 3 and len(v[0]) == 4 for v in r["vectores"])
+    
+    def test_crece_despacio(self):
+        """Cuadruplicar el ancho no cuadruplica los vectores."""
+        estrecho = len(generar_vectores_sumador(8)["vectores"])
+        ancho = len(generar_vectores_sumador(32)["vectores"])
+        assert ancho < 2 * estrecho
+    
+    def test_determinista(self):
+        """La misma semilla da los mismos vectores."""
+        assert generar_vectores_sumador(8, semilla=5)["vectores"] == \
+            generar_vectores_sumador(8, semilla=5)["vectores"]
+    
+    def test_verificar_con_los_vectores(self):
+        """Los vectores sirven para comprobar otro sumador de 32 bits."""
+        vectores = generar_vectores_sumador(32)["vectores"]
+        for a, b, op in vectores:
+            resultado, cout = sumador_restador_nbits(a, b, op, sumador=adder_cla)
+            esperado = bits_a_valor(a) + (bits_a_valor(b) ^ (2 ** 32 - 1 if op else 0)) + op
+            assert bits_a_valor(resultado) == esperado % 2 ** 32
+            assert cout == esperado >> 32
+
+
+class TestFaultDropping:
+    """Cada tanda solo simula las fallas pendientes."""
+    
+    def test_tandas_pequenas(self):
+        """Con tandas pequeñas hacen falta varias, cada vez con menos fallas."""
+        r = generar_vectores_sumador(8, candidatos=2)
+        assert r["cobertura"] == 100.0
+        assert r["tandas"] > 1
+        assert r["simuladas"] < r["tandas"] * r["total"]
+    
+    def test_fallas_redundantes(self):
+        """Las fallas que ninguna entrada detecta quedan sin detectar."""
+        red = trazar(lambda a, b: logic_gates.OR(a, logic_gates.AND(a, b)), 0, 0)
+        r = generar_vectores(red, candidatos=4, tandas_sin_progreso=3)
+        cable_and = red.compuertas[0][2]
+        assert (cable_and, 0) in r["no_detectadas"]
+        assert r["cobertura"] < 100.0
+
+
+class TestCompactacion:
+    """Pruebas de la compactación estática."""
+    
+    def test_misma_cobertura(self):
+        """Compactar quita vectores sin perder cobertura."""
+        r = generar_vectores_sumador(8, compactado=False)
+        red = r["netlist"]
+        vectores = r["vectores"] + vectores_aleatorios(20, 8, semilla=2)
+        compactos = compactar(red, vectores)
+        assert len(compactos) < len(vectores)
+        assert simular_fallas(red, compactos)["cobertura"] == 100.0
+    
+    def test_vacio(self):
+        """Sin vectores no hay nada que compactar."""
+        r = generar_vectores_sumador(4)
+        assert compactar(r["netlist"], []) == []
+    
+    def test_argumentos_invalidos(self):
+        """candidatos debe ser positivo."""
+        with pytest.raises(ValueError):
+            generar_vectores_sumador(4, candidatos=0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,74 @@
+"""
+Pruebas unitarias para el sumador-restador vectorizado.
+"""
+
+import pytest
+from itertools import product
+from src.adder_subtractor import sumador_restador_4bits
+from src.batch import sumador_restador_4bits_batch
+
+np = pytest.importorskip("numpy")
+
+
+def _bits(valor):
+    """Convierte un nibble a lista de 4 bits (MSB primero)."""
+    return [(valor >> k) & 1 for k in (3, 2, 1, 0)]
+
+
+class TestBatch:
+    """Pruebas para sumador_restador_4bits_batch."""
+    
+    def test_equivalencia_exhaustiva_nibbles(self):
+        """El modo vectorizado coincide con el escalar en las 512 entradas."""
+        casos = list(product(range(16), range(16), (0, 1)))
+        a = np.array([c[0] for c in casos], dtype=np.uint8)
+        b = np.array([c[1] for c in casos], dtype=np.uint8)
+        op = np.array([c[2] for c in casos], dtype=np.uint8)
+        
+        resultados, carries = sumador_restador_4bits_batch(a, b, op)
+        
+        assert resultados.shape == (512, 4)
+        assert carries.shape == (512,)
+        for i, (x, y, o) in enumerate(casos):
+            esperado = sumador_restador_4bits(_bits(x), _bits(y), o)
+            assert (resultados[i].tolist(), int(carries[i])) == esperado
+    
+    def test_matrices_de_bits(self):
+        """Acepta matrices N x 4 de bits con el MSB primero."""
+        a = np.array([[0,1,0,1], [0,0,1,0]])  # 5, 2
+        b = np.array([[0,0,1,1], [0,1,1,1]])  # 3, 7
+        resultados, carries = sumador_restador_4bits_batch(a, b, [0, 1])
+        
+        assert resultados.tolist() == [[1,0,0,0], [1,0,1,1]]
+        assert carries.tolist() == [0, 0]
+    
+    def test_operacion_escalar(self):
+        """Una operación escalar se aplica a todos los operandos."""
+        resultados, carries = sumador_restador_4bits_batch([7, 5], [2, 5], 1)
+        assert resultados.tolist() == [[0,1,0,1], [0,0,0,0]]
+        assert carries.tolist() == [1, 1]
+    
+    def test_arreglos_vacios(self):
+        """Arreglos vacíos producen resultados vacíos."""
+        vacio = np.array([], dtype=np.uint8)
+        resultados, carries = sumador_restador_4bits_batch(vacio, vacio, 0)
+        assert resultados.shape == (0, 4)
+        assert carries.shape == (0,)
+    
+    @pytest.mark.parametrize("a,b,op", [
+        ([16], [0], 0),              # Nibble fuera de rango
+        ([[0,2,0,0]], [[0,0,0,0]], 0),  # Bit inválido
+        ([1, 2], [1], 0),            # Longitudes distintas
+        ([1], [1], 2),               # Operación inválida
+        ([1, 2], [1, 2], [0]),       # Operación con longitud distinta
+        ([[0,1,0]], [[0,1,0]], 0),   # Matriz con 3 columnas
+        ([1.5], [1], 0),             # Valores no enteros
+    ])
+    def test_entradas_invalidas(self, a, b, op):
+        """Las entradas inválidas lanzan ValueError."""
+        with pytest.raises(ValueError):
+            sumador_restador_4bits_batch(a, b, op)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
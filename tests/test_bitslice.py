@@ -0,0 +1,110 @@
+"""
+Pruebas unitarias para la simulación por planos de bits.
+"""
+
+import random
+import pytest
+from itertools import product
+from src.logic_gates import AND, OR, NOT, XOR
+from src.half_adder import half_adder
+from src.full_adder import full_adder
+from src.adder_subtractor import sumador_restador_4bits
+from src.adder_nbits import sumador_restador_nbits
+from src.bitslice import (mascara, AND_planos, OR_planos, NOT_planos,
+                          XOR_planos, half_adder_planos, full_adder_planos,
+                          adder_4bits_planos, empaquetar, empaquetar_bits,
+                          desempaquetar, desempaquetar_bits,
+                          sumador_restador_lote)
+
+
+class TestPuertasPlanos:
+    """Las puertas y bloques por planos coinciden con los escalares."""
+    
+    def test_puertas(self):
+        """Las cuatro combinaciones de una puerta en una sola llamada."""
+        a = empaquetar_bits([0, 0, 1, 1])
+        b = empaquetar_bits([0, 1, 0, 1])
+        m = mascara(4)
+        assert desempaquetar_bits(AND_planos(a, b), 4) == [AND(0, 0), AND(0, 1), AND(1, 0), AND(1, 1)]
+        assert desempaquetar_bits(OR_planos(a, b), 4) == [OR(0, 0), OR(0, 1), OR(1, 0), OR(1, 1)]
+        assert desempaquetar_bits(XOR_planos(a, b, m), 4) == [XOR(0, 0), XOR(0, 1), XOR(1, 0), XOR(1, 1)]
+        assert desempaquetar_bits(NOT_planos(a, m), 4) == [NOT(0), NOT(0), NOT(1), NOT(1)]
+    
+    def test_not_respeta_la_mascara(self):
+        """NOT no enciende bits por encima del último vector."""
+        assert NOT_planos(0, mascara(3)) == 0b111
+    
+    def test_half_y_full_adder(self):
+        """Todas las combinaciones de los sumadores de un bit a la vez."""
+        casos = list(product((0, 1), repeat=3))
+        a, b, c = (empaquetar_bits([caso[i] for caso in casos]) for i in range(3))
+        m = mascara(len(casos))
+        
+        suma, carry = half_adder_planos(a, b, m)
+        assert list(zip(desempaquetar_bits(suma, 8), desempaquetar_bits(carry, 8))) == \
+            [half_adder(x, y) for x, y, _ in casos]
+        
+        suma, cout = full_adder_planos(a, b, c, m)
+        assert list(zip(desempaquetar_bits(suma, 8), desempaquetar_bits(cout, 8))) == \
+            [full_adder(x, y, z) for x, y, z in casos]
+    
+    def test_adder_4bits_valida_planos(self):
+        """adder_4bits_planos exige 4 planos por operando."""
+        with pytest.raises(ValueError):
+            adder_4bits_planos([0, 0], [0, 0], 0, mascara(1))
+
+
+class TestEmpaquetado:
+    """Pruebas para pasar de listas de bits a planos."""
+    
+    def test_ida_y_vuelta(self):
+        """desempaquetar(empaquetar(v)) devuelve los vectores originales."""
+        rng = random.Random(9)
+        vectores = [[rng.getrandbits(1) for _ in range(6)] for _ in range(100)]
+        assert desempaquetar(empaquetar(vectores), 100) == vectores
+    
+    def test_entradas_invalidas(self):
+        """Sin vectores, anchos distintos o bits inválidos: ValueError."""
+        with pytest.raises(ValueError):
+            empaquetar([])
+        with pytest.raises(ValueError):
+            empaquetar([[0, 1], [1]])
+        with pytest.raises(ValueError):
+            empaquetar([[0, 2]])
+
+
+class TestLote:
+    """Pruebas para sumador_restador_lote."""
+    
+    def test_exhaustivo_4_bits(self):
+        """Las 512 operaciones de 4 bits coinciden con sumador_restador_4bits."""
+        casos = list(product(product((0, 1), repeat=4),
+                             product((0, 1), repeat=4), (0, 1)))
+        obtenidos = sumador_restador_lote([list(a) for a, _, _ in casos],
+                                          [list(b) for _, b, _ in casos],
+                                          [op for _, _, op in casos])
+        for (a, b, op), obtenido in zip(casos, obtenidos):
+            assert obtenido == sumador_restador_4bits(list(a), list(b), op)
+    
+    def test_16_bits(self):
+        """Operandos aleatorios de 16 bits con una operación común."""
+        rng = random.Random(16)
+        a = [[rng.getrandbits(1) for _ in range(16)] for _ in range(200)]
+        b = [[rng.getrandbits(1) for _ in range(16)] for _ in range(200)]
+        obtenidos = sumador_restador_lote(a, b, 1)
+        assert obtenidos == [sumador_restador_nbits(x, y, 1) for x, y in zip(a, b)]
+    
+    def test_entradas_invalidas(self):
+        """Número de vectores, operaciones o anchos incoherentes."""
+        with pytest.raises(ValueError):
+            sumador_restador_lote([[0, 1]], [[0, 1], [1, 1]], 0)
+        with pytest.raises(ValueError):
+            sumador_restador_lote([[0, 1]], [[0, 1]], [0, 1])
+        with pytest.raises(ValueError):
+            sumador_restador_lote([[0, 1]], [[0, 1]], 2)
+        with pytest.raises(ValueError):
+            sumador_restador_lote([[0, 1]], [[0, 1, 1]], 0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
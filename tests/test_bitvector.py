@@ -0,0 +1,133 @@
+"""
+Pruebas unitarias para BitVector.
+"""
+
+import pickle
+import random
+import pytest
+from itertools import product
+from src.bitvector import BitVector, validados
+from src.adder_4bit import adder_4bits
+from src.adder_subtractor import sumador_restador_4bits, MOTORES
+from src.adder_nbits import adder_nbits, sumador_restador_nbits
+from src.carry_lookahead import adder_cla
+from src.complement import complemento_a_1, complemento_a_2
+from src.utils import bits_a_entero, bits_a_valor
+
+
+class TestBitVector:
+    """Pruebas del tipo BitVector."""
+    
+    def test_construccion(self):
+        """Se construye desde bits o desde un entero."""
+        v = BitVector([0, 1, 0, 1])
+        assert list(v) == [0, 1, 0, 1]
+        assert int(v) == 5
+        assert len(v) == 4
+        assert v[1] == 1 and v[-1] == 1
+        assert BitVector.desde_entero(5, 4) == v
+        assert repr(v) == "BitVector('0101')"
+        assert eval(repr(v)) is v
+        assert BitVector("1" * 20) == [1] * 20
+        assert BitVector([1.0, 0, True]) == [1, 0, 1]
+        assert type(BitVector([1.0, 0])[0]) is int
+    
+    def test_valida_al_construir(self):
+        """Los bits inválidos se detectan al construir."""
+        with pytest.raises(ValueError):
+            BitVector([0, 2])
+        with pytest.raises(ValueError):
+            BitVector([])
+        with pytest.raises(ValueError):
+            BitVector("0102")
+        with pytest.raises(ValueError):
+            BitVector("")
+        with pytest.raises(ValueError):
+            BitVector.desde_entero(16, 4)
+        with pytest.raises(ValueError):
+            BitVector.desde_entero(-1, 4)
+    
+    def test_internado(self):
+        """Los valores pequeños se comparten; los anchos grandes no."""
+        assert BitVector([0, 0, 1, 1]) is BitVector.desde_entero(3, 4)
+        assert BitVector.desde_entero(3, 4) is not BitVector.desde_entero(3, 5)
+        assert BitVector.desde_entero(3, 32) is not BitVector.desde_entero(3, 32)
+    
+    @pytest.mark.parametrize("n_bits", [1, 4, 8, 9, 32, 100])
+    def test_valor(self, n_bits):
+        """int() da el valor sin signo, internado o no."""
+        rng = random.Random(n_bits)
+        for _ in range(50):
+            valor = rng.getrandbits(n_bits)
+            bits = [int(c) for c in format(valor, "b").zfill(n_bits)]
+            assert int(BitVector(bits)) == valor
+            assert int(BitVector.desde_entero(valor, n_bits)) == valor
+    
+    def test_no_es_un_indice(self):
+        """Un BitVector no sirve como índice ni como límite de un slice."""
+        v = BitVector([0, 1])
+        with pytest.raises(TypeError):
+            [10, 20, 30][v]
+        with pytest.raises(TypeError):
+            range(v)
+    
+    def test_inmutable(self):
+        """No se pueden cambiar bits ni añadir atributos."""
+        v = BitVector([0, 1])
+        with pytest.raises(TypeError):
+            v[0] = 1
+        with pytest.raises(AttributeError):
+            v.valor = 3
+    
+    def test_igualdad_y_concatenacion(self):
+        """Se compara y concatena con listas y con otros BitVector."""
+        v = BitVector([1, 0])
+        assert v == [1, 0] and not v != [1, 0]
+        assert v + BitVector([1]) == BitVector([1, 0, 1])
+        assert type(v + BitVector([1])) is BitVector
+        assert v + [1] == [1, 0, 1] and [1] + v == [1, 1, 0]
+        assert v + (1,) == (1, 0, 1) and (1,) + v == (1, 1, 0)
+        assert hash(v) == hash(BitVector.desde_entero(2, 2))
+    
+    def test_pickle(self):
+        """Se serializa y conserva el internado."""
+        v = BitVector([1, 1, 0])
+        assert pickle.loads(pickle.dumps(v)) is v
+    
+    def test_validados(self):
+        """validados solo es True si todos los operandos son BitVector."""
+        assert validados(BitVector([0]), BitVector([1]))
+        assert not validados(BitVector([0]), [1])
+
+
+class TestCircuitosConBitVector:
+    """Los circuitos aceptan BitVector igual que listas."""
+    
+    @pytest.mark.parametrize("motor", MOTORES)
+    def test_sumador_restador_exhaustivo(self, motor):
+        """Mismos resultados con BitVector, listas y operandos mixtos."""
+        for a, b, op in product(product((0, 1), repeat=4),
+                                product((0, 1), repeat=4), (0, 1)):
+            esperado = sumador_restador_4bits(list(a), list(b), op, motor=motor)
+            assert sumador_restador_4bits(BitVector(a), BitVector(b), op,
+                                          motor=motor) == esperado
+            assert sumador_restador_4bits(list(a), BitVector(b), op,
+                                          motor=motor) == esperado
+    
+    def test_otros_circuitos(self):
+        """Sumadores de N bits, complementos y conversiones."""
+        a = BitVector.desde_entero(200, 8)
+        b = BitVector.desde_entero(100, 8)
+        assert adder_nbits(a, b) == adder_nbits(list(a), list(b))
+        assert adder_cla(a, b) == adder_nbits(list(a), list(b))
+        assert sumador_restador_nbits(a, b, 1) == sumador_restador_nbits(list(a), list(b), 1)
+        v = BitVector([0, 1, 0, 1])
+        assert complemento_a_1(v) == [1, 0, 1, 0]
+        assert complemento_a_2(v) == [1, 0, 1, 1]
+        assert adder_4bits(v, v) == adder_4bits([0, 1, 0, 1], [0, 1, 0, 1])
+        assert bits_a_valor(a) == 200
+        assert bits_a_entero(v) == 5
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,108 @@
+"""
+Pruebas unitarias para los sumadores con selección y salto de acarreo.
+"""
+
+import random
+import pytest
+from itertools import product
+from src.adder_nbits import adder_nbits
+from src.block_adders import (adder_carry_select, adder_carry_skip,
+                              ajustar_bloques, medir_configuracion,
+                              _vectores_peor_caso)
+from src.metrics import medir_circuito
+from src.utils import entero_a_bits
+
+
+SUMADORES = [adder_carry_select, adder_carry_skip]
+
+
+class TestSumadoresPorBloques:
+    """Equivalencia con el sumador ripple."""
+    
+    @pytest.mark.parametrize("sumador", SUMADORES)
+    @pytest.mark.parametrize("n_bits,bloques", [
+        (4, 1), (4, 2), (4, 3), (4, 4), (5, 2), (6, [1, 2, 3]),
+    ])
+    def test_exhaustivo(self, sumador, n_bits, bloques):
+        """Idéntico al ripple en todas las entradas para anchos pequeños."""
+        for entrada in product((0, 1), repeat=2 * n_bits + 1):
+            a = list(entrada[:n_bits])
+            b = list(entrada[n_bits:2 * n_bits])
+            cin = entrada[-1]
+            assert sumador(a, b, cin, bloques) == adder_nbits(a, b, cin)
+    
+    @pytest.mark.parametrize("sumador", SUMADORES)
+    @pytest.mark.parametrize("bloques", [3, 4, 8, [2, 4, 6, 8, 12]])
+    def test_32_bits(self, sumador, bloques):
+        """Idéntico al ripple con operandos aleatorios de 32 bits."""
+        rng = random.Random(32)
+        for _ in range(20):
+            a = entero_a_bits(rng.getrandbits(32), 32)
+            b = entero_a_bits(rng.getrandbits(32), 32)
+            cin = rng.getrandbits(1)
+            assert sumador(a, b, cin, bloques) == adder_nbits(a, b, cin)
+    
+    @pytest.mark.parametrize("sumador", SUMADORES)
+    def test_bloques_invalidos(self, sumador):
+        """Bloques que no cubren el ancho lanzan ValueError."""
+        with pytest.raises(ValueError):
+            sumador([0] * 8, [0] * 8, 0, [4, 3])
+        with pytest.raises(ValueError):
+            sumador([0] * 8, [0] * 8, 0, 0)
+
+
+class TestAjusteBloques:
+    """Pruebas para la medición y el ajuste de bloques."""
+    
+    @pytest.mark.parametrize("sumador", SUMADORES)
+    def test_vectores_de_peor_caso(self, sumador):
+        """Los vectores de peor caso alcanzan el peor retardo exhaustivo."""
+        n_bits = 5
+        
+        def circuito(a, b, cin):
+            return sumador(a, b, cin, 2)
+        
+        exhaustivo = max(
+            medir_circuito(circuito, list(e[:n_bits]), list(e[n_bits:-1]),
+                           e[-1], sensibilizado=True)["profundidad"]
+            for e in product((0, 1), repeat=2 * n_bits + 1)
+        )
+        candidatos = max(
+            medir_circuito(circuito, a, b, cin, sensibilizado=True)["profundidad"]
+            for a, b, cin in _vectores_peor_caso(n_bits)
+        )
+        assert candidatos == exhaustivo
+    
+    def test_salto_camino_falso(self):
+        """En el salto de acarreo la profundidad topológica sobreestima."""
+        medida = medir_configuracion("salto", 16, 4)
+        assert medida["retardo"] < medida["profundidad"]
+    
+    def test_seleccion_mejora_al_ripple(self):
+        """La mejor selección de acarreo es más rápida que el ripple."""
+        ripple = medir_configuracion("seleccion", 8, 8)
+        mejor = ajustar_bloques("seleccion", 8)[0]
+        assert mejor["retardo"] < ripple["retardo"]
+    
+    @pytest.mark.parametrize("tipo", ["seleccion", "salto"])
+    def test_ordenado_por_retardo(self, tipo):
+        """Las configuraciones vienen ordenadas por retardo."""
+        resultados = ajustar_bloques(tipo, 8)
+        retardos = [r["retardo"] for r in resultados]
+        assert retardos == sorted(retardos)
+        assert all(sum(r["bloques"]) == 8 for r in resultados)
+    
+    def test_candidatos(self):
+        """Se pueden indicar las configuraciones a probar."""
+        resultados = ajustar_bloques("salto", 8, candidatos=[2, 4, [2, 2, 2, 2]])
+        # [2, 2, 2, 2] es la misma configuración que 2
+        assert len(resultados) == 2
+    
+    def test_tipo_invalido(self):
+        """Un tipo inexistente lanza ValueError."""
+        with pytest.raises(ValueError):
+            medir_configuracion("ripple", 8, 4)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
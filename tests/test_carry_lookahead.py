@@ -0,0 +1,109 @@
+"""
+Pruebas unitarias para el sumador con acarreo anticipado.
+"""
+
+import random
+import pytest
+from itertools import product
+from src.adder_4bit import adder_4bits
+from src.adder_nbits import adder_nbits, sumador_restador_nbits
+from src.complement import complemento_a_2
+from src.adder_subtractor import sumador_restador_4bits
+from src.carry_lookahead import adder_cla, cla_4bits, bloque_cla
+from src.metrics import medir_sumador
+from src.utils import entero_a_bits
+
+
+class TestCLA:
+    """Pruebas para adder_cla y cla_4bits."""
+    
+    def test_cla_4bits_exhaustivo(self):
+        """cla_4bits coincide con adder_4bits en todas las entradas."""
+        for entrada in product((0, 1), repeat=9):
+            a, b, cin = list(entrada[0:4]), list(entrada[4:8]), entrada[8]
+            assert cla_4bits(a, b, cin) == adder_4bits(a, b, cin)
+    
+    @pytest.mark.parametrize("n_bits", [1, 2, 3, 5, 6])
+    def test_exhaustivo_anchos_pequenos(self, n_bits):
+        """Idéntico al ripple en todas las entradas para anchos pequeños."""
+        for entrada in product((0, 1), repeat=2 * n_bits + 1):
+            a = list(entrada[:n_bits])
+            b = list(entrada[n_bits:2 * n_bits])
+            cin = entrada[-1]
+            assert adder_cla(a, b, cin) == adder_nbits(a, b, cin)
+    
+    @pytest.mark.parametrize("n_bits", [16, 17, 32, 64])
+    def test_anchos_grandes(self, n_bits):
+        """Idéntico al ripple con operandos aleatorios (varios niveles)."""
+        rng = random.Random(n_bits)
+        for _ in range(30):
+            a = entero_a_bits(rng.getrandbits(n_bits), n_bits)
+            b = entero_a_bits(rng.getrandbits(n_bits), n_bits)
+            cin = rng.getrandbits(1)
+            assert adder_cla(a, b, cin) == adder_nbits(a, b, cin)
+    
+    def test_bloque_cla(self):
+        """G y P de un bloque siguen su definición."""
+        # g = [1,0,0,0], p = [0,1,1,1] (LSB primero): genera y propaga
+        acarreos, grupo_g, grupo_p = bloque_cla([1, 0, 0, 0], [0, 1, 1, 1], 0)
+        assert acarreos == [0, 1, 1, 1]
+        assert grupo_g == 1
+        assert grupo_p == 0
+    
+    def test_entradas_invalidas(self):
+        """Valida el ancho y los bits como los demás sumadores."""
+        with pytest.raises(ValueError):
+            cla_4bits([0, 0, 0], [0, 0, 0, 0])
+        with pytest.raises(ValueError):
+            adder_cla([0, 2], [0, 0])
+        with pytest.raises(ValueError):
+            adder_cla([0, 1], [0, 1, 1])
+
+
+class TestSumadorSeleccionable:
+    """El CLA sustituye a adder_4bits donde este se usa."""
+    
+    @pytest.mark.parametrize("motor", ["fusionado", "dos_pasos"])
+    def test_sumador_restador_4bits(self, motor):
+        """sumador_restador_4bits da lo mismo con cla_4bits."""
+        for entrada in product((0, 1), repeat=9):
+            a, b, op = list(entrada[0:4]), list(entrada[4:8]), entrada[8]
+            assert sumador_restador_4bits(a, b, op, motor, sumador=cla_4bits) \
+                == sumador_restador_4bits(a, b, op, motor)
+    
+    def test_complemento_a_2(self):
+        """complemento_a_2 da lo mismo con cla_4bits."""
+        for bits in product((0, 1), repeat=4):
+            bits = list(bits)
+            assert complemento_a_2(bits, cla_4bits) == complemento_a_2(bits)
+    
+    def test_sumador_restador_nbits(self):
+        """sumador_restador_nbits da lo mismo con adder_cla."""
+        rng = random.Random(7)
+        for _ in range(50):
+            a = entero_a_bits(rng.getrandbits(16), 16)
+            b = entero_a_bits(rng.getrandbits(16), 16)
+            op = rng.getrandbits(1)
+            assert sumador_restador_nbits(a, b, op, adder_cla) == \
+                sumador_restador_nbits(a, b, op)
+
+
+class TestProfundidadCLA:
+    """El CLA reduce la profundidad lógica frente al ripple."""
+    
+    @pytest.mark.parametrize("n_bits", [8, 16, 32, 64])
+    def test_menor_profundidad(self, n_bits):
+        """La profundidad del CLA es menor que la del ripple."""
+        ripple = medir_sumador(adder_nbits, n_bits)["profundidad"]
+        cla = medir_sumador(adder_cla, n_bits)["profundidad"]
+        assert cla < ripple
+    
+    def test_crecimiento_logaritmico(self):
+        """Duplicar el ancho no duplica la profundidad del CLA."""
+        p16 = medir_sumador(adder_cla, 16)["profundidad"]
+        p64 = medir_sumador(adder_cla, 64)["profundidad"]
+        assert p64 < 2 * p16
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
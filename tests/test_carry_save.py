@@ -0,0 +1,82 @@
+"""
+Pruebas unitarias para el acumulador carry-save.
+"""
+
+import random
+import pytest
+from itertools import product
+from src.carry_save import compresor_3_2, arbol_carry_save, sumar_operandos
+from src.carry_lookahead import adder_cla
+from src.metrics import medir_circuito
+from src.utils import entero_a_bits, bits_a_valor
+
+
+class TestCompresor:
+    """Pruebas para el compresor 3:2."""
+    
+    def test_exhaustivo_3_bits(self):
+        """suma + acarreo = x + y + z (módulo 2**N) en todas las entradas."""
+        for x, y, z in product(range(8), repeat=3):
+            suma, acarreo = compresor_3_2(entero_a_bits(x, 3),
+                                          entero_a_bits(y, 3),
+                                          entero_a_bits(z, 3))
+            assert (bits_a_valor(suma) + bits_a_valor(acarreo)) % 8 == (x + y + z) % 8
+    
+    def test_sin_propagacion(self):
+        """La profundidad no depende del ancho: no hay cadena de acarreo."""
+        p4 = medir_circuito(compresor_3_2, [0] * 4, [0] * 4, [0] * 4)
+        p16 = medir_circuito(compresor_3_2, [0] * 16, [0] * 16, [0] * 16)
+        assert p4["profundidad"] == p16["profundidad"]
+
+
+class TestSumaDeOperandos:
+    """Pruebas para el árbol y el acumulador."""
+    
+    @pytest.mark.parametrize("k", [1, 2, 3, 4, 5, 10, 33])
+    def test_arbol(self, k):
+        """El árbol reduce a dos vectores cuya suma es exacta."""
+        rng = random.Random(k)
+        valores = [rng.getrandbits(6) for _ in range(k)]
+        suma, acarreo = arbol_carry_save([entero_a_bits(v, 6) for v in valores])
+        assert len(suma) == len(acarreo)
+        assert bits_a_valor(suma) + bits_a_valor(acarreo) == sum(valores)
+        assert bits_a_valor(suma) + bits_a_valor(acarreo) < 2 ** len(suma)
+    
+    @pytest.mark.parametrize("k", [1, 2, 3, 7, 100])
+    def test_acumulador(self, k):
+        """El acumulador da la suma exacta sin desbordamiento."""
+        rng = random.Random(k)
+        valores = [rng.getrandbits(8) for _ in range(k)]
+        resultado = sumar_operandos(entero_a_bits(v, 8) for v in valores)
+        assert bits_a_valor(resultado) == sum(valores)
+    
+    def test_peor_caso(self):
+        """El ancho basta aunque todos los operandos sean máximos."""
+        resultado = sumar_operandos([[1, 1, 1, 1]] * 17)
+        assert bits_a_valor(resultado) == 17 * 15
+        assert len(resultado) == (17 * 15).bit_length()
+    
+    def test_generador(self):
+        """Acepta un generador y lo consume una sola vez."""
+        operandos = (entero_a_bits(i % 16, 4) for i in range(50))
+        assert bits_a_valor(sumar_operandos(operandos)) == sum(i % 16 for i in range(50))
+    
+    def test_sumador_final(self):
+        """La suma final puede usar otro sumador."""
+        operandos = [entero_a_bits(v, 8) for v in (200, 100, 50, 25)]
+        assert sumar_operandos(operandos, sumador=adder_cla) == sumar_operandos(operandos)
+    
+    def test_entradas_invalidas(self):
+        """Listas vacías, anchos distintos o bits inválidos lanzan ValueError."""
+        with pytest.raises(ValueError):
+            sumar_operandos([])
+        with pytest.raises(ValueError):
+            sumar_operandos([[0, 1], [0, 1, 1]])
+        with pytest.raises(ValueError):
+            sumar_operandos([[0, 1], [0, 2]])
+        with pytest.raises(ValueError):
+            arbol_carry_save([])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,110 @@
+"""
+Pruebas unitarias para la traza de la cadena de acarreo.
+"""
+
+import itertools
+import pytest
+from src.adder_4bit import adder_4bits
+from src.adder_subtractor import sumador_restador_4bits
+from src.utils import entero_a_bits
+from src.carry_trace import (
+    TrazaAcarreo, adder_4bits_trazado, sumador_trazado, sumador_restador_trazado,
+)
+
+
+class TestTraza:
+    """Pruebas de las etapas guardadas."""
+    
+    def test_igual_que_adder_4bits(self):
+        """
+        Mismo resultado que adder_4bits para las 512 entradas, y etapas
+        que coinciden con la suma bit a bit (el bucle es una copia del de
+        adder_4bits y no debe divergir).
+        """
+        traza = TrazaAcarreo()
+        for a, b, cin in itertools.product(range(16), range(16), (0, 1)):
+            a_bits, b_bits = entero_a_bits(a, 4), entero_a_bits(b, 4)
+            assert adder_4bits_trazado(a_bits, b_bits, cin, traza) == \
+                adder_4bits(a_bits, b_bits, cin)
+            acarreo = cin
+            for bit, (peso, a_i, b_i, cin_i, suma, cout) in enumerate(traza.ultima()):
+                total = (a >> bit & 1) + (b >> bit & 1) + acarreo
+                assert (peso, a_i, b_i, cin_i) == (bit, a >> bit & 1, b >> bit & 1, acarreo)
+                assert (suma, cout) == (total & 1, total >> 1)
+                acarreo = cout
+        assert len(traza) == 512
+    
+    def test_etapas(self):
+        """Cada etapa encadena su acarreo con la siguiente."""
+        traza = TrazaAcarreo()
+        resultado, cout = adder_4bits_trazado([0, 1, 0, 1], [0, 0, 1, 1], 0, traza)
+        etapas = traza.ultima()
+        assert [etapa[0] for etapa in etapas] == [0, 1, 2, 3]
+        assert [etapa[4] for etapa in etapas] == resultado[::-1]
+        assert traza.acarreos() == [0, 1, 1, 1, 0]
+        for anterior, siguiente in zip(etapas, etapas[1:]):
+            assert anterior[5] == siguiente[3]
+        assert etapas[-1][5] == cout
+    
+    @pytest.mark.parametrize("a, b, cin, esperada", [
+        ([0, 0, 0, 0], [0, 0, 0, 0], 0, 0),
+        ([1, 1, 1, 1], [0, 0, 0, 1], 0, 4),
+        ([1, 1, 1, 1], [0, 0, 0, 0], 1, 4),
+        ([0, 1, 0, 1], [0, 0, 1, 1], 0, 3),
+        ([0, 0, 1, 1], [0, 0, 1, 1], 0, 1),
+    ])
+    def test_cadena_mas_larga(self, a, b, cin, esperada):
+        """Longitud de la cadena de acarreo más larga."""
+        traza = TrazaAcarreo()
+        adder_4bits_trazado(a, b, cin, traza)
+        assert traza.cadena_mas_larga() == esperada
+    
+    def test_validacion(self):
+        """Las mismas validaciones que adder_4bits."""
+        traza = TrazaAcarreo()
+        with pytest.raises(ValueError):
+            adder_4bits_trazado([0, 1], [0, 1], 0, traza)
+        with pytest.raises(ValueError):
+            adder_4bits_trazado([0, 0, 0, 2], [0, 0, 0, 0], 0, traza)
+        assert len(traza) == 0
+    
+    def test_limpiar(self):
+        """limpiar() descarta las sumas trazadas."""
+        traza = TrazaAcarreo()
+        sumador = sumador_trazado(traza)
+        sumador([0, 0, 0, 1], [0, 0, 0, 1])
+        sumador([0, 0, 1, 1], [0, 0, 0, 1], 1)
+        assert len(traza) == 2
+        traza.limpiar()
+        assert len(traza) == 0
+
+
+class TestSumadorRestador:
+    """Pruebas de la traza a través de sumador_restador_4bits."""
+    
+    def test_resultados(self):
+        """Mismo resultado que sumador_restador_4bits."""
+        traza = TrazaAcarreo()
+        for a, b, op in itertools.product(range(16), range(16), (0, 1)):
+            a_bits, b_bits = entero_a_bits(a, 4), entero_a_bits(b, 4)
+            assert sumador_restador_trazado(a_bits, b_bits, op, traza) == \
+                sumador_restador_4bits(a_bits, b_bits, op)
+        assert len(traza) == 512
+    
+    def test_resta(self):
+        """En la resta las etapas ven B complementado y cin = 1."""
+        traza = TrazaAcarreo()
+        sumador_restador_trazado([0, 1, 1, 1], [0, 0, 1, 0], 1, traza)
+        etapas = traza.ultima()
+        assert etapas[0][3] == 1
+        assert [etapa[2] for etapa in etapas] == [1, 0, 1, 1]
+    
+    def test_camino_rapido_intacto(self):
+        """adder_4bits sigue sin parámetro de traza."""
+        import inspect
+        assert "traza" not in inspect.signature(adder_4bits).parameters
+        assert "traza" not in inspect.signature(sumador_restador_4bits).parameters
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
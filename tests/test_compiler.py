@@ -0,0 +1,178 @@
+"""
+Pruebas unitarias para la simulación compilada.
+"""
+
+import os
+import random
+import pytest
+from itertools import product
+from src import compiler
+from src.full_adder import full_adder
+from src.adder_subtractor import sumador_restador_4bits
+from src.adder_nbits import sumador_restador_nbits
+from src.carry_lookahead import cla_4bits
+from src.bitslice import empaquetar_bits, desempaquetar_bits, mascara
+from src.netlist import trazar, trazar_sumador_restador
+from src.compiler import (generar_codigo, huella, compilar,
+                          compilar_sumador_restador,
+                          sumador_restador_compilado, _clave_codigo)
+
+
+@pytest.fixture(autouse=True)
+def cache_temporal(tmp_path, monkeypatch):
+    """La caché en disco de cada prueba va a un directorio temporal."""
+    monkeypatch.setenv("SUMADOR_CACHE", str(tmp_path / "cache"))
+
+
+class TestCodigoGenerado:
+    """Pruebas del código generado."""
+    
+    def test_sin_llamadas(self):
+        """El cuerpo es código lineal: solo asignaciones con &, | y ^."""
+        codigo = generar_codigo(trazar_sumador_restador(4))
+        cuerpo = codigo.splitlines()[1:-1]
+        assert all("(" not in linea for linea in cuerpo)
+        assert codigo.startswith("def circuito(e0, e1, e2, uno=1):")
+    
+    def test_huella(self):
+        """Mismo circuito, misma huella; circuitos distintos, distinta."""
+        assert huella(trazar_sumador_restador(4)) == huella(trazar_sumador_restador(4))
+        assert huella(trazar_sumador_restador(4)) != huella(trazar_sumador_restador(5))
+    
+    def test_planos(self):
+        """Con uno = máscara la función evalúa planos de bits."""
+        circuito = compilar(trazar(full_adder, 0, 0, 0), en_disco=False)
+        casos = list(product((0, 1), repeat=3))
+        a, b, c = (empaquetar_bits([caso[i] for caso in casos]) for i in range(3))
+        suma, cout = circuito(a, b, c, uno=mascara(8))
+        assert list(zip(desempaquetar_bits(suma, 8), desempaquetar_bits(cout, 8))) == \
+            [full_adder(*caso) for caso in casos]
+
+
+class TestCacheEnDisco:
+    """Pruebas de la caché en disco."""
+    
+    def test_escribe_y_reutiliza(self, tmp_path, monkeypatch):
+        """El código se guarda con su hash y se carga en otro proceso."""
+        monkeypatch.setattr(compiler, "_compiladas", {})
+        red = trazar(full_adder, 0, 0, 0)
+        circuito = compilar(red, directorio=str(tmp_path))
+        ruta = tmp_path / f"circuito_{_clave_codigo(generar_codigo(red))}.py"
+        assert ruta.exists()
+        assert ruta.read_text() == generar_codigo(red)
+        
+        # Simula un proceso nuevo: la función se carga desde el archivo
+        monkeypatch.setattr(compiler, "_compiladas", {})
+        otra = compilar(red, directorio=str(tmp_path))
+        assert otra is not circuito
+        assert otra(1, 1, 1) == full_adder(1, 1, 1)
+    
+    def test_variable_de_entorno(self, tmp_path, monkeypatch):
+        """SUMADOR_CACHE cambia el directorio por defecto."""
+        monkeypatch.setattr(compiler, "_compiladas", {})
+        monkeypatch.setenv("SUMADOR_CACHE", str(tmp_path))
+        red = trazar(full_adder, 0, 0, 0)
+        compilar(red)
+        assert os.listdir(tmp_path) == [f"circuito_{_clave_codigo(generar_codigo(red))}.py"]
+    
+    @pytest.mark.parametrize("alteracion", ["truncado", "editado"])
+    def test_archivo_alterado(self, tmp_path, monkeypatch, alteracion):
+        """Un archivo que no coincide con el código se reescribe."""
+        monkeypatch.setattr(compiler, "_compiladas", {})
+        red = trazar(full_adder, 0, 0, 0)
+        codigo = generar_codigo(red)
+        compilar(red, directorio=str(tmp_path))
+        ruta = tmp_path / f"circuito_{_clave_codigo(codigo)}.py"
+        if alteracion == "truncado":
+            ruta.write_text(codigo[:len(codigo) // 2])
+        else:
+            ruta.write_text(codigo.replace(" & ", " | "))
+        
+        monkeypatch.setattr(compiler, "_compiladas", {})
+        circuito = compilar(red, directorio=str(tmp_path))
+        assert ruta.read_text() == codigo
+        for entradas in product((0, 1), repeat=3):
+            assert circuito(*entradas) == full_adder(*entradas)
+    
+    def test_otro_generador(self, tmp_path, monkeypatch):
+        """Si cambia el código generado, no se carga el archivo anterior."""
+        monkeypatch.setattr(compiler, "_compiladas", {})
+        red = trazar(full_adder, 0, 0, 0)
+        compilar(red, directorio=str(tmp_path))
+        
+        generar = compiler.generar_codigo
+        monkeypatch.setattr(compiler, "generar_codigo",
+                            lambda netlist: "# version 2\n" + generar(netlist))
+        monkeypatch.setattr(compiler, "_compiladas", {})
+        compilar(red, directorio=str(tmp_path))
+        assert len(list(tmp_path.glob("circuito_*.py"))) == 2
+    
+    def test_directorio_inutilizable(self, tmp_path, monkeypatch):
+        """Si no se puede escribir, se compila en memoria."""
+        monkeypatch.setattr(compiler, "_compiladas", {})
+        archivo = tmp_path / "no_es_un_directorio"
+        archivo.write_text("")
+        circuito = compilar(trazar(full_adder, 0, 0, 0), directorio=str(archivo))
+        assert circuito(0, 1, 1) == full_adder(0, 1, 1)
+
+
+class TestMotorCompilado:
+    """El motor compilado es idéntico al de puertas."""
+    
+    def test_exhaustivo_4_bits(self):
+        """Las 512 entradas de 4 bits dan el mismo resultado."""
+        directo = compilar_sumador_restador(4)
+        for a, b, op in product(product((0, 1), repeat=4),
+                                product((0, 1), repeat=4), (0, 1)):
+            esperado = sumador_restador_4bits(list(a), list(b), op)
+            assert sumador_restador_4bits(list(a), list(b), op,
+                                          motor="compilado") == esperado
+            assert sumador_restador_compilado(list(a), list(b), op) == esperado
+            assert directo(list(a), list(b), op) == esperado
+    
+    def test_con_otro_sumador(self):
+        """El motor compilado admite el parámetro sumador."""
+        for a, b, op in product(product((0, 1), repeat=4),
+                                product((0, 1), repeat=4), (0, 1)):
+            assert sumador_restador_4bits(list(a), list(b), op, "compilado",
+                                          sumador=cla_4bits) == \
+                sumador_restador_4bits(list(a), list(b), op)
+    
+    @pytest.mark.parametrize("n_bits", [8, 16, 32])
+    def test_anchos(self, n_bits):
+        """Otros anchos coinciden con sumador_restador_nbits."""
+        circuito = compilar_sumador_restador(n_bits)
+        rng = random.Random(n_bits)
+        for _ in range(50):
+            a = [rng.getrandbits(1) for _ in range(n_bits)]
+            b = [rng.getrandbits(1) for _ in range(n_bits)]
+            op = rng.getrandbits(1)
+            assert circuito(a, b, op) == sumador_restador_nbits(a, b, op)
+    
+    def test_entradas_invalidas(self):
+        """El motor compilado valida las entradas como los demás."""
+        with pytest.raises(ValueError):
+            sumador_restador_4bits([0, 0, 0, 0], [0, 2, 0, 0], 1, motor="compilado")
+        with pytest.raises(ValueError):
+            sumador_restador_4bits([0, 0, 0], [0, 0, 0, 0], 1, motor="compilado")
+    
+    def test_sumador_local_sin_cache(self):
+        """Un sumador con estado (closure) no se compila ni se guarda: cada
+        llamada pasa por él y la caché no crece."""
+        from src import adder_subtractor
+        from src.carry_trace import TrazaAcarreo, sumador_trazado
+        traza = TrazaAcarreo()
+        antes = len(adder_subtractor._compilados)
+        for _ in range(3):
+            assert sumador_restador_4bits([0, 1, 1, 1], [0, 0, 1, 0], 1, "compilado",
+                                          sumador=sumador_trazado(traza)) == \
+                ([0, 1, 0, 1], 1)
+        assert len(adder_subtractor._compilados) == antes
+        assert len(traza) == 3
+        antes = len(compiler._sumadores_restadores)
+        compilar_sumador_restador(4, sumador_trazado(traza))
+        assert len(compiler._sumadores_restadores) == antes
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
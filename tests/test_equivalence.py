@@ -0,0 +1,176 @@
+"""
+Pruebas unitarias para la verificación de equivalencia.
+"""
+
+import pytest
+from functools import partial
+from src.adder_subtractor import sumador_restador_4bits
+from src.adder_nbits import sumador_restador_nbits
+from src.carry_lookahead import adder_cla
+from src.prefix_adder import adder_kogge_stone
+from src.lookup_table import sumador_restador_tabla
+from src.netlist import trazar
+from src.equivalence import (
+    verificar_equivalencia, verificar_sumador, PRIMITIVAS_EQUIVALENCIA,
+    _patron, _decodificar,
+)
+
+
+def _red_alterada(n_bits, indice):
+    """Netlist de la referencia con la puerta `indice` cambiada."""
+    referencia = sumador_restador_4bits if n_bits == 4 else sumador_restador_nbits
+    red = trazar(referencia, [0] * n_bits, [0] * n_bits, 0,
+                 primitivas=PRIMITIVAS_EQUIVALENCIA)
+    tipo, entradas, salida = red.compuertas[indice]
+    nuevo = "AND" if tipo != "AND" else "OR"
+    red.compuertas[indice] = (nuevo, entradas, salida) if len(entradas) == 2 \
+        else ("XOR", (entradas[0], entradas[0]), salida)
+    return red
+
+
+def _primera_diferencia(red, n_bits):
+    """Contraejemplo de menor índice, buscado entrada a entrada."""
+    referencia = sumador_restador_4bits if n_bits == 4 else sumador_restador_nbits
+    for indice in range(1 << (2 * n_bits + 1)):
+        a, b, op = _decodificar(indice, n_bits)
+        if red.evaluar(a, b, op) != referencia(a, b, op):
+            return indice
+    return None
+
+
+def _sumador_incorrecto(a_bits, b_bits, operacion):
+    """Sumador-restador que se equivoca solo con 1111 + 1111."""
+    resultado, cout = sumador_restador_4bits(a_bits, b_bits, operacion)
+    if a_bits == b_bits == [1, 1, 1, 1] and operacion == 0:
+        cout = 0
+    return resultado, cout
+
+
+def _ramifica_6bits(a_bits, b_bits, operacion):
+    """Sumador-restador de 6 bits que se equivoca solo con 101010 + 010101."""
+    if a_bits == [1, 0, 1, 0, 1, 0] and b_bits == [0, 1, 0, 1, 0, 1] and operacion == 0:
+        return [0] * 6, 0
+    return sumador_restador_nbits(a_bits, b_bits, operacion)
+
+
+class TestEspacio:
+    """Pruebas de la numeración del espacio de entradas."""
+    
+    def test_patron(self):
+        """El plano de cada bit del índice vale ese bit en cada vector."""
+        for posicion in range(4):
+            plano = _patron(posicion, 4)
+            for j in range(16):
+                assert (plano >> j) & 1 == (j >> posicion) & 1
+    
+    def test_decodificar(self):
+        """El índice es a, b y operación concatenados, MSB primero."""
+        assert _decodificar(0b0111_0010_1, 4) == ([0, 1, 1, 1], [0, 0, 1, 0], 1)
+
+
+class TestEquivalentes:
+    """Diseños equivalentes a la referencia."""
+    
+    @pytest.mark.parametrize("n_bits", [1, 4, 6])
+    def test_cla(self, n_bits):
+        """El sumador con anticipación de acarreo equivale al ripple."""
+        r = verificar_sumador(adder_cla, n_bits, procesos=1)
+        assert r["equivalentes"]
+        assert r["modo"] == "planos"
+        assert r["verificadas"] == r["total"] == 2 ** (2 * n_bits + 1)
+    
+    def test_bloques_pequenos(self):
+        """El resultado no depende del tamaño de bloque."""
+        r = verificar_sumador(adder_kogge_stone, 6, procesos=1, bits_bloque=3)
+        assert r["equivalentes"]
+        assert r["bloques"] == 2 ** 13 // 2 ** 3
+    
+    def test_varios_procesos(self):
+        """Los bloques se pueden repartir entre procesos."""
+        r = verificar_sumador(adder_cla, 6, procesos=2, bits_bloque=8)
+        assert r["equivalentes"]
+        assert r["procesos"] == 2
+    
+    def test_no_trazable_modo_escalar(self):
+        """La tabla no se puede trazar: se verifica llamada a llamada."""
+        r = verificar_equivalencia(sumador_restador_tabla, 4, procesos=1)
+        assert r["equivalentes"]
+        assert r["modo"] == "escalar"
+
+
+class TestContraejemplos:
+    """Diseños que no equivalen a la referencia."""
+    
+    @pytest.mark.parametrize("indice", [0, 7, -1])
+    def test_primer_contraejemplo(self, indice):
+        """Se informa del contraejemplo de menor índice."""
+        red = _red_alterada(4, indice)
+        r = verificar_equivalencia(red, 4, procesos=1, bits_bloque=5)
+        esperado = _primera_diferencia(red, 4)
+        assert not r["equivalentes"]
+        assert r["contraejemplo"]["indice"] == esperado
+        assert r["verificadas"] == esperado
+    
+    def test_dos_pasos(self):
+        """dos_pasos difiere en el acarreo al restar 0 (complemento de 0)."""
+        candidato = partial(sumador_restador_4bits, motor="dos_pasos")
+        r = verificar_equivalencia(candidato, 4, procesos=1)
+        c = r["contraejemplo"]
+        assert r["modo"] == "escalar"
+        assert (c["a_bits"], c["b_bits"], c["operacion"]) == ([0] * 4, [0] * 4, 1)
+        assert c["esperado"][0] == c["obtenido"][0]
+        assert c["esperado"][1] != c["obtenido"][1]
+    
+    def test_contraejemplo_completo(self):
+        """El contraejemplo trae las entradas y las dos salidas."""
+        r = verificar_equivalencia(_sumador_incorrecto, 4, procesos=1, modo="escalar")
+        c = r["contraejemplo"]
+        assert (c["a_bits"], c["b_bits"], c["operacion"]) == ([1] * 4, [1] * 4, 0)
+        assert c["esperado"] == ([1, 1, 1, 0], 1)
+        assert c["obtenido"] == ([1, 1, 1, 0], 0)
+    
+    def test_varios_procesos(self):
+        """Con varios procesos el contraejemplo es el mismo."""
+        red = _red_alterada(6, 20)
+        uno = verificar_equivalencia(red, 6, procesos=1, bits_bloque=6)
+        dos = verificar_equivalencia(red, 6, procesos=2, bits_bloque=6)
+        assert uno["contraejemplo"] == dos["contraejemplo"]
+
+    
+    def test_funcion_que_ramifica(self):
+        """Una función se llama en cada entrada: no basta con su traza."""
+        r = verificar_equivalencia(_ramifica_6bits, 6, procesos=1)
+        c = r["contraejemplo"]
+        assert r["modo"] == "escalar"
+        assert not r["equivalentes"]
+        assert (c["a_bits"], c["b_bits"], c["operacion"]) == \
+            ([1, 0, 1, 0, 1, 0], [0, 1, 0, 1, 0, 1], 0)
+        assert r["verificadas"] == c["indice"] < r["total"]
+
+
+class TestErrores:
+    """Pruebas de argumentos inválidos."""
+    
+    def test_modo_desconocido(self):
+        """Un modo que no existe lanza ValueError."""
+        with pytest.raises(ValueError):
+            verificar_sumador(adder_cla, 4, modo="rapido")
+    
+    def test_forma_incorrecta(self):
+        """Un netlist de otro ancho no se puede comparar."""
+        with pytest.raises(ValueError):
+            verificar_equivalencia(_red_alterada(4, 0), 5, procesos=1)
+    
+    def test_planos_no_trazable(self):
+        """Pedir planos para un candidato no trazable es un error."""
+        with pytest.raises(ValueError):
+            verificar_equivalencia(sumador_restador_tabla, 4, modo="planos")
+    
+    def test_netlist_escalar(self):
+        """Un netlist no se puede llamar entrada a entrada."""
+        with pytest.raises(ValueError):
+            verificar_equivalencia(_red_alterada(4, 0), 4, modo="escalar")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
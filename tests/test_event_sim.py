@@ -0,0 +1,165 @@
+"""
+Pruebas unitarias para el simulador por eventos.
+"""
+
+import random
+import pytest
+from itertools import product
+from src.full_adder import full_adder
+from src.adder_subtractor import sumador_restador_4bits
+from src.adder_nbits import sumador_restador_nbits
+from src.netlist import trazar, trazar_sumador_restador
+from src.logic_gates import NOT
+from src.timing import analizar_tiempos
+from src.event_sim import SimuladorEventos, simulador_sumador_restador, RETARDOS
+
+
+def bits_aleatorios(rng, n):
+    return [rng.getrandbits(1) for _ in range(n)]
+
+
+class TestResultados:
+    """El simulador llega al mismo resultado que los circuitos."""
+    
+    def test_full_adder(self):
+        """Sumador completo con sus entradas en todas las transiciones."""
+        sim = SimuladorEventos(trazar(full_adder, 0, 0, 0))
+        for origen, destino in product(product((0, 1), repeat=3), repeat=2):
+            sim.aplicar(*origen)
+            salida, _ = sim.aplicar(*destino)
+            assert salida == full_adder(*destino)
+    
+    def test_exhaustivo_4_bits(self, todos_4):
+        """Las 512 operaciones de 4 bits, aplicadas en secuencia."""
+        sim = simulador_sumador_restador(4)
+        for a, b, op in product(todos_4, todos_4, (0, 1)):
+            salida, _ = sim.aplicar(a, b, op)
+            assert salida == sumador_restador_4bits(a, b, op)
+    
+    @pytest.mark.parametrize("retardos", [None, {"XOR": 3, "AND": 2},
+                                          {"NOT": 0, "OR": 0.5}])
+    def test_32_bits_aleatorio(self, retardos):
+        """Operandos aleatorios de 32 bits con distintos retardos."""
+        sim = simulador_sumador_restador(32, retardos)
+        rng = random.Random(32)
+        for _ in range(50):
+            a, b = bits_aleatorios(rng, 32), bits_aleatorios(rng, 32)
+            op = rng.getrandbits(1)
+            salida, _ = sim.aplicar(a, b, op)
+            assert salida == sumador_restador_nbits(a, b, op)
+    
+    def test_primitivas_descompuestas(self):
+        """También con XOR descompuesta en AND, OR y NOT."""
+        sim = SimuladorEventos(trazar_sumador_restador(8))
+        rng = random.Random(8)
+        for _ in range(50):
+            a, b = bits_aleatorios(rng, 8), bits_aleatorios(rng, 8)
+            salida, _ = sim.aplicar(a, b, 1)
+            assert salida == sumador_restador_nbits(a, b, 1)
+
+
+class TestTiempos:
+    """Pruebas del tiempo de estabilización."""
+    
+    def test_sin_cambios(self):
+        """Repetir las entradas no evalúa ninguna puerta."""
+        sim = simulador_sumador_restador(4)
+        sim.aplicar([0, 1, 1, 1], [0, 0, 0, 1], 0)
+        sim.reiniciar_contadores()
+        _, tiempo = sim.aplicar([0, 1, 1, 1], [0, 0, 0, 1], 0)
+        assert tiempo == 0
+        assert sim.evaluaciones == 0 and sim.eventos == 0
+    
+    def test_acotado_por_profundidad(self, todos_4):
+        """Con retardo unitario, nunca más que los niveles del circuito."""
+        sim = simulador_sumador_restador(4)
+        profundidad = len(sim.netlist.niveles())
+        tiempos = [sim.aplicar(a, b, op)[1]
+                   for a, b, op in product(todos_4, todos_4, (0, 1))]
+        assert max(tiempos) <= profundidad
+        assert max(tiempos) > 0
+    
+    def test_propagacion_del_acarreo(self):
+        """El acarreo que recorre toda la cadena tarda más que uno local."""
+        sim = simulador_sumador_restador(8)
+        sim.aplicar([0] * 8, [0] * 8, 0)
+        _, local = sim.aplicar([0] * 7 + [1], [0] * 8, 0)
+        sim.aplicar([0] * 8, [0] * 8, 0)
+        sim.aplicar([0] + [1] * 7, [0] * 8, 0)
+        _, cadena = sim.aplicar([0] + [1] * 7, [0] * 7 + [1], 0)
+        assert cadena > local
+    
+    def test_escala_con_retardos(self):
+        """Duplicar todos los retardos duplica el tiempo."""
+        dobles = {tipo: 2 * r for tipo, r in RETARDOS.items()}
+        simple = simulador_sumador_restador(4)
+        doble = simulador_sumador_restador(4, dobles)
+        for a, b in [([0, 1, 1, 1], [0, 0, 0, 1]), ([1, 1, 1, 1], [0, 0, 0, 1])]:
+            assert doble.aplicar(a, b, 0)[1] == 2 * simple.aplicar(a, b, 0)[1]
+    
+    def test_tiempo_acumulado(self):
+        """El tiempo de simulación avanza con cada operación."""
+        sim = simulador_sumador_restador(4)
+        _, t1 = sim.aplicar([0, 0, 0, 1], [0, 0, 0, 1], 0)
+        _, t2 = sim.aplicar([0, 0, 1, 1], [0, 0, 0, 1], 0)
+        assert sim.tiempo == t1 + t2
+    
+    def test_salida_sin_lectores(self):
+        """El cambio de una salida que nadie lee cuenta en el tiempo."""
+        sim = SimuladorEventos(trazar(NOT, 0))
+        assert sim.aplicar(1) == (0, 1)
+        assert sim.tiempo == 1
+    
+    @pytest.mark.parametrize("entradas, tiempo", [
+        ((1, 0, 0), 4),    # a -> XOR -> XOR hasta suma
+        ((1, 1, 0), 5),    # incluye el glitch de la suma
+        ((0, 0, 1), 2),    # cin -> AND -> OR de la suma
+    ])
+    def test_full_adder_exacto(self, entradas, tiempo):
+        """Tiempos exactos del full_adder desde el estado con todo a 0."""
+        sim = SimuladorEventos(trazar(full_adder, 0, 0, 0))
+        assert sim.aplicar(*entradas)[1] == tiempo
+    
+    @pytest.mark.parametrize("n_bits", [2, 4, 8, 16])
+    def test_peor_caso_igual_a_analisis_estatico(self, n_bits):
+        """0 + 0 -> 0 - 0 recorre toda la cadena: coincide con timing."""
+        sim = simulador_sumador_restador(n_bits)
+        esperado = analizar_tiempos(sim.netlist)["retardo_maximo"]
+        sim.aplicar([0] * n_bits, [0] * n_bits, 0)
+        assert sim.aplicar([0] * n_bits, [0] * n_bits, 1)[1] == esperado
+
+
+class TestTrabajo:
+    """Solo se evalúan las puertas cuyas entradas cambian."""
+    
+    def test_un_bit_en_64_bits(self):
+        """Cambiar el bit alto de A en 64 bits evalúa pocas puertas."""
+        sim = simulador_sumador_restador(64)
+        a = [0] * 64
+        sim.aplicar(a, [0] * 64, 0)
+        sim.reiniciar_contadores()
+        sim.aplicar([1] + a[1:], [0] * 64, 0)
+        assert 0 < sim.evaluaciones < len(sim.netlist) // 10
+
+
+class TestErrores:
+    """Pruebas de validación."""
+    
+    def test_retardo_negativo(self):
+        """Un retardo negativo lanza ValueError."""
+        with pytest.raises(ValueError):
+            simulador_sumador_restador(4, {"AND": -1})
+    
+    def test_entradas_invalidas(self):
+        """Bits o anchos incorrectos lanzan ValueError."""
+        sim = simulador_sumador_restador(4)
+        with pytest.raises(ValueError):
+            sim.aplicar([0] * 4, [0] * 3, 0)
+        with pytest.raises(ValueError):
+            sim.aplicar([0] * 4, [0, 0, 2, 0], 0)
+        with pytest.raises(ValueError):
+            sim.aplicar([0] * 4, [0] * 4)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
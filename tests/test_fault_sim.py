@@ -0,0 +1,128 @@
+"""
+Pruebas unitarias para la simulación de fallas de pegado.
+"""
+
+import pytest
+from src.full_adder import full_adder
+from src.carry_lookahead import adder_cla
+from src.netlist import trazar, trazar_sumador_restador, OPERACIONES
+from src.fault_sim import (
+    enumerar_fallas, describir_falla, simular_fallas, simular_fallas_sumador,
+    vectores_exhaustivos, vectores_aleatorios,
+)
+
+
+def _detecta(red, falla, vector):
+    """Simulación directa de un vector con una falla, sin planos."""
+    cable_falla, valor_falla = falla
+    bits = [bit for entrada in vector
+            for bit in (entrada if isinstance(entrada, list) else [entrada])]
+    valores = {0: 0, 1: 1}
+    valores.update(zip(red.cables_entrada(), bits))
+    correctos = dict(valores)
+    if cable_falla in valores:
+        valores[cable_falla] = valor_falla
+    for tipo, entradas, salida in red.compuertas:
+        operacion = OPERACIONES[tipo]
+        correctos[salida] = operacion(*(correctos[c] for c in entradas))
+        valores[salida] = operacion(*(valores[c] for c in entradas))
+        if salida == cable_falla:
+            valores[salida] = valor_falla
+    return any(valores[c] != correctos[c] for c in red.cables_salida())
+
+
+class TestFallas:
+    """Pruebas de la lista de fallas."""
+    
+    def test_enumerar(self):
+        """Dos fallas por entrada y por salida de puerta."""
+        red = trazar(full_adder, 0, 0, 0)
+        fallas = enumerar_fallas(red)
+        assert len(fallas) == 2 * (3 + len(red))
+        assert fallas[:2] == [(2, 0), (2, 1)]
+    
+    def test_describir(self):
+        """Las fallas se describen por argumento o por ruta de llamadas."""
+        red = trazar_sumador_restador(4)
+        nombres = ("a_bits", "b_bits", "operacion")
+        assert describir_falla(red, (red.entradas[1][2], 0), nombres) == "b_bits[2] s-a-0"
+        assert describir_falla(red, (red.entradas[2], 1), nombres) == "operacion s-a-1"
+        tipo, _, salida = red.compuertas[-1]
+        texto = describir_falla(red, (salida, 1))
+        assert texto.startswith(red.origen[-1] + f" {tipo}")
+        assert texto.endswith("s-a-1")
+
+
+class TestSimulacion:
+    """La simulación por planos coincide con la simulación directa."""
+    
+    def test_full_adder_exhaustivo(self):
+        """Con todas las entradas se detecta cada falla del sumador completo."""
+        red = trazar(full_adder, 0, 0, 0)
+        vectores = [(a, b, c) for a in (0, 1) for b in (0, 1) for c in (0, 1)]
+        r = simular_fallas(red, vectores)
+        assert r["cobertura"] == 100.0
+        for falla, primero in r["deteccion"].items():
+            detectan = [k for k, v in enumerate(vectores) if _detecta(red, falla, v)]
+            assert primero == detectan[0]
+    
+    @pytest.mark.parametrize("por_pasada", [None, 1, 7])
+    def test_igual_a_directa(self, por_pasada):
+        """Pocos vectores aleatorios: mismas fallas detectadas, con cualquier agrupación."""
+        red = trazar_sumador_restador(4)
+        vectores = vectores_aleatorios(5, 4, semilla=3)
+        r = simular_fallas(red, vectores, fallas_por_pasada=por_pasada)
+        for falla, primero in r["deteccion"].items():
+            detectan = [k for k, v in enumerate(vectores) if _detecta(red, falla, v)]
+            assert primero == (detectan[0] if detectan else None)
+        assert r["detectadas"] + len(r["no_detectadas"]) == r["total"]
+    
+    def test_exhaustivo_4_bits(self):
+        """Las 512 entradas detectan todas las fallas del sumador-restador."""
+        r = simular_fallas_sumador(vectores_exhaustivos(4))
+        assert r["cobertura"] == 100.0
+        assert r["no_detectadas"] == []
+    
+    def test_un_vector(self):
+        """Un solo vector no detecta todas las fallas."""
+        r = simular_fallas_sumador([([0, 0, 0, 0], [0, 0, 0, 0], 0)])
+        assert 0 < r["cobertura"] < 100.0
+    
+    def test_varios_procesos(self):
+        """Repartir las pasadas entre procesos da el mismo resultado."""
+        vectores = vectores_aleatorios(6, 8, semilla=8)
+        uno = simular_fallas_sumador(vectores, fallas_por_pasada=40)
+        dos = simular_fallas_sumador(vectores, fallas_por_pasada=40, procesos=2)
+        assert uno["deteccion"] == dos["deteccion"]
+    
+    def test_sumador_ancho(self):
+        """Un sumador de 32 bits con anticipación de acarreo."""
+        r = simular_fallas_sumador(vectores_aleatorios(64, 32), sumador=adder_cla)
+        assert r["total"] == len(enumerar_fallas(r["netlist"]))
+        assert r["cobertura"] > 90.0
+
+
+class TestErrores:
+    """Pruebas de argumentos inválidos."""
+    
+    def test_sin_vectores(self):
+        """Sin vectores no hay nada que simular."""
+        with pytest.raises(ValueError):
+            simular_fallas(trazar(full_adder, 0, 0, 0), [])
+    
+    def test_falla_invalida(self):
+        """Las fallas en las constantes o fuera del netlist no son válidas."""
+        red = trazar(full_adder, 0, 0, 0)
+        with pytest.raises(ValueError):
+            simular_fallas(red, [(0, 0, 0)], fallas=[(1, 0)])
+        with pytest.raises(ValueError):
+            simular_fallas(red, [(0, 0, 0)], fallas=[(red.n_cables, 0)])
+    
+    def test_vector_invalido(self):
+        """Los vectores se validan como en Netlist.evaluar."""
+        with pytest.raises(ValueError):
+            simular_fallas_sumador([([0, 0, 0, 2], [0, 0, 0, 0], 0)])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
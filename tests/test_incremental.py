@@ -0,0 +1,113 @@
+"""
+Pruebas unitarias para el evaluador incremental.
+"""
+
+import random
+import pytest
+from itertools import product
+from src.full_adder import full_adder
+from src.adder_subtractor import sumador_restador_4bits
+from src.adder_nbits import sumador_restador_nbits
+from src.netlist import trazar, trazar_sumador_restador
+from src.tech_mapping import mapear_circuito
+from src.utils import entero_a_bits
+from src.incremental import EvaluadorIncremental, sumador_restador_incremental
+
+
+class TestResultados:
+    """El evaluador da los mismos resultados que los circuitos."""
+    
+    def test_full_adder_transiciones(self):
+        """Sumador completo en las 64 transiciones entre entradas."""
+        ev = EvaluadorIncremental(trazar(full_adder, 0, 0, 0))
+        for origen, destino in product(product((0, 1), repeat=3), repeat=2):
+            ev.evaluar(*origen)
+            assert ev.evaluar(*destino) == full_adder(*destino)
+    
+    def test_exhaustivo_4_bits(self, todos_4):
+        """Las 512 operaciones de 4 bits, en secuencia."""
+        ev = sumador_restador_incremental(4)
+        for a, b, op in product(todos_4, todos_4, (0, 1)):
+            assert ev.evaluar(a, b, op) == sumador_restador_4bits(a, b, op)
+    
+    def test_aleatorio_32_bits(self):
+        """Operandos aleatorios de 32 bits."""
+        ev = sumador_restador_incremental(32)
+        rng = random.Random(32)
+        for _ in range(100):
+            a = [rng.getrandbits(1) for _ in range(32)]
+            b = [rng.getrandbits(1) for _ in range(32)]
+            op = rng.getrandbits(1)
+            assert ev.evaluar(a, b, op) == sumador_restador_nbits(a, b, op)
+    
+    def test_netlist_nand(self, todos_4):
+        """También con un netlist mapeado a NAND."""
+        ev = EvaluadorIncremental(mapear_circuito("sumador_restador_4bits"))
+        for a, b, op in product(todos_4, todos_4, (0, 1)):
+            assert ev.evaluar(a, b, op) == sumador_restador_4bits(a, b, op)
+    
+    def test_actualizar(self):
+        """actualizar() cambia solo los cables indicados."""
+        red = trazar_sumador_restador(4)
+        ev = EvaluadorIncremental(red)
+        a_cables, _, _ = red.entradas
+        ev.evaluar([0, 0, 1, 0], [0, 0, 1, 1], 0)
+        # A pasa de 0010 a 0110: 6 + 3 = 9
+        assert ev.actualizar({a_cables[1]: 1}) == ([1, 0, 0, 1], 0)
+
+
+class TestTrabajo:
+    """Pruebas de los contadores de puertas evaluadas."""
+    
+    def test_sin_cambios(self):
+        """Repetir las entradas no evalúa ninguna puerta."""
+        ev = sumador_restador_incremental(16)
+        a, b = entero_a_bits(1234, 16), entero_a_bits(4321, 16)
+        ev.evaluar(a, b, 1)
+        ev.evaluar(a, b, 1)
+        assert ev.ultima == 0
+        assert ev.llamadas == 2
+    
+    def test_contador_64_bits(self):
+        """Un contador de 64 bits evalúa una fracción pequeña del circuito."""
+        ev = sumador_restador_incremental(64)
+        uno = entero_a_bits(1, 64)
+        ev.evaluar([0] * 64, uno, 0)
+        ev.reiniciar_contadores()
+        for valor in range(1, 200):
+            a = [int(c) for c in format(valor, "b").zfill(64)]
+            assert ev.evaluar(a, uno, 0) == sumador_restador_nbits(a, uno, 0)
+        assert ev.evaluadas / ev.llamadas < len(ev.netlist) / 10
+    
+    def test_cada_puerta_una_vez(self):
+        """Ninguna llamada evalúa más puertas que las del circuito."""
+        ev = sumador_restador_incremental(8)
+        rng = random.Random(8)
+        for _ in range(100):
+            a = [rng.getrandbits(1) for _ in range(8)]
+            b = [rng.getrandbits(1) for _ in range(8)]
+            ev.evaluar(a, b, rng.getrandbits(1))
+            assert ev.ultima <= len(ev.netlist)
+    
+    def test_reiniciar_contadores(self):
+        """reiniciar_contadores() pone todo a cero y conserva el estado."""
+        ev = sumador_restador_incremental(4)
+        ev.evaluar([0, 1, 1, 1], [0, 0, 0, 1], 0)
+        ev.reiniciar_contadores()
+        assert (ev.evaluadas, ev.llamadas, ev.ultima) == (0, 0, 0)
+        assert ev.evaluar([0, 1, 1, 1], [0, 0, 0, 1], 0) == ([1, 0, 0, 0], 0)
+        assert ev.ultima == 0
+    
+    def test_entradas_invalidas(self):
+        """Entradas inválidas lanzan ValueError sin cambiar el estado."""
+        ev = sumador_restador_incremental(4)
+        ev.evaluar([0, 1, 1, 1], [0, 0, 0, 1], 0)
+        with pytest.raises(ValueError):
+            ev.evaluar([0, 1, 1, 1], [0, 0, 2, 1], 0)
+        with pytest.raises(ValueError):
+            ev.evaluar([0, 1, 1], [0, 0, 0, 1], 0)
+        assert ev.evaluar([0, 1, 1, 1], [0, 0, 0, 1], 0) == ([1, 0, 0, 0], 0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
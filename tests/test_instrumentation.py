@@ -0,0 +1,171 @@
+"""
+Pruebas unitarias para la instrumentación.
+"""
+
+import sys
+import pytest
+import src
+from src import logic_gates
+from src.adder_subtractor import sumador_restador_4bits
+from src.netlist import trazar_sumador_restador
+from src.instrumentation import (activar, desactivar, activa, reiniciar,
+                                 instantanea, instrumentar, INSTRUMENTABLES)
+
+
+modulo_half_adder = sys.modules["src.half_adder"]
+modulo_sumador_restador = sys.modules["src.adder_subtractor"]
+
+# Las llamadas se hacen a través del paquete para que se cuenten
+# (ver instrumentation)
+
+
+@pytest.fixture(autouse=True)
+def limpiar():
+    """Cada prueba empieza y termina sin instrumentación."""
+    desactivar()
+    reiniciar()
+    yield
+    desactivar()
+    reiniciar()
+
+
+class TestConteo:
+    """Pruebas de los contadores de llamadas."""
+    
+    def test_una_resta(self):
+        """Una resta llama una vez al sumador y cuatro al sumador completo."""
+        with instrumentar() as medicion:
+            src.sumador_restador_4bits([0, 1, 1, 1], [0, 0, 1, 0], 1)
+        assert medicion["sumador_restador_4bits"]["llamadas"] == 1
+        assert medicion["adder_4bits"]["llamadas"] == 1
+        assert medicion["full_adder"]["llamadas"] == 4
+        assert medicion["half_adder"]["llamadas"] == 8
+        # 4 XOR de B con la operación y 2 por sumador completo
+        assert medicion["XOR"]["llamadas"] == 12
+    
+    def test_complemento_a_2(self):
+        """complemento_a_2 llama a complemento_a_1 y al sumador."""
+        with instrumentar() as medicion:
+            src.complemento_a_2([0, 1, 0, 1])
+        assert medicion["complemento_a_2"]["llamadas"] == 1
+        assert medicion["complemento_a_1"]["llamadas"] == 1
+        assert medicion["adder_4bits"]["llamadas"] == 1
+    
+    def test_tiempos(self):
+        """Los tiempos son positivos e inclusivos."""
+        with instrumentar() as medicion:
+            src.adder_4bits([0, 1, 0, 1], [0, 0, 1, 1])
+        assert medicion["adder_4bits"]["tiempo"] > 0
+        assert medicion["adder_4bits"]["tiempo"] >= medicion["full_adder"]["tiempo"]
+    
+    def test_sin_tiempos(self):
+        """Con tiempos=False solo se cuentan las llamadas."""
+        with instrumentar(tiempos=False) as medicion:
+            src.adder_4bits([0, 1, 0, 1], [0, 0, 1, 1])
+        assert medicion["full_adder"]["llamadas"] == 4
+        assert medicion["full_adder"]["tiempo"] == 0
+    
+    def test_solo_algunas(self):
+        """Se puede instrumentar solo una parte de las funciones."""
+        with instrumentar(["full_adder"]) as medicion:
+            src.adder_4bits([0, 1, 0, 1], [0, 0, 1, 1])
+        assert set(medicion) == {"full_adder"}
+    
+    def test_resultado_intacto(self):
+        """La instrumentación no cambia los resultados."""
+        esperado = sumador_restador_4bits([0, 0, 1, 1], [0, 1, 0, 1], 1)
+        with instrumentar():
+            assert src.sumador_restador_4bits([0, 0, 1, 1], [0, 1, 0, 1], 1) == esperado
+
+
+class TestInstantanea:
+    """Pruebas de la API de instantánea y reinicio."""
+    
+    def test_activar_desactivar(self):
+        """Los contadores acumulan hasta reiniciar()."""
+        activar()
+        assert activa()
+        src.adder_4bits([0, 0, 0, 1], [0, 0, 0, 1])
+        src.adder_4bits([0, 0, 0, 1], [0, 0, 0, 1])
+        desactivar()
+        assert not activa()
+        assert instantanea()["adder_4bits"]["llamadas"] == 2
+        reiniciar()
+        assert instantanea() == {}
+    
+    def test_instrumentar_anidado(self):
+        """Dentro de una instrumentación activa, el bloque mide su parte."""
+        activar()
+        src.adder_4bits([0, 0, 0, 1], [0, 0, 0, 1])
+        with instrumentar() as medicion:
+            src.adder_4bits([0, 0, 0, 1], [0, 0, 0, 1])
+        assert activa()
+        assert medicion["adder_4bits"]["llamadas"] == 1
+        assert instantanea()["adder_4bits"]["llamadas"] == 2
+    
+    def test_excepcion(self):
+        """Una excepción dentro del bloque desactiva la instrumentación."""
+        with pytest.raises(ValueError):
+            with instrumentar():
+                src.adder_4bits([0, 0, 0], [0, 0, 0, 1])
+        assert not activa()
+    
+    def test_errores(self):
+        """Nombre desconocido o doble activación: error."""
+        with pytest.raises(ValueError):
+            activar(["multiplicador"])
+        activar()
+        with pytest.raises(RuntimeError):
+            activar()
+
+
+class TestCosteCero:
+    """Desactivada, no queda ninguna envoltura en el camino."""
+    
+    def test_funciones_originales(self):
+        """Tras desactivar, los módulos usan las funciones originales."""
+        with instrumentar():
+            assert modulo_half_adder.XOR is not INSTRUMENTABLES["XOR"]
+        assert modulo_half_adder.XOR is INSTRUMENTABLES["XOR"]
+        assert logic_gates.AND is INSTRUMENTABLES["AND"]
+        assert modulo_sumador_restador.adder_4bits is INSTRUMENTABLES["adder_4bits"]
+    
+    def test_defaults_restaurados(self):
+        """El sumador por defecto vuelve a ser la función original."""
+        original = sumador_restador_4bits.__defaults__
+        with instrumentar():
+            pass
+        assert sumador_restador_4bits.__defaults__ == original
+        assert INSTRUMENTABLES["adder_4bits"] in original
+    
+    def test_referencia_externa(self):
+        """Una referencia tomada fuera del paquete llama a la original."""
+        with instrumentar() as medicion:
+            sumador_restador_4bits([0, 1, 1, 1], [0, 0, 1, 0], 1)
+        assert "sumador_restador_4bits" not in medicion
+        assert medicion["adder_4bits"]["llamadas"] == 1
+    
+    def test_sin_contar_desactivada(self):
+        """Desactivada no se cuenta nada."""
+        src.adder_4bits([0, 0, 0, 1], [0, 0, 0, 1])
+        assert instantanea() == {}
+    
+    def test_compatible_con_trazar(self):
+        """Se puede trazar con la instrumentación activa."""
+        with instrumentar():
+            red = trazar_sumador_restador(4)
+        assert len(red) == 72
+        assert modulo_half_adder.AND is INSTRUMENTABLES["AND"]
+    
+    def test_motor_compilado_sin_envolturas(self):
+        """El motor compilado no guarda las envolturas en su caché."""
+        with instrumentar():
+            assert src.sumador_restador_4bits([0, 1, 1, 1], [0, 0, 1, 0], 1,
+                                              motor="compilado") == ([0, 1, 0, 1], 1)
+        claves = list(modulo_sumador_restador._compilados)
+        assert INSTRUMENTABLES["adder_4bits"] in claves
+        assert not any(hasattr(clave, "__wrapped__") for clave in claves)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -3,7 +3,7 @@ Pruebas unitarias para las puertas lógicas básicas.
 """
 
 import pytest
-from src.logic_gates import AND, OR, NOT, XOR, NAND
+from src.logic_gates import AND, OR, NOT, XOR, NAND, NOR
 
 
 class TestLogicGates:
@@ -48,6 +48,16 @@ class TestLogicGates:
         """Prueba paramétrica de la puerta NAND."""
         assert NAND(a, b) == expected
     
+    @pytest.mark.parametrize("a,b,expected", [
+        (0, 0, 1),
+        (0, 1, 0),
+        (1, 0, 0),
+        (1, 1, 0),
+    ])
+    def test_NOR_parametrized(self, a, b, expected):
+        """Prueba paramétrica de la puerta NOR."""
+        assert NOR(a, b) == expected
+    
     def test_XOR_implemented_with_basic_gates(self):
         """Verifica que XOR esté implementada solo con AND, OR, NOT."""
         # XOR(a,b) = (A AND NOT B) OR (NOT A AND B)
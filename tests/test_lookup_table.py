@@ -0,0 +1,78 @@
+"""
+Pruebas unitarias para el motor de tabla precalculada.
+"""
+
+import pytest
+from itertools import product
+from src.adder_subtractor import sumador_restador_4bits
+from src.lookup_table import (construir_tabla, obtener_tabla,
+                              sumador_restador_tabla, verificar_tabla,
+                              MOTOR_REFERENCIA)
+
+
+class TestLookupTable:
+    """Pruebas para la tabla de 512 entradas."""
+    
+    def test_tabla_tiene_512_entradas(self):
+        """La tabla cubre todo el espacio 16 x 16 x 2."""
+        assert len(construir_tabla()) == 512
+    
+    def test_verificar_tabla(self):
+        """La tabla coincide con el circuito de puertas."""
+        assert verificar_tabla() is True
+    
+    def test_verificar_tabla_detecta_error(self):
+        """Una entrada alterada hace fallar la verificación."""
+        tabla = construir_tabla()
+        clave = (0,1,0,1, 0,0,1,1, 0)
+        tabla[clave] = ((1,1,1,1), 0)
+        assert verificar_tabla(tabla) is False
+        
+        del tabla[clave]
+        assert verificar_tabla(tabla) is False
+    
+    def test_equivalencia_exhaustiva(self):
+        """El motor de tabla es idéntico al de puertas en todas las entradas."""
+        for entrada in product((0, 1), repeat=9):
+            a, b, op = list(entrada[0:4]), list(entrada[4:8]), entrada[8]
+            esperado = sumador_restador_4bits(a, b, op, motor=MOTOR_REFERENCIA)
+            assert sumador_restador_tabla(a, b, op) == esperado
+            assert sumador_restador_4bits(a, b, op, motor="tabla") == esperado
+    
+    def test_resultado_es_lista_nueva(self):
+        """Modificar el resultado no altera la tabla."""
+        resultado, _ = sumador_restador_tabla([0,1,0,1], [0,0,1,1], 0)
+        resultado[0] = 0
+        resultado, _ = sumador_restador_tabla([0,1,0,1], [0,0,1,1], 0)
+        assert resultado == [1, 0, 0, 0]
+    
+    def test_tabla_compartida(self):
+        """obtener_tabla construye la tabla una sola vez."""
+        assert obtener_tabla() is obtener_tabla()
+    
+    def test_entradas_invalidas(self):
+        """Las entradas fuera de la tabla lanzan ValueError."""
+        with pytest.raises(ValueError):
+            sumador_restador_tabla([0,2,0,0], [0,0,0,0], 0)
+        
+        with pytest.raises(ValueError):
+            sumador_restador_tabla([0,0,0], [0,0,0,0], 0)
+        
+        with pytest.raises(ValueError):
+            sumador_restador_tabla([0,0,0,0], [0,0,0,0], 2)
+        
+        # Anchos erróneos que suman 8 bits no caen en otra entrada
+        with pytest.raises(ValueError):
+            sumador_restador_tabla([0,0,0,0,1], [0,0,0], 1)
+        
+        with pytest.raises(ValueError):
+            sumador_restador_4bits([0,0,0,0,1], [0,0,0], 1, motor="tabla")
+    
+    def test_motor_desconocido(self):
+        """Un motor inexistente lanza ValueError."""
+        with pytest.raises(ValueError):
+            sumador_restador_4bits([0,0,0,0], [0,0,0,0], 0, motor="otro")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,84 @@
+"""
+Pruebas unitarias para las métricas de los circuitos.
+"""
+
+import sys
+import pytest
+from src.logic_gates import AND, XOR
+from src.half_adder import half_adder
+from src.full_adder import full_adder
+from src.adder_4bit import adder_4bits
+from src.adder_nbits import adder_nbits
+from src import logic_gates
+from src.metrics import medir_circuito, medir_sumador
+
+
+# El paquete reexporta la función half_adder con el nombre del módulo
+modulo_half_adder = sys.modules["src.half_adder"]
+
+
+class TestMetricas:
+    """Pruebas para medir_circuito y medir_sumador."""
+    
+    def test_puertas_primitivas(self):
+        """Cada primitiva cuenta como una puerta de profundidad 1."""
+        m = medir_circuito(AND, 1, 1)
+        assert m["compuertas"] == 1
+        assert m["profundidad"] == 1
+        assert m["por_tipo"] == {"AND": 1, "OR": 0, "NOT": 0}
+    
+    def test_xor_se_mide_por_sus_primitivas(self):
+        """XOR = 2 NOT, 2 AND y 1 OR, con profundidad 3."""
+        m = medir_circuito(XOR, 0, 1)
+        assert m["por_tipo"] == {"AND": 2, "OR": 1, "NOT": 2}
+        assert m["profundidad"] == 3
+    
+    def test_half_y_full_adder(self):
+        """Conteos conocidos del medio sumador y el sumador completo."""
+        assert medir_circuito(half_adder, 0, 0)["compuertas"] == 6
+        m = medir_circuito(full_adder, 0, 0, 0)
+        assert m["compuertas"] == 13
+        assert m["profundidad_salidas"] == [6, 5]
+    
+    def test_ripple_lineal(self):
+        """El ripple añade 2 niveles por bit en el camino del acarreo."""
+        p4 = medir_sumador(adder_nbits, 4)["profundidad"]
+        p8 = medir_sumador(adder_nbits, 8)["profundidad"]
+        assert p8 - p4 == 8
+        assert medir_sumador(adder_4bits, 4)["compuertas"] == 4 * 13
+    
+    def test_no_depende_de_los_valores(self):
+        """Las métricas son iguales para cualquier valor de entrada."""
+        m0 = medir_circuito(adder_4bits, [0,0,0,0], [0,0,0,0], 0)
+        m1 = medir_circuito(adder_4bits, [1,0,1,1], [0,1,1,1], 1)
+        assert m0 == m1
+    
+    def test_restaura_las_puertas(self):
+        """Tras medir, los módulos vuelven a usar las puertas originales."""
+        original_and = logic_gates.AND
+        medir_circuito(half_adder, 1, 1)
+        assert logic_gates.AND is original_and
+        assert modulo_half_adder.AND is original_and
+    
+    def test_restaura_tras_error(self):
+        """Las puertas se restauran aunque el circuito lance una excepción."""
+        original_and = logic_gates.AND
+        with pytest.raises(ValueError):
+            medir_circuito(adder_4bits, [0, 0], [0, 0], 0)
+        assert modulo_half_adder.AND is original_and
+
+    
+    def test_sensibilizado(self):
+        """Un 0 en una AND la decide sin esperar a la otra entrada."""
+        def circuito(a, b):
+            # Se llama a través del módulo para usar las puertas sustituidas
+            no = logic_gates.NOT
+            return logic_gates.AND(a, no(no(no(b))))
+        
+        assert medir_circuito(circuito, 0, 0)["profundidad"] == 4
+        assert medir_circuito(circuito, 0, 0, sensibilizado=True)["profundidad"] == 1
+        assert medir_circuito(circuito, 1, 0, sensibilizado=True)["profundidad"] == 4
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,203 @@
+"""
+Pruebas unitarias para el netlist.
+"""
+
+import pickle
+import random
+import sys
+import pytest
+from itertools import product
+from src import logic_gates
+from src.logic_gates import AND, XOR
+from src.full_adder import full_adder
+from src.adder_4bit import adder_4bits
+from src.adder_subtractor import sumador_restador_4bits
+from src.adder_nbits import sumador_restador_nbits
+from src.carry_lookahead import adder_cla
+from src.complement import complemento_a_2
+from src.metrics import medir_circuito
+from src.bitslice import empaquetar_bits, desempaquetar, mascara
+from src.netlist import (trazar, trazar_sumador_restador, CERO, UNO, OPERACIONES,
+                         PRIMITIVAS)
+
+
+modulo_half_adder = sys.modules["src.half_adder"]
+
+
+class TestTraza:
+    """Pruebas de la construcción del netlist."""
+    
+    def test_full_adder(self):
+        """El netlist del sumador completo tiene sus 13 primitivas."""
+        red = trazar(full_adder, 0, 0, 0)
+        assert len(red) == 13
+        assert red.contar() == {"AND": 6, "OR": 3, "NOT": 4}
+        assert red.entradas == [2, 3, 4]
+    
+    def test_misma_cuenta_que_metricas(self):
+        """El número de puertas coincide con medir_circuito."""
+        red = trazar_sumador_restador(4)
+        m = medir_circuito(sumador_restador_4bits, [0] * 4, [0] * 4, 0)
+        assert len(red) == m["compuertas"]
+        assert len(red.niveles()) == m["profundidad"]
+    
+    def test_xor_como_nodo(self):
+        """Con XOR entre las primitivas, cada XOR es un solo nodo."""
+        red = trazar(full_adder, 0, 0, 0, primitivas=("AND", "OR", "XOR"))
+        assert red.contar() == {"XOR": 2, "AND": 2, "OR": 1}
+        for a, b, c in product((0, 1), repeat=3):
+            assert red.evaluar(a, b, c) == full_adder(a, b, c)
+    
+    def test_primitiva_directa(self):
+        """Trazar una puerta primitiva da una sola puerta."""
+        red = trazar(AND, 0, 0)
+        assert len(red) == 1
+        assert red.evaluar(1, 1) == 1
+    
+    def test_constantes(self):
+        """Las constantes del complemento a 2 van a los cables 0 y 1."""
+        red = trazar(complemento_a_2, [0, 0, 0, 0])
+        leidos = {c for _, entradas, _ in red.compuertas for c in entradas}
+        assert CERO in leidos and UNO in leidos
+        for bits in product((0, 1), repeat=4):
+            assert red.evaluar(list(bits)) == complemento_a_2(list(bits))
+    
+    def test_restaura_las_puertas(self):
+        """Tras trazar, los módulos vuelven a usar las puertas originales."""
+        original = logic_gates.AND
+        trazar(full_adder, 0, 0, 0)
+        assert modulo_half_adder.AND is original
+    
+    def test_primitiva_desconocida(self):
+        """Una puerta que no se puede anotar lanza ValueError."""
+        with pytest.raises(ValueError):
+            trazar(full_adder, 0, 0, 0, primitivas=("XNOR",))
+    
+    def test_origen(self):
+        """Cada puerta recuerda la ruta de llamadas que la creó."""
+        red = trazar(adder_4bits, [0] * 4, [0] * 4, 0,
+                     primitivas=("AND", "OR", "XOR"))
+        assert len(red.origen) == len(red)
+        assert red.origen[0] == "adder_4bits[0]/full_adder[0]/half_adder[0]"
+        assert red.origen[-1] == "adder_4bits[0]/full_adder[3]"
+        rutas = {ruta for ruta in red.origen}
+        assert len([r for r in rutas if r.count("/") == 2]) == 8
+    
+    def test_nor_como_nodo(self):
+        """NOR se puede anotar como un solo nodo."""
+        red = trazar(logic_gates.NOR, 0, 0, primitivas=("NOR",))
+        assert red.contar() == {"NOR": 1}
+        for a, b in product((0, 1), repeat=2):
+            assert red.evaluar(a, b) == logic_gates.NOR(a, b)
+
+
+class TestEstructura:
+    """Pruebas de niveles y lectores."""
+    
+    def test_niveles_topologicos(self):
+        """Cada puerta solo lee cables de niveles anteriores."""
+        red = trazar_sumador_restador(8)
+        nivel_de_cable = {}
+        for k, nivel in enumerate(red.niveles()):
+            for indice in nivel:
+                _, entradas, salida = red.compuertas[indice]
+                assert all(nivel_de_cable.get(c, -1) < k for c in entradas)
+                nivel_de_cable[salida] = k
+        assert sum(len(n) for n in red.niveles()) == len(red)
+    
+    def test_lectores(self):
+        """El fan-out de cada cable cuenta las puertas que lo leen."""
+        red = trazar(full_adder, 0, 0, 0)
+        lectores = red.lectores()
+        total = sum(len(entradas) for _, entradas, _ in red.compuertas)
+        assert sum(len(l) for l in lectores) == total
+
+
+class TestEvaluacion:
+    """Pruebas de la evaluación del netlist."""
+    
+    def test_exhaustivo_4_bits(self):
+        """Igual que sumador_restador_4bits en las 512 entradas."""
+        red = trazar_sumador_restador(4)
+        for a, b, op in product(product((0, 1), repeat=4),
+                                product((0, 1), repeat=4), (0, 1)):
+            assert red.evaluar(list(a), list(b), op) == \
+                sumador_restador_4bits(list(a), list(b), op)
+    
+    @pytest.mark.parametrize("sumador", [None, adder_cla])
+    def test_16_bits(self, sumador):
+        """Igual que sumador_restador_nbits con operandos aleatorios."""
+        red = trazar_sumador_restador(16, sumador=sumador)
+        rng = random.Random(16)
+        for _ in range(50):
+            a = [rng.getrandbits(1) for _ in range(16)]
+            b = [rng.getrandbits(1) for _ in range(16)]
+            op = rng.getrandbits(1)
+            assert red.evaluar(a, b, op) == sumador_restador_nbits(a, b, op)
+    
+    def test_planos(self):
+        """evaluar_planos evalúa muchos vectores a la vez."""
+        red = trazar(XOR, 0, 0)
+        a = empaquetar_bits([0, 0, 1, 1])
+        b = empaquetar_bits([0, 1, 0, 1])
+        valores = red.evaluar_planos([a, b], mascara(4))
+        salida = valores[red.cables_salida()[0]]
+        assert desempaquetar([salida], 4) == [[0], [1], [1], [0]]
+    
+    @pytest.mark.parametrize("primitivas", [PRIMITIVAS, ("AND", "OR", "NOT", "XOR"),
+                                            ("NAND", "NOR", "NOT")])
+    def test_evaluar_igual_que_programa(self, primitivas):
+        """La función compilada de evaluar coincide con programa()."""
+        red = trazar_sumador_restador(8, primitivas=primitivas)
+        rng = random.Random(8)
+        for _ in range(50):
+            a = [rng.getrandbits(1) for _ in range(8)]
+            b = [rng.getrandbits(1) for _ in range(8)]
+            op = rng.getrandbits(1)
+            valores = red.evaluar_planos(red.aplanar(a, b, op))
+            assert red.evaluar(a, b, op) == red.reconstruir(valores)
+    
+    def test_pickle_tras_evaluar(self):
+        """Un netlist ya evaluado se puede enviar a otro proceso."""
+        red = trazar_sumador_restador(4)
+        esperado = red.evaluar([0, 1, 1, 1], [0, 0, 1, 0], 1)
+        copia = pickle.loads(pickle.dumps(red))
+        assert copia.evaluar([0, 1, 1, 1], [0, 0, 1, 0], 1) == esperado
+        assert red.evaluar([0, 1, 1, 1], [0, 0, 1, 0], 1) == esperado
+    
+    def test_aplanar_y_reconstruir(self):
+        """aplanar sigue el orden de cables; reconstruir, el de salidas."""
+        red = trazar_sumador_restador(4)
+        assert red.aplanar([0, 1, 1, 1], [0, 0, 1, 0], 1) == [0, 1, 1, 1, 0, 0, 1, 0, 1]
+        valores = red.evaluar_planos(red.aplanar([0, 1, 1, 1], [0, 0, 1, 0], 1))
+        assert red.reconstruir(valores) == ([0, 1, 0, 1], 1)
+        assert red.reconstruir(list(range(red.n_cables))) == \
+            (list(red.salidas[0]), red.salidas[1])
+    
+    @pytest.mark.parametrize("tipo", list(OPERACIONES))
+    def test_operaciones_sobre_planos(self, tipo):
+        """Con la máscara como uno, cada puerta vale lo mismo en cada vector."""
+        operacion = OPERACIONES[tipo]
+        n_entradas = 1 if tipo == "NOT" else 2
+        casos = list(product((0, 1), repeat=n_entradas))
+        planos = [empaquetar_bits([caso[i] for caso in casos])
+                  for i in range(n_entradas)]
+        plano = operacion(*planos, uno=mascara(len(casos)))
+        assert desempaquetar([plano], len(casos)) == \
+            [[operacion(*caso)] for caso in casos]
+    
+    def test_entradas_invalidas(self):
+        """Número de argumentos, anchos o bits incorrectos: ValueError."""
+        red = trazar_sumador_restador(4)
+        with pytest.raises(ValueError):
+            red.evaluar([0] * 4, [0] * 4)
+        with pytest.raises(ValueError):
+            red.evaluar([0] * 4, [0] * 3, 0)
+        with pytest.raises(ValueError):
+            red.evaluar([0] * 4, [0, 0, 0, 2], 0)
+        with pytest.raises(ValueError):
+            red.evaluar([0] * 4, [0] * 4, 2)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,148 @@
+"""
+Pruebas unitarias para el optimizador de netlists.
+"""
+
+import pytest
+from itertools import product
+from src.adder_4bit import adder_4bits
+from src.complement import complemento_a_2
+from src.netlist import Netlist, trazar, trazar_sumador_restador, CERO, UNO
+from src.optimizer import optimizar, reporte_optimizacion
+
+
+class TestReglas:
+    """Pruebas de las simplificaciones de puertas sueltas."""
+    
+    def test_constantes(self):
+        """AND/OR con una constante se reducen a un cable o a la constante."""
+        red = Netlist([2], [("AND", (2, CERO), 3), ("OR", (2, CERO), 4),
+                            ("AND", (UNO, 2), 5), ("OR", (2, UNO), 6)],
+                      [3, 4, 5, 6], 7)
+        optimizada = optimizar(red)
+        assert len(optimizada) == 0
+        assert optimizada.salidas == [CERO, 2, 2, UNO]
+    
+    def test_doble_negacion(self):
+        """NOT(NOT(x)) es x."""
+        red = Netlist([2], [("NOT", (2,), 3), ("NOT", (3,), 4)], [4], 5)
+        optimizada = optimizar(red)
+        assert len(optimizada) == 0
+        assert optimizada.salidas == [2]
+    
+    def test_complementarias(self):
+        """x AND NOT(x) es 0 y x OR NOT(x) es 1."""
+        red = Netlist([2], [("NOT", (2,), 3), ("AND", (2, 3), 4),
+                            ("OR", (3, 2), 5)], [4, 5], 6)
+        assert optimizar(red).salidas == [CERO, UNO]
+    
+    def test_xor(self):
+        """XOR con 1 pasa a NOT; XOR de un cable consigo mismo es 0."""
+        red = Netlist([2, 3], [("XOR", (2, UNO), 4), ("XOR", (3, 3), 5)],
+                      [4, 5], 6)
+        optimizada = optimizar(red)
+        assert optimizada.contar() == {"NOT": 1}
+        assert optimizada.salidas[1] == CERO
+    
+    def test_nand_nor(self):
+        """NAND y NOR con una constante o entradas iguales pasan a NOT o a constante."""
+        red = Netlist([2], [("NAND", (2, 2), 3), ("NOR", (2, CERO), 4),
+                            ("NOR", (UNO, 2), 5), ("NAND", (CERO, 2), 6)],
+                      [3, 4, 5, 6], 7)
+        optimizada = optimizar(red)
+        assert optimizada.contar() == {"NOT": 1}
+        assert optimizada.salidas[2:] == [CERO, UNO]
+        for a in (0, 1):
+            assert optimizada.evaluar(a) == red.evaluar(a)
+    
+    def test_subexpresion_comun(self):
+        """Dos puertas iguales (en cualquier orden de entradas) se fusionan."""
+        red = Netlist([2, 3], [("AND", (2, 3), 4), ("AND", (3, 2), 5),
+                               ("OR", (4, 5), 6)], [6], 7)
+        optimizada = optimizar(red)
+        # AND compartida y OR(x, x) = x
+        assert optimizada.contar() == {"AND": 1}
+    
+    def test_puertas_muertas(self):
+        """Las puertas que no llegan a las salidas se eliminan."""
+        red = Netlist([2, 3], [("AND", (2, 3), 4), ("OR", (2, 3), 5)], [5], 6)
+        assert optimizar(red).contar() == {"OR": 1}
+    
+    def test_no_modifica_original(self):
+        """El netlist original no cambia."""
+        red = trazar(adder_4bits, [0] * 4, [0] * 4)
+        compuertas = list(red.compuertas)
+        optimizar(red)
+        assert red.compuertas == compuertas
+
+
+class TestEquivalencia:
+    """El netlist optimizado calcula lo mismo que el original."""
+    
+    def test_sumador_con_cin_constante(self, todos_4):
+        """adder_4bits con cin = 0: menos puertas, mismo resultado."""
+        red = trazar(adder_4bits, [0] * 4, [0] * 4)
+        optimizada = optimizar(red)
+        assert len(optimizada) < len(red)
+        for a, b in product(todos_4, todos_4):
+            assert optimizada.evaluar(a, b) == adder_4bits(a, b)
+    
+    def test_complemento_a_2(self, todos_4):
+        """La suma de la constante [0,0,0,1] se reduce a un incrementador."""
+        red = trazar(complemento_a_2, [0] * 4)
+        optimizada = optimizar(red)
+        assert len(optimizada) < len(red) // 2
+        for a in todos_4:
+            assert optimizada.evaluar(a) == complemento_a_2(a)
+    
+    @pytest.mark.parametrize("primitivas", [("AND", "OR", "NOT"),
+                                            ("AND", "OR", "NOT", "XOR")])
+    def test_sumador_restador(self, primitivas, todos_4):
+        """El sumador-restador trazado conserva sus 512 resultados."""
+        red = trazar_sumador_restador(4, primitivas=primitivas)
+        optimizada = optimizar(red)
+        assert len(optimizada) <= len(red)
+        for a, b, op in product(todos_4, todos_4, (0, 1)):
+            assert optimizada.evaluar(a, b, op) == red.evaluar(a, b, op)
+    
+    def test_not_de_operacion_compartida(self):
+        """Las XOR con la operación comparten NOT(operacion)."""
+        red = trazar_sumador_restador(4)
+        assert optimizar(red).contar()["NOT"] < red.contar()["NOT"]
+    
+    def test_idempotente(self):
+        """Optimizar dos veces no cambia nada."""
+        una = optimizar(trazar(complemento_a_2, [0] * 4))
+        dos = optimizar(una)
+        assert dos.compuertas == una.compuertas
+        assert dos.salidas == una.salidas
+    
+    def test_conserva_origen(self):
+        """Las puertas que quedan conservan su ruta de llamadas."""
+        red = trazar(adder_4bits, [0] * 4, [0] * 4)
+        optimizada = optimizar(red)
+        assert len(optimizada.origen) == len(optimizada)
+        assert set(optimizada.origen) <= set(red.origen)
+    
+    def test_cables_compactos(self):
+        """Las salidas de las puertas quedan numeradas tras las entradas."""
+        red = optimizar(trazar(adder_4bits, [0] * 4, [0] * 4))
+        primera = UNO + 1 + len(red.cables_entrada())
+        salidas = [salida for _, _, salida in red.compuertas]
+        assert salidas == list(range(primera, red.n_cables))
+
+
+class TestReporte:
+    """Pruebas del informe de optimización."""
+    
+    def test_reporte(self):
+        """El informe da cuentas y profundidad antes y después."""
+        red = trazar(complemento_a_2, [0] * 4)
+        r = reporte_optimizacion(red)
+        assert r["antes"]["compuertas"] == len(red)
+        assert r["despues"]["compuertas"] == len(r["optimizado"])
+        assert r["despues"]["profundidad"] <= r["antes"]["profundidad"]
+        assert sum(r["despues"]["por_tipo"].values()) == r["despues"]["compuertas"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,128 @@
+"""
+Pruebas unitarias para la actividad de conmutación.
+"""
+
+import random
+import tracemalloc
+import pytest
+from src.netlist import trazar_sumador_restador
+from src.utils import entero_a_bits
+from src.power import (
+    actividad, actividad_sumador_restador, por_componente, leer_operaciones,
+)
+
+
+def _flujo(n_operaciones, n_bits=4, semilla=0):
+    """Generador de operaciones aleatorias."""
+    rng = random.Random(semilla)
+    for _ in range(n_operaciones):
+        yield ([rng.getrandbits(1) for _ in range(n_bits)],
+               [rng.getrandbits(1) for _ in range(n_bits)],
+               rng.getrandbits(1))
+
+
+def _conmutaciones_directas(red, operaciones):
+    """Conmutaciones de cada cable evaluando operación a operación."""
+    conmutaciones = [0] * red.n_cables
+    anterior = None
+    for a, b, op in operaciones:
+        valores = red.evaluar_planos(a + b + [op])
+        if anterior is not None:
+            for cable in range(red.n_cables):
+                conmutaciones[cable] += anterior[cable] != valores[cable]
+        anterior = valores[:red.n_cables]
+    return conmutaciones
+
+
+class TestConmutaciones:
+    """Las cuentas por planos coinciden con la evaluación directa."""
+    
+    @pytest.mark.parametrize("bloque", [1, 7, 64, 4096])
+    def test_igual_a_directa(self, bloque):
+        """El tamaño de bloque no cambia el resultado."""
+        red = trazar_sumador_restador(4)
+        operaciones = list(_flujo(300))
+        r = actividad(red, operaciones, bloque)
+        assert r["conmutaciones"] == _conmutaciones_directas(red, operaciones)
+        assert r["operaciones"] == 300
+        assert r["transiciones"] == 299
+    
+    def test_flujo_constante(self):
+        """Repetir la misma operación no conmuta nada."""
+        operaciones = [([0, 1, 1, 1], [0, 0, 1, 0], 1)] * 50
+        r = actividad_sumador_restador(operaciones)
+        assert r["total"] == 0
+        assert r["energia"] == 0
+        assert r["por_operacion"] == 0.0
+    
+    def test_contador(self):
+        """Al contar, el bit menos significativo cambia en cada operación."""
+        uno = entero_a_bits(1, 8)
+        r = actividad_sumador_restador((entero_a_bits(i, 8), uno, 0) for i in range(200))
+        resultado, _ = r["netlist"].salidas
+        assert r["conmutaciones"][resultado[-1]] == 199
+    
+    def test_actividad_y_totales(self):
+        """Factor de actividad entre 0 y 1 y totales coherentes."""
+        r = actividad_sumador_restador(_flujo(500))
+        assert all(0.0 <= a <= 1.0 for a in r["actividad"])
+        assert r["total"] == sum(r["por_compuerta"])
+        assert r["por_operacion"] == pytest.approx(r["total"] / 499)
+        assert r["energia"] >= r["total"]
+    
+    def test_por_componente(self):
+        """Agrupar por componente conserva el total."""
+        r = actividad_sumador_restador(_flujo(200))
+        grupos = por_componente(r["netlist"], r["por_compuerta"], profundidad=3)
+        assert sum(grupos.values()) == r["total"]
+        assert "sumador_restador_4bits[0]/adder_4bits[0]/full_adder[0]" in grupos
+
+
+class TestFlujos:
+    """Pruebas del consumo de flujos."""
+    
+    def test_memoria_constante(self):
+        """Un flujo cuatro veces más largo no necesita más memoria."""
+        red = trazar_sumador_restador(4)
+        picos = []
+        for n_operaciones in (5000, 20000):
+            tracemalloc.start()
+            actividad(red, _flujo(n_operaciones), bloque=256)
+            picos.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+        assert picos[1] < 1.5 * picos[0]
+    
+    def test_leer_operaciones(self, tmp_path):
+        """Lectura de un archivo con comentarios y operaciones +/-."""
+        ruta = tmp_path / "operaciones.txt"
+        ruta.write_text("# a b op\n0111 0010 1\n\n0101 0011 +\n0001 0001 -\n",
+                        encoding="utf-8")
+        operaciones = list(leer_operaciones(str(ruta)))
+        assert operaciones == [([0, 1, 1, 1], [0, 0, 1, 0], 1),
+                               ([0, 1, 0, 1], [0, 0, 1, 1], 0),
+                               ([0, 0, 0, 1], [0, 0, 0, 1], 1)]
+        r = actividad_sumador_restador(leer_operaciones(str(ruta)))
+        assert r["operaciones"] == 3
+    
+    def test_linea_invalida(self, tmp_path):
+        """Una línea mal formada lanza ValueError con su número."""
+        ruta = tmp_path / "operaciones.txt"
+        ruta.write_text("0111 0010 1\n0111 0012 1\n", encoding="utf-8")
+        with pytest.raises(ValueError, match="Línea 2"):
+            list(leer_operaciones(str(ruta)))
+    
+    def test_flujo_vacio(self):
+        """Sin operaciones hace falta dar el ancho."""
+        with pytest.raises(ValueError):
+            actividad_sumador_restador(iter([]))
+        r = actividad_sumador_restador(iter([]), n_bits=4)
+        assert r["operaciones"] == 0 and r["total"] == 0
+    
+    def test_operacion_invalida(self):
+        """Las operaciones se validan como en Netlist.evaluar."""
+        with pytest.raises(ValueError):
+            actividad_sumador_restador([([0, 0, 0, 2], [0, 0, 0, 0], 0)])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
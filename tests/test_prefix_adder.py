@@ -0,0 +1,104 @@
+"""
+Pruebas unitarias para los sumadores de prefijos paralelos.
+"""
+
+import random
+import pytest
+from itertools import product
+from src.adder_nbits import adder_nbits, sumador_restador_nbits
+from src.prefix_adder import (TOPOLOGIAS, red_prefijos, adder_prefijos,
+                              adder_kogge_stone, adder_brent_kung,
+                              adder_sklansky, reportar_topologias)
+from src.utils import entero_a_bits
+
+
+class TestRedPrefijos:
+    """Pruebas para la generación de las redes."""
+    
+    @pytest.mark.parametrize("topologia", TOPOLOGIAS)
+    def test_todas_las_posiciones_llegan_a_cero(self, topologia):
+        """Cada posición termina cubriendo el rango [i:0] sin huecos."""
+        for n_bits in range(1, 70):
+            inicio = list(range(n_bits))
+            for nivel in red_prefijos(topologia, n_bits):
+                anterior = list(inicio)
+                for i, j in nivel:
+                    # Solo se combinan rangos contiguos
+                    assert anterior[i] == j + 1
+                    inicio[i] = anterior[j]
+            assert inicio == [0] * n_bits
+    
+    def test_kogge_stone_4bits(self):
+        """Red conocida de Kogge-Stone para 4 bits."""
+        assert red_prefijos("kogge_stone", 4) == \
+            [[(1, 0), (2, 1), (3, 2)], [(2, 0), (3, 1)]]
+    
+    def test_niveles(self):
+        """Kogge-Stone y Sklansky usan log2(n) niveles, Brent-Kung 2·log2(n)-1."""
+        assert len(red_prefijos("kogge_stone", 32)) == 5
+        assert len(red_prefijos("sklansky", 32)) == 5
+        assert len(red_prefijos("brent_kung", 32)) == 9
+    
+    def test_topologia_invalida(self):
+        """Una topología inexistente lanza ValueError."""
+        with pytest.raises(ValueError):
+            red_prefijos("ripple", 8)
+        with pytest.raises(ValueError):
+            red_prefijos("kogge_stone", 0)
+
+
+class TestAdderPrefijos:
+    """Pruebas de equivalencia con el sumador ripple."""
+    
+    @pytest.mark.parametrize("topologia", TOPOLOGIAS)
+    @pytest.mark.parametrize("n_bits", [1, 2, 3, 4, 5])
+    def test_exhaustivo(self, topologia, n_bits):
+        """Idéntico al ripple en todas las entradas para anchos pequeños."""
+        for entrada in product((0, 1), repeat=2 * n_bits + 1):
+            a = list(entrada[:n_bits])
+            b = list(entrada[n_bits:2 * n_bits])
+            cin = entrada[-1]
+            assert adder_prefijos(a, b, cin, topologia) == \
+                adder_nbits(a, b, cin)
+    
+    @pytest.mark.parametrize("sumador", [adder_kogge_stone, adder_brent_kung,
+                                         adder_sklansky])
+    @pytest.mark.parametrize("n_bits", [16, 23, 64])
+    def test_anchos_grandes(self, sumador, n_bits):
+        """Idéntico al ripple con operandos aleatorios."""
+        rng = random.Random(n_bits)
+        for _ in range(20):
+            a = entero_a_bits(rng.getrandbits(n_bits), n_bits)
+            b = entero_a_bits(rng.getrandbits(n_bits), n_bits)
+            cin = rng.getrandbits(1)
+            assert sumador(a, b, cin) == adder_nbits(a, b, cin)
+    
+    def test_como_sumador_de_sumador_restador(self):
+        """Se puede pasar como sumador a sumador_restador_nbits."""
+        a = entero_a_bits(200, 8)
+        b = entero_a_bits(57, 8)
+        assert sumador_restador_nbits(a, b, 1, adder_sklansky) == \
+            sumador_restador_nbits(a, b, 1)
+
+
+class TestReporte:
+    """Pruebas para reportar_topologias."""
+    
+    def test_compromisos_conocidos(self):
+        """Cada topología muestra su compromiso área/profundidad/fan-out."""
+        reporte = {fila["topologia"]: fila for fila in reportar_topologias(32)}
+        ks = reporte["kogge_stone"]
+        bk = reporte["brent_kung"]
+        sk = reporte["sklansky"]
+        
+        # Kogge-Stone: la menor profundidad, el mayor número de puertas
+        assert ks["profundidad"] <= sk["profundidad"] < bk["profundidad"]
+        assert ks["compuertas"] > sk["compuertas"] > bk["compuertas"]
+        
+        # Sklansky: fan-out de la red que crece con el ancho
+        assert ks["fanout_red"] == bk["fanout_red"] == 2
+        assert sk["fanout_red"] == 32 // 2 + 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,123 @@
+"""
+Pruebas unitarias para el mapeo tecnológico.
+"""
+
+import pytest
+from itertools import product
+from src.half_adder import half_adder
+from src.full_adder import full_adder
+from src.adder_4bit import adder_4bits
+from src.adder_subtractor import sumador_restador_4bits
+from src.complement import complemento_a_2
+from src.netlist import trazar
+from src.compiler import compilar
+from src.bitslice import empaquetar, empaquetar_bits, desempaquetar, mascara
+from src.tech_mapping import (mapear, mapear_circuito, reporte_tecnologia,
+                              costo, BIBLIOTECAS, CIRCUITOS)
+
+
+class TestMapeo:
+    """Pruebas de la forma de los circuitos mapeados."""
+    
+    @pytest.mark.parametrize("biblioteca", BIBLIOTECAS)
+    @pytest.mark.parametrize("nombre", list(CIRCUITOS))
+    def test_una_sola_puerta(self, nombre, biblioteca):
+        """Los circuitos mapeados solo usan la puerta de la biblioteca."""
+        red = mapear_circuito(nombre, biblioteca)
+        assert set(red.contar()) == {biblioteca}
+    
+    def test_full_adder_nueve_nand(self):
+        """El sumador completo queda en las 9 NAND clásicas."""
+        assert mapear_circuito("full_adder", "NAND").contar() == {"NAND": 9}
+        assert mapear_circuito("half_adder", "NAND").contar() == {"NAND": 5}
+    
+    def test_primitivas_descompuestas(self):
+        """También se mapea el circuito con XOR descompuesta."""
+        red = mapear(trazar(full_adder, 0, 0, 0), "NOR")
+        assert set(red.contar()) == {"NOR"}
+        for a, b, c in product((0, 1), repeat=3):
+            assert red.evaluar(a, b, c) == full_adder(a, b, c)
+    
+    def test_sin_optimizar(self, todos_4):
+        """Sin optimizar, las constantes quedan como cables fijos."""
+        red = mapear(trazar(complemento_a_2, [0] * 4), "NAND", optimizado=False)
+        optimizada = mapear(trazar(complemento_a_2, [0] * 4), "NAND")
+        assert len(optimizada) < len(red)
+        for a in todos_4:
+            assert red.evaluar(a) == complemento_a_2(a)
+            assert optimizada.evaluar(a) == complemento_a_2(a)
+    
+    def test_biblioteca_desconocida(self):
+        """Una biblioteca desconocida lanza ValueError."""
+        with pytest.raises(ValueError):
+            mapear(trazar(half_adder, 0, 0), "AOI")
+        with pytest.raises(ValueError):
+            mapear_circuito("multiplicador")
+
+
+class TestEquivalencia:
+    """Los circuitos mapeados funcionan en los motores de simulación."""
+    
+    @pytest.mark.parametrize("biblioteca", BIBLIOTECAS)
+    def test_half_y_full_adder(self, biblioteca):
+        """Medio sumador y sumador completo con todas sus entradas."""
+        medio = mapear_circuito("half_adder", biblioteca)
+        completo = mapear_circuito("full_adder", biblioteca)
+        for a, b in product((0, 1), repeat=2):
+            assert medio.evaluar(a, b) == half_adder(a, b)
+        for a, b, c in product((0, 1), repeat=3):
+            assert completo.evaluar(a, b, c) == full_adder(a, b, c)
+    
+    @pytest.mark.parametrize("biblioteca", BIBLIOTECAS)
+    def test_adder_4bits_compilado(self, biblioteca, todos_4):
+        """adder_4bits mapeado y compilado con las 512 entradas."""
+        circuito = compilar(mapear_circuito("adder_4bits", biblioteca),
+                            en_disco=False)
+        for a, b, cin in product(todos_4, todos_4, (0, 1)):
+            assert circuito(a, b, cin) == adder_4bits(a, b, cin)
+    
+    @pytest.mark.parametrize("biblioteca", BIBLIOTECAS)
+    def test_sumador_restador_por_planos(self, biblioteca, todos_4):
+        """El sumador-restador mapeado por planos, 512 vectores a la vez."""
+        red = mapear_circuito("sumador_restador_4bits", biblioteca)
+        casos = list(product(todos_4, todos_4, (0, 1)))
+        n = len(casos)
+        entradas = (empaquetar([a for a, _, _ in casos])
+                    + empaquetar([b for _, b, _ in casos])
+                    + [empaquetar_bits([op for _, _, op in casos])])
+        valores = red.evaluar_planos(entradas, mascara(n))
+        resultado_cables, cout_cable = red.salidas
+        resultados = desempaquetar([valores[c] for c in resultado_cables], n)
+        couts = desempaquetar([valores[cout_cable]], n)
+        for (a, b, op), resultado, cout in zip(casos, resultados, couts):
+            assert (resultado, cout[0]) == sumador_restador_4bits(a, b, op)
+
+
+class TestCostes:
+    """Pruebas del informe de costes."""
+    
+    def test_costo(self):
+        """Puertas, niveles y transistores de un netlist."""
+        c = costo(mapear_circuito("full_adder", "NAND"))
+        assert c["compuertas"] == 9
+        assert c["transistores"] == 36
+        assert c["profundidad"] == 6
+    
+    def test_reporte(self):
+        """El informe tiene las tres columnas para cada circuito."""
+        reporte = reporte_tecnologia(["half_adder", "sumador_restador_4bits"])
+        assert list(reporte) == ["half_adder", "sumador_restador_4bits"]
+        for fila in reporte.values():
+            assert set(fila) == {"original", "NAND", "NOR"}
+        # NAND ahorra transistores respecto a AND/OR/NOT
+        fila = reporte["sumador_restador_4bits"]
+        assert fila["NAND"]["transistores"] < fila["original"]["transistores"]
+    
+    def test_circuito_desconocido(self):
+        """Un circuito desconocido en el informe lanza ValueError."""
+        with pytest.raises(ValueError):
+            reporte_tecnologia(["multiplicador"])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,129 @@
+"""
+Pruebas unitarias para el análisis estático de tiempos.
+"""
+
+import pytest
+from itertools import product
+from src.full_adder import full_adder
+from src.adder_nbits import adder_nbits
+from src.netlist import trazar, trazar_sumador_restador
+from src.metrics import medir_circuito
+from src.adder_subtractor import sumador_restador_4bits
+from src.event_sim import simulador_sumador_restador
+from src.timing import (analizar_tiempos, analizar_sumador,
+                        analizar_sumador_restador)
+
+
+class TestLlegadas:
+    """Pruebas de los tiempos de llegada."""
+    
+    def test_full_adder(self):
+        """Suma a los 6 niveles y acarreo a los 5 del sumador completo."""
+        r = analizar_tiempos(trazar(full_adder, 0, 0, 0))
+        assert r["llegada"] == (6, 5)
+        assert r["retardo_maximo"] == 6
+    
+    def test_igual_a_profundidad(self):
+        """Con retardo unitario, el retardo máximo es la profundidad."""
+        red = trazar_sumador_restador(4)
+        m = medir_circuito(sumador_restador_4bits, [0] * 4, [0] * 4, 0)
+        assert analizar_tiempos(red)["retardo_maximo"] == m["profundidad"]
+    
+    def test_ripple(self):
+        """Cada bit más significativo llega dos unidades después."""
+        resultado, cout = analizar_sumador(4)["llegada"]
+        assert resultado == [8, 6, 4, 2]
+        assert cout == 9
+    
+    def test_retardos_por_tipo(self):
+        """Con XOR lenta, el crítico pasa a ser el bit de suma más alto."""
+        assert analizar_sumador_restador(4)["retardo_maximo"] == 10
+        r = analizar_sumador_restador(4, {"XOR": 3})
+        # B XOR op, A XOR B', 3 x (AND, OR) y la XOR final: 3+3+6+3
+        assert r["retardo_maximo"] == 15
+        resultado, cout = r["llegada"]
+        assert resultado[0] == 15 and cout == 14
+    
+    def test_cota_de_la_simulacion(self, todos_4):
+        """Ninguna operación tarda más en estabilizarse que la cota estática."""
+        retardos = {"XOR": 2, "OR": 1.5}
+        cota = analizar_sumador_restador(4, retardos)["retardo_maximo"]
+        sim = simulador_sumador_restador(4, retardos)
+        tiempos = []
+        for a, b, op in product(todos_4, todos_4, (0, 1)):
+            sim.aplicar([0] * 4, [0] * 4, 0)
+            tiempos.append(sim.aplicar(a, b, op)[1])
+        assert max(tiempos) <= cota
+    
+    def test_64_bits_lineal(self):
+        """El sumador de 64 bits crece linealmente con el ancho."""
+        r32 = analizar_sumador(32)["retardo_maximo"]
+        r64 = analizar_sumador(64)["retardo_maximo"]
+        assert r64 - 1 == 2 * (r32 - 1)
+
+
+class TestCaminoCritico:
+    """Pruebas del camino crítico."""
+    
+    def test_recorre_la_cadena(self):
+        """El camino atraviesa los cuatro sumadores completos en orden."""
+        camino = analizar_sumador_restador(4)["camino_critico"]
+        llegadas = [paso["llegada"] for paso in camino]
+        assert llegadas == sorted(llegadas)
+        assert llegadas[-1] == 10
+        sumadores = []
+        for paso in camino:
+            for parte in paso["origen"].split("/"):
+                if parte.startswith("full_adder") and parte not in sumadores:
+                    sumadores.append(parte)
+        assert sumadores == [f"full_adder[{k}]" for k in range(4)]
+    
+    def test_puertas_conectadas(self):
+        """Cada puerta del camino lee la salida de la anterior."""
+        r = analizar_sumador(8)
+        red = trazar(adder_nbits, [0] * 8, [0] * 8, 0,
+                     primitivas=("AND", "OR", "NOT", "XOR"))
+        camino = r["camino_critico"]
+        for anterior, siguiente in zip(camino, camino[1:]):
+            salida = red.compuertas[anterior["indice"]][2]
+            assert salida in red.compuertas[siguiente["indice"]][1]
+    
+    def test_origen_con_half_adder(self):
+        """El origen identifica el medio sumador de cada puerta."""
+        camino = analizar_sumador(4)["camino_critico"]
+        assert any("half_adder[1]" in paso["origen"] for paso in camino)
+
+
+class TestHolgura:
+    """Pruebas de la holgura frente a un objetivo."""
+    
+    def test_objetivo_por_defecto(self):
+        """Sin objetivo, la holgura mínima es 0."""
+        r = analizar_sumador(4)
+        assert r["holgura_minima"] == 0 and r["cumple"]
+    
+    def test_objetivo_holgado(self):
+        """Con objetivo 12, el bit menos significativo tiene holgura 10."""
+        r = analizar_sumador(4, objetivo=12)
+        resultado, cout = r["holgura"]
+        assert resultado == [4, 6, 8, 10]
+        assert cout == 3
+        assert r["holgura_minima"] == 3 and r["cumple"]
+    
+    def test_no_cumple(self):
+        """Un objetivo menor que el retardo máximo no se cumple."""
+        r = analizar_sumador_restador(4, objetivo=8)
+        assert not r["cumple"]
+        assert r["holgura_minima"] == -2
+        # Las puertas del camino crítico tienen la peor holgura
+        for paso in r["camino_critico"]:
+            assert r["holgura_compuertas"][paso["indice"]] == -2
+    
+    def test_retardo_negativo(self):
+        """Un retardo negativo lanza ValueError."""
+        with pytest.raises(ValueError):
+            analizar_sumador(4, {"AND": -1})
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,218 @@
+"""
+Pruebas unitarias para la exportación VCD.
+"""
+
+import io
+import random
+import tracemalloc
+import pytest
+import src
+from src import adder_subtractor, lookup_table
+from src.adder_subtractor import sumador_restador_4bits
+from src.netlist import trazar_sumador_restador
+from src.vcd import EscritorVCD, volcar_sumador_restador, grabar_vcd, _identificador
+from src.instrumentation import instrumentar, reiniciar
+from src.equivalence import verificar_equivalencia
+
+
+def _flujo(n_operaciones, n_bits=4, semilla=0):
+    """Generador de operaciones aleatorias."""
+    rng = random.Random(semilla)
+    for _ in range(n_operaciones):
+        yield ([rng.getrandbits(1) for _ in range(n_bits)],
+               [rng.getrandbits(1) for _ in range(n_bits)],
+               rng.getrandbits(1))
+
+
+def _leer(texto):
+    """Cabecera (variables por identificador) y cambios por instante."""
+    cabecera, _, cuerpo = texto.partition("$enddefinitions $end\n")
+    variables = {}
+    for linea in cabecera.splitlines():
+        campos = linea.split()
+        if campos[0] == "$var":
+            variables[campos[3]] = campos[4]
+    instantes = []
+    for linea in cuerpo.splitlines():
+        if linea.startswith("#"):
+            instantes.append((int(linea[1:]), {}))
+        elif linea.startswith("b"):
+            valor, codigo = linea[1:].split()
+            instantes[-1][1][codigo] = valor
+        elif linea[0] in "01":
+            instantes[-1][1][linea[1:]] = linea[0]
+    return variables, instantes
+
+
+class TestFormato:
+    """Pruebas del formato del archivo."""
+    
+    def test_identificadores(self):
+        """Identificadores distintos con caracteres imprimibles."""
+        codigos = [_identificador(i) for i in range(10000)]
+        assert len(set(codigos)) == 10000
+        assert codigos[0] == "!" and codigos[93] == "~" and codigos[94] == "!!"
+        assert all(33 <= ord(c) <= 126 for codigo in codigos for c in codigo)
+    
+    def test_cabecera(self):
+        """Entradas, salidas y el acarreo de cada full_adder."""
+        salida = io.StringIO()
+        EscritorVCD(salida, trazar_sumador_restador(4)).cerrar()
+        texto = salida.getvalue()
+        assert "$timescale 1ns $end" in texto
+        assert texto.count("$scope") == texto.count("$upscope")
+        variables, _ = _leer(texto)
+        nombres = list(variables.values())
+        assert nombres[:5] == ["a_bits", "b_bits", "operacion", "resultado", "cout"]
+        assert nombres.count("cout") == 5
+        assert "$scope module full_adder_3 $end" in texto
+    
+    def test_internos(self):
+        """Con internos=True se declara la salida de cada puerta."""
+        red = trazar_sumador_restador(4)
+        salida = io.StringIO()
+        EscritorVCD(salida, red, internos=True).cerrar()
+        variables, _ = _leer(salida.getvalue())
+        assert len(variables) == 5 + 4 + len(red)
+
+
+class TestCambios:
+    """Solo se escriben las señales que cambian."""
+    
+    def test_valores(self):
+        """Los valores escritos son los del sumador-restador."""
+        salida = io.StringIO()
+        with EscritorVCD(salida, trazar_sumador_restador(4)) as vcd:
+            assert vcd.registrar([0, 1, 1, 1], [0, 0, 1, 0], 1) == \
+                sumador_restador_4bits([0, 1, 1, 1], [0, 0, 1, 0], 1)
+        variables, instantes = _leer(salida.getvalue())
+        codigos = {nombre: codigo for codigo, nombre in reversed(variables.items())}
+        tiempo, valores = instantes[0]
+        assert tiempo == 0
+        assert valores[codigos["resultado"]] == "0101"
+        assert valores[codigos["cout"]] == "1"
+        assert len(valores) == len(variables)
+    
+    def test_solo_cambios(self):
+        """Repetir una operación no escribe nada; cambiar A sí."""
+        salida = io.StringIO()
+        with EscritorVCD(salida, trazar_sumador_restador(4), periodo=10) as vcd:
+            for _ in range(5):
+                vcd.registrar([0, 0, 0, 1], [0, 0, 0, 1], 0)
+            vcd.registrar([0, 0, 1, 1], [0, 0, 0, 1], 0)
+        variables, instantes = _leer(salida.getvalue())
+        assert [t for t, _ in instantes] == [0, 50, 60]
+        cambios = instantes[1][1]
+        codigos = {codigo: nombre for codigo, nombre in variables.items()}
+        assert {codigos[c] for c in cambios} >= {"a_bits", "resultado"}
+        assert "b_bits" not in {codigos[c] for c in cambios}
+        assert vcd.ciclos == 6 and vcd.cambios == len(cambios)
+    
+    def test_reconstruir_flujo(self):
+        """Aplicando los cambios se recupera el resultado de cada ciclo."""
+        operaciones = list(_flujo(200))
+        salida = io.StringIO()
+        volcar_sumador_restador(salida, operaciones)
+        variables, instantes = _leer(salida.getvalue())
+        codigo = next(c for c, nombre in variables.items() if nombre == "resultado")
+        actual = None
+        por_tiempo = dict(instantes)
+        for t, (a, b, op) in enumerate(operaciones):
+            actual = por_tiempo.get(t, {}).get(codigo, actual)
+            esperado, _ = sumador_restador_4bits(a, b, op)
+            assert actual == "".join(map(str, esperado))
+
+
+class TestStreaming:
+    """Pruebas de la escritura incremental."""
+    
+    def test_archivo(self, tmp_path):
+        """Escribir a una ruta con un flujo de 8 bits."""
+        ruta = tmp_path / "traza.vcd"
+        ciclos = volcar_sumador_restador(str(ruta), _flujo(1000, 8), n_bits=8)
+        assert ciclos == 1000
+        texto = ruta.read_text(encoding="ascii")
+        assert "$var wire 8" in texto
+        assert texto.rstrip().endswith("#1000")
+    
+    def test_memoria_constante(self, tmp_path):
+        """Un flujo cuatro veces más largo no necesita más memoria."""
+        picos = []
+        for n_operaciones in (5000, 20000):
+            tracemalloc.start()
+            volcar_sumador_restador(str(tmp_path / "traza.vcd"), _flujo(n_operaciones))
+            picos.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+        assert picos[1] < 1.5 * picos[0]
+
+
+class TestGrabacion:
+    """Pruebas de grabar_vcd sobre sumador_restador_4bits."""
+    
+    def test_grabar(self):
+        """Cada llamada por el paquete es un ciclo, con cualquier motor;
+        las anidadas (la construcción de la tabla) no cuentan."""
+        salida = io.StringIO()
+        with grabar_vcd(salida) as vcd:
+            src.sumador_restador_4bits([0, 1, 1, 1], [0, 0, 1, 0], 1)
+            adder_subtractor.sumador_restador_4bits([0, 0, 1, 1], [0, 0, 0, 1], 0,
+                                                    motor="tabla")
+        assert vcd.ciclos == 2
+        assert salida.getvalue().rstrip().endswith("#2")
+    
+    def test_llamadas_internas(self, monkeypatch):
+        """Construir o verificar la tabla, verificar la equivalencia o
+        trazar dentro del bloque no son ciclos."""
+        monkeypatch.setattr(lookup_table, "_tabla", None)
+        salida = io.StringIO()
+        with grabar_vcd(salida) as vcd:
+            assert src.sumador_restador_tabla([0, 1, 1, 1], [0, 0, 1, 0], 1) == \
+                ([0, 1, 0, 1], 1)
+            assert lookup_table.verificar_tabla()
+            assert verificar_equivalencia(sumador_restador_4bits, procesos=1,
+                                          modo="escalar")["equivalentes"]
+            trazar_sumador_restador(4)
+            assert vcd.ciclos == 0
+            src.sumador_restador_4bits([0, 1, 1, 1], [0, 0, 1, 0], 1)
+        assert vcd.ciclos == 1
+    
+    def test_sin_coste_desactivada(self):
+        """Al salir vuelve la función original, sin envoltura."""
+        with grabar_vcd(io.StringIO()):
+            assert src.sumador_restador_4bits is not sumador_restador_4bits
+        assert src.sumador_restador_4bits is sumador_restador_4bits
+        assert adder_subtractor.sumador_restador_4bits is sumador_restador_4bits
+    
+    def test_restaura_con_excepcion(self):
+        """Una excepción dentro del bloque también restaura la función."""
+        with pytest.raises(ValueError):
+            with grabar_vcd(io.StringIO()):
+                src.sumador_restador_4bits([0, 0, 0, 2], [0, 0, 0, 0], 0)
+        assert src.sumador_restador_4bits is sumador_restador_4bits
+    
+    def test_ignora_sumador_de_la_llamada(self):
+        """El VCD es el del circuito de grabar_vcd, no el del sumador=
+        de la llamada grabada."""
+        def ceros(a_bits, b_bits, cin=0):
+            return [0, 0, 0, 0], 0
+        salida = io.StringIO()
+        with grabar_vcd(salida):
+            assert src.sumador_restador_4bits([0, 1, 1, 1], [0, 0, 1, 0], 1,
+                                              sumador=ceros) == ([0, 0, 0, 0], 0)
+        variables, instantes = _leer(salida.getvalue())
+        resultado = next(c for c, nombre in variables.items() if nombre == "resultado")
+        assert instantes[0][1][resultado] == "0101"
+    
+    def test_con_instrumentacion(self):
+        """Se compone con la instrumentación activa."""
+        with instrumentar() as contadores:
+            with grabar_vcd(io.StringIO()) as vcd:
+                reiniciar()
+                src.sumador_restador_4bits([0, 1, 1, 1], [0, 0, 1, 0], 1)
+        assert vcd.ciclos == 1
+        assert contadores["sumador_restador_4bits"]["llamadas"] == 1
+        assert src.sumador_restador_4bits is sumador_restador_4bits
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])